@@ -1,17 +1,43 @@
+from PyQt5.QtCore import QCoreApplication, Qt
 from PyQt5.QtWidgets import QApplication
 
+import client.data.settings as settings
 from client.socketio_client import SocketioClient
 from client.views.main_window import MainWindow
 
-# app = QApplication([])
-app = QApplication(['', '--no-sandbox'])
 
+def create_application() -> QApplication:
+    """ Create application
 
-websocket = SocketioClient()
+    QtWebEngine is started by topology view after main window is shown,
+    only its URL scheme has to be registered before
+    """
+    if settings.topology_renderer != 'web':
+        return QApplication([])
 
-window = MainWindow(websocket)
-window.show()
+    from client.views.assets_scheme import register_assets_scheme
+    register_assets_scheme()
+    # Allows QtWebEngineWidgets to be imported after application is created
+    QCoreApplication.setAttribute(Qt.AA_ShareOpenGLContexts)
+    return QApplication(['', '--no-sandbox'])
 
-websocket.connection_error.connect(window.on_connection_error)
 
-app.exec()
+def create_main_window() -> MainWindow:
+    websocket = SocketioClient(queue_size=settings.message_queue_size,
+                               drain_per_tick=settings.messages_per_tick,
+                               summarize_dropped=settings.summarize_dropped_logs)
+
+    window = MainWindow(websocket)
+    websocket.connection_error.connect(window.on_connection_error)
+    return window
+
+
+def main():
+    app = create_application()
+    window = create_main_window()
+    window.show()
+    app.exec()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,73 @@
+""" Measure cost of clustered topology updates
+
+Run with `python3 -m benchmarks.bench_clustering [nodes]`. Building the
+cluster tree happens once per loaded topology, later edits update it. The
+visible graph is recomputed on every zoom or pan of the view.
+"""
+import sys
+import time
+
+import client.data.settings as settings
+from benchmarks.synthetic import make_model, make_node
+from client.data.clustering import (build_cluster_tree, expanded_clusters,
+                                    update_cluster_tree, visible_graph)
+from client.data.layout import layout_graph
+from client.data.objects import Connection
+from client.data.topology import (apply_positions, build_graph, diff_graphs,
+                                  update_graph)
+
+
+def main():
+    nodes_count = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+
+    model = make_model(nodes_count)
+    graph = build_graph(model)
+    apply_positions(graph, layout_graph(graph))
+
+    start = time.perf_counter()
+    tree = build_cluster_tree(model, graph)
+    elapsed = time.perf_counter() - start
+    print(f'{nodes_count} nodes: cluster tree of {len(tree.clusters)} clusters'
+          f' in {elapsed:.2f} s')
+
+    # Whole graph fitted into 1000 pixels wide view, then zoomed into its middle
+    xs = [node['x'] for node in graph.nodes.values()]
+    ys = [node['y'] for node in graph.nodes.values()]
+    left, top, right, bottom = min(xs), min(ys), max(xs), max(ys)
+    scale = 1000 / max(right - left, bottom - top, 1)
+
+    shown = visible_graph(graph, tree, set())
+    for zoom in (1, 4, 16, 64):
+        width = (right - left) / zoom / 2
+        height = (bottom - top) / zoom / 2
+        middle_x, middle_y = (left + right) / 2, (top + bottom) / 2
+        viewport = (middle_x - width, middle_y - height, middle_x + width, middle_y + height)
+
+        start = time.perf_counter()
+        expanded = expanded_clusters(tree, viewport, scale * zoom,
+                                     settings.cluster_expand_size)
+        target = visible_graph(graph, tree, expanded)
+        diff = diff_graphs(shown, target)
+        elapsed = time.perf_counter() - start
+        shown = target
+        print(f'  zoom {zoom}x: {len(target.nodes)} visible nodes, {len(target.edges)} edges,'
+              f' {len(diff.nodes) + len(diff.removed_nodes)} changed, {elapsed * 1000:.1f} ms')
+
+    # Edits of model update the tree
+    model.subscribe(lambda event: update_cluster_tree(
+        tree, graph, update_graph(graph, model, event)))
+    node = make_node(nodes_count)
+    node.position = (middle_x, middle_y)
+    for name, edit in (
+            ('add node', lambda: model.add_node(node)),
+            ('add connection', lambda: model.add_connection(Connection(
+                'link-new', 'Csma', [f'{node.name}/eth0', 'node-0/eth1'], []))),
+            ('remove node', lambda: model.remove_node(node))):
+        start = time.perf_counter()
+        edit()
+        elapsed = time.perf_counter() - start
+        print(f'  {name}: {elapsed * 1000:.2f} ms')
+
+
+if __name__ == '__main__':
+    main()
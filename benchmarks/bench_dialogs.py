@@ -0,0 +1,52 @@
+""" Measure latency of building forms of dialogs
+
+Run with `python3 -m benchmarks.bench_dialogs [repeats]`. Compares
+`uic.loadUi`, which parses the .ui file on every open, with `load_form`,
+which compiles the form once per process.
+"""
+import glob
+import os
+import sys
+import time
+from xml.etree.ElementTree import parse
+
+from PyQt5 import QtWidgets, uic
+
+from benchmarks.synthetic import make_node
+from client.views.forms import UI_DIR, form_class, load_form
+
+
+def _per_open(build, repeats: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeats):
+        build()
+    return (time.perf_counter() - start) / repeats
+
+
+def main():
+    repeats = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+    os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+    app = QtWidgets.QApplication([])
+
+    import client.res.resources_rcc
+    print(f'{"form":20} {"loadUi":>10} {"compile":>10} {"load_form":>10}')
+    for path in sorted(glob.glob(os.path.join(UI_DIR, '*.ui'))):
+        name = os.path.splitext(os.path.basename(path))[0]
+        base = getattr(QtWidgets, parse(path).getroot().find('widget').get('class'))
+
+        load_ui = _per_open(lambda: uic.loadUi(path, base()), repeats)
+        start = time.perf_counter()
+        form_class(name)
+        compile_time = time.perf_counter() - start
+        cached = _per_open(lambda: load_form(base(), name), repeats)
+        print(f'{name:20} {load_ui * 1000:8.2f}ms {compile_time * 1000:8.2f}ms'
+              f' {cached * 1000:8.2f}ms')
+
+    from client.views.node_settings import NodeSettings
+    node = make_node(0)
+    elapsed = _per_open(lambda: NodeSettings(None, node), repeats)
+    print(f'NodeSettings dialog opened in {elapsed * 1000:.2f} ms')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,44 @@
+""" Compare edit sessions of nodes list with deep copies of it
+
+Run with `python3 -m benchmarks.bench_edit_session [nodes]`. Measures
+opening the node list for editing, editing one node and committing the
+edit, with a deep copy of the list as dialogs did before and with
+`EditSession`.
+"""
+import sys
+import time
+from copy import deepcopy
+
+from benchmarks.synthetic import make_model
+from client.data.objects import touch
+from client.data.session import EditSession
+
+
+def _timed(action):
+    start = time.perf_counter()
+    result = action()
+    return result, time.perf_counter() - start
+
+
+def main():
+    nodes_count = int(sys.argv[1]) if len(sys.argv) > 1 else 50000
+    model = make_model(nodes_count)
+    model.index
+    print(f'{nodes_count} nodes:')
+
+    edited, opened = _timed(lambda: deepcopy(model.nodes))
+    edited[0] = deepcopy(edited[0])
+    touch(edited[0])
+    _, committed = _timed(lambda: model.update_nodes(edited))
+    print(f'  deep copy: open {opened * 1000:.1f} ms, commit {committed * 1000:.1f} ms')
+
+    session, opened = _timed(lambda: EditSession(model, 'nodes'))
+    node = session.checkout(0)
+    touch(node)
+    session[0] = node
+    _, committed = _timed(session.commit)
+    print(f'  edit session: open {opened * 1000:.2f} ms, commit {committed * 1000:.2f} ms')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,55 @@
+""" Compare latency of /stop requests with and without pooled session
+
+Run with `python3 -m benchmarks.bench_http_session`
+"""
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import requests
+
+from client.remote.session import ServerClient
+
+
+class StopHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    # Headers and body are written separately, with Nagle's algorithm
+    # replies on kept-alive connections wait for delayed ACK
+    disable_nagle_algorithm = True
+
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header('Content-Length', '2')
+        self.end_headers()
+        self.wfile.write(b'{}')
+
+    def log_message(self, format, *args):
+        pass
+
+
+def measure(function, count):
+    start = time.perf_counter()
+    for _ in range(count):
+        function()
+    return (time.perf_counter() - start) / count * 1000
+
+
+def main():
+    server = ThreadingHTTPServer(('127.0.0.1', 0), StopHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    host, port = server.server_address
+    url = f'http://{host}:{port}'
+
+    client = ServerClient()
+    count = 500
+    fresh = measure(lambda: requests.get(url + '/stop').close(), count)
+    pooled = measure(lambda: client.stop(url).close(), count)
+    print(f'requests.get: {fresh:.3f} ms/request')
+    print(f'ServerClient: {pooled:.3f} ms/request')
+
+    client.close()
+    server.shutdown()
+
+
+if __name__ == '__main__':
+    main()
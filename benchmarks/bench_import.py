@@ -0,0 +1,42 @@
+""" Measure throughput of the streaming XML importer
+
+Run with `python3 -m benchmarks.bench_import [nodes]`, default model
+is about 100 MB of XML.
+"""
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from benchmarks.synthetic import make_model
+from client.xml.deserialize import load_model
+
+
+def main():
+    nodes_count = int(sys.argv[1]) if len(sys.argv) > 1 else 60000
+
+    fd, path = tempfile.mkstemp(suffix='.xml')
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            make_model(nodes_count).write_xml(f)
+        size = os.path.getsize(path)
+
+        start = time.perf_counter()
+        model = load_model(path)
+        elapsed = time.perf_counter() - start
+        print(f'{nodes_count} nodes, {size / 2**20:.1f} MB: {elapsed:.2f} s,'
+              f' {size / 2**20 / elapsed:.1f} MB/s')
+        del model
+
+        tracemalloc.start()
+        load_model(path)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        print(f'peak traced memory, including loaded model: {peak / 2**20:.1f} MB')
+    finally:
+        os.remove(path)
+
+
+if __name__ == '__main__':
+    main()
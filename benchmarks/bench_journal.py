@@ -0,0 +1,74 @@
+""" Measure undo journal with long histories
+
+Run with `python3 -m benchmarks.bench_journal [steps] [nodes]`. Edits route
+metrics and renames nodes of a synthetic model through `Model` editing
+methods, then undoes and redoes all of them. Reports time per step and
+memory held by the journal, with history bounded to `steps` and to a tenth
+of them, and time to rebuild the model by replaying the journal onto base.
+"""
+import sys
+import time
+import tracemalloc
+from copy import deepcopy
+
+from benchmarks.synthetic import make_model
+from client.data.journal import Journal
+
+
+def _edit(model, step: int):
+    row = step * 7919 % len(model.nodes)
+    if step % 10 == 0:
+        model.set_value(('nodes', row, 'name'), f'renamed-{step}')
+    else:
+        model.set_value(('nodes', row, 'ipv4_routes', step % 4, 'metric'), step)
+
+
+def _measure(nodes_count: int, steps: int, limit: int, with_base: bool):
+    model = make_model(nodes_count)
+    model.index
+    base = deepcopy(model) if with_base else None
+
+    tracemalloc.start()
+    model.journal = Journal(limit, base)
+    start = time.perf_counter()
+    for step in range(steps):
+        _edit(model, step)
+    recorded = time.perf_counter() - start
+    memory, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    start = time.perf_counter()
+    while model.journal.undo(model) is not None:
+        pass
+    undone = time.perf_counter() - start
+    start = time.perf_counter()
+    while model.journal.redo(model) is not None:
+        pass
+    redone = time.perf_counter() - start
+
+    kept = len(model.journal.done)
+    print(f'{steps} steps, limit {limit}{", with base" if with_base else ""}:'
+          f' edit {recorded / steps * 1e6:.1f} us/step,'
+          f' undo {undone / kept * 1e6:.1f} us/step,'
+          f' redo {redone / kept * 1e6:.1f} us/step,'
+          f' {memory / 2 ** 20:.1f} MB allocated by edits and history')
+
+    if with_base:
+        start = time.perf_counter()
+        rebuilt = deepcopy(base)
+        model.journal.replay(rebuilt)
+        elapsed = time.perf_counter() - start
+        print(f'  rebuilt by replay in {elapsed:.2f} s, equal to model: {rebuilt == model}')
+
+
+def main():
+    steps = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    nodes_count = int(sys.argv[2]) if len(sys.argv) > 2 else 10000
+
+    _measure(nodes_count, steps, steps, False)
+    _measure(nodes_count, steps, steps // 10, False)
+    _measure(nodes_count, steps, steps // 10, True)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,45 @@
+""" Measure time of topology layout computed by client
+
+Run with `python3 -m benchmarks.bench_layout [nodes]`, layouts are
+measured for growing graphs up to the given number of nodes.
+"""
+import sys
+import time
+
+from benchmarks.synthetic import make_model
+from client.data.layout import force_layout, layout_graph, np, radial_layout
+from client.data.topology import build_graph
+
+
+def main():
+    max_nodes = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+
+    nodes_count = 1000
+    while nodes_count <= max_nodes:
+        graph = build_graph(make_model(nodes_count))
+
+        start = time.perf_counter()
+        positions = layout_graph(graph)
+        elapsed = time.perf_counter() - start
+        print(f'{len(graph.nodes)} nodes, {len(graph.edges)} edges: {elapsed:.2f} s')
+
+        # Relayout after change keeps known positions
+        start = time.perf_counter()
+        layout_graph(graph, positions)
+        elapsed = time.perf_counter() - start
+        print(f'  incremental: {elapsed:.2f} s')
+
+        # Graphs with cycles get force-directed layout
+        if np is not None:
+            edges = [(i, (i + 1) % nodes_count) for i in range(nodes_count)]
+            edges += [(i, (i * 7) % nodes_count) for i in range(0, nodes_count, 10)]
+            start = time.perf_counter()
+            force_layout(nodes_count, edges, initial=radial_layout(nodes_count, edges))
+            elapsed = time.perf_counter() - start
+            print(f'  force-directed, {len(edges)} edges: {elapsed:.2f} s')
+
+        nodes_count *= 10
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,53 @@
+""" Measure memory footprint of model objects
+
+Run with `python3 -m benchmarks.bench_memory [nodes]`. Reports memory
+allocated per synthetic node (two devices, six routes, one application)
+and per connection, and growth of resident memory while the whole model
+is built.
+"""
+import gc
+import sys
+import tracemalloc
+
+from benchmarks.synthetic import make_model, make_node
+from client.data.objects import Connection
+
+
+def _rss_mb() -> float:
+    with open('/proc/self/status') as f:
+        for line in f:
+            if line.startswith('VmRSS:'):
+                return int(line.split()[1]) / 1024
+    return 0.0
+
+
+def _allocated_per_object(make, count: int = 10000) -> float:
+    tracemalloc.start()
+    objects = [make(index) for index in range(count)]
+    allocated, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del objects
+    return allocated / count
+
+
+def main():
+    nodes_count = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+
+    node = _allocated_per_object(make_node)
+    connection = _allocated_per_object(
+        lambda index: Connection(f'link-{index}', 'Csma',
+                                 [f'node-{index}/eth0', f'node-{index + 1}/eth1'],
+                                 [['DataRate', '100Mbps'], ['Delay', '2ms']]))
+    print(f'node with devices, routes and application: {node:.0f} bytes')
+    print(f'connection: {connection:.0f} bytes')
+
+    gc.collect()
+    rss = _rss_mb()
+    model = make_model(nodes_count)
+    gc.collect()
+    print(f'model of {len(model.nodes)} nodes and {len(model.connections)} connections:'
+          f' RSS +{_rss_mb() - rss:.0f} MB')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,50 @@
+""" Compare applying one model edit to topology graph with rebuilding it
+
+Run with `python3 -m benchmarks.bench_model_events [nodes]`. Every edit is
+made through `Model` editing methods, which notify `update_graph`, and
+committing an edited copy of nodes list is measured as dialogs do it.
+"""
+import sys
+import time
+from copy import deepcopy
+
+from benchmarks.synthetic import make_model
+from client.data.objects import Node, touch
+from client.data.topology import build_graph, update_graph
+
+
+def _timed(action) -> float:
+    start = time.perf_counter()
+    action()
+    return time.perf_counter() - start
+
+
+def main():
+    nodes_count = int(sys.argv[1]) if len(sys.argv) > 1 else 50000
+
+    model = make_model(nodes_count)
+    model.index
+    graph = build_graph(model)
+    print(f'{nodes_count} nodes: graph rebuilt in {_timed(lambda: build_graph(model)) * 1000:.1f} ms')
+
+    model.subscribe(lambda event: update_graph(graph, model, event))
+    node = Node('new-node', [], [], [], [])
+    edits = [
+        ('add node', lambda: model.add_node(node)),
+        ('rename node', lambda: model.rename_node(model.nodes[nodes_count // 2], 'renamed')),
+        ('change connection', lambda: model.set_interfaces(
+            model.connections[0], ['node-0/eth0', 'new-node/eth0'])),
+        ('remove node', lambda: model.remove_node(node)),
+    ]
+    for name, edit in edits:
+        print(f'  {name}: {_timed(edit) * 1000:.2f} ms')
+
+    edited = deepcopy(model.nodes)
+    edited[-1].name = 'edited'
+    touch(edited[-1])
+    print(f'  commit of edited nodes list: {_timed(lambda: model.update_nodes(edited)) * 1000:.1f} ms')
+    print(f'  graph is consistent: {graph == build_graph(model)}')
+
+
+if __name__ == '__main__':
+    main()
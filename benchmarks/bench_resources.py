@@ -0,0 +1,74 @@
+""" Compare Qt resources compiled to Python module and to binary bundle
+
+Run with `python3 -m benchmarks.bench_resources`. The Python module is
+generated by `pyrcc5` into a temporary directory, as `make res` did before.
+Each variant is measured in its own process: time to import or register
+resources and resident memory they add.
+"""
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+QRC_FILE = os.path.join('client', 'res', 'resources.qrc')
+
+
+def _rss_kb() -> int:
+    with open('/proc/self/status') as f:
+        for line in f:
+            if line.startswith('VmRSS:'):
+                return int(line.split()[1])
+    return 0
+
+
+def _child(variant: str, module_dir: str):
+    from PyQt5.QtCore import QDirIterator, QFile
+
+    rss = _rss_kb()
+    start = time.perf_counter()
+    if variant == 'python':
+        sys.path.insert(0, module_dir)
+        import resources
+    else:
+        import client.res.resources_rcc
+    elapsed = time.perf_counter() - start
+    added = _rss_kb() - rss
+
+    # Read every resource, as icons of main window do
+    files = QDirIterator(':/images', QDirIterator.Subdirectories)
+    size = 0
+    while files.hasNext():
+        resource = QFile(files.next())
+        resource.open(QFile.ReadOnly)
+        size += len(resource.readAll())
+    print(f'{variant}: loaded in {elapsed * 1000:.2f} ms, +{added} kB RSS,'
+          f' {size} bytes of resources')
+
+
+def main():
+    if len(sys.argv) > 2 and sys.argv[1] == '--child':
+        _child(sys.argv[2], sys.argv[3])
+        return
+
+    module_dir = tempfile.mkdtemp()
+    try:
+        pyrcc = shutil.which('pyrcc5')
+        variants = ['rcc']
+        if pyrcc is not None:
+            subprocess.run([pyrcc, QRC_FILE, '-o', os.path.join(module_dir, 'resources.py')],
+                           check=True)
+            variants.insert(0, 'python')
+        else:
+            print('pyrcc5 is not found, Python module is not measured')
+
+        for variant in variants:
+            subprocess.run([sys.executable, '-m', 'benchmarks.bench_resources',
+                            '--child', variant, module_dir], check=True)
+    finally:
+        shutil.rmtree(module_dir)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,53 @@
+""" Measure route tables with a million routes
+
+Run with `python3 -m benchmarks.bench_routes [routes]`. Reports memory
+held by a list of `Route` objects and by a `RouteTable` built from it by
+bulk append, time to serialize both to `<route .../>` elements and time
+to sort the table by metric and by network.
+"""
+import sys
+import time
+import tracemalloc
+
+from client.data.objects import Route, RouteTable
+from client.xml.serialize import serialize_routes
+
+
+def _route(index: int) -> Route:
+    return Route(f'10.{index >> 16 & 255}.{index >> 8 & 255}.{index & 255}',
+                 f'eth{index % 4}', index % 16, netmask='255.255.255.255')
+
+
+def _allocated(build):
+    tracemalloc.start()
+    result = build()
+    memory, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, memory
+
+
+def _timed(function) -> float:
+    start = time.perf_counter()
+    function()
+    return time.perf_counter() - start
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+
+    routes, list_memory = _allocated(lambda: [_route(index) for index in range(count)])
+    list_export = _timed(lambda: serialize_routes(routes))
+    build = _timed(lambda: RouteTable(routes))
+    table, table_memory = _allocated(lambda: RouteTable(routes))
+    del routes
+
+    print(f'{count} routes')
+    print(f'  list of Route: {list_memory / 2 ** 20:.1f} MB, exported in {list_export:.2f} s')
+    print(f'  RouteTable:    {table_memory / 2 ** 20:.1f} MB, exported in'
+          f' {_timed(lambda: serialize_routes(table)):.2f} s, built from the list in {build:.2f} s')
+    print(f'  sort by metric {_timed(lambda: table.sort("metric")):.2f} s,'
+          f' by network {_timed(lambda: table.sort("network")):.2f} s')
+
+
+if __name__ == '__main__':
+    main()
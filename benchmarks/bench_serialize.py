@@ -0,0 +1,53 @@
+""" Compare string, streaming and cached XML serialization of large models
+
+Run with `python3 -m benchmarks.bench_serialize`
+"""
+import os
+import time
+import tracemalloc
+
+from benchmarks.synthetic import make_model
+from client.data.objects import touch
+
+
+def measure(function):
+    tracemalloc.start()
+    start = time.perf_counter()
+    function()
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak
+
+
+def main():
+    print(f'{"nodes":>8} {"string, s":>10} {"peak, MB":>9} {"stream, s":>10} {"peak, MB":>9}'
+          f' {"edit, s":>10}')
+    for nodes_count in (1000, 5000, 20000):
+        model = make_model(nodes_count)
+
+        def to_string():
+            with open(os.devnull, 'w') as f:
+                f.write(model.convert_to_xml())
+
+        def to_stream():
+            with open(os.devnull, 'w') as f:
+                model.write_xml(f)
+
+        model.fragments.clear()
+        string_time, string_peak = measure(to_string)
+        model.fragments.clear()
+        stream_time, stream_peak = measure(to_stream)
+
+        # Fragments cache is warm now, change one route and serialize again
+        routes = model.nodes[0].ipv4_routes
+        routes.set_field(0, 'metric', routes.field(0, 'metric') + 1)
+        touch(model.nodes[0])
+        edit_time, _ = measure(to_stream)
+
+        print(f'{nodes_count:>8} {string_time:>10.3f} {string_peak / 2**20:>9.1f}'
+              f' {stream_time:>10.3f} {stream_peak / 2**20:>9.1f} {edit_time:>10.3f}')
+
+
+if __name__ == '__main__':
+    main()
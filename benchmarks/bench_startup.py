@@ -0,0 +1,118 @@
+""" Measure startup of the client and check it against a budget
+
+Run with `python3 -m benchmarks.bench_startup [renderer]`, default renderer
+is taken from settings. Reports import time of `app` from
+`python -X importtime` and time from process start to first paint of main
+window and to creation of topology view, under offscreen platform. Exits
+with status 1 if a budget is exceeded.
+"""
+import os
+import subprocess
+import sys
+import time
+
+# Budgets in seconds
+IMPORT_BUDGET = 0.3
+FIRST_PAINT_BUDGET = 1.0
+TOPOLOGY_BUDGET = 3.0
+
+
+def _child(renderer: str):
+    """ Start client and report its progress to stdout """
+    import client.data.settings as settings
+    settings.topology_renderer = renderer
+
+    from PyQt5.QtCore import QEvent, QObject, QTimer
+
+    import app
+
+    qt_app = app.create_application()
+    window = app.create_main_window()
+
+    class PaintWatcher(QObject):
+        painted = False
+
+        def eventFilter(self, obj, event):
+            if event.type() == QEvent.Paint and not self.painted:
+                self.painted = True
+                print('painted', flush=True)
+            return False
+
+    def check_topology():
+        if window.topology_view is None:
+            return
+        print('topology', flush=True)
+        qt_app.quit()
+
+    watcher = PaintWatcher()
+    window.installEventFilter(watcher)
+    timer = QTimer()
+    timer.timeout.connect(check_topology)
+    timer.start(1)
+
+    window.show()
+    qt_app.exec()
+
+
+def _import_time() -> float:
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c', 'import app'],
+                            capture_output=True, text=True, check=True)
+    lines = [line.split('|') for line in result.stderr.splitlines()
+             if line.startswith('import time:') and '|' in line]
+    modules = [(int(cumulative), name.rstrip()) for _, cumulative, name in lines
+               if cumulative.strip().isdigit()]
+
+    # Modules are listed after their imports, ones imported by interpreter
+    # startup end with `site`
+    names = [name.strip() for _, name in modules]
+    first = names.index('site') + 1 if 'site' in names else 0
+    app_modules = modules[first:names.index('app')]
+
+    print('slowest imports of app:')
+    for cumulative, name in sorted(app_modules, reverse=True)[:10]:
+        print(f'  {cumulative / 1000:7.1f} ms {name}')
+    return modules[names.index('app')][0] / 1e6
+
+
+def _startup_times(renderer: str):
+    env = dict(os.environ)
+    env.setdefault('QT_QPA_PLATFORM', 'offscreen')
+    start = time.perf_counter()
+    child = subprocess.Popen([sys.executable, '-m', 'benchmarks.bench_startup',
+                              '--child', renderer],
+                             env=env, stdout=subprocess.PIPE, text=True)
+    times = {}
+    for line in child.stdout:
+        times[line.strip()] = time.perf_counter() - start
+    child.wait()
+    return times
+
+
+def main():
+    args = [arg for arg in sys.argv[1:] if arg != '--child']
+    import client.data.settings as settings
+    renderer = args[0] if args else settings.topology_renderer
+    if '--child' in sys.argv:
+        _child(renderer)
+        return
+
+    results = [('import of app', _import_time(), IMPORT_BUDGET)]
+    times = _startup_times(renderer)
+    results.append(('first paint', times.get('painted'), FIRST_PAINT_BUDGET))
+    results.append((f'{renderer} topology view', times.get('topology'), TOPOLOGY_BUDGET))
+
+    over_budget = False
+    for name, elapsed, budget in results:
+        if elapsed is None:
+            print(f'{name}: not reached')
+            over_budget = True
+            continue
+        status = 'ok' if elapsed <= budget else 'OVER BUDGET'
+        over_budget |= elapsed > budget
+        print(f'{name}: {elapsed:.2f} s (budget {budget:.2f} s) {status}')
+
+    sys.exit(1 if over_budget else 0)
+
+
+if __name__ == '__main__':
+    main()
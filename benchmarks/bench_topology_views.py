@@ -0,0 +1,136 @@
+""" Compare web and native topology renderers
+
+Run with `python3 -m benchmarks.bench_topology_views [nodes] [--no-clusters]`,
+the option draws every node instead of clusters. Every renderer is
+measured in its own process: time to show the first frame, resident
+memory including helper processes, and time of one repaint.
+"""
+import os
+import subprocess
+import sys
+import time
+
+RENDERERS = ('native', 'web')
+FRAMES = 20
+
+
+def _rss_mb() -> float:
+    """ Resident memory of this process and its children, QtWebEngine runs
+    Chromium in helper processes
+    """
+    pids = [os.getpid()]
+    for entry in os.listdir('/proc'):
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f'/proc/{entry}/stat') as f:
+                if int(f.read().rsplit(')', 1)[1].split()[1]) == os.getpid():
+                    pids.append(int(entry))
+        except (OSError, IndexError, ValueError):
+            continue
+
+    total = 0
+    for pid in pids:
+        try:
+            with open(f'/proc/{pid}/status') as f:
+                for line in f:
+                    if line.startswith('VmRSS:'):
+                        total += int(line.split()[1])
+        except OSError:
+            continue
+    return total / 1024
+
+
+def _wait_for_js(page, script):
+    """ Run script in page and wait for its result """
+    from PyQt5.QtCore import QEventLoop
+
+    loop = QEventLoop()
+    result = []
+    page.runJavaScript(script, lambda value: (result.append(value), loop.quit()))
+    loop.exec()
+    return result[0]
+
+
+def measure(renderer: str, nodes_count: int, clusters: bool):
+    start = time.perf_counter()
+    from PyQt5.QtWidgets import QApplication
+
+    import client.data.model as model
+    import client.data.settings as settings
+    from benchmarks.synthetic import make_model
+
+    settings.topology_renderer = renderer
+    if not clusters:
+        settings.cluster_threshold = float('inf')
+    if renderer == 'web':
+        from client.views.assets_scheme import register_assets_scheme
+        register_assets_scheme()
+        app = QApplication(['', '--no-sandbox'])
+    else:
+        app = QApplication([])
+
+    from client.views.topology_base import create_topology_view
+    view = create_topology_view()
+    view.resize(1200, 800)
+    view.show()
+    startup = time.perf_counter() - start
+    startup_rss = _rss_mb()
+
+    model.current_model = make_model(nodes_count)
+    start = time.perf_counter()
+    view.update_topology()
+    if renderer == 'web':
+        from PyQt5.QtCore import QEventLoop
+        while not view.page_loaded:
+            app.processEvents(QEventLoop.WaitForMoreEvents)
+        _wait_for_js(view.web_view.page(), 'nodes.length')
+    app.processEvents()
+    first_frame = time.perf_counter() - start
+
+    # Let the view report its viewport, so clusters in it get expanded
+    deadline = time.perf_counter() + 0.5
+    while time.perf_counter() < deadline:
+        app.processEvents()
+
+    if renderer == 'web':
+        frame = _wait_for_js(
+            view.web_view.page(),
+            f'var start = performance.now();'
+            f'for (var i = 0; i < {FRAMES}; i++) {{ network.renderer._redraw(); }}'
+            f'(performance.now() - start) / {FRAMES}') / 1000
+    else:
+        viewport = view.graphics_view.viewport()
+        start = time.perf_counter()
+        for _ in range(FRAMES):
+            viewport.repaint()
+        frame = (time.perf_counter() - start) / FRAMES
+
+    print(f'{renderer}: startup {startup:.2f} s, RSS {startup_rss:.0f} MB;'
+          f' topology shown in {first_frame:.2f} s, {len(view.shown.nodes)} nodes drawn,'
+          f' frame {frame * 1000:.1f} ms, RSS {_rss_mb():.0f} MB')
+
+
+def main():
+    options = [arg for arg in sys.argv[1:] if arg.startswith('--')]
+    args = [arg for arg in sys.argv[1:] if not arg.startswith('--')]
+    if len(args) > 1:
+        measure(args[0], int(args[1]), '--no-clusters' not in options)
+        return
+
+    nodes_count = args[0] if args else '50000'
+    env = dict(os.environ)
+    env.setdefault('QT_QPA_PLATFORM', 'offscreen')
+    for renderer in RENDERERS:
+        result = subprocess.run([sys.executable, '-m', 'benchmarks.bench_topology_views',
+                                 renderer, nodes_count, *options],
+                                env=env, capture_output=True, text=True)
+        if result.returncode != 0:
+            error = result.stderr.strip().splitlines()
+            print(f'{renderer}: failed, {error[-1] if error else result.returncode}')
+        else:
+            print(result.stdout.strip())
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,53 @@
+from client.data.model import Model, ModelParameters
+from client.data.objects import *
+
+
+def make_node(index: int) -> Node:
+    """ Create node with two devices, a few routes and one application """
+    return Node(
+        name=f'node-{index}',
+        devices=[
+            Device(f'eth{dev}', 'Csma',
+                   [['Mtu', '1500'], ['DataRate', '100Mbps']],
+                   [[f'10.{index // 256 % 256}.{index % 256}.{dev + 1}', '255.255.255.0']],
+                   [[f'2001:db8:{index:x}::{dev + 1}', '64']])
+            for dev in range(2)
+        ],
+        applications=[
+            Application('echo', 'ns3::UdpEchoServer', [['Port', '9']])
+        ],
+        ipv4_routes=[
+            Route(f'10.{route}.0.0', 'eth0', route, netmask='255.255.0.0')
+            for route in range(4)
+        ],
+        ipv6_routes=[
+            Route(f'2001:db8:{route}::0', 'eth1', route, prefix='64')
+            for route in range(2)
+        ]
+    )
+
+
+def make_model(nodes_count: int) -> Model:
+    """ Create chain-like model with `nodes_count` nodes """
+    nodes = [make_node(index) for index in range(nodes_count)]
+    connections = [
+        Connection(f'link-{index}', 'Csma',
+                   [f'node-{index}/eth1', f'node-{index + 1}/eth0'],
+                   [['Delay', '2ms'], ['DataRate', '1Gbps']])
+        for index in range(nodes_count - 1)
+    ]
+    registers = [
+        Register('Bytes', 'ns3::Ipv4PacketProbe',
+                 f'/NodeList/{index}/$ns3::Ipv4L3Protocol/Tx', '0s', f'tx-{index}')
+        for index in range(0, nodes_count, 100)
+    ]
+
+    return Model(
+        parameters=ModelParameters(name='synthetic',
+                                   duration='10s',
+                                   populate_tables=False,
+                                   precision=Precision.MS),
+        nodes=nodes,
+        connections=connections,
+        registers=registers
+    )
@@ -0,0 +1,415 @@
+import socket
+import struct
+from dataclasses import dataclass, field
+from typing import Dict, Hashable, Iterable, List, Optional, Set, Tuple
+
+from client.data.layout import SPACING
+from client.data.model import Model
+from client.data.topology import Graph, GraphDiff, known_positions, node_id
+
+# Bounding box in page pixels: left, top, right, bottom
+Box = Tuple[float, float, float, float]
+
+# Maximal number of items in one cell of quadtree
+CELL_CAPACITY = 16
+# Depth of quadtree is limited for nodes sharing one position
+MAX_DEPTH = 24
+# Id prefix of clusters of quadtree cells
+CELL_PREFIX = 'cluster:cell:'
+
+
+@dataclass
+class Cluster:
+    """ Group of graph nodes shown as one node when zoomed out
+
+    Children are ids of graph nodes or of nested clusters
+    """
+    id: str
+    label: str
+    children: List[Hashable]
+    size: int
+    box: Box
+
+    @property
+    def center(self) -> Tuple[float, float]:
+        return (self.box[0] + self.box[2]) / 2, (self.box[1] + self.box[3]) / 2
+
+
+@dataclass
+class ClusterTree:
+    """ Hierarchy of clusters over graph with known positions """
+    clusters: Dict[str, Cluster] = field(default_factory=dict)
+    roots: List[Hashable] = field(default_factory=list)
+    # Cluster containing every graph node and cluster, None for roots
+    parents: Dict[Hashable, Optional[str]] = field(default_factory=dict)
+    # Ids of edges by the smallest cluster containing both their ends,
+    # so visible edges are found in expanded clusters only
+    cluster_edges: Dict[Optional[str], Set[str]] = field(default_factory=dict)
+    edge_clusters: Dict[str, Optional[str]] = field(default_factory=dict)
+
+
+def _bounding_box(points: Iterable[Tuple[float, float]]) -> Box:
+    xs, ys = zip(*points)
+    return min(xs), min(ys), max(xs), max(ys)
+
+
+def _merge_boxes(boxes: Iterable[Box]) -> Box:
+    left, top, right, bottom = zip(*boxes)
+    return min(left), min(top), max(right), max(bottom)
+
+
+def intersects(box: Box, other: Box) -> bool:
+    return not (box[2] < other[0] or box[0] > other[2]
+                or box[3] < other[1] or box[1] > other[3])
+
+
+def _subnet(model_node) -> Optional[str]:
+    # ipaddress module is too slow for every node of big models
+    for device in model_node.devices:
+        for address, netmask in device.ipv4_addresses:
+            try:
+                mask, = struct.unpack('!I', socket.inet_aton(netmask))
+                network, = struct.unpack('!I', socket.inet_aton(address))
+            except OSError:
+                continue
+            network = socket.inet_ntoa(struct.pack('!I', network & mask))
+            return f'{network}/{bin(mask).count("1")}'
+    return None
+
+
+def _semantic_groups(model: Model, graph: Graph) -> List[Tuple[str, str, List[Hashable]]]:
+    """ Group hubs of multi-point connections with their leaf nodes and
+    remaining nodes by IPv4 subnet of their first address
+    """
+    degree = dict.fromkeys(graph.nodes, 0)
+    neighbours = {}
+    for edge in graph.edges.values():
+        for src, dst in ((edge['from'], edge['to']), (edge['to'], edge['from'])):
+            degree[src] += 1
+            neighbours.setdefault(src, []).append(dst)
+
+    groups = []
+    grouped = set()
+    for item_id, item in graph.nodes.items():
+        if item.get('shape') != 'text':
+            continue
+        leaves = [other for other in neighbours.get(item_id, [])
+                  if degree[other] == 1 and other not in grouped]
+        if leaves:
+            groups.append((f'cluster:{item_id}', item['label'], [item_id] + leaves))
+            grouped.update(leaves)
+            grouped.add(item_id)
+
+    per_subnet = {}
+    for model_node in model.nodes:
+        item_id = node_id(model_node)
+        if item_id in grouped or item_id not in graph.nodes:
+            continue
+        subnet = _subnet(model_node)
+        if subnet is not None:
+            per_subnet.setdefault(subnet, []).append(item_id)
+
+    for subnet, members in per_subnet.items():
+        if len(members) > 1:
+            groups.append((f'cluster:subnet:{subnet}', subnet, members))
+
+    return groups
+
+
+def build_cluster_tree(model: Model, graph: Graph) -> ClusterTree:
+    """ Build hierarchy of clusters of graph
+
+    Hubs with their leaves and nodes of one subnet are grouped first, if
+    they are laid out close to each other. Then the groups and remaining
+    nodes are split by a quadtree over their positions, so every cluster
+    has a bounded number of children.
+
+    :param model: model the graph is built from
+    :param graph: graph whose nodes all have positions
+    """
+    tree = ClusterTree()
+    positions = known_positions(graph)
+
+    # Items placed into quadtree, with their boxes and number of nodes
+    items: Dict[Hashable, Tuple[Box, int]] = {
+        item_id: ((x, y, x, y), 1) for item_id, (x, y) in positions.items()
+    }
+    for cluster_id, label, members in _semantic_groups(model, graph):
+        members = [member for member in members if member in positions]
+        if len(members) < 2:
+            continue
+        box = _bounding_box(positions[member] for member in members)
+        # Scattered group would be expanded at any zoom, its nodes stay alone
+        if max(box[2] - box[0], box[3] - box[1]) > SPACING * len(members):
+            continue
+        tree.clusters[cluster_id] = Cluster(cluster_id, f'{label} ({len(members)})',
+                                            members, len(members), box)
+        for member in members:
+            del items[member]
+            tree.parents[member] = cluster_id
+        items[cluster_id] = (box, len(members))
+
+    if items:
+        tree.roots = _split(tree, items, _centers(items), list(items),
+                            _merge_boxes(box for box, _ in items.values()), '')
+    for item_id in tree.roots:
+        tree.parents[item_id] = None
+    for edge_id, edge in graph.edges.items():
+        _index_edge(tree, edge_id, edge)
+    return tree
+
+
+def _centers(items: Dict[Hashable, Tuple[Box, int]]) -> Dict[Hashable, Tuple[float, float]]:
+    return {item_id: ((box[0] + box[2]) / 2, (box[1] + box[3]) / 2)
+            for item_id, (box, _) in items.items()}
+
+
+def _split(tree: ClusterTree, items: Dict[Hashable, Tuple[Box, int]],
+           centers: Dict[Hashable, Tuple[float, float]],
+           item_ids: List[Hashable], cell: Box, path: str) -> List[Hashable]:
+    """ Get items representing quadtree cell, cluster is created for
+    crowded cells
+
+    :param items: boxes and numbers of nodes of items, created clusters are added
+    :param path: quadrants leading to cell, its length is depth of cell
+    """
+    if len(item_ids) <= CELL_CAPACITY or len(path) == MAX_DEPTH:
+        return item_ids
+
+    middle_x, middle_y = (cell[0] + cell[2]) / 2, (cell[1] + cell[3]) / 2
+    quadrants = [[], [], [], []]
+    for item_id in item_ids:
+        x, y = centers[item_id]
+        quadrants[(x >= middle_x) + 2 * (y >= middle_y)].append(item_id)
+
+    children = []
+    for quadrant, quadrant_items in enumerate(quadrants):
+        if not quadrant_items:
+            continue
+        right, bottom = quadrant % 2, quadrant // 2
+        quadrant_cell = (middle_x if right else cell[0], middle_y if bottom else cell[1],
+                         cell[2] if right else middle_x, cell[3] if bottom else middle_y)
+        quadrant_children = _split(tree, items, centers, quadrant_items, quadrant_cell,
+                                   f'{path}{quadrant}')
+        if len(quadrant_children) == 1:
+            children.extend(quadrant_children)
+            continue
+
+        cluster_id = f'{CELL_PREFIX}{path}{quadrant}'
+        size = sum(items[child][1] for child in quadrant_children)
+        box = _merge_boxes(items[child][0] for child in quadrant_children)
+        tree.clusters[cluster_id] = Cluster(cluster_id, f'{size} nodes',
+                                            quadrant_children, size, box)
+        for child in quadrant_children:
+            tree.parents[child] = cluster_id
+        items[cluster_id] = (box, size)
+        children.append(cluster_id)
+    return children
+
+
+def _common_cluster(tree: ClusterTree, item_id: Hashable, other: Hashable) -> Optional[str]:
+    cluster_id = tree.parents[item_id]
+    if cluster_id == tree.parents[other]:
+        return cluster_id
+    ancestors = set()
+    while cluster_id is not None:
+        ancestors.add(cluster_id)
+        cluster_id = tree.parents[cluster_id]
+    cluster_id = tree.parents[other]
+    while cluster_id is not None and cluster_id not in ancestors:
+        cluster_id = tree.parents[cluster_id]
+    return cluster_id
+
+
+def _index_edge(tree: ClusterTree, edge_id: str, edge: dict):
+    # Edges of nodes without position are not shown
+    if edge['from'] in tree.parents and edge['to'] in tree.parents:
+        cluster_id = _common_cluster(tree, edge['from'], edge['to'])
+        tree.edge_clusters[edge_id] = cluster_id
+        tree.cluster_edges.setdefault(cluster_id, set()).add(edge_id)
+
+
+def _unindex_edge(tree: ClusterTree, edge_id: str):
+    if edge_id in tree.edge_clusters:
+        cluster_id = tree.edge_clusters.pop(edge_id)
+        edges = tree.cluster_edges[cluster_id]
+        edges.discard(edge_id)
+        if not edges:
+            del tree.cluster_edges[cluster_id]
+
+
+def _item_box(tree: ClusterTree, graph: Graph, item_id: Hashable) -> Tuple[Box, int]:
+    cluster = tree.clusters.get(item_id)
+    if cluster is not None:
+        return cluster.box, cluster.size
+    item = graph.nodes[item_id]
+    return (item['x'], item['y'], item['x'], item['y']), 1
+
+
+def _refresh(tree: ClusterTree, graph: Graph, cluster_id: Optional[str]):
+    """ Recompute sizes, boxes and labels of cluster and its ancestors """
+    while cluster_id is not None:
+        cluster = tree.clusters[cluster_id]
+        boxes = [_item_box(tree, graph, child) for child in cluster.children]
+        cluster.size = sum(size for _, size in boxes)
+        cluster.box = _merge_boxes(box for box, _ in boxes)
+        if cluster_id.startswith(CELL_PREFIX):
+            cluster.label = f'{cluster.size} nodes'
+        else:
+            cluster.label = f'{cluster.label.rpartition(" (")[0]} ({cluster.size})'
+        cluster_id = tree.parents[cluster_id]
+
+
+def _detach(tree: ClusterTree, graph: Graph, item_id: Hashable):
+    """ Remove item from its cluster, clusters left empty are removed """
+    cluster_id = tree.parents.pop(item_id)
+    if cluster_id is None:
+        tree.roots.remove(item_id)
+        return
+    cluster = tree.clusters[cluster_id]
+    cluster.children.remove(item_id)
+    if cluster.children:
+        _refresh(tree, graph, cluster_id)
+    else:
+        del tree.clusters[cluster_id]
+        _detach(tree, graph, cluster_id)
+
+
+def _attach(tree: ClusterTree, graph: Graph, item_id: Hashable):
+    """ Add graph node to the quadtree cell closest to its position,
+    the cell is split if it gets crowded
+    """
+    item = graph.nodes[item_id]
+    x, y = item['x'], item['y']
+
+    def distance(cluster_id):
+        left, top, right, bottom = tree.clusters[cluster_id].box
+        return max(left - x, x - right, 0) + max(top - y, y - bottom, 0)
+
+    cluster_id, children = None, tree.roots
+    while True:
+        cells = [child for child in children if str(child).startswith(CELL_PREFIX)]
+        if not cells:
+            break
+        cluster_id = min(cells, key=distance)
+        children = tree.clusters[cluster_id].children
+
+    children.append(item_id)
+    tree.parents[item_id] = cluster_id
+    if len(children) <= CELL_CAPACITY:
+        _refresh(tree, graph, cluster_id)
+        return
+
+    # Edges between children of split cell may get into the new clusters
+    items = {child: _item_box(tree, graph, child) for child in children}
+    path = cluster_id[len(CELL_PREFIX):] if cluster_id is not None else ''
+    cell = _merge_boxes(box for box, _ in items.values())
+    children[:] = _split(tree, items, _centers(items), list(children), cell, path)
+    for child in children:
+        tree.parents[child] = cluster_id
+    _refresh(tree, graph, cluster_id)
+    for edge_id in list(tree.cluster_edges.get(cluster_id, ())):
+        _unindex_edge(tree, edge_id)
+        _index_edge(tree, edge_id, graph.edges[edge_id])
+
+
+def update_cluster_tree(tree: ClusterTree, graph: Graph, diff: GraphDiff):
+    """ Apply change of graph to its cluster tree
+
+    New nodes are added to quadtree cells next to them, removed ones leave
+    their clusters. Only the touched clusters and their ancestors are
+    updated, moved nodes stay in their clusters. Groups of hubs and subnets
+    are formed when the tree is built again.
+
+    :param graph: graph with the change applied, new nodes have positions
+    :param diff: change of graph returned by `update_graph`
+    """
+    for edge_id in diff.removed_edges:
+        _unindex_edge(tree, edge_id)
+    for edge in diff.edges:
+        _unindex_edge(tree, edge['id'])
+    for item_id in diff.removed_nodes:
+        if item_id in tree.parents:
+            _detach(tree, graph, item_id)
+    for item in diff.nodes:
+        if item['id'] in tree.parents:
+            _refresh(tree, graph, tree.parents[item['id']])
+        elif 'x' in item:
+            _attach(tree, graph, item['id'])
+    for edge in diff.edges:
+        _index_edge(tree, edge['id'], edge)
+
+
+def expanded_clusters(tree: ClusterTree, viewport: Box, scale: float,
+                      min_size: float, pinned: Set[str] = frozenset()) -> Set[str]:
+    """ Get clusters which should be expanded at given view
+
+    Cluster is expanded if it intersects viewport and it is either pinned or
+    at least `min_size` pixels large on screen
+
+    :param viewport: visible part of page in page pixels
+    :param scale: zoom of page, screen pixels per page pixel
+    """
+    expanded = set()
+    stack = [item_id for item_id in tree.roots if item_id in tree.clusters]
+    while stack:
+        cluster = tree.clusters[stack.pop()]
+        if not intersects(cluster.box, viewport):
+            continue
+        left, top, right, bottom = cluster.box
+        if cluster.id in pinned or max(right - left, bottom - top) * scale >= min_size:
+            expanded.add(cluster.id)
+            stack.extend(child for child in cluster.children if child in tree.clusters)
+    return expanded
+
+
+def visible_graph(graph: Graph, tree: ClusterTree, expanded: Set[str]) -> Graph:
+    """ Get graph with collapsed clusters replaced by single nodes
+
+    Edges between collapsed clusters are merged into one edge whose `value`
+    is the number of merged edges
+    """
+    visible = Graph()
+    # Expanded clusters whose ancestors are expanded too, None for roots
+    opened = [None]
+
+    stack = list(tree.roots)
+    while stack:
+        item_id = stack.pop()
+        cluster = tree.clusters.get(item_id)
+        if cluster is None:
+            visible.nodes[item_id] = graph.nodes[item_id]
+        elif item_id in expanded:
+            opened.append(item_id)
+            stack.extend(cluster.children)
+        else:
+            x, y = cluster.center
+            visible.nodes[item_id] = {'id': item_id, 'label': cluster.label,
+                                      'x': x, 'y': y, 'value': cluster.size}
+
+    def owner(item_id, top):
+        """ Visible node representing graph node below opened cluster """
+        shown = item_id
+        cluster_id = tree.parents[item_id]
+        while cluster_id != top:
+            if cluster_id not in expanded:
+                shown = cluster_id
+            cluster_id = tree.parents[cluster_id]
+        return shown
+
+    # Edges are visible if clusters containing both their ends are opened
+    merged = {}
+    for cluster_id in opened:
+        for edge_id in tree.cluster_edges.get(cluster_id, ()):
+            edge = graph.edges[edge_id]
+            src, dst = owner(edge['from'], cluster_id), owner(edge['to'], cluster_id)
+            if src == edge['from'] and dst == edge['to']:
+                visible.edges[edge_id] = edge
+            else:
+                merged[src, dst] = merged.get((src, dst), 0) + 1
+
+    for (src, dst), count in merged.items():
+        edge_id = f'{src}-{dst}'
+        visible.edges[edge_id] = {'id': edge_id, 'from': src, 'to': dst, 'value': count}
+
+    return visible
@@ -0,0 +1,36 @@
+from dataclasses import dataclass
+from enum import Enum, auto
+from typing import Any, Callable
+
+
+class Change(Enum):
+    NODE_ADDED = auto()
+    NODE_REMOVED = auto()
+    NODE_RENAMED = auto()
+    NODE_CHANGED = auto()
+    CONNECTION_ADDED = auto()
+    CONNECTION_REMOVED = auto()
+    CONNECTION_CHANGED = auto()
+    REGISTER_ADDED = auto()
+    REGISTER_REMOVED = auto()
+    REGISTER_CHANGED = auto()
+    # Whole list of nodes, connections or registers was assigned
+    RESET = auto()
+
+
+@dataclass
+class ModelEvent:
+    """ Change of model
+
+    `row` is position of the object in its list, after the change for added
+    and changed objects and before it for removed ones. `old` is the replaced
+    object for changed objects, old name for renamed nodes and name of the
+    list for reset.
+    """
+    change: Change
+    row: int = -1
+    obj: Any = None
+    old: Any = None
+
+
+Observer = Callable[[ModelEvent], None]
@@ -0,0 +1,161 @@
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from client.data.objects import Connection, Device, Node
+
+
+def device_path(node: Node, device: Device) -> str:
+    """ Interface path of device as used by connections, `node/device` """
+    return f'{node.name}/{device.name}'
+
+
+def path_node(path: str) -> str:
+    """ Node name of interface path """
+    return path.split('/', 1)[0]
+
+
+class _Shared(list):
+    """ Objects indexed under the same key, most keys have one object
+    which is stored without a list
+    """
+
+
+def _add(table: dict, key: str, value):
+    existing = table.get(key)
+    if existing is None:
+        table[key] = value
+    elif type(existing) is _Shared:
+        existing.append(value)
+    else:
+        table[key] = _Shared((existing, value))
+
+
+def _remove(table: dict, key: str, value):
+    """ Remove value from table by identity, equal copies may be indexed too """
+    existing = table.get(key)
+    if existing is value:
+        del table[key]
+    elif type(existing) is _Shared:
+        for i, item in enumerate(existing):
+            if item is value:
+                del existing[i]
+                break
+        if len(existing) == 1:
+            table[key] = existing[0]
+
+
+def _first(table: dict, key: str):
+    existing = table.get(key)
+    return existing[0] if type(existing) is _Shared else existing
+
+
+def _all(table: dict, key: str) -> list:
+    existing = table.get(key)
+    if existing is None:
+        return []
+    return list(existing) if type(existing) is _Shared else [existing]
+
+
+class ModelIndex:
+    """ Lookup tables of model objects
+
+    Node by name, device by `node/device` path and connections by interface
+    path and by node name. Names are not unique while the user edits the model, so a key may
+    refer to several objects, lookups return the one added first. Positions
+    of objects in model lists are remembered too, see `row`.
+    """
+
+    def __init__(self, nodes: Iterable[Node] = (),
+                 connections: Iterable[Connection] = ()) -> None:
+        self.nodes: Dict[str, Node] = {}
+        # Device path to its node, devices are looked up in node by name
+        self.devices: Dict[str, Node] = {}
+        self.connections: Dict[str, Connection] = {}
+        # Node name to connections using any of its interfaces
+        self.endpoints: Dict[str, Connection] = {}
+        # Model list name to positions of its objects by object id,
+        # checked on use, as inserted and removed objects shift them
+        self.rows: Dict[str, Dict[int, int]] = {'nodes': {}, 'connections': {}}
+        for row, node in enumerate(nodes):
+            self.add_node(node)
+            self.rows['nodes'][id(node)] = row
+        for row, connection in enumerate(connections):
+            self.add_connection(connection)
+            self.rows['connections'][id(connection)] = row
+
+    def node(self, name: str) -> Optional[Node]:
+        return _first(self.nodes, name)
+
+    def device(self, path: str) -> Optional[Tuple[Node, Device]]:
+        node = _first(self.devices, path)
+        if node is None:
+            return None
+        name = path[len(node.name) + 1:]
+        return node, next(device for device in node.devices if device.name == name)
+
+    def connections_of(self, path: str) -> List[Connection]:
+        return _all(self.connections, path)
+
+    def connections_at(self, name: str) -> List[Connection]:
+        return _all(self.endpoints, name)
+
+    def device_paths(self) -> List[str]:
+        return list(self.devices)
+
+    def row(self, collection: str, items: list, obj) -> int:
+        """ Position of object in model list `collection` by identity
+
+        List is scanned only when the remembered position is missing or
+        shifted by inserted or removed objects, so edits of objects found
+        by name cost O(1)
+        """
+        rows = self.rows.get(collection)
+        row = None if rows is None else rows.get(id(obj))
+        if row is None or row >= len(items) or items[row] is not obj:
+            rows = self.rows[collection] = {id(item): row for row, item in enumerate(items)}
+            row = rows.get(id(obj))
+            if row is None:
+                raise ValueError(f'{obj!r} is not in model')
+        return row
+
+    def set_row(self, collection: str, obj, row: int):
+        """ Remember position of object put into model list """
+        rows = self.rows.get(collection)
+        if rows is not None:
+            rows[id(obj)] = row
+
+    def add_node(self, node: Node):
+        _add(self.nodes, node.name, node)
+        for device in node.devices:
+            _add(self.devices, device_path(node, device), node)
+
+    def remove_node(self, node: Node):
+        _remove(self.nodes, node.name, node)
+        for device in node.devices:
+            _remove(self.devices, device_path(node, device), node)
+
+    def add_connection(self, connection: Connection):
+        # Connection listing an interface or node twice is indexed once under it
+        for path in dict.fromkeys(connection.interfaces):
+            _add(self.connections, path, connection)
+        for name in dict.fromkeys(map(path_node, connection.interfaces)):
+            _add(self.endpoints, name, connection)
+
+    def remove_connection(self, connection: Connection):
+        for path in dict.fromkeys(connection.interfaces):
+            _remove(self.connections, path, connection)
+        for name in dict.fromkeys(map(path_node, connection.interfaces)):
+            _remove(self.endpoints, name, connection)
+
+    def add(self, collection: str, obj):
+        """ Index object added to model list `collection` """
+        if collection == 'nodes':
+            self.add_node(obj)
+        elif collection == 'connections':
+            self.add_connection(obj)
+
+    def remove(self, collection: str, obj):
+        """ Drop object removed from model list `collection` """
+        if collection == 'nodes':
+            self.remove_node(obj)
+        elif collection == 'connections':
+            self.remove_connection(obj)
@@ -0,0 +1,211 @@
+from collections import deque
+from contextlib import contextmanager
+from copy import deepcopy
+from dataclasses import dataclass, field
+from typing import Any, Deque, List, Optional, Tuple, Union
+
+# Path of value from root object, attribute names and list positions,
+# e.g. ('nodes', 3, 'ipv4_routes', 0, 'metric')
+Path = Tuple[Union[str, int], ...]
+
+
+def resolve(root, path: Path):
+    """ Get value at path """
+    for key in path:
+        root = root[key] if isinstance(key, int) else getattr(root, key)
+    return root
+
+
+def set_value(root, path: Path, value) -> Any:
+    """ Set value at path, returns the old value """
+    if len(path) > 1 and isinstance(path[-2], int):
+        table = resolve(root, path[:-2])
+        # Tables storing rows themselves, e.g. `RouteTable` and `AttributeTable`,
+        # set fields themselves
+        if hasattr(table, 'set_field'):
+            return table.set_field(path[-2], path[-1], value)
+    parent = resolve(root, path[:-1])
+    key = path[-1]
+    if isinstance(key, int):
+        old = parent[key]
+        parent[key] = value
+    else:
+        old = getattr(parent, key)
+        setattr(parent, key, value)
+    return old
+
+
+def insert_item(root, path: Path, row: int, obj):
+    """ Insert object into list at path """
+    resolve(root, path).insert(row, obj)
+
+
+def remove_item(root, path: Path, row: int) -> Any:
+    """ Remove object from list at path, returns the object """
+    return resolve(root, path).pop(row)
+
+
+def _set(target, path: Path, value):
+    # Model keeps its indexes and observers up to date itself
+    if hasattr(target, 'set_value'):
+        target.set_value(path, value)
+    else:
+        set_value(target, path, value)
+
+
+def _insert(target, path: Path, row: int, obj):
+    if hasattr(target, 'insert_item'):
+        target.insert_item(path, row, obj)
+    else:
+        insert_item(target, path, row, obj)
+
+
+def _remove(target, path: Path, row: int):
+    if hasattr(target, 'remove_item'):
+        target.remove_item(path, row)
+    else:
+        remove_item(target, path, row)
+
+
+@dataclass
+class SetValue:
+    path: Path
+    old: Any
+    new: Any
+    # Copy of `new` made when the command is recorded, objects put into
+    # root are edited in place by later commands
+    snapshot: Any = field(default=None, repr=False, compare=False)
+
+    def freeze(self):
+        self.snapshot = deepcopy(self.new)
+
+    def apply(self, target, copy: bool = False):
+        _set(target, self.path, deepcopy(self.snapshot) if copy else self.new)
+
+    def revert(self, target):
+        _set(target, self.path, self.old)
+
+
+@dataclass
+class InsertItem:
+    path: Path
+    row: int
+    obj: Any
+    # Copy of `obj` made when the command is recorded, see `SetValue`
+    snapshot: Any = field(default=None, repr=False, compare=False)
+
+    def freeze(self):
+        self.snapshot = deepcopy(self.obj)
+
+    def apply(self, target, copy: bool = False):
+        _insert(target, self.path, self.row,
+                deepcopy(self.snapshot) if copy else self.obj)
+
+    def revert(self, target):
+        _remove(target, self.path, self.row)
+
+
+@dataclass
+class RemoveItem:
+    path: Path
+    row: int
+    obj: Any
+
+    def freeze(self):
+        # Removed object is not applied to copies of root
+        pass
+
+    def apply(self, target, copy: bool = False):
+        _remove(target, self.path, self.row)
+
+    def revert(self, target):
+        _insert(target, self.path, self.row, self.obj)
+
+
+Command = Union[SetValue, InsertItem, RemoveItem]
+
+
+class Journal:
+    """ Bounded history of edits for undo and redo
+
+    Commands address edited values by path from the root object, which is
+    a `Model` or an object edited in a dialog, so they hold only edited
+    values and are applied in O(1). At most `limit` commands are kept,
+    older ones are applied to `base` copy of the root if it is given, so
+    `replay` onto a copy of `base` rebuilds the edited root. Objects put
+    into the root are copied when their command is recorded, so their later
+    in-place edits reach copies only through their own commands.
+    """
+
+    def __init__(self, limit: int = 1000, base=None) -> None:
+        self.limit = limit
+        self.base = base
+        self.done: Deque[Command] = deque()
+        self.undone: List[Command] = []
+        # Number of commands dropped without base
+        self.dropped = 0
+        # Commands applied by undo and redo are not recorded
+        self._paused = False
+
+    def record(self, command: Command):
+        if self._paused:
+            return
+        command.freeze()
+        self.done.append(command)
+        self.undone.clear()
+        if len(self.done) > self.limit:
+            oldest = self.done.popleft()
+            if self.base is not None:
+                oldest.apply(self.base, copy=True)
+            else:
+                self.dropped += 1
+
+    @contextmanager
+    def _unrecorded(self):
+        self._paused = True
+        try:
+            yield
+        finally:
+            self._paused = False
+
+    def execute(self, target, command: Command):
+        """ Apply command to target and record it """
+        with self._unrecorded():
+            command.apply(target)
+        self.record(command)
+
+    def can_undo(self) -> bool:
+        return bool(self.done)
+
+    def can_redo(self) -> bool:
+        return bool(self.undone)
+
+    def undo(self, target) -> Optional[Command]:
+        """ Revert the last command on target, returns it """
+        if not self.done:
+            return None
+        command = self.done.pop()
+        with self._unrecorded():
+            command.revert(target)
+        self.undone.append(command)
+        return command
+
+    def redo(self, target) -> Optional[Command]:
+        """ Apply the last undone command to target, returns it """
+        if not self.undone:
+            return None
+        command = self.undone.pop()
+        with self._unrecorded():
+            command.apply(target)
+        self.done.append(command)
+        return command
+
+    def replay(self, target):
+        """ Apply kept commands to target, a copy of `base` or of the root
+        as it was when recording started
+        """
+        if self.dropped:
+            raise ValueError(f'{self.dropped} commands were dropped, '
+                             f'journal without base can not be replayed')
+        for command in self.done:
+            command.apply(target, copy=True)
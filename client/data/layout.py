@@ -0,0 +1,228 @@
+import math
+import random
+from collections import deque
+from typing import Dict, Hashable, List, Optional, Sequence, Tuple
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from client.data.objects import Position
+from client.data.topology import Graph
+
+# Distance between neighbour nodes in page pixels
+SPACING = 100.0
+
+
+def _edge_indices(graph: Graph, index: Dict[Hashable, int]) -> List[Tuple[int, int]]:
+    return [(index[edge['from']], index[edge['to']])
+            for edge in graph.edges.values()
+            if edge['from'] in index and edge['to'] in index]
+
+
+def hierarchical_layout(count: int, edges: Sequence[Tuple[int, int]]) -> List[Position]:
+    """ Layered layout for tree-like graphs
+
+    Every connected component is laid out by BFS from its node with the
+    highest degree, one level per row, components are placed side by side.
+
+    :param count: number of nodes
+    :param edges: pairs of node indices
+    :return: position of every node, distance between neighbours is 1
+    """
+    adjacency = [[] for _ in range(count)]
+    for src, dst in edges:
+        adjacency[src].append(dst)
+        adjacency[dst].append(src)
+
+    positions = [(0.0, 0.0)] * count
+    visited = [False] * count
+    offset = 0.0
+    for root in sorted(range(count), key=lambda node: -len(adjacency[node])):
+        if visited[root]:
+            continue
+
+        levels = []
+        visited[root] = True
+        queue = deque([(root, 0)])
+        while queue:
+            node, level = queue.popleft()
+            if level == len(levels):
+                levels.append([])
+            levels[level].append(node)
+            for neighbour in adjacency[node]:
+                if not visited[neighbour]:
+                    visited[neighbour] = True
+                    queue.append((neighbour, level + 1))
+
+        width = max(map(len, levels))
+        for level, nodes in enumerate(levels):
+            start = offset + (width - len(nodes)) / 2
+            for order, node in enumerate(nodes):
+                positions[node] = (start + order, float(level))
+        offset += width + 1
+
+    return positions
+
+
+def radial_layout(count: int, edges: Sequence[Tuple[int, int]]) -> List[Position]:
+    """ BFS levels of `hierarchical_layout` placed on concentric circles,
+    used as initial positions of force-directed layout
+    """
+    levels = {}
+    for node, (x, level) in enumerate(hierarchical_layout(count, edges)):
+        levels.setdefault(level, []).append((x, node))
+
+    positions = [(0.0, 0.0)] * count
+    for level, nodes in levels.items():
+        nodes.sort()
+        for order, (_, node) in enumerate(nodes):
+            angle = 2 * math.pi * order / len(nodes)
+            positions[node] = ((level + 1) * math.cos(angle),
+                               (level + 1) * math.sin(angle))
+    return positions
+
+
+def force_layout(count: int, edges: Sequence[Tuple[int, int]],
+                 iterations: int = 50, seed: int = 0,
+                 initial: Optional[Sequence[Position]] = None) -> List[Position]:
+    """ Force-directed layout vectorized with NumPy
+
+    Fruchterman-Reingold forces, repulsion uses grid approximation: every
+    node is repelled by centers of mass of its own and 8 neighbour cells,
+    farther nodes are ignored. One iteration costs O(nodes + edges).
+
+    :param count: number of nodes
+    :param edges: pairs of node indices
+    :param iterations: number of iterations
+    :param seed: seed of random initial positions
+    :param initial: initial positions instead of random ones
+    :return: position of every node, ideal edge length is 1
+    """
+    if count == 0:
+        return []
+
+    rng = np.random.default_rng(seed)
+    side = math.sqrt(count)
+    if initial is None:
+        pos = rng.uniform(0, side, (count, 2))
+    else:
+        pos = np.array(initial, dtype=float).reshape(count, 2)
+        # Split coincident nodes
+        pos += rng.uniform(-0.01, 0.01, (count, 2))
+
+    edges = np.array(edges, dtype=np.int64).reshape(-1, 2)
+    src, dst = edges[:, 0], edges[:, 1]
+
+    cell_size = 2.0
+    temperature = side / 10
+    cooling = (0.01 / temperature) ** (1 / iterations) if temperature > 0.01 else 1
+    for _ in range(iterations):
+        disp = np.zeros((count, 2))
+
+        # Repulsion, k^2 / d with k = 1, from centers of mass of near cells
+        cells = np.floor((pos - pos.min(axis=0)) / cell_size).astype(np.int64)
+        grid_w, grid_h = cells.max(axis=0) + 3
+        flat = (cells[:, 0] + 1) * grid_h + cells[:, 1] + 1
+        mass = np.bincount(flat, minlength=grid_w * grid_h).astype(float)
+        sum_x = np.bincount(flat, weights=pos[:, 0], minlength=grid_w * grid_h)
+        sum_y = np.bincount(flat, weights=pos[:, 1], minlength=grid_w * grid_h)
+
+        for dx in (-1, 0, 1):
+            for dy in (-1, 0, 1):
+                cell = flat + dx * grid_h + dy
+                m, cx, cy = mass[cell], sum_x[cell], sum_y[cell]
+                if dx == 0 and dy == 0:
+                    # Exclude node itself from its own cell
+                    m = m - 1
+                    cx = cx - pos[:, 0]
+                    cy = cy - pos[:, 1]
+                present = m > 0
+                safe_m = np.where(present, m, 1)
+                delta_x = pos[:, 0] - cx / safe_m
+                delta_y = pos[:, 1] - cy / safe_m
+                dist2 = np.maximum(delta_x ** 2 + delta_y ** 2, 1e-4)
+                force = np.where(present, m / dist2, 0)
+                disp[:, 0] += delta_x * force
+                disp[:, 1] += delta_y * force
+
+        # Attraction, d^2 / k along edges
+        if len(src) > 0:
+            delta = pos[src] - pos[dst]
+            dist = np.sqrt((delta ** 2).sum(axis=1))[:, None]
+            pull = delta * dist
+            for axis in (0, 1):
+                disp[:, axis] -= np.bincount(src, weights=pull[:, axis], minlength=count)
+                disp[:, axis] += np.bincount(dst, weights=pull[:, axis], minlength=count)
+
+        # Move nodes, displacement is limited by temperature
+        length = np.maximum(np.sqrt((disp ** 2).sum(axis=1)), 1e-9)[:, None]
+        pos += disp / length * np.minimum(length, temperature)
+        temperature *= cooling
+
+    return [tuple(map(float, xy)) for xy in pos]
+
+
+def _place_near_neighbours(graph: Graph, known: Dict[Hashable, Position],
+                           seed: int) -> Dict[Hashable, Position]:
+    """ Place new nodes at center of their already placed neighbours """
+    neighbours = {node_id: [] for node_id in graph.nodes}
+    for edge in graph.edges.values():
+        if edge['from'] in neighbours and edge['to'] in neighbours:
+            neighbours[edge['from']].append(edge['to'])
+            neighbours[edge['to']].append(edge['from'])
+
+    rng = random.Random(seed)
+    positions = {node_id: known[node_id] for node_id in graph.nodes if node_id in known}
+    xs = [x for x, _ in positions.values()]
+    ys = [y for _, y in positions.values()]
+    box = (min(xs), min(ys), max(xs), max(ys))
+
+    # New nodes are placed in BFS order, so chains of new nodes grow from placed ones
+    queue = deque(node_id for node_id in graph.nodes if node_id not in positions)
+    postponed = 0
+    while queue:
+        node_id = queue.popleft()
+        placed = [positions[other] for other in neighbours[node_id] if other in positions]
+        if not placed and postponed < len(queue) + 1:
+            queue.append(node_id)
+            postponed += 1
+            continue
+        postponed = 0
+
+        if placed:
+            x = sum(x for x, _ in placed) / len(placed)
+            y = sum(y for _, y in placed) / len(placed)
+        else:
+            x = rng.uniform(box[0], box[2])
+            y = rng.uniform(box[1], box[3])
+        positions[node_id] = (x + rng.uniform(-0.5, 0.5) * SPACING,
+                              y + rng.uniform(-0.5, 0.5) * SPACING)
+
+    return positions
+
+
+def layout_graph(graph: Graph, known: Optional[Dict[Hashable, Position]] = None,
+                 seed: int = 0) -> Dict[Hashable, Position]:
+    """ Compute positions of graph nodes in page pixels
+
+    Nodes with `known` positions keep them and new nodes are placed next
+    to their neighbours. Without known positions tree-like graphs get
+    hierarchical layout and other ones force-directed layout.
+    """
+    if known and any(node_id in known for node_id in graph.nodes):
+        return _place_near_neighbours(graph, known, seed)
+
+    ids = list(graph.nodes)
+    index = {node_id: order for order, node_id in enumerate(ids)}
+    edges = _edge_indices(graph, index)
+
+    if len(edges) < len(ids) or np is None:
+        positions = hierarchical_layout(len(ids), edges)
+    else:
+        positions = force_layout(len(ids), edges, seed=seed,
+                                 initial=radial_layout(len(ids), edges))
+
+    return {node_id: (x * SPACING, y * SPACING)
+            for node_id, (x, y) in zip(ids, positions)}
@@ -0,0 +1,245 @@
+import re
+from array import array
+from typing import Iterable, List, Optional, Set, Tuple
+
+LEVELS = ('LOG', 'ERROR')
+
+# ns-3 log line with prefixes: "+1.0s 0 UdpEchoClientApplication:Send(): ..."
+_source_pattern = re.compile(r'(\w+):[\w~]+\(')
+
+
+class LogBuffer:
+    """ Ring buffer of simulation log lines
+
+    Every line gets sequence number, lines with numbers in `first..end-1`
+    are kept. Level and source of lines are stored as small integer codes.
+    """
+
+    def __init__(self, capacity: int) -> None:
+        self.capacity = capacity
+        self.first = 0
+        self.end = 0
+        self._texts: List[str] = []
+        self._levels = bytearray()
+        self._sources = array('I')
+        self.sources: List[str] = ['']
+        self._source_ids = {'': 0}
+
+    def __len__(self):
+        return self.end - self.first
+
+    def _source_id(self, text: str) -> int:
+        match = _source_pattern.search(text, 0, 200)
+        if match is None:
+            return 0
+        name = match.group(1)
+        source_id = self._source_ids.get(name)
+        if source_id is None:
+            source_id = len(self.sources)
+            self._source_ids[name] = source_id
+            self.sources.append(name)
+        return source_id
+
+    def append(self, level: str, text: str):
+        level_id = LEVELS.index(level)
+        source_id = self._source_id(text)
+
+        if len(self._texts) < self.capacity:
+            self._texts.append(text)
+            self._levels.append(level_id)
+            self._sources.append(source_id)
+        else:
+            index = self.end % self.capacity
+            self._texts[index] = text
+            self._levels[index] = level_id
+            self._sources[index] = source_id
+            self.first += 1
+        self.end += 1
+
+    def extend(self, lines: Iterable[Tuple[str, str]]):
+        for level, text in lines:
+            self.append(level, text)
+
+    def text(self, seq: int) -> str:
+        return self._texts[seq % self.capacity]
+
+    def texts(self, first: int, end: int) -> List[str]:
+        """ Get texts of lines with sequence numbers in `first..end-1` """
+        begin = first % self.capacity
+        if begin + end - first <= len(self._texts):
+            return self._texts[begin:begin + end - first]
+        return self._texts[begin:] + self._texts[:(end - first) - (len(self._texts) - begin)]
+
+    def level(self, seq: int) -> str:
+        return LEVELS[self._levels[seq % self.capacity]]
+
+    def source(self, seq: int) -> str:
+        return self.sources[self._sources[seq % self.capacity]]
+
+    def clear(self):
+        self.first = 0
+        self.end = 0
+        self._texts = []
+        self._levels = bytearray()
+        self._sources = array('I')
+
+
+class _SearchState:
+    """ Matching sequence numbers of lines for one query """
+
+    def __init__(self, query: str, matches: array, scanned: int) -> None:
+        self.query = query
+        self.matches = matches
+        # Index of first actual match in `matches`
+        self.start = 0
+        # Lines before this sequence number are checked
+        self.scanned = scanned
+
+    def __len__(self):
+        return len(self.matches) - self.start
+
+    def drop_before(self, first: int) -> int:
+        """ Drop matches evicted from buffer, return number of dropped """
+        start = self.start
+        matches = self.matches
+        while start < len(matches) and matches[start] < first:
+            start += 1
+
+        dropped = start - self.start
+        self.start = start
+        if start > 1024 and start * 2 > len(matches):
+            del matches[:start]
+            self.start = 0
+        return dropped
+
+
+class LogFilter:
+    """ Filtered view of `LogBuffer`
+
+    Lines are filtered by level, source and case-insensitive substring.
+    Search is incremental: when query is extended only previous matches
+    are checked, and results of shorter queries are kept, so erasing
+    characters doesn't rescan the buffer. New lines are checked once.
+    """
+
+    max_history = 32
+
+    def __init__(self, buffer: LogBuffer) -> None:
+        self.buffer = buffer
+        self.levels: Optional[Set[str]] = None
+        self.source: Optional[str] = None
+        self.query = ''
+        # Search states of typed queries, last one is shown.
+        # Empty if nothing is filtered and all lines are shown
+        self._history: List[_SearchState] = []
+        # Shown range of buffer when nothing is filtered
+        self._first = buffer.first
+        self._end = buffer.end
+
+    def __len__(self):
+        if not self._history:
+            return self._end - self._first
+        return len(self._history[-1])
+
+    def seq(self, row: int) -> int:
+        """ Get sequence number of line shown in `row` """
+        if not self._history:
+            return self._first + row
+        state = self._history[-1]
+        return state.matches[state.start + row]
+
+    def is_filtered(self) -> bool:
+        return self.levels is not None or self.source is not None or self.query != ''
+
+    def _matches(self, seq: int, query: str) -> bool:
+        buffer = self.buffer
+        if self.levels is not None and buffer.level(seq) not in self.levels:
+            return False
+        if self.source is not None and buffer.source(seq) != self.source:
+            return False
+        return query in buffer.text(seq).lower()
+
+    def _scan(self, seqs: Iterable[int], query: str) -> array:
+        return array('q', (seq for seq in seqs if self._matches(seq, query)))
+
+    def _scan_range(self, first: int, end: int, query: str) -> array:
+        """ Same as `_scan` for sequence range, blocks of lines not
+        containing query are skipped at once
+        """
+        if query == '':
+            return self._scan(range(first, end), query)
+
+        matches = array('q')
+        block_size = 1024
+        for block in range(first, end, block_size):
+            block_end = min(block + block_size, end)
+            text = '\n'.join(self.buffer.texts(block, block_end)).lower()
+            if query in text:
+                matches.extend(self._scan(range(block, block_end), query))
+        return matches
+
+    def _refresh(self, state: _SearchState) -> Tuple[int, int]:
+        buffer = self.buffer
+        dropped = state.drop_before(buffer.first)
+        new = self._scan_range(max(state.scanned, buffer.first), buffer.end,
+                               state.query)
+        state.matches.extend(new)
+        state.scanned = buffer.end
+        return dropped, len(new)
+
+    def set_filter(self, levels: Optional[Set[str]] = None, source: Optional[str] = None):
+        """ Set level and source filter, None disables filter """
+        self.levels = None if levels is None else set(levels)
+        self.source = source
+        self._history.clear()
+        self.set_query(self.query)
+
+    def set_query(self, query: str):
+        self.query = query = query.lower()
+        history = self._history
+        self._first = self.buffer.first
+        self._end = self.buffer.end
+        if not self.is_filtered():
+            history.clear()
+            return
+
+        # Go back to the state of a shorter query
+        while history and history[-1].query not in query:
+            history.pop()
+
+        if history:
+            self._refresh(history[-1])
+            if history[-1].query == query:
+                return
+
+            # Extended query, only previous matches are checked
+            state = history[-1]
+            matches = self._scan(state.matches[state.start:], query)
+        else:
+            buffer = self.buffer
+            matches = self._scan_range(buffer.first, buffer.end, query)
+
+        history.append(_SearchState(query, matches, self.buffer.end))
+        if len(history) > self.max_history:
+            del history[0]
+
+    def update(self) -> Tuple[int, int]:
+        """ Apply lines appended to buffer and evicted from it
+
+        :return: number of rows removed from the top and number of rows
+            added to the bottom
+        """
+        if self._history:
+            return self._refresh(self._history[-1])
+
+        buffer = self.buffer
+        removed = min(buffer.first, self._end) - self._first
+        added = buffer.end - max(self._end, buffer.first)
+        self._first = buffer.first
+        self._end = buffer.end
+        return removed, added
+
+    def reset(self):
+        """ Forget search results, must be called after buffer is cleared """
+        self._history.clear()
+        self.set_query(self.query)
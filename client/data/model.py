@@ -1,10 +1,17 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum, auto
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Iterator, List, Optional, TextIO, Tuple
 
+from client.data.events import Change, ModelEvent, Observer
+from client.data.index import ModelIndex
+from client.data.journal import (InsertItem, Journal, Path, RemoveItem, SetValue,
+                                 insert_item, remove_item, resolve, set_value)
+from client.data.session import INSERT, REMOVE, EditSession
 from client.data.objects import *
-from client.xml.serialize import (serialize_connections, serialize_node,
-                                  serialize_registers)
+from client.xml.cache import FragmentCache
+from client.xml.serialize import (CHUNK_SIZE, chunked,
+                                  serialize_connections_iter, serialize_node,
+                                  serialize_registers_iter)
 
 
 @dataclass
@@ -21,19 +28,333 @@ class Model:
     nodes: List[Node]
     connections: List[Connection]
     registers: List[Register]
+    fragments: FragmentCache = field(default_factory=FragmentCache, init=False,
+                                     repr=False, compare=False)
+    _index: Optional[ModelIndex] = field(default=None, init=False,
+                                         repr=False, compare=False)
+    _observers: List[Observer] = field(default_factory=list, init=False,
+                                       repr=False, compare=False)
+    _version: int = field(default=0, init=False, repr=False, compare=False)
+    # History of edits made by editing methods, not recorded if None
+    journal: Optional[Journal] = field(default=None, init=False,
+                                       repr=False, compare=False)
+
+    def __setattr__(self, name, value):
+        # Assigning new lists of nodes or connections invalidates the index
+        if name in ('nodes', 'connections'):
+            object.__setattr__(self, '_index', None)
+        object.__setattr__(self, name, value)
+        # and paths of recorded edits
+        if name in _CHANGES and self.__dict__.get('journal') is not None:
+            object.__setattr__(self, 'journal', Journal(self.journal.limit))
+        if name in _CHANGES and '_observers' in self.__dict__:
+            self._emit(ModelEvent(Change.RESET, old=name))
+
+    def subscribe(self, observer: Observer):
+        """ Call observer with `ModelEvent` after every change made
+        by the editing methods below
+        """
+        self._observers.append(observer)
+
+    def unsubscribe(self, observer: Observer):
+        self._observers.remove(observer)
+
+    @property
+    def version(self) -> int:
+        """ Number of changes made by editing methods """
+        return self._version
+
+    def _emit(self, event: ModelEvent):
+        self._version += 1
+        for observer in list(self._observers):
+            observer(event)
+
+    @property
+    def index(self) -> ModelIndex:
+        """ Lookup tables of nodes, devices and connections
+
+        Built on first use after nodes or connections are assigned and kept
+        up to date by the editing methods below. Objects changed in place
+        by other means must be put back with `replace_node` or
+        `replace_connection`.
+        """
+        if self._index is None:
+            self._index = ModelIndex(self.nodes, self.connections)
+        return self._index
+
+    def node(self, name: str) -> Optional[Node]:
+        """ Get node by name """
+        return self.index.node(name)
+
+    def device(self, path: str) -> Optional[Tuple[Node, Device]]:
+        """ Get node and its device by interface path `node/device` """
+        return self.index.device(path)
+
+    def connections_of(self, path: str) -> List[Connection]:
+        """ Get connections using interface `node/device` """
+        return self.index.connections_of(path)
+
+    def connections_at(self, name: str) -> List[Connection]:
+        """ Get connections using any interface of node """
+        return self.index.connections_at(name)
+
+    def device_paths(self) -> List[str]:
+        """ Get interface paths of all devices """
+        return self.index.device_paths()
+
+    def set_value(self, path: Path, value):
+        """ Set value at path from model, e.g. `('nodes', 0, 'name')`
+
+        Path of two items replaces the object in model list. Every edit
+        of model objects is made by this method, `insert_item` or
+        `remove_item`, which keep index up to date, notify observers and
+        record the edit in `journal`.
+        """
+        name, row = path[0], path[1]
+        items = getattr(self, name)
+        owner = items[row]
+        if self._index is not None:
+            self._index.remove(name, owner)
+        old = set_value(self, path, value)
+        if len(path) > 2:
+            touch(owner)
+        new_owner = items[row]
+        if self._index is not None:
+            self._index.add(name, new_owner)
+            self._index.set_row(name, new_owner, row)
+
+        if self.journal is not None:
+            self.journal.record(SetValue(path, old, value))
+        if name == 'nodes' and path[2:] == ('name',):
+            self._emit(ModelEvent(Change.NODE_RENAMED, row, owner, old))
+        else:
+            self._emit(ModelEvent(_CHANGES[name][2], row, new_owner, owner))
+
+    def insert_item(self, path: Path, row: int, obj):
+        """ Insert object into list at path, e.g. `('nodes',)` """
+        name = path[0]
+        if len(path) == 1:
+            self._edit_list(path, row, obj, InsertItem)
+            getattr(self, name).insert(row, obj)
+            if self._index is not None:
+                self._index.add(name, obj)
+                self._index.set_row(name, obj, row)
+            self._emit(ModelEvent(_CHANGES[name][0], row, obj))
+        else:
+            self._edit_owner(path, lambda: insert_item(self, path, row, obj))
+            self._edit_list(path, row, obj, InsertItem)
+
+    def remove_item(self, path: Path, row: int):
+        """ Remove object from list at path, e.g. `('nodes',)` """
+        name = path[0]
+        if len(path) == 1:
+            obj = getattr(self, name).pop(row)
+            if self._index is not None:
+                self._index.remove(name, obj)
+            self._edit_list(path, row, obj, RemoveItem)
+            self._emit(ModelEvent(_CHANGES[name][1], row, obj))
+        else:
+            obj = resolve(self, path)[row]
+            self._edit_list(path, row, obj, RemoveItem)
+            self._edit_owner(path, lambda: remove_item(self, path, row))
+
+    def _edit_list(self, path: Path, row: int, obj, command):
+        if self.journal is not None:
+            self.journal.record(command(path, row, obj))
+
+    def _edit_owner(self, path: Path, edit):
+        """ Edit list inside of model object, e.g. devices of node """
+        name, row = path[0], path[1]
+        owner = getattr(self, name)[row]
+        if self._index is not None:
+            self._index.remove(name, owner)
+        edit()
+        touch(owner)
+        if self._index is not None:
+            self._index.add(name, owner)
+        self._emit(ModelEvent(_CHANGES[name][2], row, owner, owner))
+
+    def _update(self, name: str, edited: list):
+        """ Merge edited copy of list into model
+
+        Objects are matched by revision, objects with the same revision are
+        kept, so only added, removed and changed objects produce events.
+        Copies are expected to keep order of the list, as edit dialogs do,
+        otherwise the list is replaced.
+        """
+        items = getattr(self, name)
+        revisions = {obj.revision for obj in items}
+        edited_revisions = {obj.revision for obj in edited}
+
+        row = 0
+        for obj in edited:
+            # Drop removed objects before the next kept or changed one
+            while row < len(items) and items[row].revision not in edited_revisions \
+                    and obj.revision in revisions:
+                self.remove_item((name,), row)
+            if row < len(items) and items[row].revision == obj.revision:
+                pass
+            elif obj.revision in revisions:
+                setattr(self, name, list(edited))
+                return
+            elif row < len(items) and items[row].revision not in edited_revisions:
+                self.set_value((name, row), obj)
+            else:
+                self.insert_item((name,), row, obj)
+            row += 1
+        while row < len(items):
+            self.remove_item((name,), row)
+
+    def commit(self, session: EditSession):
+        """ Apply edits made in session
+
+        Edits are replayed one by one, so committing costs O(edits) and
+        produces events of edited objects only. If the list was changed
+        since the session started, edited copy of it is merged as by
+        `update_nodes`.
+        """
+        name = session.collection
+        if getattr(self, name) is not session.base or self._version != session.version:
+            self._update(name, list(session.items))
+            return
+
+        for operation, row, obj in session.operations:
+            if operation == INSERT:
+                self.insert_item((name,), row, obj)
+            elif operation == REMOVE:
+                self.remove_item((name,), row)
+            else:
+                self.set_value((name, row), obj)
+
+    def _row(self, name: str, obj) -> int:
+        """ Position of object in model list by identity """
+        return self.index.row(name, getattr(self, name), obj)
+
+    def add_node(self, node: Node):
+        self.insert_item(('nodes',), len(self.nodes), node)
+
+    def remove_node(self, node: Node):
+        self.remove_item(('nodes',), self._row('nodes', node))
+
+    def replace_node(self, old: Node, new: Node):
+        """ Put edited copy of node in place of the old one """
+        self.set_value(('nodes', self._row('nodes', old)), new)
+
+    def update_nodes(self, nodes: List[Node]):
+        """ Merge edited copy of nodes list, see `_update` """
+        self._update('nodes', nodes)
+
+    def rename_node(self, node: Node, name: str):
+        self.set_value(('nodes', self._row('nodes', node), 'name'), name)
+
+    def add_device(self, node: Node, device: Device):
+        self.insert_item(('nodes', self._row('nodes', node), 'devices'),
+                         len(node.devices), device)
+
+    def remove_device(self, node: Node, device: Device):
+        self.remove_item(('nodes', self._row('nodes', node), 'devices'),
+                         _position(node.devices, device))
+
+    def rename_device(self, node: Node, device: Device, name: str):
+        self.set_value(('nodes', self._row('nodes', node), 'devices',
+                        _position(node.devices, device), 'name'), name)
+
+    def add_connection(self, connection: Connection):
+        self.insert_item(('connections',), len(self.connections), connection)
+
+    def remove_connection(self, connection: Connection):
+        self.remove_item(('connections',), self._row('connections', connection))
+
+    def replace_connection(self, old: Connection, new: Connection):
+        """ Put edited copy of connection in place of the old one """
+        self.set_value(('connections', self._row('connections', old)), new)
+
+    def update_connections(self, connections: List[Connection]):
+        """ Merge edited copy of connections list, see `_update` """
+        self._update('connections', connections)
+
+    def set_interfaces(self, connection: Connection, interfaces: List[str]):
+        self.set_value(('connections', self._row('connections', connection),
+                        'interfaces'), interfaces)
+
+    def add_register(self, register: Register):
+        self.insert_item(('registers',), len(self.registers), register)
+
+    def remove_register(self, register: Register):
+        self.remove_item(('registers',), self._row('registers', register))
+
+    def replace_register(self, old: Register, new: Register):
+        self.set_value(('registers', self._row('registers', old)), new)
+
+    def update_registers(self, registers: List[Register]):
+        """ Merge edited copy of registers list, see `_update` """
+        self._update('registers', registers)
 
     def convert_to_xml(self):
-        return '<?xml version="1.0" encoding="UTF-8"?>' + self._serialize()
+        return ''.join(self.iter_xml())
 
-    def _serialize(self):
-        return f'<model name="{self.parameters.name}">' \
+    def iter_xml(self) -> Iterator[str]:
+        """ Serialize model into a stream of XML fragments
+
+        Fragments are produced one node, connection or register at a time,
+        so the whole document is never held in memory. Fragments of objects
+        not changed since the previous pass are taken from `fragments` cache.
+        """
+        self.fragments.begin()
+        yield '<?xml version="1.0" encoding="UTF-8"?>'
+        yield f'<model name="{self.parameters.name}">' \
             + f'<populate-routing-tables>{str(self.parameters.populate_tables).lower()}</populate-routing-tables>' \
             + f'<duration>{self.parameters.duration}</duration>' \
-            + f'<precision>{self.parameters.precision.name}</precision>' \
-            + ''.join(map(serialize_node, self.nodes)) \
-            + serialize_connections(self.connections) \
-            + serialize_registers(self.registers) \
-            + '</model>'
+            + f'<precision>{self.parameters.precision.name}</precision>'
+        for node in self.nodes:
+            yield self.fragments.get(node, serialize_node)
+        yield from serialize_connections_iter(self.connections, self.fragments)
+        yield from serialize_registers_iter(self.registers, self.fragments)
+        yield '</model>'
+        self.fragments.end()
+
+    def xml_snapshot(self) -> Tuple[str, ...]:
+        """ Serialize model into a tuple of XML fragments
+
+        The whole pass, including use of `fragments` cache, runs on the
+        calling thread, so the snapshot can be sent by another thread while
+        the model is edited. Fragments are shared with the cache, the tuple
+        adds a reference per object.
+        """
+        return tuple(self.iter_xml())
+
+    def iter_xml_chunks(self, chunk_size: int = CHUNK_SIZE) -> Iterator[str]:
+        """ Same as `iter_xml`, but fragments are joined into chunks
+        of about `chunk_size` characters
+        """
+        return chunked(self.iter_xml(), chunk_size)
+
+    def write_xml(self, file: TextIO):
+        """ Write model XML into file-like object without building
+        the whole document in memory
+        """
+        for chunk in self.iter_xml_chunks():
+            file.write(chunk)
+
+
+# Added, removed and changed events of model lists
+_CHANGES = {
+    'nodes': (Change.NODE_ADDED, Change.NODE_REMOVED, Change.NODE_CHANGED),
+    'connections': (Change.CONNECTION_ADDED, Change.CONNECTION_REMOVED,
+                    Change.CONNECTION_CHANGED),
+    'registers': (Change.REGISTER_ADDED, Change.REGISTER_REMOVED,
+                  Change.REGISTER_CHANGED),
+}
+
+
+def _position(items: list, obj) -> int:
+    """ Position of object in list by identity, `list.index` would match
+    equal copies
+    """
+    for i, item in enumerate(items):
+        if item is obj:
+            return i
+    raise ValueError(f'{obj!r} is not in model')
 
 
 current_model = Model(
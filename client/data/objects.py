@@ -1,13 +1,219 @@
-from dataclasses import dataclass
-from typing import List, Dict, Optional, Tuple
+import sys
+from array import array
+from collections import Counter
+from copy import deepcopy
+from dataclasses import dataclass, field, fields, replace
+from itertools import count, islice, starmap
+from operator import attrgetter
+from socket import inet_aton, inet_ntoa
+from typing import Any, Iterable, Iterator, List, Dict, Optional, Sequence, Tuple
 from enum import Enum, auto
 
-Attributes = List[List[str]]
 Address = List[str]
+# Position of node in topology view, in page pixels
+Position = Tuple[float, float]
 
+_revisions = count()
 
+
+def next_revision() -> int:
+    """ Get new unique revision number """
+    return next(_revisions)
+
+
+def touch(obj):
+    """ Mark object as changed
+
+    Must be called after in-place edits of `Node`, `Connection` or
+    `Register`, so cached XML fragments of the old state are not reused
+    """
+    obj.revision = next_revision()
+
+
+def slotted(cls):
+    """ Recreate dataclass with `__slots__` instead of per-instance `__dict__`
+
+    Same as `dataclass(slots=True)` of Python 3.10. Models have hundreds
+    of thousands of objects and per-instance dicts are a noticeable share
+    of their memory.
+    """
+    names = tuple(f.name for f in fields(cls))
+    namespace = {key: value for key, value in cls.__dict__.items()
+                 if key not in names and key not in ('__dict__', '__weakref__')}
+    namespace['__slots__'] = names
+    slotted_cls = type(cls)(cls.__name__, cls.__bases__, namespace)
+    slotted_cls.__qualname__ = cls.__qualname__
+    return slotted_cls
+
+
+class AttributeTable:
+    """ ns-3 attributes of object, `[key, value]` rows with unique keys
+
+    Keys are interned, so every object refers to the same strings of common
+    keys such as `DataRate` or `Mtu`. Values are looked up and updated by
+    key in O(1). Rows are kept in one ordered dict, objects have a few
+    attributes, so operations by row position are O(rows).
+
+    The table is used as a list of `[key, value]` rows. Rows are read as
+    new lists, so they are edited by item assignment or `set_field`, never
+    in place. Adding a row with a key which is already used raises
+    ValueError.
+    """
+
+    __slots__ = ('_values',)
+
+    def __init__(self, rows: Iterable[Sequence[str]] = ()) -> None:
+        self._values: Dict[str, str] = {}
+        self.extend(rows)
+
+    def __len__(self):
+        return len(self._values)
+
+    def __contains__(self, key: str):
+        return key in self._values
+
+    def _new_key(self, key: str) -> str:
+        if key in self._values:
+            raise ValueError(f'Attribute "{key}" is already set')
+        return sys.intern(key) if type(key) is str else key
+
+    def _key(self, row: int) -> str:
+        if row < 0:
+            row += len(self._values)
+        if not 0 <= row < len(self._values):
+            raise IndexError('attribute row out of range')
+        return next(islice(self._values, row, None))
+
+    def get(self, key: str, default: Optional[str] = None) -> Optional[str]:
+        return self._values.get(key, default)
+
+    def set(self, key: str, value: str):
+        """ Update value of key, append a row if there is no such key """
+        if key in self._values:
+            self._values[key] = value
+        else:
+            self.append((key, value))
+
+    def unused_key(self, key: str) -> str:
+        """ Get key, or key with a number if it is used """
+        number = 1
+        unused = key
+        while unused in self._values:
+            number += 1
+            unused = f'{key}{number}'
+        return unused
+
+    def keys(self) -> List[str]:
+        return list(self._values)
+
+    def items(self) -> Iterator[Tuple[str, str]]:
+        """ Iterate over (key, value) pairs in order of rows """
+        return iter(self._values.items())
+
+    def append(self, row: Sequence[str]):
+        key, value = row
+        self._values[self._new_key(key)] = value
+
+    def extend(self, rows: Iterable[Sequence[str]]):
+        for row in rows:
+            self.append(row)
+
+    def insert(self, row: int, item: Sequence[str]):
+        """ Insert row before row, as `list.insert` """
+        key, value = item
+        key = self._new_key(key)
+        items = list(self._values.items())
+        items.insert(row, (key, value))
+        self._values = dict(items)
+
+    def pop(self, row: int = -1) -> List[str]:
+        key = self._key(row)
+        return [key, self._values.pop(key)]
+
+    def __getitem__(self, row: int) -> List[str]:
+        key = self._key(row)
+        return [key, self._values[key]]
+
+    def __setitem__(self, row: int, item: Sequence[str]):
+        key, value = item
+        old = self._key(row)
+        if key == old:
+            self._values[key] = value
+            return
+        # Renamed key keeps its position
+        items = list(self._values.items())
+        items[items.index((old, self._values[old]))] = (self._new_key(key), value)
+        self._values = dict(items)
+
+    def __delitem__(self, row: int):
+        self.pop(row)
+
+    def __iter__(self) -> Iterator[List[str]]:
+        return map(list, self._values.items())
+
+    def field(self, row: int, column: int) -> str:
+        """ Get key, column 0, or value, column 1, of row """
+        key = self._key(row)
+        return key if column == 0 else self._values[key]
+
+    def set_field(self, row: int, column: int, value: str) -> str:
+        """ Set key, column 0, or value, column 1, of row, returns
+        the old one
+        """
+        key = self._key(row)
+        if column == 0:
+            self[row] = (value, self._values[key])
+            return key
+        old = self._values[key]
+        self._values[key] = value
+        return old
+
+    def copy(self) -> 'AttributeTable':
+        table = AttributeTable()
+        table._values = dict(self._values)
+        return table
+
+    def __deepcopy__(self, memo):
+        # Keys and values are immutable
+        return self.copy()
+
+    def __eq__(self, other):
+        if isinstance(other, AttributeTable):
+            # Order of rows matters, as for lists
+            return list(self._values.items()) == list(other._values.items())
+        if isinstance(other, list):
+            return list(self) == other
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self):
+        return f'AttributeTable({list(self)!r})'
+
+    def __reduce__(self):
+        return AttributeTable, (list(self),)
+
+
+# Kept for annotations of objects with attributes
+Attributes = AttributeTable
+
+
+class _WithAttributes:
+    """ Base of objects with attributes, rows given as lists are stored
+    in `AttributeTable`
+    """
+
+    __slots__ = ()
+
+    def __setattr__(self, name, value):
+        if name == 'attributes' and not isinstance(value, AttributeTable):
+            value = AttributeTable(value)
+        object.__setattr__(self, name, value)
+
+
+@slotted
 @dataclass
-class Device:
+class Device(_WithAttributes):
     name: str
     type: str
     attributes: Attributes
@@ -15,13 +221,15 @@ class Device:
     ipv6_addresses: List[Address]
 
 
+@slotted
 @dataclass
-class Application:
+class Application(_WithAttributes):
     name: str
     type: str
     attributes: Attributes
 
     
+@slotted
 @dataclass
 class Route:
     network: str
@@ -31,23 +239,509 @@ class Route:
     netmask: Optional[str] = None
 
 
+# Tables with fewer rows keep `Route` objects, column storage costs more
+# than it saves for them
+VECTOR_ROWS = 256
+
+# Texts of 16-bit halves of IPv4 addresses, `a.b.` of high and `c.d` of low
+# ones, filled on first use
+_high_texts: List[str] = []
+_low_texts: List[str] = []
+
+
+class _Pool:
+    """ Distinct values of a column of `RouteTable` referred to by codes
+
+    Uses of every value are counted. Values which are no longer used are
+    dropped and their codes are given to new values, so the pool holds
+    only values used by the table.
+    """
+
+    __slots__ = ('values', 'codes', 'uses', 'free')
+
+    def __init__(self) -> None:
+        # Value of every code, None for free codes
+        self.values: List[Any] = []
+        self.codes: Dict[Any, int] = {}
+        self.uses = array('I')
+        self.free: List[int] = []
+
+    def __len__(self):
+        return len(self.codes)
+
+    def _new(self, value) -> int:
+        if self.free:
+            code = self.free.pop()
+            self.values[code] = value
+        else:
+            code = len(self.values)
+            self.values.append(value)
+            self.uses.append(0)
+        self.codes[value] = code
+        return code
+
+    def add(self, value) -> int:
+        """ Get code of value and count its use """
+        code = self.codes.get(value)
+        if code is None:
+            code = self._new(value)
+        self.uses[code] += 1
+        return code
+
+    def add_all(self, values: List) -> List[int]:
+        """ Get codes of values and count their uses """
+        codes = list(map(self.codes.get, values))
+        if None in codes:
+            for row, code in enumerate(codes):
+                if code is None:
+                    value = values[row]
+                    code = self.codes.get(value)
+                    codes[row] = self._new(value) if code is None else code
+        for code, uses in Counter(codes).items():
+            self.uses[code] += uses
+        return codes
+
+    def release(self, code: int):
+        """ Count that a row does not use value of code anymore """
+        self.uses[code] -= 1
+        if self.uses[code] == 0:
+            del self.codes[self.values[code]]
+            self.values[code] = None
+            self.free.append(code)
+
+    def copy(self) -> '_Pool':
+        pool = _Pool()
+        pool.values = list(self.values)
+        pool.codes = dict(self.codes)
+        pool.uses = array('I', self.uses)
+        pool.free = list(self.free)
+        return pool
+
+
+def _prefix_key(prefix) -> Tuple[int, int, str]:
+    """ Order prefix lengths as numbers, missing ones go first and
+    ones which are not numbers last
+    """
+    if prefix is None:
+        return 0, 0, ''
+    try:
+        return 1, int(prefix), ''
+    except (TypeError, ValueError):
+        return 2, 0, str(prefix)
+
+
+def _pack(network) -> int:
+    """ IPv4 address of network as integer, -1 if it is not written
+    in the usual dotted form
+    """
+    try:
+        packed = inet_aton(network)
+    except (OSError, TypeError, ValueError):
+        return -1
+    # Short forms, leading zeros and spaces are kept as written
+    return int.from_bytes(packed, 'big') if inet_ntoa(packed) == network else -1
+
+
+def _unpack(packed: int) -> str:
+    return inet_ntoa(packed.to_bytes(4, 'big'))
+
+
+def _halves(packed: array) -> Tuple[array, array]:
+    """ High and low 16-bit halves of the low 32 bits of 64-bit integers,
+    taken from their bytes
+    """
+    halves = array('H')
+    halves.frombytes(packed.tobytes())
+    if sys.byteorder == 'little':
+        return halves[1::4], halves[0::4]
+    return halves[2::4], halves[3::4]
+
+
+class RouteTable:
+    """ Routes of node, large tables are stored by columns
+
+    Tables with fewer than `VECTOR_ROWS` rows keep `Route` objects. Larger
+    ones are stored by columns: networks in dotted IPv4 form are packed
+    into integers, other networks are pooled and referred to by negative
+    codes. Prefix, netmask and dst repeat in most routes, their distinct
+    triples are pooled and stored as codes. A row takes 20 bytes instead
+    of a `Route` object with its strings. Pools belong to the table and
+    drop values which are not used by its rows.
+
+    The table is used as a list of `Route`. Rows of large tables are read
+    as new `Route` objects, so rows are edited by item assignment or
+    `set_field`, never in place.
+    """
+
+    __slots__ = ('_rows', '_networks', '_escaped', '_targets', '_target_pool', '_metrics')
+
+    def __init__(self, routes: Iterable[Route] = ()) -> None:
+        # Routes of small table, None when the table is stored by columns
+        self._rows: Optional[List[Route]] = []
+        # Columns, created when the table grows
+        self._networks: Optional[array] = None
+        self._targets: Optional[array] = None
+        self._metrics: Optional[array] = None
+        self._target_pool: Optional[_Pool] = None
+        # Networks which are not packed, code -1 is the first one.
+        # Created for the first of them
+        self._escaped: Optional[_Pool] = None
+        self.extend(routes)
+
+    def __len__(self):
+        if self._rows is not None:
+            return len(self._rows)
+        return len(self._metrics)
+
+    def _row(self, row: int) -> int:
+        count = len(self)
+        if row < 0:
+            row += count
+        if not 0 <= row < count:
+            raise IndexError('route table row out of range')
+        return row
+
+    def _network_code(self, network) -> int:
+        packed = _pack(network)
+        if packed >= 0:
+            return packed
+        if self._escaped is None:
+            self._escaped = _Pool()
+        return ~self._escaped.add(network)
+
+    def _release_network(self, code: int):
+        if code < 0:
+            self._escaped.release(~code)
+
+    def _network(self, code: int):
+        return _unpack(code) if code >= 0 else self._escaped.values[~code]
+
+    def _target_code(self, prefix, netmask, dst) -> int:
+        return self._target_pool.add((prefix, netmask, dst))
+
+    def _grown(self):
+        if self._rows is not None and len(self._rows) >= VECTOR_ROWS:
+            self._store_columns()
+
+    def _store_columns(self):
+        rows = self._rows
+        self._rows = None
+        self._networks = array('q')
+        self._targets = array('I')
+        self._metrics = array('q')
+        self._target_pool = _Pool()
+        self._extend_columns(rows)
+
+    def _extend_columns(self, routes: List[Route]):
+        # Fields are converted column by column, only escaped networks
+        # and new targets are handled one by one
+        networks = list(map(attrgetter('network'), routes))
+        codes = list(map(_pack, networks))
+        if -1 in codes:
+            if self._escaped is None:
+                self._escaped = _Pool()
+            rows = [row for row, code in enumerate(codes) if code < 0]
+            escaped = self._escaped.add_all([networks[row] for row in rows])
+            for row, code in zip(rows, escaped):
+                codes[row] = ~code
+        self._networks.extend(codes)
+
+        targets = list(zip(map(attrgetter('prefix'), routes),
+                           map(attrgetter('netmask'), routes),
+                           map(attrgetter('dst'), routes)))
+        self._targets.extend(self._target_pool.add_all(targets))
+        self._metrics.extend(map(attrgetter('metric'), routes))
+
+    def add(self, network: str, dst: str, metric: int,
+            prefix: Optional[str] = None, netmask: Optional[str] = None):
+        """ Append route given by its fields """
+        if self._rows is not None:
+            self._rows.append(Route(network, dst, metric, prefix, netmask))
+            self._grown()
+            return
+        self._networks.append(self._network_code(network))
+        self._targets.append(self._target_code(prefix, netmask, dst))
+        self._metrics.append(metric)
+
+    def append(self, route: Route):
+        if self._rows is not None:
+            self._rows.append(route)
+            self._grown()
+            return
+        self.add(route.network, route.dst, route.metric, route.prefix, route.netmask)
+
+    def extend(self, routes: Iterable[Route]):
+        if not isinstance(routes, RouteTable) or routes._rows is not None:
+            routes = list(routes)
+            if self._rows is not None:
+                self._rows.extend(routes)
+                self._grown()
+            else:
+                self._extend_columns(routes)
+            return
+
+        # Columns are copied at once, with pools of empty table
+        if self._rows is not None:
+            self._store_columns()
+        if not self._metrics:
+            self._networks.extend(routes._networks)
+            self._targets.extend(routes._targets)
+            self._metrics.extend(routes._metrics)
+            self._target_pool = routes._target_pool.copy()
+            self._escaped = None if routes._escaped is None else routes._escaped.copy()
+            return
+
+        # Codes of other table are translated through values of its pools
+        networks = routes._networks
+        if routes._escaped:
+            escaped = routes._escaped.values
+            networks = [code if code >= 0 else self._network_code(escaped[~code])
+                        for code in networks]
+        self._networks.extend(networks)
+        targets = routes._target_pool.values
+        self._targets.extend(self._target_pool.add_all(
+            list(map(targets.__getitem__, routes._targets))))
+        self._metrics.extend(routes._metrics)
+
+    def insert(self, row: int, route: Route):
+        """ Insert route before row, as `list.insert` """
+        if self._rows is not None:
+            self._rows.insert(row, route)
+            self._grown()
+            return
+        self._networks.insert(row, self._network_code(route.network))
+        self._targets.insert(row, self._target_code(route.prefix, route.netmask, route.dst))
+        self._metrics.insert(row, route.metric)
+
+    def pop(self, row: int = -1) -> Route:
+        if self._rows is not None:
+            return self._rows.pop(row)
+        route = self[row]
+        row = self._row(row)
+        self._release_network(self._networks[row])
+        self._target_pool.release(self._targets[row])
+        del self._networks[row]
+        del self._targets[row]
+        del self._metrics[row]
+        return route
+
+    def __getitem__(self, row: int) -> Route:
+        if self._rows is not None:
+            return self._rows[row]
+        row = self._row(row)
+        prefix, netmask, dst = self._target_pool.values[self._targets[row]]
+        return Route(self._network(self._networks[row]), dst,
+                     self._metrics[row], prefix, netmask)
+
+    def __setitem__(self, row: int, route: Route):
+        if self._rows is not None:
+            self._rows[row] = route
+            return
+        row = self._row(row)
+        # New values are counted first, so values kept by the row stay pooled
+        network = self._network_code(route.network)
+        self._release_network(self._networks[row])
+        self._networks[row] = network
+        target = self._target_code(route.prefix, route.netmask, route.dst)
+        self._target_pool.release(self._targets[row])
+        self._targets[row] = target
+        self._metrics[row] = route.metric
+
+    def __delitem__(self, row: int):
+        self.pop(row)
+
+    def rows(self) -> Iterator[Tuple[str, str, int, Optional[str], Optional[str]]]:
+        """ Iterate over fields of routes, in order of `Route` fields """
+        if self._rows is not None:
+            for route in self._rows:
+                yield route.network, route.dst, route.metric, route.prefix, route.netmask
+            return
+        targets = self._target_pool.values
+        escaped = self._escaped.values if self._escaped is not None else None
+        for network, target, metric in zip(self._networks, self._targets, self._metrics):
+            prefix, netmask, dst = targets[target]
+            yield (_unpack(network) if network >= 0 else escaped[~network],
+                   dst, metric, prefix, netmask)
+
+    def __iter__(self) -> Iterator[Route]:
+        if self._rows is not None:
+            return iter(self._rows)
+        return starmap(Route, self.rows())
+
+    def field(self, row: int, name: str) -> Any:
+        """ Get field of route in row without creating `Route` """
+        if name not in _ROUTE_FIELDS:
+            raise KeyError(name)
+        if self._rows is not None:
+            return getattr(self._rows[row], name)
+        row = self._row(row)
+        if name == 'network':
+            return self._network(self._networks[row])
+        elif name == 'metric':
+            return self._metrics[row]
+        return self._target_pool.values[self._targets[row]][_ROUTE_FIELDS[name]]
+
+    def set_field(self, row: int, name: str, value) -> Any:
+        """ Set field of route in row, returns the old value
+
+        Route objects of small tables are replaced, they may be
+        referred to by recorded edits.
+        """
+        old = self.field(row, name)
+        if self._rows is not None:
+            self._rows[row] = replace(self._rows[row], **{name: value})
+            return old
+        row = self._row(row)
+        if name == 'network':
+            code = self._network_code(value)
+            self._release_network(self._networks[row])
+            self._networks[row] = code
+        elif name == 'metric':
+            self._metrics[row] = value
+        else:
+            target = list(self._target_pool.values[self._targets[row]])
+            target[_ROUTE_FIELDS[name]] = value
+            code = self._target_code(*target)
+            self._target_pool.release(self._targets[row])
+            self._targets[row] = code
+        return old
+
+    def column(self, name: str) -> List:
+        """ Get values of field in all rows """
+        if name not in _ROUTE_FIELDS:
+            raise KeyError(name)
+        if self._rows is not None:
+            return [getattr(route, name) for route in self._rows]
+        if name == 'network':
+            return list(map(str.__add__, *self.network_halves()))
+        elif name == 'metric':
+            return self._metrics.tolist()
+        position = _ROUTE_FIELDS[name]
+        return [target[position] for target in self.targets()]
+
+    def network_halves(self) -> Tuple[List[str], List[str]]:
+        """ Get texts of halves of networks of table stored by columns,
+        `a.b.` and `c.d` of packed ones and the whole network and ''
+        of others. Networks are written by joining halves without making
+        a string per network.
+        """
+        networks = self._networks
+        if not _low_texts:
+            _low_texts.extend(f'{half >> 8}.{half & 255}' for half in range(1 << 16))
+            _high_texts.extend(text + '.' for text in _low_texts)
+        high, low = _halves(networks)
+        high = list(map(_high_texts.__getitem__, high))
+        low = list(map(_low_texts.__getitem__, low))
+        if self._escaped and min(networks) < 0:
+            escaped = self._escaped.values
+            for row, code in enumerate(networks):
+                if code < 0:
+                    high[row] = escaped[~code]
+                    low[row] = ''
+        return high, low
+
+    def targets(self) -> List[Tuple[Optional[str], Optional[str], str]]:
+        """ Get (prefix, netmask, dst) of rows of table stored by columns,
+        equal triples are the same objects
+        """
+        return list(map(self._target_pool.values.__getitem__, self._targets))
+
+    def sort(self, name: str, reverse: bool = False):
+        """ Sort rows by field, stable as `list.sort`
+
+        IPv4 networks are ordered as addresses and go before other
+        networks, which are ordered as strings. Prefixes are ordered as
+        numbers. Missing values go first.
+        """
+        if name == 'network':
+            codes = self._networks if self._rows is None else \
+                list(map(_pack, self.column('network')))
+            keys = codes if min(codes, default=0) >= 0 else \
+                [(0, code, '') if code >= 0 else (1, 0, str(self.field(row, name)))
+                 for row, code in enumerate(codes)]
+        elif name == 'metric':
+            keys = self.column('metric') if self._rows is not None else self._metrics
+        elif name == 'prefix':
+            keys = list(map(_prefix_key, self.column(name)))
+        else:
+            keys = [(value is not None, str(value)) for value in self.column(name)]
+        order = sorted(range(len(self)), key=keys.__getitem__, reverse=reverse)
+        if self._rows is not None:
+            self._rows[:] = map(self._rows.__getitem__, order)
+            return
+        for column in (self._networks, self._targets, self._metrics):
+            column[:] = array(column.typecode, map(column.__getitem__, order))
+
+    def copy(self) -> 'RouteTable':
+        table = RouteTable()
+        table.extend(self)
+        return table
+
+    def __deepcopy__(self, memo):
+        if self._rows is not None:
+            return RouteTable(deepcopy(self._rows, memo))
+        # Pooled targets and networks are immutable
+        return self.copy()
+
+    def __eq__(self, other):
+        if isinstance(other, RouteTable):
+            # Codes are compared if both tables have the same pool of targets
+            if self._rows is None and other._rows is None \
+                    and not self._escaped and not other._escaped \
+                    and self._target_pool.values == other._target_pool.values:
+                return self._networks == other._networks \
+                    and self._targets == other._targets \
+                    and self._metrics == other._metrics
+            return len(self) == len(other) and list(self.rows()) == list(other.rows())
+        if isinstance(other, list):
+            return list(self) == other
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self):
+        return f'RouteTable({list(self)!r})'
+
+    def __reduce__(self):
+        return RouteTable, (list(self),)
+
+
+# Position of route fields in pooled targets
+_ROUTE_FIELDS = {'network': None, 'dst': 2, 'metric': None, 'prefix': 0, 'netmask': 1}
+
+
+@slotted
 @dataclass
 class Node:
     name: str
     devices: List[Device]
     applications: List[Application]
-    ipv4_routes: List[Route]
-    ipv6_routes: List[Route]
+    ipv4_routes: RouteTable
+    ipv6_routes: RouteTable
+    position: Optional[Position] = None
+    revision: int = field(default_factory=next_revision,
+                          compare=False, repr=False)
+
+    def __setattr__(self, name, value):
+        # Routes given as lists are stored in tables
+        if name in ('ipv4_routes', 'ipv6_routes') and not isinstance(value, RouteTable):
+            value = RouteTable(value)
+        object.__setattr__(self, name, value)
 
 
+@slotted
 @dataclass
-class Connection:
+class Connection(_WithAttributes):
     name: str
     type: str
     interfaces: List[str]
     attributes: Attributes
+    position: Optional[Position] = None
+    revision: int = field(default_factory=next_revision,
+                          compare=False, repr=False)
 
 
+@slotted
 @dataclass
 class Register:
     value_name: str
@@ -57,6 +751,8 @@ class Register:
     file: str
     end: Optional[str] = None
     sink: Optional[str] = None
+    revision: int = field(default_factory=next_revision,
+                          compare=False, repr=False)
 
 
 class Precision(Enum):
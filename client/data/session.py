@@ -0,0 +1,65 @@
+from copy import deepcopy
+from typing import TYPE_CHECKING, Iterator, List, Tuple
+
+if TYPE_CHECKING:
+    from client.data.model import Model
+
+INSERT = 'insert'
+REMOVE = 'remove'
+REPLACE = 'replace'
+
+
+class EditSession:
+    """ Edits of nodes, connections or registers list of model, applied
+    to the model when the session is committed
+
+    `items` is a copy of the list which shares objects with the model, so
+    opening a session does not copy objects. An object has to be copied
+    with `checkout` before it is edited and put back with item assignment.
+    Edits are recorded, committing replays them in O(edits).
+    """
+
+    def __init__(self, model: 'Model', collection: str) -> None:
+        self.model = model
+        self.collection = collection
+        self.base = getattr(model, collection)
+        self.version = model.version
+        self.items = list(self.base)
+        self.operations: List[Tuple[str, int, object]] = []
+
+    def __len__(self):
+        return len(self.items)
+
+    def __iter__(self) -> Iterator:
+        return iter(self.items)
+
+    def __getitem__(self, row: int):
+        return self.items[row]
+
+    def __setitem__(self, row: int, obj):
+        row = self._row(row)
+        self.items[row] = obj
+        self.operations.append((REPLACE, row, obj))
+
+    def __delitem__(self, row: int):
+        row = self._row(row)
+        del self.items[row]
+        self.operations.append((REMOVE, row, None))
+
+    def _row(self, row: int) -> int:
+        if row < 0:
+            row += len(self.items)
+        if not 0 <= row < len(self.items):
+            raise IndexError('session row out of range')
+        return row
+
+    def append(self, obj):
+        self.operations.append((INSERT, len(self.items), obj))
+        self.items.append(obj)
+
+    def checkout(self, row: int):
+        """ Get private copy of object to be edited """
+        return deepcopy(self.items[row])
+
+    def commit(self):
+        self.model.commit(self)
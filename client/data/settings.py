@@ -1 +1,40 @@
 remote_url = ''
+
+# Content encoding of uploaded model: None, 'gzip' or 'zstd'
+upload_encoding = None
+# Models smaller than this number of bytes are uploaded uncompressed
+compression_threshold = 256 * 1024
+
+# Timeouts of requests to server, in seconds
+connect_timeout = 5
+read_timeout = 30
+# Number of retries of idempotent requests
+retries = 3
+
+# Number of lines kept in simulation log
+log_max_lines = 1000000
+# Maximal number of log refreshes per second
+log_refresh_rate = 30
+
+# Number of server messages buffered before LOG messages are dropped
+message_queue_size = 10000
+# Maximal number of server messages handled by GUI per tick
+messages_per_tick = 2000
+# Report number of dropped LOG messages in log
+summarize_dropped_logs = True
+
+# Number of model edits which can be undone
+undo_limit = 1000
+
+# Layout of topologies with at least this number of nodes is computed
+# by client instead of physics simulation of the page
+layout_threshold = 300
+# Topologies with at least this number of nodes are shown as clusters
+# which expand when zoomed in or double-clicked
+cluster_threshold = 2000
+# Size of cluster on screen in pixels at which it is expanded
+cluster_expand_size = 150
+
+# Renderer of topology: 'web' draws it by vis-network in QtWebEngine,
+# 'native' by QGraphicsScene without loading QtWebEngine
+topology_renderer = 'web'
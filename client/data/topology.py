@@ -0,0 +1,335 @@
+from dataclasses import dataclass, field
+from typing import Dict, Hashable, List, Optional, Tuple, Union
+
+from client.data.events import Change, ModelEvent
+from client.data.index import ModelIndex, path_node
+from client.data.model import Model
+from client.data.objects import Connection, Node, Position, touch
+
+
+@dataclass
+class Graph:
+    """ Topology graph in vis-network format
+
+    Nodes and edges are dicts of vis-network item properties keyed by item id
+    """
+    nodes: Dict[Hashable, dict] = field(default_factory=dict)
+    edges: Dict[str, dict] = field(default_factory=dict)
+    # Model object of every graph node, and ids of proxy nodes and edges
+    # of every connection, so model changes are applied without rebuilding
+    objects: Dict[Hashable, Union[Node, Connection]] = field(
+        default_factory=dict, compare=False, repr=False)
+    connection_items: Dict[int, Tuple[List[Hashable], List[str]]] = field(
+        default_factory=dict, compare=False, repr=False)
+    # Connections sharing every proxy node, connections with the same name
+    # have one proxy shown with properties of the last of them
+    proxies: Dict[Hashable, List[Connection]] = field(
+        default_factory=dict, compare=False, repr=False)
+    # Connection of every edge by ids of parallel edges, keyed by
+    # unnumbered edge id
+    parallel: Dict[str, Dict[str, Connection]] = field(
+        default_factory=dict, compare=False, repr=False)
+
+
+@dataclass
+class GraphDiff:
+    """ Changes turning one `Graph` into another """
+    nodes: List[dict] = field(default_factory=list)
+    edges: List[dict] = field(default_factory=list)
+    removed_nodes: List[Hashable] = field(default_factory=list)
+    removed_edges: List[str] = field(default_factory=list)
+
+    def is_empty(self) -> bool:
+        return not (self.nodes or self.edges or self.removed_nodes or self.removed_edges)
+
+
+def node_id(node: Node) -> str:
+    """ Graph id of node, stable between runs """
+    return f'node:{node.name}'
+
+
+def connection_id(connection: Connection) -> str:
+    """ Graph id of proxy node of connection, stable between runs """
+    return f'connection:{connection.name}'
+
+
+def _graph_node(item_id: str, obj: Union[Node, Connection], **properties) -> dict:
+    graph_node = {'id': item_id, 'label': obj.name, **properties}
+    if obj.position is not None:
+        graph_node['x'], graph_node['y'] = obj.position
+    return graph_node
+
+
+def _edge_base(src, dst) -> str:
+    return f'{src}-{dst}'
+
+
+def _add_edge(graph: Graph, src, dst, connection: Connection) -> str:
+    edge_id = base = _edge_base(src, dst)
+    # Parallel edges get numbered ids
+    duplicate = 1
+    while edge_id in graph.edges:
+        duplicate += 1
+        edge_id = f'{base}#{duplicate}'
+    graph.edges[edge_id] = {'id': edge_id, 'from': src, 'to': dst}
+    graph.parallel.setdefault(base, {})[edge_id] = connection
+    return edge_id
+
+
+def _add_node(graph: Graph, node: Node):
+    # Of nodes with the same name the one found by model index is shown
+    item_id = node_id(node)
+    if item_id not in graph.nodes:
+        graph.nodes[item_id] = _graph_node(item_id, node)
+        graph.objects[item_id] = node
+
+
+def _add_connection(graph: Graph, index: ModelIndex, connection: Connection):
+    # endpoint = Node/Interface, nodes are looked up in model index
+    # so their graph ids are the ones of indexed nodes
+    endpoints = [index.node(path_node(endpoint))
+                 for endpoint in connection.interfaces]
+    nodes, edges = [], []
+
+    if len(endpoints) == 2:
+        # Create edge betwen two nodes
+        src, dst = endpoints
+        if src is not None and dst is not None:
+            edges.append(_add_edge(graph, node_id(src), node_id(dst), connection))
+    elif len(endpoints) > 2:
+        # Create proxy object and connect to it
+        proxy = connection_id(connection)
+        graph.proxies.setdefault(proxy, []).append(connection)
+        _show_proxy(graph, proxy, connection)
+        nodes.append(proxy)
+        for node in endpoints:
+            if node is not None:
+                edges.append(_add_edge(graph, node_id(node), proxy, connection))
+
+    graph.connection_items[id(connection)] = (nodes, edges)
+
+
+def _show_proxy(graph: Graph, proxy: Hashable, connection: Connection):
+    graph.nodes[proxy] = _graph_node(proxy, connection, shape='text')
+    graph.objects[proxy] = connection
+
+
+def _remove_connection(graph: Graph, connection: Connection):
+    nodes, edges = graph.connection_items.pop(id(connection), ((), ()))
+    for edge_id in edges:
+        edge = graph.edges.pop(edge_id)
+        base = _edge_base(edge['from'], edge['to'])
+        parallel = graph.parallel[base]
+        del parallel[edge_id]
+        if not parallel:
+            del graph.parallel[base]
+    for item_id in nodes:
+        # Proxy is kept while other connections use it
+        sharing = graph.proxies[item_id]
+        sharing[:] = [other for other in sharing if other is not connection]
+        if not sharing:
+            del graph.proxies[item_id]
+            del graph.nodes[item_id]
+            del graph.objects[item_id]
+        elif graph.objects[item_id] is connection:
+            _show_proxy(graph, item_id, sharing[-1])
+
+
+def build_graph(model: Model) -> Graph:
+    """ Build topology graph of model
+
+    Connection of two nodes becomes an edge, connection of more nodes
+    becomes a proxy node linked to all of them. Graph nodes of model objects
+    with known position get `x` and `y` properties.
+    """
+    graph = Graph()
+    for node in model.nodes:
+        _add_node(graph, node)
+
+    index = model.index
+    for connection in model.connections:
+        _add_connection(graph, index, connection)
+
+    return graph
+
+
+def update_graph(graph: Graph, model: Model, event: ModelEvent) -> Optional[GraphDiff]:
+    """ Apply model change to graph built by `build_graph`
+
+    Only the changed objects and connections of changed nodes are
+    processed. Returns changes of the graph, or None if the graph has to
+    be rebuilt.
+    """
+    if event.change is Change.RESET:
+        return None
+
+    index = model.index
+    # Items as they were before the change, of every touched item
+    nodes_before = {}
+    edges_before = {}
+    # Ids of edges whose parallel edges changed
+    numbered = set()
+
+    def remember(nodes, edges):
+        for item_id in nodes:
+            nodes_before.setdefault(item_id, graph.nodes.get(item_id))
+        for edge_id in edges:
+            edges_before.setdefault(edge_id, graph.edges.get(edge_id))
+
+    def show_proxies(nodes):
+        # Shared proxy shows the connection which is the last in model,
+        # as in `build_graph`
+        for proxy in nodes:
+            sharing = graph.proxies.get(proxy, ())
+            if len(sharing) > 1:
+                _show_proxy(graph, proxy, max(sharing, key=lambda connection: index.row(
+                    'connections', model.connections, connection)))
+
+    def mark_parallel(edges):
+        for edge_id in edges:
+            edge = graph.edges[edge_id]
+            numbered.add(_edge_base(edge['from'], edge['to']))
+
+    def number_edges(base):
+        # Parallel edges are numbered in model order, as in `build_graph`
+        owners = graph.parallel.get(base)
+        if not owners or len(owners) == 1 and base in owners:
+            return
+
+        def order(edge_id):
+            connection = owners[edge_id]
+            return (index.row('connections', model.connections, connection),
+                    graph.connection_items[id(connection)][1].index(edge_id))
+
+        old_ids = sorted(owners, key=order)
+        new_ids = [base] + [f'{base}#{number}' for number in range(2, len(old_ids) + 1)]
+        if old_ids == new_ids:
+            return
+        remember([], old_ids + new_ids)
+        renamed = dict(zip(old_ids, new_ids))
+        edges = {edge_id: graph.edges.pop(edge_id) for edge_id in old_ids}
+        for old_id, new_id in renamed.items():
+            graph.edges[new_id] = dict(edges[old_id], id=new_id)
+        for connection in {id(connection): connection for connection in owners.values()}.values():
+            items = graph.connection_items[id(connection)][1]
+            items[:] = [renamed.get(edge_id, edge_id) for edge_id in items]
+        graph.parallel[base] = {renamed[edge_id]: owners[edge_id] for edge_id in old_ids}
+
+    def add_connection(connection):
+        # Proxy node may be shared with connection of the same name
+        if len(connection.interfaces) > 2:
+            remember([connection_id(connection)], [])
+        _add_connection(graph, index, connection)
+        # Edge ids are not taken when edges are added
+        nodes, edges = graph.connection_items[id(connection)]
+        for edge_id in edges:
+            edges_before.setdefault(edge_id, None)
+        mark_parallel(edges)
+        show_proxies(nodes)
+
+    def remove_connection(connection):
+        nodes, edges = graph.connection_items.get(id(connection), ((), ()))
+        remember(nodes, edges)
+        mark_parallel(edges)
+        _remove_connection(graph, connection)
+        show_proxies(nodes)
+
+    def add_node(node):
+        remember([node_id(node)], [])
+        _add_node(graph, node)
+
+    def remove_node(node, name):
+        item_id = f'node:{name}'
+        remember([item_id], [])
+        if graph.objects.get(item_id) is node:
+            del graph.nodes[item_id]
+            del graph.objects[item_id]
+            other = index.node(name)
+            if other is not None:
+                _add_node(graph, other)
+
+    def reconnect(name):
+        for connection in index.connections_at(name):
+            remove_connection(connection)
+            add_connection(connection)
+
+    change = event.change
+    if change is Change.NODE_ADDED:
+        add_node(event.obj)
+        reconnect(event.obj.name)
+    elif change is Change.NODE_REMOVED:
+        remove_node(event.obj, event.obj.name)
+        reconnect(event.obj.name)
+    elif change is Change.NODE_RENAMED:
+        remove_node(event.obj, event.old)
+        reconnect(event.old)
+        add_node(event.obj)
+        reconnect(event.obj.name)
+    elif change is Change.NODE_CHANGED:
+        # Devices of node are not shown, node edited in place is not redrawn
+        if event.old is not event.obj:
+            remove_node(event.old, event.old.name)
+            reconnect(event.old.name)
+            add_node(event.obj)
+            reconnect(event.obj.name)
+    elif change is Change.CONNECTION_ADDED:
+        add_connection(event.obj)
+    elif change is Change.CONNECTION_REMOVED:
+        remove_connection(event.obj)
+    elif change is Change.CONNECTION_CHANGED:
+        remove_connection(event.old)
+        add_connection(event.obj)
+    for base in numbered:
+        number_edges(base)
+
+    diff = GraphDiff()
+    for items, before, current, removed in (
+            (diff.nodes, nodes_before, graph.nodes, diff.removed_nodes),
+            (diff.edges, edges_before, graph.edges, diff.removed_edges)):
+        for item_id, old_item in before.items():
+            item = current.get(item_id)
+            if item is None:
+                if old_item is not None:
+                    removed.append(item_id)
+            elif item != old_item:
+                items.append(item)
+    return diff
+
+
+def known_positions(graph: Graph) -> Dict[Hashable, Position]:
+    """ Get positions of graph nodes which have them """
+    return {item_id: (item['x'], item['y'])
+            for item_id, item in graph.nodes.items() if 'x' in item}
+
+
+def apply_positions(graph: Graph, positions: Dict[Hashable, Position]):
+    """ Store computed positions in graph and model objects it was built from
+
+    Positions are rounded to tenths of pixel, only objects whose position
+    changed are touched
+    """
+    for item_id, (x, y) in positions.items():
+        obj = graph.objects.get(item_id)
+        if obj is None:
+            continue
+        position = (round(x, 1), round(y, 1))
+        if obj.position != position:
+            obj.position = position
+            touch(obj)
+        graph.nodes[item_id]['x'], graph.nodes[item_id]['y'] = position
+
+
+def diff_graphs(old: Graph, new: Graph) -> GraphDiff:
+    """ Get changes turning `old` graph into `new` one """
+    diff = GraphDiff()
+
+    for items, old_items, new_items, removed in (
+            (diff.nodes, old.nodes, new.nodes, diff.removed_nodes),
+            (diff.edges, old.edges, new.edges, diff.removed_edges)):
+        for item_id, item in new_items.items():
+            if old_items.get(item_id) != item:
+                items.append(item)
+        for item_id in old_items.keys() - new_items.keys():
+            removed.append(item_id)
+
+    return diff
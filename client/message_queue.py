@@ -0,0 +1,80 @@
+import json
+import threading
+from collections import deque
+from typing import List
+
+
+class MessageQueue:
+    """ Bounded queue of server messages between socket.io thread and GUI
+
+    When queue holds `capacity` messages, new `LOG` messages are dropped,
+    other messages (`ERROR`, `UPLOADED`, ...) are always accepted.
+    With `summarize` policy, number of dropped messages is reported by
+    a `LOG` message inserted into the stream.
+    """
+
+    def __init__(self, capacity: int = 10000, summarize: bool = True) -> None:
+        self.capacity = capacity
+        self.summarize = summarize
+
+        self._lock = threading.Lock()
+        self._messages = deque()
+        self._notified = False
+        self._dropped_since_drain = 0
+
+        # Counters
+        self.received = 0
+        self.dropped = 0
+        self.malformed = 0
+        self.max_size = 0
+
+    def put(self, message: str) -> bool:
+        """ Add message, may be called from any thread
+
+        :return: True if consumer should be notified about new messages
+        """
+        try:
+            data = json.loads(message)
+            status = data['status']
+        except (ValueError, TypeError, KeyError):
+            with self._lock:
+                self.malformed += 1
+            return False
+
+        with self._lock:
+            self.received += 1
+            if status == 'LOG' and len(self._messages) >= self.capacity:
+                self.dropped += 1
+                self._dropped_since_drain += 1
+                return False
+
+            self._messages.append(data)
+            self.max_size = max(self.max_size, len(self._messages))
+
+            notify = not self._notified
+            self._notified = True
+            return notify
+
+    def drain(self, limit: int) -> List[dict]:
+        """ Take up to `limit` messages
+
+        Consumer is notified again only after queue is drained completely
+        """
+        with self._lock:
+            count = min(limit, len(self._messages))
+            messages = [self._messages.popleft() for _ in range(count)]
+
+            if self._dropped_since_drain > 0 and self.summarize:
+                messages.append({
+                    'status': 'LOG',
+                    'msg': f'[{self._dropped_since_drain} log messages dropped]'
+                })
+            self._dropped_since_drain = 0
+
+            if not self._messages:
+                self._notified = False
+            return messages
+
+    def __len__(self):
+        with self._lock:
+            return len(self._messages)
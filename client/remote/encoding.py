@@ -0,0 +1,75 @@
+import zlib
+from typing import Dict, Iterable, Iterator, Tuple, Union
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+Body = Union[bytes, Iterable[bytes]]
+
+
+def available_encodings() -> Tuple[str, ...]:
+    """ Get content encodings supported for upload """
+    return ('gzip', 'zstd') if zstandard is not None else ('gzip',)
+
+
+def _compressor(encoding: str):
+    if encoding == 'gzip':
+        return zlib.compressobj(6, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+    elif encoding == 'zstd':
+        if zstandard is None:
+            raise ValueError('zstd encoding requires "zstandard" package')
+        return zstandard.ZstdCompressor().compressobj()
+    raise ValueError(f'Unknown content encoding "{encoding}"')
+
+
+def compress(chunks: Iterable[bytes], encoding: str) -> Iterator[bytes]:
+    """ Compress stream of chunks on the fly
+
+    :param chunks: source data
+    :param encoding: `gzip` or `zstd`
+    """
+    compressor = _compressor(encoding)
+    for chunk in chunks:
+        compressed = compressor.compress(chunk)
+        if compressed:
+            yield compressed
+    yield compressor.flush()
+
+
+def encode_body(chunks: Iterable[bytes], encoding: str = None,
+                threshold: int = 0) -> Tuple[Dict[str, str], Body]:
+    """ Prepare request body from stream of chunks
+
+    Source is read until `threshold` bytes are buffered. Smaller bodies
+    are returned as plain bytes, larger ones are compressed on the fly
+    and returned as generator, which is sent with chunked transfer encoding.
+
+    :param chunks: source data
+    :param encoding: `gzip`, `zstd` or None to disable compression
+    :param threshold: minimal size of compressed body
+    :return: headers to add to request and body
+    """
+    chunks = iter(chunks)
+    if encoding is None:
+        return {}, chunks
+
+    _compressor(encoding)  # Fail early on unsupported encoding
+
+    buffered = []
+    size = 0
+    for chunk in chunks:
+        buffered.append(chunk)
+        size += len(chunk)
+        if size >= threshold:
+            break
+    else:
+        return {}, b''.join(buffered)
+
+    def source():
+        yield from buffered
+        buffered.clear()
+        yield from chunks
+
+    return {'Content-Encoding': encoding}, compress(source(), encoding)
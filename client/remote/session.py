@@ -0,0 +1,87 @@
+import threading
+from typing import List, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+import client.data.settings as settings
+
+
+class ServerClient:
+    """ HTTP client of ns3-server
+
+    Keeps pool of keep-alive connections shared by all requests. Sessions
+    are not thread-safe, so every thread sending requests gets its own
+    session, all of them use the same connection pool.
+    Idempotent requests are retried with exponential backoff on connection
+    errors and 502/503/504 responses, `/start` upload is never retried.
+    """
+
+    def __init__(self, connect_timeout: float = 5, read_timeout: float = 30,
+                 retries: int = 3, backoff: float = 0.2, pool_size: int = 4) -> None:
+        self.timeout = (connect_timeout, read_timeout)
+
+        retry = Retry(total=retries,
+                      backoff_factor=backoff,
+                      allowed_methods=frozenset(('GET', 'HEAD', 'OPTIONS')),
+                      status_forcelist=(502, 503, 504),
+                      raise_on_status=False)
+        self.adapter = HTTPAdapter(pool_connections=1,
+                                   pool_maxsize=pool_size,
+                                   max_retries=retry)
+
+        self._local = threading.local()
+        self._sessions: List[requests.Session] = []
+        self._lock = threading.Lock()
+
+    @property
+    def session(self) -> requests.Session:
+        """ Session of the calling thread """
+        session = getattr(self._local, 'session', None)
+        if session is None:
+            session = requests.Session()
+            session.mount('http://', self.adapter)
+            session.mount('https://', self.adapter)
+            self._local.session = session
+            with self._lock:
+                self._sessions.append(session)
+        return session
+
+    def request(self, method: str, url: str, **kwargs) -> requests.Response:
+        kwargs.setdefault('timeout', self.timeout)
+        return self.session.request(method, url, **kwargs)
+
+    def start(self, url: str, body, headers=None, **kwargs) -> requests.Response:
+        """ Upload model and start simulation """
+        return self.request('POST', url + '/start', data=body, headers=headers, **kwargs)
+
+    def stop(self, url: str, **kwargs) -> requests.Response:
+        """ Stop running simulation """
+        return self.request('GET', url + '/stop', **kwargs)
+
+    def close(self):
+        # Sessions close the shared adapter too
+        with self._lock:
+            sessions, self._sessions = self._sessions, []
+        for session in sessions:
+            session.close()
+        self.adapter.close()
+
+
+_shared_client: Optional[ServerClient] = None
+_shared_client_lock = threading.Lock()
+
+
+def shared_client() -> ServerClient:
+    """ Get client shared by the whole application, created with
+    timeouts and retries from `client.data.settings`
+    """
+    global _shared_client
+    # Called by worker threads, only one of them creates the client
+    with _shared_client_lock:
+        if _shared_client is None:
+            _shared_client = ServerClient(connect_timeout=settings.connect_timeout,
+                                          read_timeout=settings.read_timeout,
+                                          retries=settings.retries)
+        return _shared_client
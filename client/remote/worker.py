@@ -0,0 +1,98 @@
+from typing import TYPE_CHECKING, Dict, Iterable, Optional, Union
+
+from PyQt5.QtCore import QObject, QRunnable, pyqtSignal
+
+if TYPE_CHECKING:
+    from client.remote.session import ServerClient
+
+
+class RequestCancelled(Exception):
+    """ Raised inside worker when request is cancelled """
+
+
+class RequestSignals(QObject):
+    """ Signals of `RequestTask`, delivered to the thread owning this object """
+
+    # status code, response text
+    finished = pyqtSignal(int, str)
+    # error description
+    failed = pyqtSignal(str)
+    cancelled = pyqtSignal()
+    # bytes of body sent so far
+    progress = pyqtSignal(int)
+
+
+class RequestTask(QRunnable):
+    """ HTTP request executed in `QThreadPool`
+
+    Results are reported with `signals`, so slots connected to them are
+    called in the GUI thread. Request is sent with `shared_client()`
+    unless other client is passed.
+    """
+
+    def __init__(self, method: str, url: str,
+                 headers: Optional[Dict[str, str]] = None,
+                 body: Union[bytes, Iterable[bytes], None] = None,
+                 timeout: Optional[float] = None,
+                 client: Optional['ServerClient'] = None) -> None:
+        super().__init__()
+        self.setAutoDelete(False)
+
+        self.method = method
+        self.url = url
+        self.headers = headers
+        self.body = body
+        self.timeout = timeout
+        self.client = client
+        self.signals = RequestSignals()
+        self._cancelled = False
+
+    def cancel(self):
+        """ Abort upload and suppress result signals
+
+        Request, which was already sent, can't be recalled
+        """
+        self._cancelled = True
+
+    def is_cancelled(self) -> bool:
+        return self._cancelled
+
+    def _stream_body(self, chunks: Iterable[bytes]):
+        sent = 0
+        for chunk in chunks:
+            if self._cancelled:
+                raise RequestCancelled()
+            yield chunk
+            sent += len(chunk)
+            self.signals.progress.emit(sent)
+
+    def _send(self):
+        body = self.body
+        if body is not None and not isinstance(body, bytes):
+            body = self._stream_body(body)
+        # HTTP stack is imported by the first request, in the worker thread
+        from client.remote.session import shared_client
+        client = self.client or shared_client()
+        kwargs = {} if self.timeout is None else {'timeout': self.timeout}
+        return client.request(self.method, self.url, headers=self.headers,
+                              data=body, **kwargs)
+
+    def run(self):
+        try:
+            with self._send() as res:
+                text = res.text
+                status = res.status_code
+        except RequestCancelled:
+            self.signals.cancelled.emit()
+            return
+        except Exception as err:
+            if self._cancelled:
+                self.signals.cancelled.emit()
+            else:
+                self.signals.failed.emit(str(err))
+            return
+
+        if self._cancelled:
+            self.signals.cancelled.emit()
+        else:
+            self.signals.finished.emit(status, text)
@@ -1,851 +0,0 @@
-# -*- coding: utf-8 -*-
-
-# Resource object code
-#
-# Created by: The Resource Compiler for PyQt5 (Qt v5.15.2)
-#
-# WARNING! All changes made in this file will be lost!
-
-from PyQt5 import QtCore
-
-qt_resource_data = b"\
-\x00\x00\x02\xb0\
-\x3c\
-\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x32\x35\x22\x20\x68\
-\x65\x69\x67\x68\x74\x3d\x22\x31\x37\x22\x20\x76\x69\x65\x77\x42\
-\x6f\x78\x3d\x22\x30\x20\x30\x20\x32\x35\x20\x31\x37\x22\x20\x66\
-\x69\x6c\x6c\x3d\x22\x6e\x6f\x6e\x65\x22\x20\x78\x6d\x6c\x6e\x73\
-\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\
-\x6f\x72\x67\x2f\x32\x30\x30\x30\x2f\x73\x76\x67\x22\x3e\x0a\x3c\
-\x70\x61\x74\x68\x20\x64\x3d\x22\x4d\x32\x34\x2e\x38\x35\x36\x35\
-\x20\x31\x30\x2e\x30\x36\x36\x35\x4c\x32\x31\x2e\x37\x31\x33\x31\
-\x20\x31\x35\x2e\x34\x35\x35\x32\x43\x32\x31\x2e\x34\x36\x38\x35\
-\x20\x31\x35\x2e\x38\x37\x34\x36\x20\x32\x31\x2e\x31\x31\x38\x32\
-\x20\x31\x36\x2e\x32\x32\x32\x35\x20\x32\x30\x2e\x36\x39\x37\x32\
-\x20\x31\x36\x2e\x34\x36\x34\x33\x43\x32\x30\x2e\x32\x37\x36\x33\
-\x20\x31\x36\x2e\x37\x30\x36\x31\x20\x31\x39\x2e\x37\x39\x39\x32\
-\x20\x31\x36\x2e\x38\x33\x33\x33\x20\x31\x39\x2e\x33\x31\x33\x38\
-\x20\x31\x36\x2e\x38\x33\x33\x33\x48\x31\x2e\x39\x35\x34\x32\x31\
-\x43\x31\x2e\x31\x35\x30\x32\x36\x20\x31\x36\x2e\x38\x33\x33\x33\
-\x20\x30\x2e\x36\x34\x39\x33\x34\x39\x20\x31\x35\x2e\x39\x36\x31\
-\x32\x20\x31\x2e\x30\x35\x34\x34\x33\x20\x31\x35\x2e\x32\x36\x36\
-\x38\x4c\x34\x2e\x31\x39\x37\x38\x33\x20\x39\x2e\x38\x37\x38\x31\
-\x32\x43\x34\x2e\x34\x34\x32\x34\x36\x20\x39\x2e\x34\x35\x38\x37\
-\x36\x20\x34\x2e\x37\x39\x32\x37\x32\x20\x39\x2e\x31\x31\x30\x38\
-\x34\x20\x35\x2e\x32\x31\x33\x37\x32\x20\x38\x2e\x38\x36\x39\x30\
-\x34\x43\x35\x2e\x36\x33\x34\x37\x31\x20\x38\x2e\x36\x32\x37\x32\
-\x34\x20\x36\x2e\x31\x31\x31\x37\x33\x20\x38\x2e\x35\x20\x36\x2e\
-\x35\x39\x37\x32\x32\x20\x38\x2e\x35\x48\x32\x33\x2e\x39\x35\x36\
-\x38\x43\x32\x34\x2e\x37\x36\x30\x37\x20\x38\x2e\x35\x20\x32\x35\
-\x2e\x32\x36\x31\x36\x20\x39\x2e\x33\x37\x32\x30\x39\x20\x32\x34\
-\x2e\x38\x35\x36\x35\x20\x31\x30\x2e\x30\x36\x36\x35\x5a\x4d\x36\
-\x2e\x35\x39\x37\x32\x32\x20\x37\x2e\x31\x31\x31\x31\x31\x48\x32\
-\x30\x2e\x38\x33\x33\x33\x56\x35\x2e\x30\x32\x37\x37\x37\x43\x32\
-\x30\x2e\x38\x33\x33\x33\x20\x33\x2e\x38\x37\x37\x31\x37\x20\x31\
-\x39\x2e\x39\x30\x30\x36\x20\x32\x2e\x39\x34\x34\x34\x34\x20\x31\
-\x38\x2e\x37\x35\x20\x32\x2e\x39\x34\x34\x34\x34\x48\x31\x31\x2e\
-\x38\x30\x35\x36\x4c\x39\x2e\x30\x32\x37\x37\x38\x20\x30\x2e\x31\
-\x36\x36\x36\x36\x34\x48\x32\x2e\x30\x38\x33\x33\x33\x43\x30\x2e\
-\x39\x33\x32\x37\x32\x36\x20\x30\x2e\x31\x36\x36\x36\x36\x34\x20\
-\x30\x20\x31\x2e\x30\x39\x39\x33\x39\x20\x30\x20\x32\x2e\x32\x35\
-\x56\x31\x34\x2e\x33\x31\x38\x4c\x32\x2e\x39\x39\x38\x31\x33\x20\
-\x39\x2e\x31\x37\x38\x33\x43\x33\x2e\x37\x34\x31\x39\x33\x20\x37\
-\x2e\x39\x30\x33\x32\x31\x20\x35\x2e\x31\x32\x31\x30\x35\x20\x37\
-\x2e\x31\x31\x31\x31\x31\x20\x36\x2e\x35\x39\x37\x32\x32\x20\x37\
-\x2e\x31\x31\x31\x31\x31\x5a\x22\x20\x66\x69\x6c\x6c\x3d\x22\x62\
-\x6c\x61\x63\x6b\x22\x2f\x3e\x0a\x3c\x2f\x73\x76\x67\x3e\x0a\
-\x00\x00\x01\x7c\
-\x3c\
-\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x32\x35\x22\x20\x68\
-\x65\x69\x67\x68\x74\x3d\x22\x32\x35\x22\x20\x76\x69\x65\x77\x42\
-\x6f\x78\x3d\x22\x30\x20\x30\x20\x32\x35\x20\x32\x35\x22\x20\x66\
-\x69\x6c\x6c\x3d\x22\x6e\x6f\x6e\x65\x22\x20\x78\x6d\x6c\x6e\x73\
-\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\
-\x6f\x72\x67\x2f\x32\x30\x30\x30\x2f\x73\x76\x67\x22\x3e\x0a\x3c\
-\x70\x61\x74\x68\x20\x64\x3d\x22\x4d\x32\x33\x2e\x38\x32\x37\x20\
-\x30\x48\x31\x2e\x31\x37\x33\x32\x34\x43\x30\x2e\x31\x33\x32\x33\
-\x31\x39\x20\x30\x20\x2d\x30\x2e\x33\x39\x32\x39\x32\x35\x20\x31\
-\x2e\x32\x36\x32\x39\x39\x20\x30\x2e\x33\x34\x34\x36\x32\x34\x20\
-\x32\x2e\x30\x30\x30\x35\x34\x4c\x39\x2e\x33\x37\x35\x20\x31\x31\
-\x2e\x30\x33\x32\x33\x56\x32\x31\x2e\x30\x39\x33\x38\x43\x39\x2e\
-\x33\x37\x35\x20\x32\x31\x2e\x34\x37\x36\x31\x20\x39\x2e\x35\x36\
-\x31\x35\x37\x20\x32\x31\x2e\x38\x33\x34\x35\x20\x39\x2e\x38\x37\
-\x34\x38\x35\x20\x32\x32\x2e\x30\x35\x33\x38\x4c\x31\x33\x2e\x37\
-\x38\x31\x31\x20\x32\x34\x2e\x37\x38\x37\x32\x43\x31\x34\x2e\x35\
-\x35\x31\x38\x20\x32\x35\x2e\x33\x32\x36\x37\x20\x31\x35\x2e\x36\
-\x32\x35\x20\x32\x34\x2e\x37\x37\x39\x39\x20\x31\x35\x2e\x36\x32\
-\x35\x20\x32\x33\x2e\x38\x32\x37\x31\x56\x31\x31\x2e\x30\x33\x32\
-\x33\x4c\x32\x34\x2e\x36\x35\x35\x36\x20\x32\x2e\x30\x30\x30\x35\
-\x34\x43\x32\x35\x2e\x33\x39\x31\x36\x20\x31\x2e\x32\x36\x34\x34\
-\x35\x20\x32\x34\x2e\x38\x37\x20\x30\x20\x32\x33\x2e\x38\x32\x37\
-\x20\x30\x5a\x22\x20\x66\x69\x6c\x6c\x3d\x22\x62\x6c\x61\x63\x6b\
-\x22\x2f\x3e\x0a\x3c\x2f\x73\x76\x67\x3e\x0a\
-\x00\x00\x07\x9a\
-\x3c\
-\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x32\x35\x22\x20\x68\
-\x65\x69\x67\x68\x74\x3d\x22\x32\x35\x22\x20\x76\x69\x65\x77\x42\
-\x6f\x78\x3d\x22\x30\x20\x30\x20\x32\x35\x20\x32\x35\x22\x20\x66\
-\x69\x6c\x6c\x3d\x22\x6e\x6f\x6e\x65\x22\x20\x78\x6d\x6c\x6e\x73\
-\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\
-\x6f\x72\x67\x2f\x32\x30\x30\x30\x2f\x73\x76\x67\x22\x3e\x0a\x3c\
-\x70\x61\x74\x68\x20\x64\x3d\x22\x4d\x32\x33\x2e\x34\x33\x37\x35\
-\x20\x37\x2e\x38\x31\x32\x35\x48\x31\x2e\x35\x36\x32\x35\x43\x30\
-\x2e\x36\x39\x39\x35\x36\x31\x20\x37\x2e\x38\x31\x32\x35\x20\x30\
-\x20\x37\x2e\x31\x31\x32\x39\x34\x20\x30\x20\x36\x2e\x32\x35\x56\
-\x33\x2e\x31\x32\x35\x43\x30\x20\x32\x2e\x32\x36\x32\x30\x36\x20\
-\x30\x2e\x36\x39\x39\x35\x36\x31\x20\x31\x2e\x35\x36\x32\x35\x20\
-\x31\x2e\x35\x36\x32\x35\x20\x31\x2e\x35\x36\x32\x35\x48\x32\x33\
-\x2e\x34\x33\x37\x35\x43\x32\x34\x2e\x33\x30\x30\x34\x20\x31\x2e\
-\x35\x36\x32\x35\x20\x32\x35\x20\x32\x2e\x32\x36\x32\x30\x36\x20\
-\x32\x35\x20\x33\x2e\x31\x32\x35\x56\x36\x2e\x32\x35\x43\x32\x35\
-\x20\x37\x2e\x31\x31\x32\x39\x34\x20\x32\x34\x2e\x33\x30\x30\x34\
-\x20\x37\x2e\x38\x31\x32\x35\x20\x32\x33\x2e\x34\x33\x37\x35\x20\
-\x37\x2e\x38\x31\x32\x35\x5a\x4d\x32\x31\x2e\x30\x39\x33\x38\x20\
-\x33\x2e\x35\x31\x35\x36\x32\x43\x32\x30\x2e\x34\x34\x36\x35\x20\
-\x33\x2e\x35\x31\x35\x36\x32\x20\x31\x39\x2e\x39\x32\x31\x39\x20\
-\x34\x2e\x30\x34\x30\x32\x38\x20\x31\x39\x2e\x39\x32\x31\x39\x20\
-\x34\x2e\x36\x38\x37\x35\x43\x31\x39\x2e\x39\x32\x31\x39\x20\x35\
-\x2e\x33\x33\x34\x37\x32\x20\x32\x30\x2e\x34\x34\x36\x35\x20\x35\
-\x2e\x38\x35\x39\x33\x38\x20\x32\x31\x2e\x30\x39\x33\x38\x20\x35\
-\x2e\x38\x35\x39\x33\x38\x43\x32\x31\x2e\x37\x34\x31\x20\x35\x2e\
-\x38\x35\x39\x33\x38\x20\x32\x32\x2e\x32\x36\x35\x36\x20\x35\x2e\
-\x33\x33\x34\x37\x32\x20\x32\x32\x2e\x32\x36\x35\x36\x20\x34\x2e\
-\x36\x38\x37\x35\x43\x32\x32\x2e\x32\x36\x35\x36\x20\x34\x2e\x30\
-\x34\x30\x32\x38\x20\x32\x31\x2e\x37\x34\x31\x20\x33\x2e\x35\x31\
-\x35\x36\x32\x20\x32\x31\x2e\x30\x39\x33\x38\x20\x33\x2e\x35\x31\
-\x35\x36\x32\x5a\x4d\x31\x37\x2e\x39\x36\x38\x38\x20\x33\x2e\x35\
-\x31\x35\x36\x32\x43\x31\x37\x2e\x33\x32\x31\x35\x20\x33\x2e\x35\
-\x31\x35\x36\x32\x20\x31\x36\x2e\x37\x39\x36\x39\x20\x34\x2e\x30\
-\x34\x30\x32\x38\x20\x31\x36\x2e\x37\x39\x36\x39\x20\x34\x2e\x36\
-\x38\x37\x35\x43\x31\x36\x2e\x37\x39\x36\x39\x20\x35\x2e\x33\x33\
-\x34\x37\x32\x20\x31\x37\x2e\x33\x32\x31\x35\x20\x35\x2e\x38\x35\
-\x39\x33\x38\x20\x31\x37\x2e\x39\x36\x38\x38\x20\x35\x2e\x38\x35\
-\x39\x33\x38\x43\x31\x38\x2e\x36\x31\x36\x20\x35\x2e\x38\x35\x39\
-\x33\x38\x20\x31\x39\x2e\x31\x34\x30\x36\x20\x35\x2e\x33\x33\x34\
-\x37\x32\x20\x31\x39\x2e\x31\x34\x30\x36\x20\x34\x2e\x36\x38\x37\
-\x35\x43\x31\x39\x2e\x31\x34\x30\x36\x20\x34\x2e\x30\x34\x30\x32\
-\x38\x20\x31\x38\x2e\x36\x31\x36\x20\x33\x2e\x35\x31\x35\x36\x32\
-\x20\x31\x37\x2e\x39\x36\x38\x38\x20\x33\x2e\x35\x31\x35\x36\x32\
-\x5a\x4d\x32\x33\x2e\x34\x33\x37\x35\x20\x31\x35\x2e\x36\x32\x35\
-\x48\x31\x2e\x35\x36\x32\x35\x43\x30\x2e\x36\x39\x39\x35\x36\x31\
-\x20\x31\x35\x2e\x36\x32\x35\x20\x30\x20\x31\x34\x2e\x39\x32\x35\
-\x34\x20\x30\x20\x31\x34\x2e\x30\x36\x32\x35\x56\x31\x30\x2e\x39\
-\x33\x37\x35\x43\x30\x20\x31\x30\x2e\x30\x37\x34\x36\x20\x30\x2e\
-\x36\x39\x39\x35\x36\x31\x20\x39\x2e\x33\x37\x35\x20\x31\x2e\x35\
-\x36\x32\x35\x20\x39\x2e\x33\x37\x35\x48\x32\x33\x2e\x34\x33\x37\
-\x35\x43\x32\x34\x2e\x33\x30\x30\x34\x20\x39\x2e\x33\x37\x35\x20\
-\x32\x35\x20\x31\x30\x2e\x30\x37\x34\x36\x20\x32\x35\x20\x31\x30\
-\x2e\x39\x33\x37\x35\x56\x31\x34\x2e\x30\x36\x32\x35\x43\x32\x35\
-\x20\x31\x34\x2e\x39\x32\x35\x34\x20\x32\x34\x2e\x33\x30\x30\x34\
-\x20\x31\x35\x2e\x36\x32\x35\x20\x32\x33\x2e\x34\x33\x37\x35\x20\
-\x31\x35\x2e\x36\x32\x35\x5a\x4d\x32\x31\x2e\x30\x39\x33\x38\x20\
-\x31\x31\x2e\x33\x32\x38\x31\x43\x32\x30\x2e\x34\x34\x36\x35\x20\
-\x31\x31\x2e\x33\x32\x38\x31\x20\x31\x39\x2e\x39\x32\x31\x39\x20\
-\x31\x31\x2e\x38\x35\x32\x38\x20\x31\x39\x2e\x39\x32\x31\x39\x20\
-\x31\x32\x2e\x35\x43\x31\x39\x2e\x39\x32\x31\x39\x20\x31\x33\x2e\
-\x31\x34\x37\x32\x20\x32\x30\x2e\x34\x34\x36\x35\x20\x31\x33\x2e\
-\x36\x37\x31\x39\x20\x32\x31\x2e\x30\x39\x33\x38\x20\x31\x33\x2e\
-\x36\x37\x31\x39\x43\x32\x31\x2e\x37\x34\x31\x20\x31\x33\x2e\x36\
-\x37\x31\x39\x20\x32\x32\x2e\x32\x36\x35\x36\x20\x31\x33\x2e\x31\
-\x34\x37\x32\x20\x32\x32\x2e\x32\x36\x35\x36\x20\x31\x32\x2e\x35\
-\x43\x32\x32\x2e\x32\x36\x35\x36\x20\x31\x31\x2e\x38\x35\x32\x38\
-\x20\x32\x31\x2e\x37\x34\x31\x20\x31\x31\x2e\x33\x32\x38\x31\x20\
-\x32\x31\x2e\x30\x39\x33\x38\x20\x31\x31\x2e\x33\x32\x38\x31\x5a\
-\x4d\x31\x37\x2e\x39\x36\x38\x38\x20\x31\x31\x2e\x33\x32\x38\x31\
-\x43\x31\x37\x2e\x33\x32\x31\x35\x20\x31\x31\x2e\x33\x32\x38\x31\
-\x20\x31\x36\x2e\x37\x39\x36\x39\x20\x31\x31\x2e\x38\x35\x32\x38\
-\x20\x31\x36\x2e\x37\x39\x36\x39\x20\x31\x32\x2e\x35\x43\x31\x36\
-\x2e\x37\x39\x36\x39\x20\x31\x33\x2e\x31\x34\x37\x32\x20\x31\x37\
-\x2e\x33\x32\x31\x35\x20\x31\x33\x2e\x36\x37\x31\x39\x20\x31\x37\
-\x2e\x39\x36\x38\x38\x20\x31\x33\x2e\x36\x37\x31\x39\x43\x31\x38\
-\x2e\x36\x31\x36\x20\x31\x33\x2e\x36\x37\x31\x39\x20\x31\x39\x2e\
-\x31\x34\x30\x36\x20\x31\x33\x2e\x31\x34\x37\x32\x20\x31\x39\x2e\
-\x31\x34\x30\x36\x20\x31\x32\x2e\x35\x43\x31\x39\x2e\x31\x34\x30\
-\x36\x20\x31\x31\x2e\x38\x35\x32\x38\x20\x31\x38\x2e\x36\x31\x36\
-\x20\x31\x31\x2e\x33\x32\x38\x31\x20\x31\x37\x2e\x39\x36\x38\x38\
-\x20\x31\x31\x2e\x33\x32\x38\x31\x5a\x4d\x32\x33\x2e\x34\x33\x37\
-\x35\x20\x32\x33\x2e\x34\x33\x37\x35\x48\x31\x2e\x35\x36\x32\x35\
-\x43\x30\x2e\x36\x39\x39\x35\x36\x31\x20\x32\x33\x2e\x34\x33\x37\
-\x35\x20\x30\x20\x32\x32\x2e\x37\x33\x37\x39\x20\x30\x20\x32\x31\
-\x2e\x38\x37\x35\x56\x31\x38\x2e\x37\x35\x43\x30\x20\x31\x37\x2e\
-\x38\x38\x37\x31\x20\x30\x2e\x36\x39\x39\x35\x36\x31\x20\x31\x37\
-\x2e\x31\x38\x37\x35\x20\x31\x2e\x35\x36\x32\x35\x20\x31\x37\x2e\
-\x31\x38\x37\x35\x48\x32\x33\x2e\x34\x33\x37\x35\x43\x32\x34\x2e\
-\x33\x30\x30\x34\x20\x31\x37\x2e\x31\x38\x37\x35\x20\x32\x35\x20\
-\x31\x37\x2e\x38\x38\x37\x31\x20\x32\x35\x20\x31\x38\x2e\x37\x35\
-\x56\x32\x31\x2e\x38\x37\x35\x43\x32\x35\x20\x32\x32\x2e\x37\x33\
-\x37\x39\x20\x32\x34\x2e\x33\x30\x30\x34\x20\x32\x33\x2e\x34\x33\
-\x37\x35\x20\x32\x33\x2e\x34\x33\x37\x35\x20\x32\x33\x2e\x34\x33\
-\x37\x35\x5a\x4d\x32\x31\x2e\x30\x39\x33\x38\x20\x31\x39\x2e\x31\
-\x34\x30\x36\x43\x32\x30\x2e\x34\x34\x36\x35\x20\x31\x39\x2e\x31\
-\x34\x30\x36\x20\x31\x39\x2e\x39\x32\x31\x39\x20\x31\x39\x2e\x36\
-\x36\x35\x33\x20\x31\x39\x2e\x39\x32\x31\x39\x20\x32\x30\x2e\x33\
-\x31\x32\x35\x43\x31\x39\x2e\x39\x32\x31\x39\x20\x32\x30\x2e\x39\
-\x35\x39\x37\x20\x32\x30\x2e\x34\x34\x36\x35\x20\x32\x31\x2e\x34\
-\x38\x34\x34\x20\x32\x31\x2e\x30\x39\x33\x38\x20\x32\x31\x2e\x34\
-\x38\x34\x34\x43\x32\x31\x2e\x37\x34\x31\x20\x32\x31\x2e\x34\x38\
-\x34\x34\x20\x32\x32\x2e\x32\x36\x35\x36\x20\x32\x30\x2e\x39\x35\
-\x39\x37\x20\x32\x32\x2e\x32\x36\x35\x36\x20\x32\x30\x2e\x33\x31\
-\x32\x35\x43\x32\x32\x2e\x32\x36\x35\x36\x20\x31\x39\x2e\x36\x36\
-\x35\x33\x20\x32\x31\x2e\x37\x34\x31\x20\x31\x39\x2e\x31\x34\x30\
-\x36\x20\x32\x31\x2e\x30\x39\x33\x38\x20\x31\x39\x2e\x31\x34\x30\
-\x36\x5a\x4d\x31\x37\x2e\x39\x36\x38\x38\x20\x31\x39\x2e\x31\x34\
-\x30\x36\x43\x31\x37\x2e\x33\x32\x31\x35\x20\x31\x39\x2e\x31\x34\
-\x30\x36\x20\x31\x36\x2e\x37\x39\x36\x39\x20\x31\x39\x2e\x36\x36\
-\x35\x33\x20\x31\x36\x2e\x37\x39\x36\x39\x20\x32\x30\x2e\x33\x31\
-\x32\x35\x43\x31\x36\x2e\x37\x39\x36\x39\x20\x32\x30\x2e\x39\x35\
-\x39\x37\x20\x31\x37\x2e\x33\x32\x31\x35\x20\x32\x31\x2e\x34\x38\
-\x34\x34\x20\x31\x37\x2e\x39\x36\x38\x38\x20\x32\x31\x2e\x34\x38\
-\x34\x34\x43\x31\x38\x2e\x36\x31\x36\x20\x32\x31\x2e\x34\x38\x34\
-\x34\x20\x31\x39\x2e\x31\x34\x30\x36\x20\x32\x30\x2e\x39\x35\x39\
-\x37\x20\x31\x39\x2e\x31\x34\x30\x36\x20\x32\x30\x2e\x33\x31\x32\
-\x35\x43\x31\x39\x2e\x31\x34\x30\x36\x20\x31\x39\x2e\x36\x36\x35\
-\x33\x20\x31\x38\x2e\x36\x31\x36\x20\x31\x39\x2e\x31\x34\x30\x36\
-\x20\x31\x37\x2e\x39\x36\x38\x38\x20\x31\x39\x2e\x31\x34\x30\x36\
-\x5a\x22\x20\x66\x69\x6c\x6c\x3d\x22\x62\x6c\x61\x63\x6b\x22\x2f\
-\x3e\x0a\x3c\x2f\x73\x76\x67\x3e\x0a\
-\x00\x00\x06\x69\
-\x3c\
-\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x32\x35\x22\x20\x68\
-\x65\x69\x67\x68\x74\x3d\x22\x32\x35\x22\x20\x76\x69\x65\x77\x42\
-\x6f\x78\x3d\x22\x30\x20\x30\x20\x32\x35\x20\x32\x35\x22\x20\x66\
-\x69\x6c\x6c\x3d\x22\x6e\x6f\x6e\x65\x22\x20\x78\x6d\x6c\x6e\x73\
-\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\
-\x6f\x72\x67\x2f\x32\x30\x30\x30\x2f\x73\x76\x67\x22\x3e\x0a\x3c\
-\x70\x61\x74\x68\x20\x64\x3d\x22\x4d\x32\x33\x2e\x37\x39\x38\x38\
-\x20\x31\x35\x2e\x34\x31\x35\x31\x4c\x32\x31\x2e\x37\x31\x38\x37\
-\x20\x31\x34\x2e\x32\x31\x33\x39\x43\x32\x31\x2e\x39\x32\x38\x37\
-\x20\x31\x33\x2e\x30\x38\x31\x31\x20\x32\x31\x2e\x39\x32\x38\x37\
-\x20\x31\x31\x2e\x39\x31\x39\x20\x32\x31\x2e\x37\x31\x38\x37\x20\
-\x31\x30\x2e\x37\x38\x36\x32\x4c\x32\x33\x2e\x37\x39\x38\x38\x20\
-\x39\x2e\x35\x38\x35\x30\x31\x43\x32\x34\x2e\x30\x33\x38\x31\x20\
-\x39\x2e\x34\x34\x38\x32\x39\x20\x32\x34\x2e\x31\x34\x35\x35\x20\
-\x39\x2e\x31\x36\x35\x30\x38\x20\x32\x34\x2e\x30\x36\x37\x34\x20\
-\x38\x2e\x39\x30\x31\x34\x31\x43\x32\x33\x2e\x35\x32\x35\x34\x20\
-\x37\x2e\x31\x36\x33\x31\x33\x20\x32\x32\x2e\x36\x30\x32\x35\x20\
-\x35\x2e\x35\x39\x30\x38\x37\x20\x32\x31\x2e\x33\x39\x36\x35\x20\
-\x34\x2e\x32\x38\x32\x32\x37\x43\x32\x31\x2e\x32\x31\x30\x39\x20\
-\x34\x2e\x30\x38\x32\x30\x38\x20\x32\x30\x2e\x39\x30\x38\x32\x20\
-\x34\x2e\x30\x33\x33\x32\x35\x20\x32\x30\x2e\x36\x37\x33\x38\x20\
-\x34\x2e\x31\x36\x39\x39\x37\x4c\x31\x38\x2e\x35\x39\x33\x37\x20\
-\x35\x2e\x33\x37\x31\x31\x34\x43\x31\x37\x2e\x37\x31\x39\x37\x20\
-\x34\x2e\x36\x31\x39\x31\x39\x20\x31\x36\x2e\x37\x31\x33\x39\x20\
-\x34\x2e\x30\x33\x38\x31\x33\x20\x31\x35\x2e\x36\x32\x35\x20\x33\
-\x2e\x36\x35\x37\x32\x37\x56\x31\x2e\x32\x35\x39\x38\x31\x43\x31\
-\x35\x2e\x36\x32\x35\x20\x30\x2e\x39\x38\x36\x33\x37\x34\x20\x31\
-\x35\x2e\x34\x33\x34\x36\x20\x30\x2e\x37\x34\x37\x31\x31\x36\x20\
-\x31\x35\x2e\x31\x36\x36\x20\x30\x2e\x36\x38\x38\x35\x32\x32\x43\
-\x31\x33\x2e\x33\x37\x34\x20\x30\x2e\x32\x38\x38\x31\x33\x32\x20\
-\x31\x31\x2e\x35\x33\x38\x31\x20\x30\x2e\x33\x30\x37\x36\x36\x33\
-\x20\x39\x2e\x38\x33\x33\x39\x38\x20\x30\x2e\x36\x38\x38\x35\x32\
-\x32\x43\x39\x2e\x35\x36\x35\x34\x32\x20\x30\x2e\x37\x34\x37\x31\
-\x31\x36\x20\x39\x2e\x33\x37\x34\x39\x39\x20\x30\x2e\x39\x38\x36\
-\x33\x37\x34\x20\x39\x2e\x33\x37\x34\x39\x39\x20\x31\x2e\x32\x35\
-\x39\x38\x31\x56\x33\x2e\x36\x36\x32\x31\x36\x43\x38\x2e\x32\x39\
-\x31\x30\x31\x20\x34\x2e\x30\x34\x37\x39\x20\x37\x2e\x32\x38\x35\
-\x31\x35\x20\x34\x2e\x36\x32\x38\x39\x35\x20\x36\x2e\x34\x30\x36\
-\x32\x34\x20\x35\x2e\x33\x37\x36\x30\x32\x4c\x34\x2e\x33\x33\x31\
-\x30\x35\x20\x34\x2e\x31\x37\x34\x38\x35\x43\x34\x2e\x30\x39\x31\
-\x37\x39\x20\x34\x2e\x30\x33\x38\x31\x33\x20\x33\x2e\x37\x39\x33\
-\x39\x34\x20\x34\x2e\x30\x38\x32\x30\x38\x20\x33\x2e\x36\x30\x38\
-\x33\x39\x20\x34\x2e\x32\x38\x37\x31\x36\x43\x32\x2e\x34\x30\x32\
-\x33\x34\x20\x35\x2e\x35\x39\x30\x38\x37\x20\x31\x2e\x34\x37\x39\
-\x34\x39\x20\x37\x2e\x31\x36\x33\x31\x33\x20\x30\x2e\x39\x33\x37\
-\x34\x39\x34\x20\x38\x2e\x39\x30\x36\x33\x43\x30\x2e\x38\x35\x34\
-\x34\x38\x36\x20\x39\x2e\x31\x36\x39\x39\x37\x20\x30\x2e\x39\x36\
-\x36\x37\x39\x20\x39\x2e\x34\x35\x33\x31\x37\x20\x31\x2e\x32\x30\
-\x36\x30\x35\x20\x39\x2e\x35\x38\x39\x38\x39\x4c\x33\x2e\x32\x38\
-\x36\x31\x33\x20\x31\x30\x2e\x37\x39\x31\x31\x43\x33\x2e\x30\x37\
-\x36\x31\x37\x20\x31\x31\x2e\x39\x32\x33\x39\x20\x33\x2e\x30\x37\
-\x36\x31\x37\x20\x31\x33\x2e\x30\x38\x36\x20\x33\x2e\x32\x38\x36\
-\x31\x33\x20\x31\x34\x2e\x32\x31\x38\x38\x4c\x31\x2e\x32\x30\x36\
-\x30\x35\x20\x31\x35\x2e\x34\x32\x43\x30\x2e\x39\x36\x36\x37\x39\
-\x20\x31\x35\x2e\x35\x35\x36\x37\x20\x30\x2e\x38\x35\x39\x33\x36\
-\x39\x20\x31\x35\x2e\x38\x33\x39\x39\x20\x30\x2e\x39\x33\x37\x34\
-\x39\x34\x20\x31\x36\x2e\x31\x30\x33\x36\x43\x31\x2e\x34\x37\x39\
-\x34\x39\x20\x31\x37\x2e\x38\x34\x31\x38\x20\x32\x2e\x34\x30\x32\
-\x33\x34\x20\x31\x39\x2e\x34\x31\x34\x31\x20\x33\x2e\x36\x30\x38\
-\x33\x39\x20\x32\x30\x2e\x37\x32\x32\x37\x43\x33\x2e\x37\x39\x33\
-\x39\x34\x20\x32\x30\x2e\x39\x32\x32\x39\x20\x34\x2e\x30\x39\x36\
-\x36\x37\x20\x32\x30\x2e\x39\x37\x31\x37\x20\x34\x2e\x33\x33\x31\
-\x30\x35\x20\x32\x30\x2e\x38\x33\x35\x4c\x36\x2e\x34\x31\x31\x31\
-\x33\x20\x31\x39\x2e\x36\x33\x33\x38\x43\x37\x2e\x32\x38\x35\x31\
-\x35\x20\x32\x30\x2e\x33\x38\x35\x38\x20\x38\x2e\x32\x39\x31\x30\
-\x31\x20\x32\x30\x2e\x39\x36\x36\x38\x20\x39\x2e\x33\x37\x39\x38\
-\x38\x20\x32\x31\x2e\x33\x34\x37\x37\x56\x32\x33\x2e\x37\x35\x43\
-\x39\x2e\x33\x37\x39\x38\x38\x20\x32\x34\x2e\x30\x32\x33\x35\x20\
-\x39\x2e\x35\x37\x30\x33\x31\x20\x32\x34\x2e\x32\x36\x32\x37\x20\
-\x39\x2e\x38\x33\x38\x38\x36\x20\x32\x34\x2e\x33\x32\x31\x33\x43\
-\x31\x31\x2e\x36\x33\x30\x39\x20\x32\x34\x2e\x37\x32\x31\x37\x20\
-\x31\x33\x2e\x34\x36\x36\x38\x20\x32\x34\x2e\x37\x30\x32\x32\x20\
-\x31\x35\x2e\x31\x37\x30\x39\x20\x32\x34\x2e\x33\x32\x31\x33\x43\
-\x31\x35\x2e\x34\x33\x39\x34\x20\x32\x34\x2e\x32\x36\x32\x37\x20\
-\x31\x35\x2e\x36\x32\x39\x39\x20\x32\x34\x2e\x30\x32\x33\x35\x20\
-\x31\x35\x2e\x36\x32\x39\x39\x20\x32\x33\x2e\x37\x35\x56\x32\x31\
-\x2e\x33\x34\x37\x37\x43\x31\x36\x2e\x37\x31\x33\x39\x20\x32\x30\
-\x2e\x39\x36\x32\x20\x31\x37\x2e\x37\x31\x39\x37\x20\x32\x30\x2e\
-\x33\x38\x30\x39\x20\x31\x38\x2e\x35\x39\x38\x36\x20\x31\x39\x2e\
-\x36\x33\x33\x38\x4c\x32\x30\x2e\x36\x37\x38\x37\x20\x32\x30\x2e\
-\x38\x33\x35\x43\x32\x30\x2e\x39\x31\x38\x20\x32\x30\x2e\x39\x37\
-\x31\x37\x20\x32\x31\x2e\x32\x31\x35\x38\x20\x32\x30\x2e\x39\x32\
-\x37\x38\x20\x32\x31\x2e\x34\x30\x31\x34\x20\x32\x30\x2e\x37\x32\
-\x32\x37\x43\x32\x32\x2e\x36\x30\x37\x34\x20\x31\x39\x2e\x34\x31\
-\x39\x20\x32\x33\x2e\x35\x33\x30\x33\x20\x31\x37\x2e\x38\x34\x36\
-\x37\x20\x32\x34\x2e\x30\x37\x32\x33\x20\x31\x36\x2e\x31\x30\x33\
-\x36\x43\x32\x34\x2e\x31\x34\x35\x35\x20\x31\x35\x2e\x38\x33\x35\
-\x20\x32\x34\x2e\x30\x33\x38\x31\x20\x31\x35\x2e\x35\x35\x31\x38\
-\x20\x32\x33\x2e\x37\x39\x38\x38\x20\x31\x35\x2e\x34\x31\x35\x31\
-\x5a\x4d\x31\x32\x2e\x35\x20\x31\x36\x2e\x34\x30\x36\x33\x43\x31\
-\x30\x2e\x33\x34\x36\x37\x20\x31\x36\x2e\x34\x30\x36\x33\x20\x38\
-\x2e\x35\x39\x33\x37\x34\x20\x31\x34\x2e\x36\x35\x33\x34\x20\x38\
-\x2e\x35\x39\x33\x37\x34\x20\x31\x32\x2e\x35\x43\x38\x2e\x35\x39\
-\x33\x37\x34\x20\x31\x30\x2e\x33\x34\x36\x37\x20\x31\x30\x2e\x33\
-\x34\x36\x37\x20\x38\x2e\x35\x39\x33\x38\x20\x31\x32\x2e\x35\x20\
-\x38\x2e\x35\x39\x33\x38\x43\x31\x34\x2e\x36\x35\x33\x33\x20\x38\
-\x2e\x35\x39\x33\x38\x20\x31\x36\x2e\x34\x30\x36\x32\x20\x31\x30\
-\x2e\x33\x34\x36\x37\x20\x31\x36\x2e\x34\x30\x36\x32\x20\x31\x32\
-\x2e\x35\x43\x31\x36\x2e\x34\x30\x36\x32\x20\x31\x34\x2e\x36\x35\
-\x33\x34\x20\x31\x34\x2e\x36\x35\x33\x33\x20\x31\x36\x2e\x34\x30\
-\x36\x33\x20\x31\x32\x2e\x35\x20\x31\x36\x2e\x34\x30\x36\x33\x5a\
-\x22\x20\x66\x69\x6c\x6c\x3d\x22\x62\x6c\x61\x63\x6b\x22\x2f\x3e\
-\x0a\x3c\x2f\x73\x76\x67\x3e\x0a\
-\x00\x00\x01\x67\
-\x3c\
-\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x32\x33\x22\x20\x68\
-\x65\x69\x67\x68\x74\x3d\x22\x32\x33\x22\x20\x76\x69\x65\x77\x42\
-\x6f\x78\x3d\x22\x30\x20\x30\x20\x32\x33\x20\x32\x33\x22\x20\x66\
-\x69\x6c\x6c\x3d\x22\x6e\x6f\x6e\x65\x22\x20\x78\x6d\x6c\x6e\x73\
-\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\
-\x6f\x72\x67\x2f\x32\x30\x30\x30\x2f\x73\x76\x67\x22\x3e\x0a\x3c\
-\x70\x61\x74\x68\x20\x64\x3d\x22\x4d\x32\x30\x2e\x30\x39\x33\x38\
-\x20\x30\x2e\x35\x36\x32\x35\x48\x32\x2e\x39\x30\x36\x32\x35\x43\
-\x31\x2e\x36\x31\x32\x33\x20\x30\x2e\x35\x36\x32\x35\x20\x30\x2e\
-\x35\x36\x32\x35\x20\x31\x2e\x36\x31\x32\x33\x20\x30\x2e\x35\x36\
-\x32\x35\x20\x32\x2e\x39\x30\x36\x32\x35\x56\x32\x30\x2e\x30\x39\
-\x33\x38\x43\x30\x2e\x35\x36\x32\x35\x20\x32\x31\x2e\x33\x38\x37\
-\x37\x20\x31\x2e\x36\x31\x32\x33\x20\x32\x32\x2e\x34\x33\x37\x35\
-\x20\x32\x2e\x39\x30\x36\x32\x35\x20\x32\x32\x2e\x34\x33\x37\x35\
-\x48\x32\x30\x2e\x30\x39\x33\x38\x43\x32\x31\x2e\x33\x38\x37\x37\
-\x20\x32\x32\x2e\x34\x33\x37\x35\x20\x32\x32\x2e\x34\x33\x37\x35\
-\x20\x32\x31\x2e\x33\x38\x37\x37\x20\x32\x32\x2e\x34\x33\x37\x35\
-\x20\x32\x30\x2e\x30\x39\x33\x38\x56\x32\x2e\x39\x30\x36\x32\x35\
-\x43\x32\x32\x2e\x34\x33\x37\x35\x20\x31\x2e\x36\x31\x32\x33\x20\
-\x32\x31\x2e\x33\x38\x37\x37\x20\x30\x2e\x35\x36\x32\x35\x20\x32\
-\x30\x2e\x30\x39\x33\x38\x20\x30\x2e\x35\x36\x32\x35\x5a\x22\x20\
-\x66\x69\x6c\x6c\x3d\x22\x62\x6c\x61\x63\x6b\x22\x2f\x3e\x0a\x3c\
-\x2f\x73\x76\x67\x3e\x0a\
-\x00\x00\x01\x4a\
-\x3c\
-\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x32\x33\x22\x20\x68\
-\x65\x69\x67\x68\x74\x3d\x22\x32\x35\x22\x20\x76\x69\x65\x77\x42\
-\x6f\x78\x3d\x22\x30\x20\x30\x20\x32\x33\x20\x32\x35\x22\x20\x66\
-\x69\x6c\x6c\x3d\x22\x6e\x6f\x6e\x65\x22\x20\x78\x6d\x6c\x6e\x73\
-\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\
-\x6f\x72\x67\x2f\x32\x30\x30\x30\x2f\x73\x76\x67\x22\x3e\x0a\x3c\
-\x70\x61\x74\x68\x20\x64\x3d\x22\x4d\x32\x31\x2e\x32\x38\x35\x32\
-\x20\x31\x30\x2e\x34\x38\x33\x34\x4c\x34\x2e\x30\x39\x37\x36\x36\
-\x20\x30\x2e\x33\x32\x32\x32\x38\x37\x43\x32\x2e\x37\x30\x31\x31\
-\x37\x20\x2d\x30\x2e\x35\x30\x32\x39\x30\x38\x20\x30\x2e\x35\x36\
-\x32\x35\x20\x30\x2e\x32\x39\x37\x38\x37\x33\x20\x30\x2e\x35\x36\
-\x32\x35\x20\x32\x2e\x33\x33\x38\x38\x39\x56\x32\x32\x2e\x36\x35\
-\x36\x33\x43\x30\x2e\x35\x36\x32\x35\x20\x32\x34\x2e\x34\x38\x37\
-\x33\x20\x32\x2e\x35\x34\x39\x38\x20\x32\x35\x2e\x35\x39\x30\x38\
-\x20\x34\x2e\x30\x39\x37\x36\x36\x20\x32\x34\x2e\x36\x37\x32\x39\
-\x4c\x32\x31\x2e\x32\x38\x35\x32\x20\x31\x34\x2e\x35\x31\x36\x36\
-\x43\x32\x32\x2e\x38\x31\x38\x34\x20\x31\x33\x2e\x36\x31\x33\x33\
-\x20\x32\x32\x2e\x38\x32\x33\x32\x20\x31\x31\x2e\x33\x38\x36\x37\
-\x20\x32\x31\x2e\x32\x38\x35\x32\x20\x31\x30\x2e\x34\x38\x33\x34\
-\x5a\x22\x20\x66\x69\x6c\x6c\x3d\x22\x62\x6c\x61\x63\x6b\x22\x2f\
-\x3e\x0a\x3c\x2f\x73\x76\x67\x3e\x0a\
-\x00\x00\x01\x4a\
-\x3c\
-\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x32\x33\x22\x20\x68\
-\x65\x69\x67\x68\x74\x3d\x22\x32\x35\x22\x20\x76\x69\x65\x77\x42\
-\x6f\x78\x3d\x22\x30\x20\x30\x20\x32\x33\x20\x32\x35\x22\x20\x66\
-\x69\x6c\x6c\x3d\x22\x6e\x6f\x6e\x65\x22\x20\x78\x6d\x6c\x6e\x73\
-\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\
-\x6f\x72\x67\x2f\x32\x30\x30\x30\x2f\x73\x76\x67\x22\x3e\x0a\x3c\
-\x70\x61\x74\x68\x20\x64\x3d\x22\x4d\x32\x31\x2e\x32\x38\x35\x32\
-\x20\x31\x30\x2e\x34\x38\x33\x34\x4c\x34\x2e\x30\x39\x37\x36\x36\
-\x20\x30\x2e\x33\x32\x32\x32\x38\x37\x43\x32\x2e\x37\x30\x31\x31\
-\x37\x20\x2d\x30\x2e\x35\x30\x32\x39\x30\x38\x20\x30\x2e\x35\x36\
-\x32\x35\x20\x30\x2e\x32\x39\x37\x38\x37\x33\x20\x30\x2e\x35\x36\
-\x32\x35\x20\x32\x2e\x33\x33\x38\x38\x39\x56\x32\x32\x2e\x36\x35\
-\x36\x33\x43\x30\x2e\x35\x36\x32\x35\x20\x32\x34\x2e\x34\x38\x37\
-\x33\x20\x32\x2e\x35\x34\x39\x38\x20\x32\x35\x2e\x35\x39\x30\x38\
-\x20\x34\x2e\x30\x39\x37\x36\x36\x20\x32\x34\x2e\x36\x37\x32\x39\
-\x4c\x32\x31\x2e\x32\x38\x35\x32\x20\x31\x34\x2e\x35\x31\x36\x36\
-\x43\x32\x32\x2e\x38\x31\x38\x34\x20\x31\x33\x2e\x36\x31\x33\x33\
-\x20\x32\x32\x2e\x38\x32\x33\x32\x20\x31\x31\x2e\x33\x38\x36\x37\
-\x20\x32\x31\x2e\x32\x38\x35\x32\x20\x31\x30\x2e\x34\x38\x33\x34\
-\x5a\x22\x20\x66\x69\x6c\x6c\x3d\x22\x62\x6c\x61\x63\x6b\x22\x2f\
-\x3e\x0a\x3c\x2f\x73\x76\x67\x3e\x0a\
-\x00\x00\x02\x95\
-\x3c\
-\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x32\x35\x22\x20\x68\
-\x65\x69\x67\x68\x74\x3d\x22\x31\x39\x22\x20\x76\x69\x65\x77\x42\
-\x6f\x78\x3d\x22\x30\x20\x30\x20\x32\x35\x20\x31\x39\x22\x20\x66\
-\x69\x6c\x6c\x3d\x22\x6e\x6f\x6e\x65\x22\x20\x78\x6d\x6c\x6e\x73\
-\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\
-\x6f\x72\x67\x2f\x32\x30\x30\x30\x2f\x73\x76\x67\x22\x3e\x0a\x3c\
-\x70\x61\x74\x68\x20\x64\x3d\x22\x4d\x32\x34\x2e\x32\x31\x38\x38\
-\x20\x36\x2e\x33\x37\x35\x48\x32\x31\x2e\x38\x37\x35\x56\x34\x2e\
-\x30\x33\x31\x32\x35\x43\x32\x31\x2e\x38\x37\x35\x20\x33\x2e\x36\
-\x30\x31\x35\x36\x20\x32\x31\x2e\x35\x32\x33\x34\x20\x33\x2e\x32\
-\x35\x20\x32\x31\x2e\x30\x39\x33\x38\x20\x33\x2e\x32\x35\x48\x31\
-\x38\x2e\x37\x35\x56\x30\x2e\x39\x30\x36\x32\x35\x43\x31\x38\x2e\
-\x37\x35\x20\x30\x2e\x34\x37\x36\x35\x36\x32\x20\x31\x38\x2e\x33\
-\x39\x38\x34\x20\x30\x2e\x31\x32\x35\x20\x31\x37\x2e\x39\x36\x38\
-\x38\x20\x30\x2e\x31\x32\x35\x48\x37\x2e\x30\x33\x31\x32\x35\x43\
-\x36\x2e\x36\x30\x31\x35\x36\x20\x30\x2e\x31\x32\x35\x20\x36\x2e\
-\x32\x35\x20\x30\x2e\x34\x37\x36\x35\x36\x32\x20\x36\x2e\x32\x35\
-\x20\x30\x2e\x39\x30\x36\x32\x35\x56\x33\x2e\x32\x35\x48\x33\x2e\
-\x39\x30\x36\x32\x35\x43\x33\x2e\x34\x37\x36\x35\x36\x20\x33\x2e\
-\x32\x35\x20\x33\x2e\x31\x32\x35\x20\x33\x2e\x36\x30\x31\x35\x36\
-\x20\x33\x2e\x31\x32\x35\x20\x34\x2e\x30\x33\x31\x32\x35\x56\x36\
-\x2e\x33\x37\x35\x48\x30\x2e\x37\x38\x31\x32\x35\x43\x30\x2e\x33\
-\x35\x31\x35\x36\x32\x20\x36\x2e\x33\x37\x35\x20\x30\x20\x36\x2e\
-\x37\x32\x36\x35\x36\x20\x30\x20\x37\x2e\x31\x35\x36\x32\x35\x56\
-\x31\x38\x2e\x30\x39\x33\x38\x43\x30\x20\x31\x38\x2e\x35\x32\x33\
-\x34\x20\x30\x2e\x33\x35\x31\x35\x36\x32\x20\x31\x38\x2e\x38\x37\
-\x35\x20\x30\x2e\x37\x38\x31\x32\x35\x20\x31\x38\x2e\x38\x37\x35\
-\x48\x34\x2e\x36\x38\x37\x35\x56\x31\x32\x2e\x36\x32\x35\x48\x36\
-\x2e\x32\x35\x56\x31\x38\x2e\x38\x37\x35\x48\x39\x2e\x33\x37\x35\
-\x56\x31\x32\x2e\x36\x32\x35\x48\x31\x30\x2e\x39\x33\x37\x35\x56\
-\x31\x38\x2e\x38\x37\x35\x48\x31\x34\x2e\x30\x36\x32\x35\x56\x31\
-\x32\x2e\x36\x32\x35\x48\x31\x35\x2e\x36\x32\x35\x56\x31\x38\x2e\
-\x38\x37\x35\x48\x31\x38\x2e\x37\x35\x56\x31\x32\x2e\x36\x32\x35\
-\x48\x32\x30\x2e\x33\x31\x32\x35\x56\x31\x38\x2e\x38\x37\x35\x48\
-\x32\x34\x2e\x32\x31\x38\x38\x43\x32\x34\x2e\x36\x34\x38\x34\x20\
-\x31\x38\x2e\x38\x37\x35\x20\x32\x35\x20\x31\x38\x2e\x35\x32\x33\
-\x34\x20\x32\x35\x20\x31\x38\x2e\x30\x39\x33\x38\x56\x37\x2e\x31\
-\x35\x36\x32\x35\x43\x32\x35\x20\x36\x2e\x37\x32\x36\x35\x36\x20\
-\x32\x34\x2e\x36\x34\x38\x34\x20\x36\x2e\x33\x37\x35\x20\x32\x34\
-\x2e\x32\x31\x38\x38\x20\x36\x2e\x33\x37\x35\x5a\x22\x20\x66\x69\
-\x6c\x6c\x3d\x22\x62\x6c\x61\x63\x6b\x22\x2f\x3e\x0a\x3c\x2f\x73\
-\x76\x67\x3e\x0a\
-\x00\x00\x03\xc4\
-\x3c\
-\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x32\x33\x22\x20\x68\
-\x65\x69\x67\x68\x74\x3d\x22\x32\x33\x22\x20\x76\x69\x65\x77\x42\
-\x6f\x78\x3d\x22\x30\x20\x30\x20\x32\x33\x20\x32\x33\x22\x20\x66\
-\x69\x6c\x6c\x3d\x22\x6e\x6f\x6e\x65\x22\x20\x78\x6d\x6c\x6e\x73\
-\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\
-\x6f\x72\x67\x2f\x32\x30\x30\x30\x2f\x73\x76\x67\x22\x3e\x0a\x3c\
-\x70\x61\x74\x68\x20\x64\x3d\x22\x4d\x32\x31\x2e\x37\x35\x31\x20\
-\x35\x2e\x33\x34\x34\x37\x38\x4c\x31\x37\x2e\x36\x35\x35\x32\x20\
-\x31\x2e\x32\x34\x38\x39\x37\x43\x31\x37\x2e\x32\x31\x35\x37\x20\
-\x30\x2e\x38\x30\x39\x34\x33\x35\x20\x31\x36\x2e\x36\x31\x39\x35\
-\x20\x30\x2e\x35\x36\x32\x35\x30\x33\x20\x31\x35\x2e\x39\x39\x37\
-\x39\x20\x30\x2e\x35\x36\x32\x35\x48\x32\x2e\x39\x30\x36\x32\x35\
-\x43\x31\x2e\x36\x31\x31\x38\x32\x20\x30\x2e\x35\x36\x32\x35\x20\
-\x30\x2e\x35\x36\x32\x35\x20\x31\x2e\x36\x31\x31\x38\x32\x20\x30\
-\x2e\x35\x36\x32\x35\x20\x32\x2e\x39\x30\x36\x32\x35\x56\x32\x30\
-\x2e\x30\x39\x33\x38\x43\x30\x2e\x35\x36\x32\x35\x20\x32\x31\x2e\
-\x33\x38\x38\x32\x20\x31\x2e\x36\x31\x31\x38\x32\x20\x32\x32\x2e\
-\x34\x33\x37\x35\x20\x32\x2e\x39\x30\x36\x32\x35\x20\x32\x32\x2e\
-\x34\x33\x37\x35\x48\x32\x30\x2e\x30\x39\x33\x38\x43\x32\x31\x2e\
-\x33\x38\x38\x32\x20\x32\x32\x2e\x34\x33\x37\x35\x20\x32\x32\x2e\
-\x34\x33\x37\x35\x20\x32\x31\x2e\x33\x38\x38\x32\x20\x32\x32\x2e\
-\x34\x33\x37\x35\x20\x32\x30\x2e\x30\x39\x33\x38\x56\x37\x2e\x30\
-\x30\x32\x30\x35\x43\x32\x32\x2e\x34\x33\x37\x35\x20\x36\x2e\x33\
-\x38\x30\x34\x35\x20\x32\x32\x2e\x31\x39\x30\x36\x20\x35\x2e\x37\
-\x38\x34\x33\x31\x20\x32\x31\x2e\x37\x35\x31\x20\x35\x2e\x33\x34\
-\x34\x37\x38\x5a\x4d\x31\x31\x2e\x35\x20\x31\x39\x2e\x33\x31\x32\
-\x35\x43\x39\x2e\x37\x37\x34\x31\x32\x20\x31\x39\x2e\x33\x31\x32\
-\x35\x20\x38\x2e\x33\x37\x35\x20\x31\x37\x2e\x39\x31\x33\x34\x20\
-\x38\x2e\x33\x37\x35\x20\x31\x36\x2e\x31\x38\x37\x35\x43\x38\x2e\
-\x33\x37\x35\x20\x31\x34\x2e\x34\x36\x31\x36\x20\x39\x2e\x37\x37\
-\x34\x31\x32\x20\x31\x33\x2e\x30\x36\x32\x35\x20\x31\x31\x2e\x35\
-\x20\x31\x33\x2e\x30\x36\x32\x35\x43\x31\x33\x2e\x32\x32\x35\x39\
-\x20\x31\x33\x2e\x30\x36\x32\x35\x20\x31\x34\x2e\x36\x32\x35\x20\
-\x31\x34\x2e\x34\x36\x31\x36\x20\x31\x34\x2e\x36\x32\x35\x20\x31\
-\x36\x2e\x31\x38\x37\x35\x43\x31\x34\x2e\x36\x32\x35\x20\x31\x37\
-\x2e\x39\x31\x33\x34\x20\x31\x33\x2e\x32\x32\x35\x39\x20\x31\x39\
-\x2e\x33\x31\x32\x35\x20\x31\x31\x2e\x35\x20\x31\x39\x2e\x33\x31\
-\x32\x35\x5a\x4d\x31\x36\x2e\x31\x38\x37\x35\x20\x34\x2e\x34\x34\
-\x33\x33\x36\x56\x39\x2e\x33\x35\x31\x35\x36\x43\x31\x36\x2e\x31\
-\x38\x37\x35\x20\x39\x2e\x36\x37\x35\x31\x35\x20\x31\x35\x2e\x39\
-\x32\x35\x31\x20\x39\x2e\x39\x33\x37\x35\x20\x31\x35\x2e\x36\x30\
-\x31\x36\x20\x39\x2e\x39\x33\x37\x35\x48\x34\x2e\x32\x37\x33\x34\
-\x34\x43\x33\x2e\x39\x34\x39\x38\x35\x20\x39\x2e\x39\x33\x37\x35\
-\x20\x33\x2e\x36\x38\x37\x35\x20\x39\x2e\x36\x37\x35\x31\x35\x20\
-\x33\x2e\x36\x38\x37\x35\x20\x39\x2e\x33\x35\x31\x35\x36\x56\x34\
-\x2e\x32\x37\x33\x34\x34\x43\x33\x2e\x36\x38\x37\x35\x20\x33\x2e\
-\x39\x34\x39\x38\x35\x20\x33\x2e\x39\x34\x39\x38\x35\x20\x33\x2e\
-\x36\x38\x37\x35\x20\x34\x2e\x32\x37\x33\x34\x34\x20\x33\x2e\x36\
-\x38\x37\x35\x48\x31\x35\x2e\x34\x33\x31\x36\x43\x31\x35\x2e\x35\
-\x38\x37\x31\x20\x33\x2e\x36\x38\x37\x35\x20\x31\x35\x2e\x37\x33\
-\x36\x31\x20\x33\x2e\x37\x34\x39\x32\x32\x20\x31\x35\x2e\x38\x34\
-\x35\x39\x20\x33\x2e\x38\x35\x39\x31\x33\x4c\x31\x36\x2e\x30\x31\
-\x35\x39\x20\x34\x2e\x30\x32\x39\x30\x35\x43\x31\x36\x2e\x30\x37\
-\x30\x33\x20\x34\x2e\x30\x38\x33\x34\x35\x20\x31\x36\x2e\x31\x31\
-\x33\x35\x20\x34\x2e\x31\x34\x38\x30\x34\x20\x31\x36\x2e\x31\x34\
-\x32\x39\x20\x34\x2e\x32\x31\x39\x31\x33\x43\x31\x36\x2e\x31\x37\
-\x32\x34\x20\x34\x2e\x32\x39\x30\x32\x32\x20\x31\x36\x2e\x31\x38\
-\x37\x35\x20\x34\x2e\x33\x36\x36\x34\x31\x20\x31\x36\x2e\x31\x38\
-\x37\x35\x20\x34\x2e\x34\x34\x33\x33\x36\x5a\x22\x20\x66\x69\x6c\
-\x6c\x3d\x22\x62\x6c\x61\x63\x6b\x22\x2f\x3e\x0a\x3c\x2f\x73\x76\
-\x67\x3e\x0a\
-\x00\x00\x03\xb6\
-\x3c\
-\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x32\x35\x22\x20\x68\
-\x65\x69\x67\x68\x74\x3d\x22\x32\x30\x22\x20\x76\x69\x65\x77\x42\
-\x6f\x78\x3d\x22\x30\x20\x30\x20\x32\x35\x20\x32\x30\x22\x20\x66\
-\x69\x6c\x6c\x3d\x22\x6e\x6f\x6e\x65\x22\x20\x78\x6d\x6c\x6e\x73\
-\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\
-\x6f\x72\x67\x2f\x32\x30\x30\x30\x2f\x73\x76\x67\x22\x3e\x0a\x3c\
-\x70\x61\x74\x68\x20\x64\x3d\x22\x4d\x32\x35\x20\x31\x30\x2e\x33\
-\x31\x32\x35\x56\x39\x2e\x36\x38\x37\x35\x43\x32\x35\x20\x39\x2e\
-\x33\x34\x32\x31\x39\x20\x32\x34\x2e\x37\x32\x30\x33\x20\x39\x2e\
-\x30\x36\x32\x35\x20\x32\x34\x2e\x33\x37\x35\x20\x39\x2e\x30\x36\
-\x32\x35\x48\x31\x33\x2e\x34\x33\x37\x35\x56\x37\x2e\x35\x48\x31\
-\x36\x2e\x32\x35\x43\x31\x36\x2e\x39\x34\x30\x32\x20\x37\x2e\x35\
-\x20\x31\x37\x2e\x35\x20\x36\x2e\x39\x34\x30\x32\x33\x20\x31\x37\
-\x2e\x35\x20\x36\x2e\x32\x35\x56\x31\x2e\x32\x35\x43\x31\x37\x2e\
-\x35\x20\x30\x2e\x35\x35\x39\x37\x36\x36\x20\x31\x36\x2e\x39\x34\
-\x30\x32\x20\x30\x20\x31\x36\x2e\x32\x35\x20\x30\x48\x38\x2e\x37\
-\x35\x43\x38\x2e\x30\x35\x39\x37\x37\x20\x30\x20\x37\x2e\x35\x20\
-\x30\x2e\x35\x35\x39\x37\x36\x36\x20\x37\x2e\x35\x20\x31\x2e\x32\
-\x35\x56\x36\x2e\x32\x35\x43\x37\x2e\x35\x20\x36\x2e\x39\x34\x30\
-\x32\x33\x20\x38\x2e\x30\x35\x39\x37\x37\x20\x37\x2e\x35\x20\x38\
-\x2e\x37\x35\x20\x37\x2e\x35\x48\x31\x31\x2e\x35\x36\x32\x35\x56\
-\x39\x2e\x30\x36\x32\x35\x48\x30\x2e\x36\x32\x35\x43\x30\x2e\x32\
-\x37\x39\x36\x38\x37\x20\x39\x2e\x30\x36\x32\x35\x20\x30\x20\x39\
-\x2e\x33\x34\x32\x31\x39\x20\x30\x20\x39\x2e\x36\x38\x37\x35\x56\
-\x31\x30\x2e\x33\x31\x32\x35\x43\x30\x20\x31\x30\x2e\x36\x35\x37\
-\x38\x20\x30\x2e\x32\x37\x39\x36\x38\x37\x20\x31\x30\x2e\x39\x33\
-\x37\x35\x20\x30\x2e\x36\x32\x35\x20\x31\x30\x2e\x39\x33\x37\x35\
-\x48\x34\x2e\x36\x38\x37\x35\x56\x31\x32\x2e\x35\x48\x32\x2e\x35\
-\x43\x31\x2e\x38\x30\x39\x37\x37\x20\x31\x32\x2e\x35\x20\x31\x2e\
-\x32\x35\x20\x31\x33\x2e\x30\x35\x39\x38\x20\x31\x2e\x32\x35\x20\
-\x31\x33\x2e\x37\x35\x56\x31\x38\x2e\x37\x35\x43\x31\x2e\x32\x35\
-\x20\x31\x39\x2e\x34\x34\x30\x32\x20\x31\x2e\x38\x30\x39\x37\x37\
-\x20\x32\x30\x20\x32\x2e\x35\x20\x32\x30\x48\x38\x2e\x37\x35\x43\
-\x39\x2e\x34\x34\x30\x32\x33\x20\x32\x30\x20\x31\x30\x20\x31\x39\
-\x2e\x34\x34\x30\x32\x20\x31\x30\x20\x31\x38\x2e\x37\x35\x56\x31\
-\x33\x2e\x37\x35\x43\x31\x30\x20\x31\x33\x2e\x30\x35\x39\x38\x20\
-\x39\x2e\x34\x34\x30\x32\x33\x20\x31\x32\x2e\x35\x20\x38\x2e\x37\
-\x35\x20\x31\x32\x2e\x35\x48\x36\x2e\x35\x36\x32\x35\x56\x31\x30\
-\x2e\x39\x33\x37\x35\x48\x31\x38\x2e\x34\x33\x37\x35\x56\x31\x32\
-\x2e\x35\x48\x31\x36\x2e\x32\x35\x43\x31\x35\x2e\x35\x35\x39\x38\
-\x20\x31\x32\x2e\x35\x20\x31\x35\x20\x31\x33\x2e\x30\x35\x39\x38\
-\x20\x31\x35\x20\x31\x33\x2e\x37\x35\x56\x31\x38\x2e\x37\x35\x43\
-\x31\x35\x20\x31\x39\x2e\x34\x34\x30\x32\x20\x31\x35\x2e\x35\x35\
-\x39\x38\x20\x32\x30\x20\x31\x36\x2e\x32\x35\x20\x32\x30\x48\x32\
-\x32\x2e\x35\x43\x32\x33\x2e\x31\x39\x30\x32\x20\x32\x30\x20\x32\
-\x33\x2e\x37\x35\x20\x31\x39\x2e\x34\x34\x30\x32\x20\x32\x33\x2e\
-\x37\x35\x20\x31\x38\x2e\x37\x35\x56\x31\x33\x2e\x37\x35\x43\x32\
-\x33\x2e\x37\x35\x20\x31\x33\x2e\x30\x35\x39\x38\x20\x32\x33\x2e\
-\x31\x39\x30\x32\x20\x31\x32\x2e\x35\x20\x32\x32\x2e\x35\x20\x31\
-\x32\x2e\x35\x48\x32\x30\x2e\x33\x31\x32\x35\x56\x31\x30\x2e\x39\
-\x33\x37\x35\x48\x32\x34\x2e\x33\x37\x35\x43\x32\x34\x2e\x37\x32\
-\x30\x33\x20\x31\x30\x2e\x39\x33\x37\x35\x20\x32\x35\x20\x31\x30\
-\x2e\x36\x35\x37\x38\x20\x32\x35\x20\x31\x30\x2e\x33\x31\x32\x35\
-\x5a\x4d\x31\x30\x20\x35\x56\x32\x2e\x35\x48\x31\x35\x56\x35\x48\
-\x31\x30\x5a\x4d\x37\x2e\x35\x20\x31\x37\x2e\x35\x48\x33\x2e\x37\
-\x35\x56\x31\x35\x48\x37\x2e\x35\x56\x31\x37\x2e\x35\x5a\x4d\x32\
-\x31\x2e\x32\x35\x20\x31\x37\x2e\x35\x48\x31\x37\x2e\x35\x56\x31\
-\x35\x48\x32\x31\x2e\x32\x35\x56\x31\x37\x2e\x35\x5a\x22\x20\x66\
-\x69\x6c\x6c\x3d\x22\x62\x6c\x61\x63\x6b\x22\x2f\x3e\x0a\x3c\x2f\
-\x73\x76\x67\x3e\x0a\
-\x00\x00\x03\x3b\
-\x3c\
-\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x32\x35\x22\x20\x68\
-\x65\x69\x67\x68\x74\x3d\x22\x32\x35\x22\x20\x76\x69\x65\x77\x42\
-\x6f\x78\x3d\x22\x30\x20\x30\x20\x32\x35\x20\x32\x35\x22\x20\x66\
-\x69\x6c\x6c\x3d\x22\x6e\x6f\x6e\x65\x22\x20\x78\x6d\x6c\x6e\x73\
-\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\
-\x6f\x72\x67\x2f\x32\x30\x30\x30\x2f\x73\x76\x67\x22\x3e\x0a\x3c\
-\x70\x61\x74\x68\x20\x64\x3d\x22\x4d\x31\x32\x2e\x35\x20\x30\x2e\
-\x33\x39\x30\x36\x32\x35\x43\x35\x2e\x38\x31\x30\x35\x35\x20\x30\
-\x2e\x33\x39\x30\x36\x32\x35\x20\x30\x2e\x33\x39\x30\x36\x32\x35\
-\x20\x35\x2e\x38\x31\x30\x35\x35\x20\x30\x2e\x33\x39\x30\x36\x32\
-\x35\x20\x31\x32\x2e\x35\x43\x30\x2e\x33\x39\x30\x36\x32\x35\x20\
-\x31\x39\x2e\x31\x38\x39\x35\x20\x35\x2e\x38\x31\x30\x35\x35\x20\
-\x32\x34\x2e\x36\x30\x39\x34\x20\x31\x32\x2e\x35\x20\x32\x34\x2e\
-\x36\x30\x39\x34\x43\x31\x39\x2e\x31\x38\x39\x35\x20\x32\x34\x2e\
-\x36\x30\x39\x34\x20\x32\x34\x2e\x36\x30\x39\x34\x20\x31\x39\x2e\
-\x31\x38\x39\x35\x20\x32\x34\x2e\x36\x30\x39\x34\x20\x31\x32\x2e\
-\x35\x43\x32\x34\x2e\x36\x30\x39\x34\x20\x35\x2e\x38\x31\x30\x35\
-\x35\x20\x31\x39\x2e\x31\x38\x39\x35\x20\x30\x2e\x33\x39\x30\x36\
-\x32\x35\x20\x31\x32\x2e\x35\x20\x30\x2e\x33\x39\x30\x36\x32\x35\
-\x5a\x4d\x31\x39\x2e\x35\x33\x31\x32\x20\x31\x33\x2e\x38\x36\x37\
-\x32\x43\x31\x39\x2e\x35\x33\x31\x32\x20\x31\x34\x2e\x31\x38\x39\
-\x35\x20\x31\x39\x2e\x32\x36\x37\x36\x20\x31\x34\x2e\x34\x35\x33\
-\x31\x20\x31\x38\x2e\x39\x34\x35\x33\x20\x31\x34\x2e\x34\x35\x33\
-\x31\x48\x31\x34\x2e\x34\x35\x33\x31\x56\x31\x38\x2e\x39\x34\x35\
-\x33\x43\x31\x34\x2e\x34\x35\x33\x31\x20\x31\x39\x2e\x32\x36\x37\
-\x36\x20\x31\x34\x2e\x31\x38\x39\x35\x20\x31\x39\x2e\x35\x33\x31\
-\x32\x20\x31\x33\x2e\x38\x36\x37\x32\x20\x31\x39\x2e\x35\x33\x31\
-\x32\x48\x31\x31\x2e\x31\x33\x32\x38\x43\x31\x30\x2e\x38\x31\x30\
-\x35\x20\x31\x39\x2e\x35\x33\x31\x32\x20\x31\x30\x2e\x35\x34\x36\
-\x39\x20\x31\x39\x2e\x32\x36\x37\x36\x20\x31\x30\x2e\x35\x34\x36\
-\x39\x20\x31\x38\x2e\x39\x34\x35\x33\x56\x31\x34\x2e\x34\x35\x33\
-\x31\x48\x36\x2e\x30\x35\x34\x36\x39\x43\x35\x2e\x37\x33\x32\x34\
-\x32\x20\x31\x34\x2e\x34\x35\x33\x31\x20\x35\x2e\x34\x36\x38\x37\
-\x35\x20\x31\x34\x2e\x31\x38\x39\x35\x20\x35\x2e\x34\x36\x38\x37\
-\x35\x20\x31\x33\x2e\x38\x36\x37\x32\x56\x31\x31\x2e\x31\x33\x32\
-\x38\x43\x35\x2e\x34\x36\x38\x37\x35\x20\x31\x30\x2e\x38\x31\x30\
-\x35\x20\x35\x2e\x37\x33\x32\x34\x32\x20\x31\x30\x2e\x35\x34\x36\
-\x39\x20\x36\x2e\x30\x35\x34\x36\x39\x20\x31\x30\x2e\x35\x34\x36\
-\x39\x48\x31\x30\x2e\x35\x34\x36\x39\x56\x36\x2e\x30\x35\x34\x36\
-\x39\x43\x31\x30\x2e\x35\x34\x36\x39\x20\x35\x2e\x37\x33\x32\x34\
-\x32\x20\x31\x30\x2e\x38\x31\x30\x35\x20\x35\x2e\x34\x36\x38\x37\
-\x35\x20\x31\x31\x2e\x31\x33\x32\x38\x20\x35\x2e\x34\x36\x38\x37\
-\x35\x48\x31\x33\x2e\x38\x36\x37\x32\x43\x31\x34\x2e\x31\x38\x39\
-\x35\x20\x35\x2e\x34\x36\x38\x37\x35\x20\x31\x34\x2e\x34\x35\x33\
-\x31\x20\x35\x2e\x37\x33\x32\x34\x32\x20\x31\x34\x2e\x34\x35\x33\
-\x31\x20\x36\x2e\x30\x35\x34\x36\x39\x56\x31\x30\x2e\x35\x34\x36\
-\x39\x48\x31\x38\x2e\x39\x34\x35\x33\x43\x31\x39\x2e\x32\x36\x37\
-\x36\x20\x31\x30\x2e\x35\x34\x36\x39\x20\x31\x39\x2e\x35\x33\x31\
-\x32\x20\x31\x30\x2e\x38\x31\x30\x35\x20\x31\x39\x2e\x35\x33\x31\
-\x32\x20\x31\x31\x2e\x31\x33\x32\x38\x56\x31\x33\x2e\x38\x36\x37\
-\x32\x5a\x22\x20\x66\x69\x6c\x6c\x3d\x22\x62\x6c\x61\x63\x6b\x22\
-\x2f\x3e\x0a\x3c\x2f\x73\x76\x67\x3e\x0a\
-\x00\x00\x07\xfc\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x9a\x00\x00\x00\x5f\x08\x06\x00\x00\x00\x10\xda\xde\x10\
-\x00\x00\x00\xe1\x69\x43\x43\x50\x73\x52\x47\x42\x00\x00\x18\x95\
-\x63\x60\x60\x3c\xcd\x00\x04\x4c\x0e\x0c\x0c\xb9\x79\x25\x45\x41\
-\xee\x4e\x0a\x11\x91\x51\x0a\x0c\x48\x20\x31\xb9\xb8\x80\x01\x37\
-\x60\x64\x60\xf8\x76\x0d\x44\x32\x30\x5c\xd6\x0d\x2c\x61\xe5\xc7\
-\xa3\x16\x1b\xe0\x2c\x02\x5a\x08\xa4\x3f\x00\xb1\x48\x3a\x98\xcd\
-\xc8\x02\x62\x27\x41\xd8\x12\x20\x76\x79\x49\x41\x09\x90\xad\x03\
-\x62\x27\x17\x14\x81\xd8\x40\x17\x33\xf0\x14\x85\x04\x39\x03\xd9\
-\x3e\x40\xb6\x42\x3a\x12\x3b\x09\x89\x9d\x92\x5a\x9c\x0c\x64\xe7\
-\x00\xd9\xf1\x08\xbf\xe5\xcf\x67\x60\xb0\xf8\xc2\xc0\xc0\x3c\x11\
-\x21\x96\x34\x8d\x81\x61\x7b\x3b\x03\x83\xc4\x1d\x84\x98\xca\x42\
-\x06\x06\xfe\x56\x06\x86\x6d\x97\x11\x62\x9f\xfd\xc1\xfe\x65\x14\
-\x3b\x54\x92\x5a\x51\x02\x12\xf1\xd3\x77\x64\x28\x48\x2c\x4a\x04\
-\x4b\x33\x83\x02\x34\x2d\x8d\x81\xe1\xd3\x72\x06\x06\xde\x48\x06\
-\x06\xe1\x0b\x0c\x0c\x5c\xd1\x10\x77\x80\x01\x6b\x31\x30\xa0\x49\
-\x0c\x27\x42\x00\x00\x72\xd8\x36\x84\xa3\x1f\x47\xb3\x00\x00\x00\
-\x09\x70\x48\x59\x73\x00\x00\x0f\x88\x00\x00\x0f\x88\x01\x16\xc8\
-\xa5\x86\x00\x00\x01\xa7\x7a\x54\x58\x74\x58\x4d\x4c\x3a\x63\x6f\
-\x6d\x2e\x61\x64\x6f\x62\x65\x2e\x78\x6d\x70\x00\x00\x28\x91\x85\
-\x93\x51\x6f\x82\x30\x14\x85\xdf\xfd\x15\x0d\x7b\x96\x02\x8a\x19\
-\x0d\x90\xa8\x48\xe2\x83\xd9\xe2\x4c\xb6\xd7\x0e\xea\x6c\x66\x5b\
-\xd2\xd6\xc1\xfe\xfd\x28\xe2\x74\x03\x36\x9e\xa0\xdc\xf3\xdd\x73\
-\x2f\x9c\xb0\x42\x15\x2b\x18\xd1\x18\x54\xec\xc8\x15\xaa\x22\x0b\
-\xe7\xe2\x95\xa0\xfa\xde\x1c\x43\x0b\x34\x25\xfa\x3d\xb2\x5e\x36\
-\x8f\x60\x29\x24\x01\xbe\x3d\xb5\x1d\x2b\x1e\x01\x00\x42\x99\xef\
-\xd1\x36\x49\x5b\x79\xfd\x14\x59\x07\xad\x0b\x04\x61\x59\x96\x76\
-\x39\xb1\x85\x7c\x83\x6e\x10\x04\xd0\xf1\xa0\xe7\x8d\xeb\x8a\xb1\
-\xfa\xe4\x1a\x57\x63\xae\xee\xce\x90\x0b\x27\x21\x2a\x93\xb4\xd0\
-\x54\x70\x60\x9e\xf1\xab\x38\xe9\xc8\xb2\xda\x9a\xf3\xd5\xfa\x64\
-\xc5\x66\xf3\xdd\x8a\x2b\xbb\x71\x6d\x67\x82\xc1\x0a\x17\xd0\xb5\
-\x1d\xc8\x18\xec\x53\x2a\xbd\x25\xfb\xbf\x95\x6a\xf7\x59\x10\xb8\
-\x25\x4a\x9c\x64\x46\xea\xf2\xbb\x01\x0b\x7f\x63\xfa\x44\x9a\xee\
-\x07\x9a\x9b\x37\x67\x59\x7c\xd5\x85\xcd\x9c\xf5\x62\x24\xfd\x20\
-\x79\x2a\x05\x6b\x16\x53\x60\xa9\x88\x31\x19\x59\x17\x97\xb7\x2a\
-\x23\x6c\xc6\x44\x94\x2b\x8d\x79\x46\xd6\x49\x5c\x93\x6c\x4a\x73\
-\xe4\x2c\x5d\xdf\xf7\xbc\xe4\x7e\xe1\xcf\x5d\x77\xe5\xdc\x07\x5e\
-\x92\xae\x56\xf3\x60\x36\x5b\xcc\xa6\xa9\x1f\xc2\x8e\xb4\x8f\x9c\
-\x8b\xec\xc4\x08\xd7\x2d\x39\xbf\x92\x57\xff\x91\x6f\xa4\x37\x93\
-\xc2\xce\xa8\x3d\x7b\x18\x6a\x3a\x71\x86\x9b\x76\xa4\x1d\xec\x7a\
-\x70\x4b\xe9\x7f\xd8\x75\xdf\x96\x0c\x16\x2d\x25\xc1\x5a\xc8\x9d\
-\x10\xc7\x78\x6e\xbe\x32\x78\x3c\x08\x2d\xd4\x41\x14\x60\xf9\xe4\
-\x83\x67\xca\x73\x51\xaa\x06\xf4\xa3\xf8\x86\x63\xfe\x09\xf4\x20\
-\x69\xed\x1b\x9b\x54\xc4\x6e\x08\x3b\x67\x97\x04\xc1\x5f\x11\x3a\
-\xe7\x13\xb6\x01\x8d\x47\x75\xa7\x4b\xd8\xe3\xd1\x17\x41\x60\x2d\
-\xac\xa9\xa9\x2c\xbe\x00\x00\x05\x0e\x49\x44\x41\x54\x78\x9c\xed\
-\xdd\xc1\x71\xe2\x48\x14\x06\xe0\xff\x01\x36\x3a\x12\x82\x43\xc0\
-\x55\x63\xaa\xe6\xb4\x72\x04\x46\x11\x18\x47\x30\x9e\x08\xc6\x44\
-\xe0\x99\x08\x6c\x47\xd0\xde\x08\xac\x3d\x6d\x95\xa1\x0a\x32\x58\
-\x42\xf0\x11\x0f\x98\xb7\x07\xf0\xcc\x00\x02\x24\xd4\x6e\x1a\xf4\
-\x7f\x47\x24\xf4\x44\xd5\x8f\x90\xd4\xad\x07\x40\x44\x44\x44\x19\
-\xc8\xae\x77\x80\xfc\x63\x7a\xa8\x61\x14\x34\x21\xb8\x04\x10\xce\
-\x2f\xd5\x17\x00\x31\x54\xfe\x8e\x1a\xc3\xfb\xb4\xdb\x64\xd0\x68\
-\x8e\xe9\x1e\x37\xa1\x72\x07\x48\x6d\xe3\xca\x8a\x01\x04\x57\xd1\
-\xd9\x30\xde\xb4\x2a\x83\x46\xbf\x98\x6e\x70\x07\x45\x2b\xf3\x1b\
-\x15\x57\x9b\x8e\x6e\x0c\x1a\x01\xc8\x11\xb2\x77\x1b\xc2\xc6\xa0\
-\xd1\xec\xe7\xb2\x64\x72\x6f\x48\xdf\x4e\xa3\xc6\xa8\x9f\xb4\xa8\
-\x94\x7b\xe3\xb4\xd7\x4c\x0f\xb5\xe9\x39\x99\x05\x52\xbe\x5d\xb5\
-\x88\x41\x2b\xba\x51\xd0\x4c\x75\xe2\x9f\x4e\x68\x9e\x8f\xea\x49\
-\x0b\x18\xb4\xa2\x13\xbd\xb0\xbb\xbd\x72\x33\xe9\x65\x06\x8d\x42\
-\xcb\xdb\xfb\x2b\xe9\x45\x06\xad\xf0\xac\xfd\x6c\xae\xc5\xa0\x91\
-\x13\x0c\x1a\x39\xc1\xa0\x91\x13\x0c\x1a\x39\x51\xd9\xf5\x0e\xd0\
-\x7a\xa6\x13\x84\x48\x9a\x41\x31\x96\xc7\xe8\xf3\x70\xe0\x7e\x8f\
-\xb6\xc3\xa0\x79\xca\x74\x82\x1b\x28\x2e\x01\x9c\x2c\x2f\x15\xa0\
-\x82\x5b\xd3\xa9\xf6\x21\xda\x8e\x3e\xfd\x7c\x74\xbd\x7f\x59\x31\
-\x68\x9e\x31\xcf\x47\x75\x48\xe9\x0e\x40\x7d\xf3\x48\xb4\xd4\xa1\
-\x62\x4c\xa7\xfa\x88\xca\xeb\x55\x74\x8a\x17\x07\xbb\xb8\x15\x9e\
-\xa3\x79\x64\x16\xb2\x27\x40\x12\x87\x71\x56\x93\x26\xc6\xd5\x27\
-\xd3\x83\x93\x7b\x62\xdb\x60\xd0\x3c\x61\x7a\xa8\xcd\x42\xb6\x65\
-\x58\xa4\x8e\x71\x90\x7f\x06\xc6\x07\x61\xd0\x7c\x31\xae\xa6\x9b\
-\xd5\xba\x5e\x68\x3a\xd5\x6b\x2b\xfb\x63\x19\x83\xe6\x81\xe9\x8c\
-\x07\x49\x1c\x8c\xde\xc2\x37\x4b\xdb\xb1\x8a\x41\xf3\x41\xa9\xfc\
-\xc5\xde\xc6\xa4\x66\xba\xc7\xb6\x42\x6b\x0d\x83\xe6\x83\x89\xe5\
-\x19\x14\x2a\x89\x33\x28\x76\x89\x41\xf3\x81\x24\xdd\x2b\xcb\xb5\
-\xc1\x8c\x57\xad\x1f\x8f\x41\x23\x27\x18\x34\x72\x82\x41\x23\x27\
-\x18\x34\x72\x82\x41\x23\x27\x38\xa8\xbe\xc6\xef\x66\x27\x7a\x01\
-\x20\x9c\xbb\x73\xaf\x18\xa0\x84\x18\x8a\x87\x34\xbd\x27\x8a\x8e\
-\x47\xb4\x15\x4c\xf7\xb8\x89\x71\xf5\x3f\x08\xee\xa6\x77\xed\x17\
-\x86\x87\x04\x27\xb3\x16\x02\x4f\xa6\x13\x3c\xad\x7a\x9e\x91\xa6\
-\x18\xb4\x04\xd3\x3e\x14\x25\x93\x61\xec\x31\x84\x94\x7b\xe6\x39\
-\x68\x7d\xe4\x7e\xed\x33\x06\x6d\x41\xae\x66\x27\x82\x3b\x86\x2d\
-\x19\x83\xf6\x87\x69\xb3\x93\x1c\x1d\x75\x00\x40\xf4\xd6\xfc\x1b\
-\x9c\x58\xd9\xa1\x03\xc2\xa0\xcd\xd8\x6b\x76\x22\x35\x1c\xf9\x39\
-\x83\x62\x97\x18\xb4\x77\x36\x9b\x9d\x28\x5a\x3c\xaa\xcd\x63\xd0\
-\xde\x4d\xfb\xb5\xda\x53\x51\xef\xa6\xea\xec\x12\x83\xf6\x5b\x68\
-\x79\x7b\xde\x4d\xd5\xd9\x25\x06\xed\xc3\xb8\x69\x9e\xb2\x2f\x18\
-\x34\x72\x82\x41\x23\x27\x18\x34\x72\x82\x41\x23\x27\xf6\x66\xf6\
-\xc6\xec\x29\xee\x70\x69\x06\xc5\x1b\xe2\x7d\x6a\x76\x52\x54\xde\
-\x07\x6d\x36\x76\xf8\x2d\xf1\x01\x0e\x01\x50\x01\x4c\x27\x88\x01\
-\xb4\x39\x5d\xc7\x5f\xde\x06\x6d\xae\xd9\xc9\x66\x21\x80\xd0\x74\
-\x83\x7b\x94\x87\x5f\x7d\x6e\x76\x52\x54\x5e\x9e\xa3\x6d\xdd\xec\
-\x44\xd1\xf2\xbd\xd9\x49\x51\x79\x17\x34\x3b\xcd\x4e\xaa\x76\xfe\
-\x09\x84\xac\xf1\x2e\x68\x76\x9a\x9d\x48\x93\xf3\xc2\xfc\xe2\x55\
-\xd0\x8a\xd0\xec\xa4\xa8\xbc\x0a\x9a\xd5\x66\x27\x82\x13\x1f\x9b\
-\x9d\x14\x95\x5f\x41\x2b\x40\xb3\x93\xa2\xf2\x2b\x68\x05\x68\x76\
-\x52\x54\x7e\x05\x8d\x0e\x16\x83\x46\x4e\x30\x68\xe4\x04\x83\x46\
-\x4e\x30\x68\xe4\x44\xea\x41\x75\xf3\x1c\xb4\x20\x7a\x01\x95\xfa\
-\xfc\xd5\xa1\xf6\x01\xc4\xd0\xc9\x43\xd4\x18\xf5\xed\xef\x22\x1d\
-\x82\x8d\x41\x33\xdd\xe3\x26\x26\xa5\xdb\x69\xb8\x04\xcb\x7f\x1b\
-\x23\x75\x00\x75\x48\xf9\xda\x74\xca\x31\xc6\xb8\xe2\xfc\x30\x5a\
-\xb4\xf6\xa7\xf3\x57\xb3\x93\xf4\xf7\xb7\x42\x54\xb4\xc7\x3b\xf2\
-\xb4\x68\x65\xd0\xb6\x6f\x76\x22\x35\x68\xc9\xcc\xfe\xfe\x8f\x08\
-\xc0\x8a\xa0\x59\x69\x76\x02\x35\x9c\x17\x46\xef\x96\x82\x66\xb5\
-\xd9\xc9\x5b\x70\x9b\x7f\x3b\x74\x08\x96\x8f\x68\xe3\x6a\xcb\x6a\
-\xb3\x13\x1e\xd5\x08\x89\x3f\x9d\x72\x61\xb5\xc2\x28\xe0\x85\x01\
-\x25\x9e\xa3\x85\x96\x2b\x70\xaa\x0e\x39\x18\x19\x50\xdb\x53\x7f\
-\x68\x1f\x71\x08\x8a\x9c\x60\xd0\xc8\x09\x06\x8d\x9c\x60\xd0\xc8\
-\x09\x06\x8d\x9c\x60\xd0\xc8\x09\x06\x8d\x9c\x60\xd0\xc8\x09\x06\
-\x8d\x9c\x60\xd0\xc8\x09\x06\x8d\x9c\x60\xd0\xc8\x89\xe5\xa0\x29\
-\x06\x96\x6b\xfc\x93\x7a\x4d\xeb\xb5\x35\xfd\x53\x59\x45\xad\x9d\
-\x69\xdd\x14\x24\xf9\xb3\x2c\x07\xad\x84\xd8\x6e\xe1\x49\xfa\x0f\
-\x62\xbd\xb6\xa6\x0f\x79\x51\x6b\xc3\x72\xed\x49\xf2\x81\x25\xe9\
-\x88\xf6\x60\xad\xa8\x62\x10\x7d\xfa\xf9\x98\x61\xfd\xc3\xa8\x0d\
-\x7d\xc9\x54\x7b\xf2\xf6\x63\x67\xb5\x75\x62\xf7\x73\x37\x86\xf7\
-\x49\x4b\x96\x82\x36\x6b\xa1\x1e\x5b\xaa\xdc\xce\xb2\x72\x61\x6b\
-\x37\x46\x7d\x40\xd3\x87\xc3\xdb\xda\xb2\xf2\x0b\x93\x7c\x31\x30\
-\xc6\x15\xa0\x79\x5b\xa8\xc7\xab\xd2\xbd\xd6\x21\xd4\x3e\x7b\xfd\
-\x9e\xbd\xb6\x7c\xdd\x59\xed\xca\xab\x85\xcf\xad\xfd\xe8\x6c\x78\
-\xb3\x6a\x69\x62\xd0\xa2\xcf\xc3\x01\x74\x72\xbe\x7d\x71\xed\xa3\
-\x32\x8c\xb6\x79\x27\x6b\xef\xa0\xf6\x29\x5e\xf2\xd7\x7e\x3d\x5f\
-\xb7\xc6\xca\xdb\x1b\x51\x63\xd4\x87\x4e\xce\xb3\x5f\x11\xe9\x23\
-\x2a\xaf\xe7\x79\xfe\x54\x82\xb5\x77\x58\x3b\xfb\x55\x68\x9c\xa6\
-\xf6\x52\x27\x8d\x45\xa6\x87\x1a\xc6\xc1\x35\xa0\x5f\xd6\x3f\x86\
-\xa7\x7d\x88\xb6\x33\x9d\x88\xb2\xb6\x77\xb5\x01\xc0\x74\x82\x1b\
-\x28\x2e\xd7\xb6\xc2\x98\x7e\x19\xda\x69\x4f\x51\x36\x06\x6d\x61\
-\x07\x42\x2c\x3d\x25\xa5\x2f\xd0\x49\xfc\xd1\x9d\x84\x58\xbb\x58\
-\xb5\x89\x88\x88\x0a\xee\x7f\xbc\xf8\x2d\xe4\x45\xcf\xb0\x8d\x00\
-\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
-"
-
-qt_resource_name = b"\
-\x00\x06\
-\x07\x03\x7d\xc3\
-\x00\x69\
-\x00\x6d\x00\x61\x00\x67\x00\x65\x00\x73\
-\x00\x0a\
-\x06\x99\x52\x27\
-\x00\x69\
-\x00\x6d\x00\x70\x00\x6f\x00\x72\x00\x74\x00\x2e\x00\x73\x00\x76\x00\x67\
-\x00\x0a\
-\x09\xca\x2a\x27\
-\x00\x74\
-\x00\x72\x00\x61\x00\x63\x00\x65\x00\x72\x00\x2e\x00\x73\x00\x76\x00\x67\
-\x00\x0b\
-\x0b\x73\x90\x47\
-\x00\x63\
-\x00\x6f\x00\x6e\x00\x6e\x00\x65\x00\x63\x00\x74\x00\x2e\x00\x73\x00\x76\x00\x67\
-\x00\x0c\
-\x0b\xdf\x2c\xc7\
-\x00\x73\
-\x00\x65\x00\x74\x00\x74\x00\x69\x00\x6e\x00\x67\x00\x73\x00\x2e\x00\x73\x00\x76\x00\x67\
-\x00\x08\
-\x0b\x63\x55\x87\
-\x00\x73\
-\x00\x74\x00\x6f\x00\x70\x00\x2e\x00\x73\x00\x76\x00\x67\
-\x00\x07\
-\x09\xc1\x5a\x27\
-\x00\x72\
-\x00\x75\x00\x6e\x00\x2e\x00\x73\x00\x76\x00\x67\
-\x00\x0f\
-\x00\xc4\xa6\x67\
-\x00\x63\
-\x00\x6f\x00\x6e\x00\x6e\x00\x65\x00\x63\x00\x74\x00\x69\x00\x6f\x00\x6e\x00\x73\x00\x2e\x00\x73\x00\x76\x00\x67\
-\x00\x0a\
-\x06\x9a\xc4\x27\
-\x00\x65\
-\x00\x78\x00\x70\x00\x6f\x00\x72\x00\x74\x00\x2e\x00\x73\x00\x76\x00\x67\
-\x00\x09\
-\x0a\xbf\xb2\x67\
-\x00\x6d\
-\x00\x6f\x00\x64\x00\x65\x00\x6c\x00\x2e\x00\x73\x00\x76\x00\x67\
-\x00\x0c\
-\x09\x55\x16\x67\
-\x00\x61\
-\x00\x64\x00\x64\x00\x5f\x00\x6e\x00\x6f\x00\x64\x00\x65\x00\x2e\x00\x73\x00\x76\x00\x67\
-\x00\x08\
-\x06\x06\x59\xe7\
-\x00\x6e\
-\x00\x73\x00\x2d\x00\x33\x00\x2e\x00\x70\x00\x6e\x00\x67\
-"
-
-qt_resource_struct_v1 = b"\
-\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x01\
-\x00\x00\x00\x00\x00\x02\x00\x00\x00\x0c\x00\x00\x00\x02\
-\x00\x00\x00\xaa\x00\x00\x00\x00\x00\x01\x00\x00\x16\x46\
-\x00\x00\x01\x1e\x00\x00\x00\x00\x00\x01\x00\x00\x23\xa0\
-\x00\x00\x00\x12\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\
-\x00\x00\x00\xce\x00\x00\x00\x00\x00\x01\x00\x00\x18\xdf\
-\x00\x00\x01\x00\x00\x00\x00\x00\x00\x01\x00\x00\x20\x61\
-\x00\x00\x00\x96\x00\x00\x00\x00\x00\x01\x00\x00\x13\xaa\
-\x00\x00\x00\x96\x00\x00\x00\x00\x00\x01\x00\x00\x14\xf8\
-\x00\x00\x00\x2c\x00\x00\x00\x00\x00\x01\x00\x00\x02\xb4\
-\x00\x00\x00\xe8\x00\x00\x00\x00\x00\x01\x00\x00\x1c\xa7\
-\x00\x00\x00\x80\x00\x00\x00\x00\x00\x01\x00\x00\x12\x3f\
-\x00\x00\x00\x46\x00\x00\x00\x00\x00\x01\x00\x00\x04\x34\
-\x00\x00\x00\x62\x00\x00\x00\x00\x00\x01\x00\x00\x0b\xd2\
-"
-
-qt_resource_struct_v2 = b"\
-\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x01\
-\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x02\x00\x00\x00\x0c\x00\x00\x00\x02\
-\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\xaa\x00\x00\x00\x00\x00\x01\x00\x00\x16\x46\
-\x00\x00\x01\x87\xff\xd9\xea\x4c\
-\x00\x00\x01\x1e\x00\x00\x00\x00\x00\x01\x00\x00\x23\xa0\
-\x00\x00\x01\x88\x00\x02\x63\x38\
-\x00\x00\x00\x12\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\
-\x00\x00\x01\x87\xff\xd3\xb7\x85\
-\x00\x00\x00\xce\x00\x00\x00\x00\x00\x01\x00\x00\x18\xdf\
-\x00\x00\x01\x87\xff\xd3\xf6\x7c\
-\x00\x00\x01\x00\x00\x00\x00\x00\x00\x01\x00\x00\x20\x61\
-\x00\x00\x01\x87\xff\xd4\x9e\x60\
-\x00\x00\x00\x96\x00\x00\x00\x00\x00\x01\x00\x00\x13\xaa\
-\x00\x00\x01\x87\xff\xd0\xa1\x49\
-\x00\x00\x00\x96\x00\x00\x00\x00\x00\x01\x00\x00\x14\xf8\
-\x00\x00\x01\x87\xff\xd0\xa1\x49\
-\x00\x00\x00\x2c\x00\x00\x00\x00\x00\x01\x00\x00\x02\xb4\
-\x00\x00\x01\x87\xff\xda\xac\x6f\
-\x00\x00\x00\xe8\x00\x00\x00\x00\x00\x01\x00\x00\x1c\xa7\
-\x00\x00\x01\x87\xff\xe9\xcc\x91\
-\x00\x00\x00\x80\x00\x00\x00\x00\x00\x01\x00\x00\x12\x3f\
-\x00\x00\x01\x87\xff\xd4\x64\xc0\
-\x00\x00\x00\x46\x00\x00\x00\x00\x00\x01\x00\x00\x04\x34\
-\x00\x00\x01\x87\xff\xd3\x74\xc5\
-\x00\x00\x00\x62\x00\x00\x00\x00\x00\x01\x00\x00\x0b\xd2\
-\x00\x00\x01\x87\xff\xda\x7f\x07\
-"
-
-qt_version = [int(v) for v in QtCore.qVersion().split('.')]
-if qt_version < [5, 8, 0]:
-    rcc_version = 1
-    qt_resource_struct = qt_resource_struct_v1
-else:
-    rcc_version = 2
-    qt_resource_struct = qt_resource_struct_v2
-
-def qInitResources():
-    QtCore.qRegisterResourceData(rcc_version, qt_resource_struct, qt_resource_name, qt_resource_data)
-
-def qCleanupResources():
-    QtCore.qUnregisterResourceData(rcc_version, qt_resource_struct, qt_resource_name, qt_resource_data)
-
-qInitResources()
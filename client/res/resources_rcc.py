@@ -0,0 +1,13 @@
+""" Registers binary bundle of Qt resources built by `make res`
+
+Qt memory-maps the bundle, so images are paged in from disk when used.
+Forms import this module, registration happens once per process.
+"""
+import os
+
+from PyQt5.QtCore import QResource
+
+RESOURCES_FILE = os.path.join(os.path.dirname(__file__), 'resources.rcc')
+
+if not QResource.registerResource(RESOURCES_FILE):
+    raise ImportError(f'Can not register Qt resources "{RESOURCES_FILE}", run `make res`')
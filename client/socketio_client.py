@@ -1,26 +1,68 @@
 import typing
-from PyQt5.QtCore import QObject, pyqtSignal
+from PyQt5.QtCore import QObject, QTimer, pyqtSignal
 
-import socketio
+from client.message_queue import MessageQueue
 
 
 class SocketioClient(QObject):
-    data_received = pyqtSignal(str)
+    # list of decoded messages
+    messages_received = pyqtSignal(list)
     connected = pyqtSignal()
     disconnected = pyqtSignal()
     connection_error = pyqtSignal(str)
 
-    def __init__(self, parent: QObject = None) -> None:
+    # Emitted from socket.io thread when queue becomes non-empty
+    _messages_available = pyqtSignal()
+
+    def __init__(self, parent: QObject = None, queue_size: int = 10000,
+                 drain_per_tick: int = 2000, tick_interval: int = 30,
+                 summarize_dropped: bool = True) -> None:
+        """ Object constructor
+
+        :param queue_size: number of messages kept until `LOG` messages are dropped
+        :param drain_per_tick: maximal number of messages delivered per tick
+        :param tick_interval: interval between deliveries in ms
+        :param summarize_dropped: report number of dropped messages to log
+        """
         super().__init__(parent)
 
-        self.sio = socketio.Client()
-        self.sio.on('connect', self._on_connect)
-        self.sio.on('disconnect', self._on_disconnect)
-        self.sio.on('json', self._on_message)
-        self.sio.on('connect_error', self._on_connect_error)
+        self.queue = MessageQueue(queue_size, summarize_dropped)
+        self.drain_per_tick = drain_per_tick
+
+        self.drain_timer = QTimer(self)
+        self.drain_timer.setInterval(tick_interval)
+        self.drain_timer.timeout.connect(self._drain)
+        self._messages_available.connect(self._on_messages_available)
+
+        # socket.io client is slow to import, it is created on first connect
+        self.sio = None
+
+    def _client(self):
+        if self.sio is None:
+            import socketio
+
+            self.sio = socketio.Client()
+            self.sio.on('connect', self._on_connect)
+            self.sio.on('disconnect', self._on_disconnect)
+            self.sio.on('json', self._on_message)
+            self.sio.on('connect_error', self._on_connect_error)
+        return self.sio
 
     def _on_message(self, message):
-        self.data_received.emit(message)
+        if self.queue.put(message):
+            self._messages_available.emit()
+
+    def _on_messages_available(self):
+        if not self.drain_timer.isActive():
+            self._drain()
+            self.drain_timer.start()
+
+    def _drain(self):
+        messages = self.queue.drain(self.drain_per_tick)
+        if len(self.queue) == 0:
+            self.drain_timer.stop()
+        if messages:
+            self.messages_received.emit(messages)
 
     def _on_connect(self):
         self.connected.emit()
@@ -33,6 +75,6 @@ class SocketioClient(QObject):
 
     def connect(self, url):
         try:
-            self.sio.connect(url)
+            self._client().connect(url)
         except:
             pass
@@ -1,13 +1,17 @@
 from copy import deepcopy
 from typing import List
 
+import client.data.settings as settings
+from client.data.journal import InsertItem, Journal, RemoveItem
 from client.data.objects import Application
-from PyQt5 import QtCore, QtGui, uic
+from PyQt5 import QtCore, QtGui
 from PyQt5.QtCore import QAbstractTableModel, Qt
 from PyQt5.QtWidgets import QDialog, QLineEdit, QHeaderView
 from PyQt5.QtWidgets import QWidget
 
 from client.views.attributes_model import AttributesModel
+from client.views.forms import load_form
+from client.views.undo import install_undo
 from client.data.objects import Address
 
 
@@ -21,9 +25,12 @@ class ApplicationsSettings(QDialog):
 
     def __init__(self, parent: QtCore.QObject, editable: Application):
         super().__init__(parent)
-        uic.loadUi('client/ui/AppSettings.ui', self)
+        load_form(self, 'AppSettings')
 
         self.editable = editable
+        # Edits of attributes, undone by standard shortcuts
+        self.journal = Journal(settings.undo_limit)
+        install_undo(self, self.journal, editable, self.update_attributes)
 
         self.name_edit.setText(self.editable.name)
         self.type_edit.setText(self.editable.type)
@@ -37,19 +44,24 @@ class ApplicationsSettings(QDialog):
         self.update_attributes()
 
     def on_add_attribute(self):
-        self.editable.attributes.append(['name', 'value'])
+        self.journal.execute(self.editable, InsertItem(
+            ('attributes',), len(self.editable.attributes),
+            [self.editable.attributes.unused_key('name'), 'value']))
         self.update_attributes()
 
     def on_delete_attribute(self):
         index = self.attributes_table.currentIndex().row()
-        if len(self.editable.attributes) > 0:
-            del self.editable.attributes[index]
+        attributes = self.editable.attributes
+        if len(attributes) > 0:
+            index %= len(attributes)
+            self.journal.execute(self.editable,
+                                 RemoveItem(('attributes',), index, attributes[index]))
             self.update_attributes()
 
     def update_attributes(self):
         self.attributes_table.setModel(
             AttributesModel(
-                self.editable.attributes, self
+                self.editable.attributes, self, self.journal, ('attributes',)
             )
         )
 
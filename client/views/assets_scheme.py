@@ -0,0 +1,54 @@
+import mimetypes
+import os
+
+from PyQt5.QtCore import QBuffer, QByteArray, QIODevice
+from PyQt5.QtWebEngineCore import (QWebEngineUrlRequestJob, QWebEngineUrlScheme,
+                                   QWebEngineUrlSchemeHandler)
+
+ASSETS_SCHEME = b'ns-client'
+ASSETS_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'html')
+
+
+def register_assets_scheme():
+    """ Register URL scheme of topology page assets
+
+    Must be called before `QApplication` is created
+    """
+    scheme = QWebEngineUrlScheme(ASSETS_SCHEME)
+    scheme.setSyntax(QWebEngineUrlScheme.Syntax.Host)
+    scheme.setFlags(QWebEngineUrlScheme.SecureScheme |
+                    QWebEngineUrlScheme.LocalScheme)
+    QWebEngineUrlScheme.registerScheme(scheme)
+
+
+class AssetsSchemeHandler(QWebEngineUrlSchemeHandler):
+    """ Serves files of `client/html` from memory
+
+    Files are read once per process and shared by all topology views
+    """
+
+    def __init__(self, parent=None) -> None:
+        super().__init__(parent)
+        self.assets = {}
+
+    def _asset(self, name: str) -> QByteArray:
+        if name not in self.assets:
+            path = os.path.join(ASSETS_DIR, name)
+            if os.path.dirname(name) != '' or not os.path.isfile(path):
+                return None
+            with open(path, 'rb') as f:
+                self.assets[name] = QByteArray(f.read())
+        return self.assets[name]
+
+    def requestStarted(self, job: QWebEngineUrlRequestJob):
+        name = job.requestUrl().path().lstrip('/')
+        data = self._asset(name)
+        if data is None:
+            job.fail(QWebEngineUrlRequestJob.UrlNotFound)
+            return
+
+        mime_type, _ = mimetypes.guess_type(name)
+        buffer = QBuffer(job)
+        buffer.setData(data)
+        buffer.open(QIODevice.ReadOnly)
+        job.reply((mime_type or 'application/octet-stream').encode(), buffer)
@@ -1,21 +1,39 @@
+from typing import Optional
+
 from PyQt5.QtCore import QAbstractTableModel, QObject, Qt
+from client.data.journal import Journal, Path, SetValue, set_value
 from client.data.objects import Attributes
 
 
 class AttributesModel(QAbstractTableModel):
-    """ Table model for view/edit attributes """
-    def __init__(self, attributes: Attributes, parent: QObject) -> None:
+    """ Table model for view/edit attributes
+
+    Edits are recorded in `journal` if it is given, `path` is path
+    of attributes from root object of the journal. Keys used by other
+    rows are not accepted.
+    """
+    def __init__(self, attributes: Attributes, parent: QObject,
+                 journal: Optional[Journal] = None, path: Path = ()) -> None:
         super().__init__(parent)
         self.attributes = attributes
         self.header = ('name', 'value')
+        self.journal = journal
+        self.path = path
 
     def data(self, index, role):
         if role == Qt.DisplayRole or role == Qt.EditRole:
-            return self.attributes[index.row()][index.column()]
+            return self.attributes.field(index.row(), index.column())
 
     def setData(self, index, value, role):
         if role == Qt.EditRole:
-            self.attributes[index.row()][index.column()] = value.strip()
+            cell = (index.row(), index.column())
+            try:
+                old = set_value(self.attributes, cell, value.strip())
+            except ValueError:
+                # Key of another row, the view keeps the old one
+                return False
+            if self.journal is not None:
+                self.journal.record(SetValue(self.path + cell, old, value.strip()))
             return True
         return False
 
@@ -1,12 +1,9 @@
-from copy import deepcopy
-from typing import List
-
-import client.data.model as model
-from client.data.objects import Connection
+from client.data.objects import Connection, touch
+from client.data.session import EditSession
 from client.views.connection_settings import ConnectionSettings
+from client.views.forms import load_form
+from client.views.object_list_model import ObjectListModel
 
-from PyQt5 import uic
-from PyQt5.QtGui import QStandardItem, QStandardItemModel
 from PyQt5.QtWidgets import QDialog, QListView, QPushButton, QWidget
 
 
@@ -16,47 +13,37 @@ class ConnectionsList(QDialog):
     edit_connection: QPushButton
     delete_connection: QPushButton
     connections_list: QListView
-    connections: List[Connection]
+    connections: EditSession
 
-    def __init__(self, parent: QWidget, connections: List[Connection]) -> None:
+    def __init__(self, parent: QWidget, connections: EditSession) -> None:
         super().__init__(parent)
-        uic.loadUi('client/ui/ConnectionsList.ui', self)
+        load_form(self, 'ConnectionsList')
 
         self.connections = connections
+        self.list_model = ObjectListModel(connections, self)
+        self.connections_list.setModel(self.list_model)
 
         self.add_connection.clicked.connect(self.on_add)
         self.edit_connection.clicked.connect(self.on_edit)
         self.delete_connection.clicked.connect(self.on_delete)
 
-        self.update_list()
-
     def on_add(self):
         new_connection = Connection('new-connection', 'Csma', [], [])
         if ConnectionSettings(self, new_connection).exec() == 1:
-            self.connections.append(new_connection)
-            self.update_list()
+            touch(new_connection)
+            self.list_model.append(new_connection)
 
     def on_edit(self):
         index = self.connections_list.currentIndex().row()
         if index == -1:
             return
 
-        edited = deepcopy(self.connections[index])
+        edited = self.connections.checkout(index)
         if ConnectionSettings(self, edited).exec() == 1:
-            self.connections[index] = edited
-            self.update_list()
+            touch(edited)
+            self.list_model.replace(index, edited)
 
     def on_delete(self):
         index = self.connections_list.currentIndex().row()
         if len(self.connections) > 0:
-            del self.connections[index]
-            self.update_list()
-
-    def update_list(self):
-        list_model = QStandardItemModel()
-        self.connections_list.setModel(list_model)
-
-        for conn in self.connections:
-            item = QStandardItem(conn.name)
-            item.setEditable(False)
-            list_model.appendRow(item)
+            self.list_model.remove(index)
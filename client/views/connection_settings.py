@@ -1,11 +1,15 @@
 from typing import List
 
 import client.data.model as model
+import client.data.settings as settings
+from client.data.journal import InsertItem, Journal, RemoveItem
 from client.data.objects import Connection
 from client.views.attributes_model import AttributesModel
+from client.views.forms import load_form
+from client.views.undo import install_undo
 
-from PyQt5 import uic
-from PyQt5.QtCore import QAbstractListModel, QModelIndex, QObject, Qt
+from PyQt5.QtCore import (QAbstractListModel, QModelIndex, QObject,
+                          QStringListModel, Qt)
 from PyQt5.QtWidgets import (QComboBox, QDialog, QHeaderView, QLineEdit,
                              QListView, QPushButton, QStyledItemDelegate,
                              QWidget)
@@ -36,17 +40,22 @@ class InterfaceModel(QAbstractListModel):
 
 
 class QComboBoxDelegate(QStyledItemDelegate):
-    """ Combo box delecate to picking existing interfaces """
+    """ Combo box delecate to picking existing interfaces
+
+    Interface paths are taken from model index once, all editors share
+    one list model of them
+    """
+
+    def __init__(self, parent: QObject = None) -> None:
+        super().__init__(parent)
+        self.paths = QStringListModel(
+            ['None'] + model.current_model.device_paths(), self)
 
     def createEditor(self, parent, option, index):
         value = index.data(Qt.EditRole)
 
         editor = QComboBox(parent)
-        editor.addItems(['None'])
-
-        for node in model.current_model.nodes:
-            editor.addItems(
-                [f'{node.name}/{dev.name}' for dev in node.devices])
+        editor.setModel(self.paths)
 
         editor.setCurrentText(value)
 
@@ -68,9 +77,12 @@ class ConnectionSettings(QDialog):
 
     def __init__(self, parent: QWidget, editable: Connection) -> None:
         super().__init__(parent)
-        uic.loadUi('client/ui/ConnectionSettings.ui', self)
+        load_form(self, 'ConnectionSettings')
 
         self.editable = editable
+        # Edits of attributes, undone by standard shortcuts
+        self.journal = Journal(settings.undo_limit)
+        install_undo(self, self.journal, editable, self.update_attributes)
 
         self.type_combo.addItems(['Csma', 'Ppp'])
         self.type_combo.setCurrentText(editable.type)
@@ -79,6 +91,7 @@ class ConnectionSettings(QDialog):
         self.name_edit.setText(editable.name)
         self.name_edit.textChanged.connect(self.on_change_name)
 
+        self.interfaces_list.setItemDelegate(QComboBoxDelegate(self))
         self.add_interface.clicked.connect(self.on_add_interface)
         self.delete_interface.clicked.connect(self.on_delete_interface)
         self.update_interfaces()
@@ -105,18 +118,22 @@ class ConnectionSettings(QDialog):
             self.update_interfaces()
 
     def on_add_attribute(self):
-        self.editable.attributes.append(['name', 'value'])
+        self.journal.execute(self.editable, InsertItem(
+            ('attributes',), len(self.editable.attributes),
+            [self.editable.attributes.unused_key('name'), 'value']))
         self.update_attributes()
 
     def on_delete_attribute(self):
         index = self.attributes_table.currentIndex().row()
-        if len(self.editable.attributes) > 0:
-            del self.editable.attributes[index]
+        attributes = self.editable.attributes
+        if len(attributes) > 0:
+            index %= len(attributes)
+            self.journal.execute(self.editable,
+                                 RemoveItem(('attributes',), index, attributes[index]))
             self.update_attributes()
 
     def update_interfaces(self):
         model = InterfaceModel(self, self.editable.interfaces)
-        self.interfaces_list.setItemDelegate(QComboBoxDelegate())
         self.interfaces_list.setModel(
             model
         )
@@ -124,6 +141,6 @@ class ConnectionSettings(QDialog):
     def update_attributes(self):
         self.attributes_table.setModel(
             AttributesModel(
-                self.editable.attributes, self
+                self.editable.attributes, self, self.journal, ('attributes',)
             )
         )
@@ -1,10 +1,13 @@
 from copy import deepcopy
 from typing import List
 
+import client.data.settings as settings
+from client.data.journal import InsertItem, Journal, RemoveItem
 from client.data.objects import Address, Device
 from client.views.attributes_model import AttributesModel
+from client.views.forms import load_form
+from client.views.undo import install_undo
 
-from PyQt5 import uic
 from PyQt5.QtCore import QAbstractTableModel, Qt
 from PyQt5.QtWidgets import (QComboBox, QDialog, QHeaderView, QLineEdit,
                              QTableView, QWidget)
@@ -59,9 +62,12 @@ class DeviceSettings(QDialog):
 
     def __init__(self, parent: QWidget, editable: Device) -> None:
         super().__init__(parent)
-        uic.loadUi('client/ui/DeviceSettings.ui', self)
+        load_form(self, 'DeviceSettings')
 
         self.editable = editable
+        # Edits of attributes, undone by standard shortcuts
+        self.journal = Journal(settings.undo_limit)
+        install_undo(self, self.journal, editable, self.update_attributes)
 
         self.name_edit.setText(self.editable.name)
         self.name_edit.textChanged.connect(self.update_device_name)
@@ -89,19 +95,24 @@ class DeviceSettings(QDialog):
         self.update_attributes()
 
     def on_add_attribute(self):
-        self.editable.attributes.append(['name', 'value'])
+        self.journal.execute(self.editable, InsertItem(
+            ('attributes',), len(self.editable.attributes),
+            [self.editable.attributes.unused_key('name'), 'value']))
         self.update_attributes()
 
     def on_delete_attribute(self):
         index = self.attributes_table.currentIndex().row()
-        if len(self.editable.attributes) > 0:
-            del self.editable.attributes[index]
+        attributes = self.editable.attributes
+        if len(attributes) > 0:
+            index %= len(attributes)
+            self.journal.execute(self.editable,
+                                 RemoveItem(('attributes',), index, attributes[index]))
             self.update_attributes()
 
     def update_attributes(self):
         self.attributes_table.setModel(
             AttributesModel(
-                self.editable.attributes, self
+                self.editable.attributes, self, self.journal, ('attributes',)
             )
         )
 
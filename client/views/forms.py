@@ -0,0 +1,32 @@
+import os
+from functools import lru_cache
+
+from PyQt5 import uic
+from PyQt5.QtWidgets import QWidget
+
+UI_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'ui')
+
+
+@lru_cache(maxsize=None)
+def form_class(name: str) -> type:
+    """ Get form class generated from `client/ui/<name>.ui`
+
+    Form is compiled to Python once per process, resources included by
+    the form are registered by importing `client.res.resources_rcc`
+    """
+    form, _ = uic.loadUiType(os.path.join(UI_DIR, f'{name}.ui'),
+                             from_imports=True,
+                             resource_suffix='_rcc',
+                             import_from='client.res')
+    return form
+
+
+def load_form(widget: QWidget, name: str):
+    """ Build form `client/ui/<name>.ui` on widget
+
+    Same as `uic.loadUi`, child widgets become attributes of the widget
+    and its slots are connected by name
+    """
+    form = form_class(name)()
+    form.setupUi(widget)
+    widget.__dict__.update(vars(form))
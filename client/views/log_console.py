@@ -0,0 +1,141 @@
+from collections import deque
+
+from PyQt5.QtCore import QAbstractListModel, QModelIndex, QObject, Qt, QTimer
+from PyQt5.QtGui import QBrush, QColor
+from PyQt5.QtWidgets import (QComboBox, QHBoxLayout, QLineEdit, QListView,
+                             QVBoxLayout, QWidget)
+
+from client.data.log import LEVELS, LogBuffer, LogFilter
+
+
+class LogListModel(QAbstractListModel):
+    """ List model of filtered simulation log """
+
+    error_brush = QBrush(QColor('red'))
+
+    def __init__(self, log_filter: LogFilter, parent: QObject) -> None:
+        super().__init__(parent)
+        self.log_filter = log_filter
+        self.rows = len(log_filter)
+
+    def rowCount(self, index=QModelIndex()):
+        return 0 if index.isValid() else self.rows
+
+    def data(self, index, role):
+        if role == Qt.DisplayRole:
+            return self.log_filter.buffer.text(self.log_filter.seq(index.row()))
+        elif role == Qt.ForegroundRole:
+            if self.log_filter.buffer.level(self.log_filter.seq(index.row())) == 'ERROR':
+                return self.error_brush
+
+    def update(self):
+        """ Apply lines added to buffer and evicted from it """
+        removed, added = self.log_filter.update()
+        if removed > 0:
+            self.beginRemoveRows(QModelIndex(), 0, removed - 1)
+            self.rows -= removed
+            self.endRemoveRows()
+        if added > 0:
+            self.beginInsertRows(QModelIndex(), self.rows, self.rows + added - 1)
+            self.rows += added
+            self.endInsertRows()
+
+    def refilter(self, apply):
+        """ Change filter with `apply` callback and reset model """
+        self.beginResetModel()
+        apply()
+        self.rows = len(self.log_filter)
+        self.endResetModel()
+
+
+class LogConsole(QWidget):
+    """ Simulation log with level, source and text filters
+
+    Lines are kept in `LogBuffer` ring and shown by `QListView`, which
+    renders only visible rows. Incoming lines are queued and flushed at most
+    `refresh_rate` times per second.
+    """
+
+    def __init__(self, parent: QWidget = None, max_lines: int = 1000000,
+                 refresh_rate: int = 30) -> None:
+        super().__init__(parent)
+
+        self.buffer = LogBuffer(max_lines)
+        self.log_filter = LogFilter(self.buffer)
+        self.model = LogListModel(self.log_filter, self)
+
+        self.search_edit = QLineEdit(self)
+        self.search_edit.setPlaceholderText('Search')
+        self.search_edit.setClearButtonEnabled(True)
+        self.search_edit.textChanged.connect(self.on_search)
+
+        self.level_combo = QComboBox(self)
+        self.level_combo.addItems(['All levels', *LEVELS])
+        self.level_combo.currentIndexChanged.connect(self.on_change_filter)
+
+        self.source_combo = QComboBox(self)
+        self.source_combo.addItem('All sources')
+        self.source_combo.currentIndexChanged.connect(self.on_change_filter)
+
+        self.list_view = QListView(self)
+        self.list_view.setUniformItemSizes(True)
+        self.list_view.setSelectionMode(QListView.ExtendedSelection)
+        self.list_view.setModel(self.model)
+
+        filters = QHBoxLayout()
+        filters.addWidget(self.search_edit)
+        filters.addWidget(self.level_combo)
+        filters.addWidget(self.source_combo)
+
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.addLayout(filters)
+        layout.addWidget(self.list_view)
+
+        # Lines which don't fit into buffer anyway are dropped as they come
+        self.pending = deque(maxlen=self.buffer.capacity)
+        self.timer = QTimer(self)
+        self.timer.setSingleShot(True)
+        self.timer.setInterval(1000 // refresh_rate)
+        self.timer.timeout.connect(self.flush)
+
+    def append(self, level: str, text: str):
+        self.pending.append((level, text))
+        if not self.timer.isActive():
+            self.timer.start()
+
+    def flush(self):
+        if not self.pending:
+            return
+
+        scroll_bar = self.list_view.verticalScrollBar()
+        at_bottom = scroll_bar.value() == scroll_bar.maximum()
+
+        self.buffer.extend(self.pending)
+        self.pending.clear()
+        self.model.update()
+        self._update_sources()
+
+        if at_bottom:
+            self.list_view.scrollToBottom()
+
+    def _update_sources(self):
+        sources = self.buffer.sources
+        # First source of buffer is empty one, first item of combo is 'All sources'
+        for source in sources[self.source_combo.count():]:
+            self.source_combo.addItem(source)
+
+    def on_search(self, text):
+        self.model.refilter(lambda: self.log_filter.set_query(text))
+
+    def on_change_filter(self):
+        level = self.level_combo.currentIndex()
+        source = self.source_combo.currentIndex()
+        self.model.refilter(lambda: self.log_filter.set_filter(
+            levels=None if level == 0 else {LEVELS[level - 1]},
+            source=None if source == 0 else self.buffer.sources[source])
+        )
+
+    def clear(self):
+        self.pending.clear()
+        self.model.refilter(lambda: (self.buffer.clear(), self.log_filter.reset()))
@@ -1,47 +1,67 @@
 import json
 from copy import deepcopy
+from xml.etree.ElementTree import ParseError
 
-import requests
-from PyQt5 import QtCore, uic
+from PyQt5 import QtCore
+from PyQt5.QtCore import QThreadPool
 from PyQt5.QtWidgets import (QAction, QFileDialog, QFrame, QMainWindow,
-                             QMessageBox, QTextBrowser, QVBoxLayout)
+                             QMessageBox, QVBoxLayout, QWidget)
 
 import client.data.model as model
 import client.data.settings as settings
+from client.data.journal import Journal
+from client.data.session import EditSession
+from client.remote.encoding import encode_body
+from client.remote.worker import RequestTask
 from client.socketio_client import SocketioClient
+from client.xml.deserialize import load_model
+from client.xml.serialize import chunked
 from client.views.connection_list import ConnectionsList
+from client.views.forms import load_form
+from client.views.log_console import LogConsole
 from client.views.model_settings import ModelSettings
 from client.views.node_list import NodeList
 from client.views.remote_diag import RemoteDiag
-from client.views.topology_view import TopologyView
+from client.views.topology_base import create_topology_view
 from client.views.tracers_list import TracersList
 
 
 class MainWindow(QMainWindow):
-    log_window: QTextBrowser
+    log_window: QWidget
     connect_button: QAction
     nodes_button: QAction
     export_button: QAction
+    import_button: QAction
     settings_button: QAction
     connections_button: QAction
     tracers_button: QAction
     stop_button: QAction
     run_button: QAction
+    undo_button: QAction
+    redo_button: QAction
     topology_window: QFrame
 
     def __init__(self, websocket: SocketioClient) -> None:
         super().__init__()
-        import client.res.resources
-        uic.loadUi('client/ui/MainWindow.ui', self)
+        load_form(self, 'MainWindow')
+
+        self.log_window.setLayout(QVBoxLayout())
+        self.log_window.layout().setContentsMargins(QtCore.QMargins(0, 0, 0, 0))
+
+        self.log_console = LogConsole(self.log_window,
+                                      settings.log_max_lines,
+                                      settings.log_refresh_rate)
+        self.log_window.layout().addWidget(self.log_console)
 
         self.websocket = websocket
-        self.websocket.data_received.connect(self._on_receive)
+        self.websocket.messages_received.connect(self._on_receive)
         self.websocket.connected.connect(self._on_connected)
 
         self.connect_button.triggered.connect(self.on_remotes_button)
         self.nodes_button.triggered.connect(self.on_nodes_button)
 
         self.export_button.triggered.connect(self.export_model)
+        self.import_button.triggered.connect(self.import_model)
 
         self.settings_button.triggered.connect(self.on_open_settings)
 
@@ -52,13 +72,30 @@ class MainWindow(QMainWindow):
         self.stop_button.triggered.connect(self.send_stop)
         self.run_button.triggered.connect(self.send_model)
 
+        self.undo_button.triggered.connect(self.on_undo)
+        self.redo_button.triggered.connect(self.on_redo)
+        model.current_model.journal = Journal(settings.undo_limit)
+
+        self.pending_requests = set()
+        self.upload_task = None
+
         self.topology_window.setLayout(QVBoxLayout())
         self.topology_window.layout().setContentsMargins(QtCore.QMargins(0, 0, 0, 0))
 
-        self.topology_view = TopologyView()
+        # Topology view may start the web engine, it is created once
+        # the window is shown
+        self.topology_view = None
+        QtCore.QTimer.singleShot(0, self._create_topology_view)
+
+    def _create_topology_view(self):
+        self.topology_view = create_topology_view()
         self.topology_window.layout().addWidget(self.topology_view)
         self.topology_view.update_topology()
 
+    def _update_topology(self):
+        if self.topology_view is not None:
+            self.topology_view.update_topology()
+
     def on_remotes_button(self):
         diag = RemoteDiag(self)
         diag.accepted.connect(self.reconnect)
@@ -66,19 +103,19 @@ class MainWindow(QMainWindow):
 
     def on_nodes_button(self):
         NodeList(self).exec()
-        self.topology_view.update_topology()
 
-    def _on_receive(self, data):
-        data = json.loads(data)
-        if data['status'] == 'LOG':
-            self.log_window.append(data['msg'])
-        elif data['status'] == 'UPLOADED':
-            self._show_message_box(
-                QMessageBox.Information, f'Uploaded {data["msg"]}')
-        elif data['status'] == 'ERROR':
-            self.log_window.append('ERROR: ' + data['msg'])
-            self._show_message_box(QMessageBox.Critical,
-                                   'Error', 'Simulation error', data['msg'])
+    def _on_receive(self, messages):
+        for data in messages:
+            if data['status'] == 'LOG':
+                self.log_console.append('LOG', data['msg'])
+            elif data['status'] == 'UPLOADED':
+                self._show_message_box(
+                    QMessageBox.Information, f'Uploaded {data["msg"]}')
+            elif data['status'] == 'ERROR':
+                self.log_console.append('ERROR', data['msg'])
+                self.log_console.flush()
+                self._show_message_box(QMessageBox.Critical,
+                                       'Error', 'Simulation error', data['msg'])
 
     def _show_message_box(self, icon,  text, title=None, informative_text=None):
         msg = QMessageBox()
@@ -108,22 +145,41 @@ class MainWindow(QMainWindow):
             model.current_model.parameters = new_settings
 
     def on_open_connections(self):
-        edited = deepcopy(model.current_model.connections)
+        edited = EditSession(model.current_model, 'connections')
         if ConnectionsList(self, edited).exec() == 1:
-            model.current_model.connections = edited
-            self.topology_view.update_topology()
+            edited.commit()
 
     def export_model(self):
         file, _ = QFileDialog.getSaveFileName(self, 'Save File', filter='.xml')
         if len(file) > 0:
-            with open(file + '.xml', 'w') as f:
-                content = model.current_model.convert_to_xml()
-                f.write(content)
+            with open(file + '.xml', 'w', encoding='utf-8') as f:
+                model.current_model.write_xml(f)
+
+    def import_model(self):
+        file, _ = QFileDialog.getOpenFileName(self, 'Open File', filter='*.xml')
+        if len(file) == 0:
+            return
+
+        try:
+            model.current_model = load_model(file)
+        except (OSError, ParseError, ValueError, KeyError) as err:
+            self._show_message_box(QMessageBox.Critical, 'Can\'t import model',
+                                   'Error', str(err))
+            return
+
+        model.current_model.journal = Journal(settings.undo_limit)
+        self._update_topology()
+
+    def on_undo(self):
+        model.current_model.journal.undo(model.current_model)
+
+    def on_redo(self):
+        model.current_model.journal.redo(model.current_model)
 
     def on_open_tracers(self):
-        edited = deepcopy(model.current_model.registers)
+        edited = EditSession(model.current_model, 'registers')
         if TracersList(self, edited).exec() == 1:
-            model.current_model.registers = edited
+            edited.commit()
 
     def send_model(self):
         url = settings.remote_url.strip()
@@ -131,23 +187,71 @@ class MainWindow(QMainWindow):
             return
 
         headers = {'Content-Type': 'application/xml'}
-        model_xml = model.current_model.convert_to_xml()
-        with requests.post(url+'/start', headers=headers, data=model_xml) as res:
-            if res.status_code != 200:
-                json_msg = json.loads(res.text)
-                self._show_message_box(QMessageBox.Critical,
-                                       'Server error', 'Error', json_msg['error'])
+        # Model is serialized here, the worker sends the snapshot while
+        # the model is edited. Generator body is sent with chunked transfer
+        # encoding
+        fragments = model.current_model.xml_snapshot()
+        model_xml = (chunk.encode('utf-8') for chunk in chunked(fragments))
+        try:
+            encoding_headers, body = encode_body(model_xml,
+                                                 settings.upload_encoding,
+                                                 settings.compression_threshold)
+        except ValueError as err:
+            self._show_message_box(QMessageBox.Critical,
+                                   'Can\'t upload model', 'Error', str(err))
+            return
+
+        headers.update(encoding_headers)
+        task = RequestTask('POST', url+'/start', headers, body)
+        task.signals.progress.connect(self._on_upload_progress)
+        for signal in (task.signals.finished, task.signals.failed, task.signals.cancelled):
+            signal.connect(lambda *args: self._on_upload_done(task))
+
+        self.upload_task = task
+        self.run_button.setEnabled(False)
+        self._start_request(task)
 
     def send_stop(self):
         url = settings.remote_url.strip()
         if self.check_url(url) == False:
             return
 
-        with requests.get(url+'/stop') as res:
-            if res.status_code != 200:
-                json_msg = json.loads(res.text)
-                self._show_message_box(QMessageBox.Critical,
-                                       'Server error', 'Error', json_msg['error'])
+        if self.upload_task is not None:
+            self.upload_task.cancel()
+
+        self._start_request(RequestTask('GET', url+'/stop'))
+
+    def _start_request(self, task: RequestTask):
+        task.signals.finished.connect(self._on_response)
+        task.signals.failed.connect(self._on_request_failed)
+
+        # Keep task alive until it reports result
+        self.pending_requests.add(task)
+        for signal in (task.signals.finished, task.signals.failed, task.signals.cancelled):
+            signal.connect(lambda *args: self.pending_requests.discard(task))
+
+        QThreadPool.globalInstance().start(task)
+
+    def _on_response(self, status, text):
+        if status != 200:
+            json_msg = json.loads(text)
+            self._show_message_box(QMessageBox.Critical,
+                                   'Server error', 'Error', json_msg['error'])
+
+    def _on_request_failed(self, error):
+        self._show_message_box(QMessageBox.Critical,
+                               'Request failed', 'Error', error)
+
+    def _on_upload_progress(self, sent):
+        self.statusBar().showMessage(f'Uploading model: {sent / 2**20:.1f} MB')
+
+    def _on_upload_done(self, task):
+        if self.upload_task is not task:
+            return
+
+        self.upload_task = None
+        self.run_button.setEnabled(True)
+        self.statusBar().clearMessage()
 
     def check_url(self, url) -> bool:
         if url == '':
@@ -1,7 +1,7 @@
-from PyQt5 import uic
 from PyQt5.QtWidgets import QComboBox, QDialog, QLineEdit
 
 from client.data.objects import Precision
+from client.views.forms import load_form
 
 
 class ModelSettings(QDialog):
@@ -15,7 +15,7 @@ class ModelSettings(QDialog):
 
     def __init__(self, parent, settings):
         super().__init__(parent)
-        uic.loadUi('client/ui/ModelSettings.ui', self)
+        load_form(self, 'ModelSettings')
 
         self.settings = settings
 
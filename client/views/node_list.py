@@ -1,13 +1,11 @@
-from copy import deepcopy
-from typing import List
-
-from PyQt5 import uic
-from PyQt5.QtGui import QStandardItem, QStandardItemModel
 from PyQt5.QtWidgets import QDialog, QListView, QPushButton, QWidget
 
 import client.data.model as model
-from client.data.objects import Node
+from client.data.objects import Node, touch
+from client.data.session import EditSession
+from client.views.forms import load_form
 from client.views.node_settings import NodeSettings
+from client.views.object_list_model import ObjectListModel
 
 
 class NodeList(QDialog):
@@ -20,50 +18,41 @@ class NodeList(QDialog):
     edit_button: QPushButton
     delete_button: QPushButton
     list_view: QListView
-    nodes_list: List[Node]
+    nodes_list: EditSession
 
     def __init__(self, parent: QWidget) -> None:
         super().__init__(parent)
-        uic.loadUi('client/ui/NodeList.ui', self)
+        load_form(self, 'NodeList')
 
         self.add_button.clicked.connect(self.on_add)
         self.edit_button.clicked.connect(self.on_edit)
         self.delete_button.clicked.connect(self.on_delete)
 
-        self.nodes_list = deepcopy(model.current_model.nodes)
-        self.update_list()
-
-    def update_list(self) -> None:
-        list_model = QStandardItemModel()
-        self.list_view.setModel(list_model)
-
-        for node in self.nodes_list:
-            item = QStandardItem(node.name)
-            item.setEditable(False)
-            list_model.appendRow(item)
+        self.nodes_list = EditSession(model.current_model, 'nodes')
+        self.list_model = ObjectListModel(self.nodes_list, self)
+        self.list_view.setModel(self.list_model)
 
     def on_add(self):
         new_node = Node('new', [], [], [], [])
         if NodeSettings(self, new_node).exec() == 1:
-            self.nodes_list.append(new_node)
-            self.update_list()
+            touch(new_node)
+            self.list_model.append(new_node)
 
     def on_edit(self):
         id = self.list_view.currentIndex().row()
         if id == -1:
             return
 
-        edited = deepcopy(self.nodes_list[id])
+        edited = self.nodes_list.checkout(id)
         if NodeSettings(self, edited).exec() == 1:
-            self.nodes_list[id] = edited
-            self.update_list()
+            touch(edited)
+            self.list_model.replace(id, edited)
 
     def on_delete(self):
         to_delete = self.list_view.currentIndex().row()
         if len(self.nodes_list) > 0:
-            del self.nodes_list[to_delete]
-            self.update_list()
+            self.list_model.remove(to_delete)
 
     def accept(self):
-        model.current_model.nodes = self.nodes_list
+        self.nodes_list.commit()
         super().accept()
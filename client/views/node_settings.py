@@ -1,54 +1,55 @@
 from copy import deepcopy
-from typing import List
+from typing import Optional
 
-from PyQt5 import uic
 from PyQt5.QtCore import QAbstractTableModel, QObject, Qt
-from PyQt5.QtGui import QStandardItem, QStandardItemModel
 from PyQt5.QtWidgets import (QDialog, QHeaderView, QLineEdit, QListView,
                              QTableView, QWidget)
 
-from client.data.objects import Application, Device, Node, Route
+import client.data.settings as settings
+from client.data.journal import (InsertItem, Journal, Path, RemoveItem, SetValue,
+                                 set_value)
+from client.data.objects import Application, Device, Node, Route, RouteTable, touch
 from client.views.app_settings import ApplicationsSettings
 from client.views.device_settings import DeviceSettings
+from client.views.forms import load_form
+from client.views.object_list_model import ObjectListModel
+from client.views.undo import install_undo
 
 
 class RoutesTableModel(QAbstractTableModel):
-    """ Table model for node's routes """
+    """ Table model for node's routes
+
+    Edits are recorded in `journal` if it is given, `path` is path
+    of routes from root object of the journal
+    """
 
     ipv4_header = ('net', 'mask', 'dst', 'metric')
     ipv6_header = ('net', 'prefix', 'dst', 'metric')
+    ipv4_fields = ('network', 'netmask', 'dst', 'metric')
+    ipv6_fields = ('network', 'prefix', 'dst', 'metric')
 
-    def __init__(self, routes: List[Route], is_ipv6: bool, parent: QObject) -> None:
+    def __init__(self, routes: RouteTable, is_ipv6: bool, parent: QObject,
+                 journal: Optional[Journal] = None, path: Path = ()) -> None:
         super().__init__(parent)
         self.routes = routes
         self.is_ipv6 = is_ipv6
+        self.journal = journal
+        self.path = path
 
     def data(self, index, role):
         if role == Qt.DisplayRole or role == Qt.EditRole:
-            route = self.routes[index.row()]
-            if index.column() == 0:
-                return route.network
-            elif index.column() == 1:
-                return route.prefix if self.is_ipv6 else route.netmask
-            elif index.column() == 2:
-                return route.dst
-            elif index.column() == 3:
-                return route.metric
+            # Only the shown cell is read from the table
+            field = (self.ipv6_fields if self.is_ipv6 else self.ipv4_fields)[index.column()]
+            return self.routes.field(index.row(), field)
 
     def setData(self, index, value, role):
         if role == Qt.EditRole:
-            route = self.routes[index.row()]
-            if index.column() == 0:
-                route.network = value.strip()
-            elif index.column() == 1:
-                if self.is_ipv6:
-                    route.prefix = value.strip()
-                else:
-                    route.netmask = value.strip()
-            elif index.column() == 2:
-                route.dst = value.strip()
-            elif index.column() == 3:
-                route.metric = int(value)
+            field = (self.ipv6_fields if self.is_ipv6 else self.ipv4_fields)[index.column()]
+            value = int(value) if field == 'metric' else value.strip()
+            cell = (index.row(), field)
+            old = set_value(self.routes, cell, value)
+            if self.journal is not None:
+                self.journal.record(SetValue(self.path + cell, old, value))
             return True
         return False
 
@@ -82,10 +83,13 @@ class NodeSettings(QDialog):
     def __init__(self, parent: QWidget, editable_node: Node) -> None:
         super().__init__(parent)
 
-        import client.res.resources
-        uic.loadUi('client/ui/NodeSettings.ui', self)
+        load_form(self, 'NodeSettings')
 
         self.editable_node = editable_node
+        # Edits of devices, applications and routes, undone by standard
+        # shortcuts. Name edit has undo of its own
+        self.journal = Journal(settings.undo_limit)
+        install_undo(self, self.journal, editable_node, self.update_lists)
         self.name_edit.setText(editable_node.name)
         self.name_edit.textChanged.connect(self.update_node_name)
 
@@ -107,102 +111,125 @@ class NodeSettings(QDialog):
         self.delete_app.clicked.connect(self.on_delete_app)
         self.edit_app.clicked.connect(self.on_edit_app)
 
-        self.update_device_list()
-        self.update_apps_list()
-        self.update_ipv4_routes()
-        self.update_ipv6_routes()
+        self.update_lists()
 
     def update_node_name(self, name):
         self.editable_node.name = name.strip()
 
-    def update_device_list(self):
-        list_model = QStandardItemModel()
-        self.device_list.setModel(list_model)
-        for device in self.editable_node.devices:
-            item = QStandardItem(device.name)
-            item.setEditable(False)
-            list_model.appendRow(item)
-
-    def update_apps_list(self):
-        list_model = QStandardItemModel()
-        self.applications_list.setModel(list_model)
-        for app in self.editable_node.applications:
-            item = QStandardItem(app.name)
-            item.setEditable(False)
-            list_model.appendRow(item)
-
     def update_ipv4_routes(self):
         self.ipv4_routes.setModel(RoutesTableModel(
-            self.editable_node.ipv4_routes, False, self))
+            self.editable_node.ipv4_routes, False, self,
+            self.journal, ('ipv4_routes',)))
 
     def update_ipv6_routes(self):
         self.ipv6_routes.setModel(RoutesTableModel(
-            self.editable_node.ipv6_routes, True, self))
+            self.editable_node.ipv6_routes, True, self,
+            self.journal, ('ipv6_routes',)))
+
+    def update_devices(self):
+        self.devices_model = ObjectListModel(self.editable_node.devices, self)
+        self.device_list.setModel(self.devices_model)
+
+    def update_apps(self):
+        self.apps_model = ObjectListModel(self.editable_node.applications, self)
+        self.applications_list.setModel(self.apps_model)
+
+    def update_lists(self):
+        # Lists are rebuilt after undo and redo, other edits are made
+        # through their models row by row
+        self.update_devices()
+        self.update_apps()
+        self.update_ipv4_routes()
+        self.update_ipv6_routes()
 
     def on_delete_device(self):
         index = self.device_list.currentIndex().row()
-        if len(self.editable_node.devices) > 0:
-            del self.editable_node.devices[index]
-            self.update_device_list()
+        devices = self.editable_node.devices
+        if len(devices) > 0:
+            index %= len(devices)
+            device = devices[index]
+            self.devices_model.remove(index)
+            self.journal.record(RemoveItem(('devices',), index, device))
+            touch(self.editable_node)
 
     def on_add_device(self):
         new_device = Device('eth', 'Csma', [], [], [])
         if DeviceSettings(self, new_device).exec() == 1:
-            self.editable_node.devices.append(new_device)
-            self.update_device_list()
+            row = len(self.editable_node.devices)
+            self.devices_model.append(new_device)
+            self.journal.record(InsertItem(('devices',), row, new_device))
+            touch(self.editable_node)
 
     def on_edit_device(self):
         index = self.device_list.currentIndex().row()
         if index == -1:
             return
 
-        edited = deepcopy(self.editable_node.devices[index])
+        # Attributes and addresses edited in device dialog are undone
+        # here at once
+        old = self.editable_node.devices[index]
+        edited = deepcopy(old)
         if DeviceSettings(self, edited).exec() == 1:
-            self.editable_node.devices[index] = edited
-            self.update_device_list()
+            self.devices_model.replace(index, edited)
+            self.journal.record(SetValue(('devices', index), old, edited))
+            touch(self.editable_node)
 
     def add_new_ipv4_route(self):
-        self.editable_node.ipv4_routes.append(
-            Route('', '', 0, netmask='')
-        )
+        routes = self.editable_node.ipv4_routes
+        self.journal.execute(self.editable_node, InsertItem(
+            ('ipv4_routes',), len(routes), Route('', '', 0, netmask='')))
         self.update_ipv4_routes()
 
     def add_new_ipv6_route(self):
-        self.editable_node.ipv6_routes.append(
-            Route('', '', 0, prefix='16')
-        )
+        routes = self.editable_node.ipv6_routes
+        self.journal.execute(self.editable_node, InsertItem(
+            ('ipv6_routes',), len(routes), Route('', '', 0, prefix='16')))
         self.update_ipv6_routes()
 
     def on_delete_ipv4_route(self):
         index = self.ipv4_routes.currentIndex().row()
-        if len(self.editable_node.ipv4_routes) > 0:
-            del self.editable_node.ipv4_routes[index]
+        routes = self.editable_node.ipv4_routes
+        if len(routes) > 0:
+            index %= len(routes)
+            self.journal.execute(self.editable_node,
+                                 RemoveItem(('ipv4_routes',), index, routes[index]))
             self.update_ipv4_routes()
 
     def on_delete_ipv6_route(self):
         index = self.ipv6_routes.currentIndex().row()
-        if len(self.editable_node.ipv6_routes) > 0:
-            del self.editable_node.ipv6_routes[index]
+        routes = self.editable_node.ipv6_routes
+        if len(routes) > 0:
+            index %= len(routes)
+            self.journal.execute(self.editable_node,
+                                 RemoveItem(('ipv6_routes',), index, routes[index]))
             self.update_ipv6_routes()
 
     def on_add_app(self):
         new_app = Application('app', '', [])
         if ApplicationsSettings(self, new_app).exec() == 1:
-            self.editable_node.applications.append(new_app)
-            self.update_apps_list()
+            row = len(self.editable_node.applications)
+            self.apps_model.append(new_app)
+            self.journal.record(InsertItem(('applications',), row, new_app))
+            touch(self.editable_node)
 
     def on_edit_app(self):
         index = self.applications_list.currentIndex().row()
         if index == -1:
             return
 
-        edited_app = deepcopy(self.editable_node.applications[index])
+        old = self.editable_node.applications[index]
+        edited_app = deepcopy(old)
         if ApplicationsSettings(self, edited_app).exec() == 1:
-            self.editable_node.applications[index] = edited_app
-            self.update_apps_list()
+            self.apps_model.replace(index, edited_app)
+            self.journal.record(SetValue(('applications', index), old, edited_app))
+            touch(self.editable_node)
 
     def on_delete_app(self):
         index = self.applications_list.currentIndex().row()
-        if len(self.editable_node.applications) > 0:
-            del self.editable_node.applications[index]
-            self.update_apps_list()
+        apps = self.editable_node.applications
+        if len(apps) > 0:
+            index %= len(apps)
+            app = apps[index]
+            self.apps_model.remove(index)
+            self.journal.record(RemoveItem(('applications',), index, app))
+            touch(self.editable_node)
@@ -0,0 +1,43 @@
+from typing import List
+
+from PyQt5.QtCore import QAbstractListModel, QModelIndex, QObject, Qt
+
+
+class ObjectListModel(QAbstractListModel):
+    """ List model showing names of objects of a list
+
+    The list, or `EditSession` of model list, is edited through the model
+    one row at a time, so views redraw only changed rows and keep their
+    selection
+    """
+
+    def __init__(self, objects: List, parent: QObject, label: str = 'name') -> None:
+        super().__init__(parent)
+        self.objects = objects
+        self.label = label
+
+    def rowCount(self, index=QModelIndex()):
+        return 0 if index.isValid() else len(self.objects)
+
+    def data(self, index, role):
+        if role == Qt.DisplayRole:
+            return getattr(self.objects[index.row()], self.label)
+
+    def append(self, obj):
+        row = len(self.objects)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self.objects.append(obj)
+        self.endInsertRows()
+
+    def replace(self, row: int, obj):
+        self.objects[row] = obj
+        index = self.index(row)
+        self.dataChanged.emit(index, index, [Qt.DisplayRole])
+
+    def remove(self, row: int):
+        # Negative rows count from the end, as with lists
+        if row < 0:
+            row += len(self.objects)
+        self.beginRemoveRows(QModelIndex(), row, row)
+        del self.objects[row]
+        self.endRemoveRows()
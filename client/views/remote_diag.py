@@ -1,7 +1,7 @@
-from PyQt5 import uic
 from PyQt5.QtWidgets import QWidget, QDialog
 
 import client.data.settings as settings
+from client.views.forms import load_form
 
 
 class RemoteDiag(QDialog):
@@ -10,8 +10,7 @@ class RemoteDiag(QDialog):
     def __init__(self, parent: QWidget) -> None:
         super().__init__(parent)
 
-        import client.res.resources
-        uic.loadUi('client/ui/ConnectRemote.ui', self)
+        load_form(self, 'ConnectRemote')
 
         self.url_edit.setText(settings.remote_url)
 
@@ -0,0 +1,177 @@
+from PyQt5.QtWidgets import QWidget
+
+import client.data.model as model
+import client.data.settings as settings
+from client.data.events import ModelEvent
+from client.data.topology import (Graph, GraphDiff, apply_positions, build_graph,
+                                  diff_graphs, known_positions, update_graph)
+
+
+class BaseTopologyView(QWidget):
+    """ Topology widget independent of the way graph is drawn
+
+    Builds graph of current model, computes layout and clusters of big
+    graphs and passes changes of shown graph to `_apply_diff`. Later changes
+    of the model are applied to the graph as they are made.
+    """
+
+    # Whether renderer can lay out small graphs by itself
+    has_physics = False
+
+    def __init__(self, *args):
+        """ Object constructor
+
+        :param args: list of args passed to parent class `QWidget`
+        """
+        super().__init__(*args)
+
+        # Graph shown by renderer and graph to be shown
+        self.shown = Graph()
+        self.target = Graph()
+        # Whether positions are computed by renderer's physics instead of python
+        self.physics = self.has_physics
+        # Whole graph and its clusters, None if graph is shown unclustered
+        self.graph = Graph()
+        self.clusters = None
+        self.viewport = None
+        self.scale = 1.0
+        # Clusters expanded by double-click
+        self.pinned = set()
+        # Model whose changes are shown
+        self.observed = None
+
+    def _ready(self) -> bool:
+        """ Whether renderer accepts changes """
+        return True
+
+    def _apply_diff(self, diff: GraphDiff):
+        raise NotImplementedError
+
+    def _push_changes(self):
+        if not self._ready():
+            return
+        diff = diff_graphs(self.shown, self.target)
+        if not diff.is_empty():
+            self._apply_diff(diff)
+        self.shown = self.target
+
+    def _update_target(self):
+        if self.clusters is None:
+            self.target = self.graph
+            return
+
+        from client.data.clustering import expanded_clusters, visible_graph
+        expanded = set()
+        if self.viewport is not None:
+            expanded = expanded_clusters(self.clusters, self.viewport, self.scale,
+                                         settings.cluster_expand_size, self.pinned)
+        self.target = visible_graph(self.graph, self.clusters, expanded)
+
+    def set_viewport(self, viewport, scale):
+        self.viewport = viewport
+        self.scale = scale
+        if self.clusters is None:
+            return
+
+        # Clusters expanded by double-click collapse once they are scrolled away
+        from client.data.clustering import intersects
+        clusters = self.clusters.clusters
+        self.pinned = {cluster_id for cluster_id in self.pinned
+                       if cluster_id in clusters
+                       and intersects(clusters[cluster_id].box, viewport)}
+        self._update_target()
+        self._push_changes()
+
+    def expand_cluster(self, item_id):
+        if self.clusters is None or item_id not in self.clusters.clusters:
+            return
+        self.pinned.add(item_id)
+        self._update_target()
+        self._push_changes()
+
+    def _observe(self, observed: model.Model):
+        if observed is self.observed:
+            return
+        if self.observed is not None:
+            self.observed.unsubscribe(self.model_changed)
+        observed.subscribe(self.model_changed)
+        self.observed = observed
+
+    def _place_new_nodes(self, diff: GraphDiff):
+        """ Compute positions of graph nodes added by diff next to their
+        neighbours
+        """
+        new = [item['id'] for item in diff.nodes if 'x' not in item]
+        if not new:
+            return
+
+        from client.data.layout import layout_graph
+        nearby = Graph(nodes={item_id: self.graph.nodes[item_id] for item_id in new})
+        for edge in diff.edges:
+            if edge['from'] in nearby.nodes or edge['to'] in nearby.nodes:
+                nearby.edges[edge['id']] = edge
+                for item_id in (edge['from'], edge['to']):
+                    nearby.nodes.setdefault(item_id, self.graph.nodes[item_id])
+        positions = layout_graph(nearby, known_positions(nearby))
+        apply_positions(self.graph, {item_id: positions[item_id] for item_id in new})
+
+    def model_changed(self, event: ModelEvent):
+        """ Show change of model
+
+        Graph is updated in place and only its changes are passed to
+        renderer. Clusters of changed graph nodes are updated as well.
+        """
+        diff = update_graph(self.graph, self.observed, event)
+        if diff is None:
+            self.update_topology()
+            return
+        if diff.is_empty():
+            return
+
+        if not self.physics:
+            self._place_new_nodes(diff)
+        if self.clusters is not None:
+            from client.data.clustering import update_cluster_tree
+            update_cluster_tree(self.clusters, self.graph, diff)
+        if self._ready() and self.shown is self.graph:
+            self._apply_diff(diff)
+        else:
+            self._update_target()
+            self._push_changes()
+
+    def update_topology(self):
+        self._observe(model.current_model)
+        self.graph = build_graph(model.current_model)
+
+        # Physics stabilization of big graphs is too slow, precompute layout.
+        # Positions are kept in model, so saved layout is reused on reload.
+        # Layout and clustering import NumPy, so they are imported when needed.
+        known = known_positions(self.graph)
+        self.physics = self.has_physics and not known \
+            and len(self.graph.nodes) < settings.layout_threshold
+        if not self.physics and len(known) < len(self.graph.nodes):
+            from client.data.layout import layout_graph
+            positions = layout_graph(self.graph, known)
+            apply_positions(self.graph, positions)
+
+        # Drawing of all nodes of big graphs is too slow to pan or zoom
+        if not self.physics and len(self.graph.nodes) >= settings.cluster_threshold:
+            from client.data.clustering import build_cluster_tree
+            self.clusters = build_cluster_tree(model.current_model, self.graph)
+        else:
+            self.clusters = None
+        self._update_target()
+        self._push_changes()
+
+
+def create_topology_view(*args) -> BaseTopologyView:
+    """ Create topology widget of renderer selected by `settings.topology_renderer`
+
+    QtWebEngine is imported only if web renderer is selected
+    """
+    if settings.topology_renderer == 'native':
+        from client.views.topology_scene import SceneTopologyView
+        return SceneTopologyView(*args)
+
+    from client.views.topology_view import TopologyView
+    return TopologyView(*args)
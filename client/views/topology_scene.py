@@ -0,0 +1,192 @@
+import math
+from typing import Dict, List
+
+from PyQt5.QtCore import QLineF, QMargins, QRectF, Qt, QTimer
+from PyQt5.QtGui import QBrush, QColor, QPainter, QPen
+from PyQt5.QtWidgets import (QGraphicsItem, QGraphicsLineItem, QGraphicsScene,
+                             QGraphicsView, QStyleOptionGraphicsItem, QVBoxLayout)
+
+from client.data.topology import Graph, GraphDiff
+from client.views.topology_base import BaseTopologyView
+
+NODE_RADIUS = 10.0
+NODE_COLOR = QColor('#97c2fc')
+NODE_BORDER = QColor('#2b7ce9')
+EDGE_COLOR = QColor('#2b7ce9')
+# Labels are not drawn when zoomed out below this scale
+LABEL_MIN_SCALE = 0.4
+
+
+class NodeItem(QGraphicsItem):
+    """ Node of topology, dot with label below it
+
+    Collapsed clusters are drawn bigger, depending on number of their nodes,
+    proxy nodes of connections are drawn as label only
+    """
+
+    def __init__(self, properties: dict) -> None:
+        super().__init__()
+        self.edges: List['EdgeItem'] = []
+        self.setFlags(QGraphicsItem.ItemIsMovable |
+                      QGraphicsItem.ItemSendsGeometryChanges)
+        self.set_properties(properties)
+
+    def set_properties(self, properties: dict):
+        self.prepareGeometryChange()
+        self.properties = properties
+        self.label = properties.get('label', '')
+        self.text_only = properties.get('shape') == 'text'
+        self.radius = NODE_RADIUS
+        if 'value' in properties:
+            self.radius *= 1 + math.log10(properties['value'])
+        self.setPos(properties.get('x', 0.0), properties.get('y', 0.0))
+        self.update()
+
+    def boundingRect(self) -> QRectF:
+        # Room for label below the dot
+        return QRectF(-4 * self.radius, -self.radius, 8 * self.radius, 3 * self.radius)
+
+    def paint(self, painter: QPainter, option: QStyleOptionGraphicsItem, widget=None):
+        lod = option.levelOfDetailFromTransform(painter.worldTransform())
+        if not self.text_only:
+            painter.setPen(QPen(NODE_BORDER, 1))
+            painter.setBrush(QBrush(NODE_COLOR))
+            painter.drawEllipse(QRectF(-self.radius, -self.radius,
+                                       2 * self.radius, 2 * self.radius))
+        if lod >= LABEL_MIN_SCALE or self.text_only:
+            painter.setPen(Qt.black)
+            label_top = -self.radius / 2 if self.text_only else self.radius
+            painter.drawText(QRectF(-4 * self.radius, label_top, 8 * self.radius, self.radius),
+                             Qt.AlignHCenter | Qt.AlignTop, self.label)
+
+    def itemChange(self, change, value):
+        if change == QGraphicsItem.ItemPositionHasChanged:
+            for edge in self.edges:
+                edge.adjust()
+        return super().itemChange(change, value)
+
+
+class EdgeItem(QGraphicsLineItem):
+    """ Edge of topology, merged edges are drawn thicker """
+
+    def __init__(self, properties: dict, src: NodeItem, dst: NodeItem) -> None:
+        super().__init__()
+        self.properties = properties
+        self.src = src
+        self.dst = dst
+        src.edges.append(self)
+        dst.edges.append(self)
+        width = 1 + math.log2(properties.get('value', 1))
+        self.setPen(QPen(EDGE_COLOR, width))
+        # Edges are drawn under nodes
+        self.setZValue(-1)
+        self.adjust()
+
+    def adjust(self):
+        self.setLine(QLineF(self.src.pos(), self.dst.pos()))
+
+    def detach(self):
+        self.src.edges.remove(self)
+        self.dst.edges.remove(self)
+
+
+class TopologyGraphicsView(QGraphicsView):
+    """ Graphics view zoomed by mouse wheel, reporting visible part of scene """
+
+    def __init__(self, scene: QGraphicsScene, topology: 'SceneTopologyView') -> None:
+        super().__init__(scene, topology)
+        self.topology = topology
+        self.setDragMode(QGraphicsView.ScrollHandDrag)
+        self.setTransformationAnchor(QGraphicsView.AnchorUnderMouse)
+        self.setViewportUpdateMode(QGraphicsView.SmartViewportUpdate)
+        self.setOptimizationFlags(QGraphicsView.DontSavePainterState |
+                                  QGraphicsView.DontAdjustForAntialiasing)
+        self.setRenderHint(QPainter.Antialiasing)
+
+        # Viewport is reported once scrolling or zooming stops
+        self.viewport_timer = QTimer(self)
+        self.viewport_timer.setSingleShot(True)
+        self.viewport_timer.setInterval(100)
+        self.viewport_timer.timeout.connect(self.report_viewport)
+        self.horizontalScrollBar().valueChanged.connect(self.viewport_timer.start)
+        self.verticalScrollBar().valueChanged.connect(self.viewport_timer.start)
+
+    def report_viewport(self):
+        rect = self.mapToScene(self.viewport().rect()).boundingRect()
+        self.topology.set_viewport((rect.left(), rect.top(), rect.right(), rect.bottom()),
+                                   self.transform().m11())
+
+    def wheelEvent(self, event):
+        factor = 1.25 ** (event.angleDelta().y() / 120)
+        self.scale(factor, factor)
+        self.viewport_timer.start()
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self.viewport_timer.start()
+
+    def mouseDoubleClickEvent(self, event):
+        item = self.itemAt(event.pos())
+        if isinstance(item, NodeItem):
+            self.topology.expand_cluster(item.properties['id'])
+        super().mouseDoubleClickEvent(event)
+
+
+class SceneTopologyView(BaseTopologyView):
+    """ Topology widget drawn by `QGraphicsScene`
+
+    Lighter alternative of web based `TopologyView`, items are updated
+    incrementally and the scene's BSP index limits painting to visible items
+    """
+
+    def __init__(self, *args):
+        """ Object constructor
+
+        :param args: list of args passed to parent class `QWidget`
+        """
+        super().__init__(*args)
+        self.scene = QGraphicsScene(self)
+        self.scene.setItemIndexMethod(QGraphicsScene.BspTreeIndex)
+        self.graphics_view = TopologyGraphicsView(self.scene, self)
+
+        layout = QVBoxLayout(self)
+        self.setLayout(layout)
+        self.layout().addWidget(self.graphics_view)
+        layout.setContentsMargins(QMargins(0, 0, 0, 0))
+
+        self.node_items: Dict[object, NodeItem] = {}
+        self.edge_items: Dict[str, EdgeItem] = {}
+
+    def _remove_edge(self, edge_id):
+        edge = self.edge_items.pop(edge_id)
+        edge.detach()
+        self.scene.removeItem(edge)
+
+    def _apply_diff(self, diff: GraphDiff):
+        was_empty = not self.node_items
+
+        for edge_id in diff.removed_edges:
+            self._remove_edge(edge_id)
+        for node_id in diff.removed_nodes:
+            self.scene.removeItem(self.node_items.pop(node_id))
+
+        for properties in diff.nodes:
+            item = self.node_items.get(properties['id'])
+            if item is None:
+                item = NodeItem(properties)
+                self.node_items[properties['id']] = item
+                self.scene.addItem(item)
+            else:
+                item.set_properties(properties)
+
+        for properties in diff.edges:
+            if properties['id'] in self.edge_items:
+                self._remove_edge(properties['id'])
+            edge = EdgeItem(properties, self.node_items[properties['from']],
+                            self.node_items[properties['to']])
+            self.edge_items[properties['id']] = edge
+            self.scene.addItem(edge)
+
+        if was_empty and self.node_items:
+            self.graphics_view.fitInView(self.scene.itemsBoundingRect(), Qt.KeepAspectRatio)
+            self.graphics_view.viewport_timer.start()
@@ -1,18 +1,56 @@
-import os
+import json
+from dataclasses import asdict
 
-from PyQt5.QtCore import QMargins, QUrl
-from PyQt5.QtWebEngineWidgets import QWebEngineView
-from PyQt5.QtWidgets import QVBoxLayout, QWidget
-from pyvis.network import Network
+from PyQt5.QtCore import QMargins, QObject, QUrl, pyqtSlot
+from PyQt5.QtWebChannel import QWebChannel
+from PyQt5.QtWebEngineWidgets import QWebEngineProfile, QWebEngineView
+from PyQt5.QtWidgets import QVBoxLayout
 
-import client.data.model as model
+from client.data.topology import Graph, GraphDiff
+from client.views.assets_scheme import ASSETS_SCHEME, AssetsSchemeHandler
+from client.views.topology_base import BaseTopologyView
 
+PAGE_URL = QUrl('ns-client://topology/topology_page.html')
 
-class TopologyView(QWidget):
-    """ Topology widget based on pyvis and QWebEngine """
+_assets_handler = None
+
+
+def _install_assets_handler():
+    global _assets_handler
+    if _assets_handler is None:
+        _assets_handler = AssetsSchemeHandler()
+        QWebEngineProfile.defaultProfile().installUrlSchemeHandler(
+            ASSETS_SCHEME, _assets_handler)
+
+
+class TopologyBridge(QObject):
+    """ Object exposed to topology page through `QWebChannel` """
+
+    def __init__(self, view: BaseTopologyView) -> None:
+        super().__init__(view)
+        self.view = view
+
+    @pyqtSlot(float, float, float, float, float)
+    def viewportChanged(self, left, top, right, bottom, scale):
+        self.view.set_viewport((left, top, right, bottom), scale)
+
+    @pyqtSlot(str)
+    def expandCluster(self, item_id):
+        self.view.expand_cluster(item_id)
+
+
+class TopologyView(BaseTopologyView):
+    """ Topology widget based on vis-network and QWebEngine
+
+    Page is loaded once, later changes of topology are pushed into
+    vis-network data sets. Big topologies are shown as clusters, which
+    are expanded when page reports they got large enough on screen.
+    """
 
     web_view: QWebEngineView
 
+    has_physics = True
+
     def __init__(self, *args):
         """ Object constructor
 
@@ -26,39 +64,25 @@ class TopologyView(QWidget):
         self.layout().addWidget(self.web_view)
         layout.setContentsMargins(QMargins(0, 0, 0, 0))
 
-    def update_topology(self):
-        network = Network()
-        network.set_template(os.path.join(
-            os.getcwd(), 'client', 'html', 'topology_template.html')
-        )
-
-        id_per_node = {}
-        for index, node in enumerate(model.current_model.nodes):
-            network.add_node(index, node.name)
-            id_per_node[node.name] = index
-
-        for connection in model.current_model.connections:
-            # endpoint = Node/Interface
-            endpoints = [endpoint.split('/')[0]
-                         for endpoint in connection.interfaces]
-
-            if len(endpoints) == 2:
-                # Create edge betwen two nodes
-                src, dst = endpoints
-                if src in id_per_node and dst in id_per_node:
-                    network.add_edge(id_per_node[src], id_per_node[dst])
-            elif len(endpoints) > 2:
-                # Create proxy object and connect to it
-                proxy = hash(connection.name)
-                network.add_node(proxy, label=connection.name, shape='text')
-                for node in endpoints:
-                    if node in id_per_node:
-                        network.add_edge(id_per_node[node], proxy)
-            else:
-                pass
-
-        tolopogy = os.path.join(os.getcwd(), 'client', 'html', 'topology.html')
-        network.save_graph(tolopogy)
-
-        topology_path = QUrl.fromLocalFile(tolopogy)
-        self.web_view.load(topology_path)
+        self.page_loaded = False
+        self.web_view.loadFinished.connect(self._on_load_finished)
+
+        self.channel = QWebChannel(self)
+        self.channel.registerObject('topology', TopologyBridge(self))
+        self.web_view.page().setWebChannel(self.channel)
+
+        _install_assets_handler()
+        self.web_view.load(PAGE_URL)
+
+    def _on_load_finished(self, ok):
+        self.page_loaded = ok
+        self.shown = Graph()
+        self._push_changes()
+
+    def _ready(self) -> bool:
+        return self.page_loaded
+
+    def _apply_diff(self, diff: GraphDiff):
+        physics = 'true' if self.physics else 'false'
+        self.web_view.page().runJavaScript(
+            f'applyTopologyDiff({json.dumps(asdict(diff))}, {physics})')
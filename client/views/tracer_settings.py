@@ -1,8 +1,8 @@
-from PyQt5 import uic
 from PyQt5.QtCore import Qt
 from PyQt5.QtWidgets import QComboBox, QDialog, QLineEdit, QWidget
 
 from client.data.objects import Register
+from client.views.forms import load_form
 
 
 class TracerSettings(QDialog):
@@ -22,7 +22,7 @@ class TracerSettings(QDialog):
 
     def __init__(self, parent: QWidget, tracer: Register) -> None:
         super().__init__(parent)
-        uic.loadUi('client/ui/TracerSettings.ui', self)
+        load_form(self, 'TracerSettings')
 
         self.tracer = tracer
 
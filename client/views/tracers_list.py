@@ -1,11 +1,9 @@
-from copy import deepcopy
-from typing import List
-
-from PyQt5 import uic
-from PyQt5.QtGui import QStandardItem, QStandardItemModel
 from PyQt5.QtWidgets import QDialog, QListView, QPushButton, QWidget
 
-from client.data.objects import Register
+from client.data.objects import Register, touch
+from client.data.session import EditSession
+from client.views.forms import load_form
+from client.views.object_list_model import ObjectListModel
 from client.views.tracer_settings import TracerSettings
 
 
@@ -19,45 +17,35 @@ class TracersList(QDialog):
     delete_tracer: QPushButton
     edit_tracer: QPushButton
 
-    def __init__(self, parent: QWidget, tracers: List[Register]) -> None:
+    def __init__(self, parent: QWidget, tracers: EditSession) -> None:
         super().__init__(parent)
-        uic.loadUi('client/ui/TracersList.ui', self)
+        load_form(self, 'TracersList')
 
         self.tracers = tracers
+        self.list_model = ObjectListModel(tracers, self, label='value_name')
+        self.tracers_list.setModel(self.list_model)
 
         self.add_tracer.clicked.connect(self.on_add_tracer)
         self.edit_tracer.clicked.connect(self.on_edit_tracer)
         self.delete_tracer.clicked.connect(self.on_delete_tracer)
 
-        self.update_list()
-
     def on_add_tracer(self):
         new_tracer = Register('val', '', '', '0s', 'file_name', None, None)
         if TracerSettings(self, new_tracer).exec() == 1:
-            self.tracers.append(new_tracer)
-            self.update_list()
+            touch(new_tracer)
+            self.list_model.append(new_tracer)
 
     def on_edit_tracer(self):
         index = self.tracers_list.currentIndex().row()
         if index == -1:
             return
 
-        edited = deepcopy(self.tracers[index])
+        edited = self.tracers.checkout(index)
         if TracerSettings(self, edited).exec() == 1:
-            self.tracers[index] = edited
-            self.update_list()
+            touch(edited)
+            self.list_model.replace(index, edited)
 
     def on_delete_tracer(self):
         index = self.tracers_list.currentIndex().row()
         if len(self.tracers) > 0:
-            del self.tracers[index]
-            self.update_list()
-
-    def update_list(self):
-        list_model = QStandardItemModel()
-        self.tracers_list.setModel(list_model)
-
-        for tracer in self.tracers:
-            item = QStandardItem(tracer.value_name)
-            item.setEditable(False)
-            list_model.appendRow(item)
+            self.list_model.remove(index)
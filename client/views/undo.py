@@ -0,0 +1,22 @@
+from typing import Callable
+
+from PyQt5.QtGui import QKeySequence
+from PyQt5.QtWidgets import QShortcut, QWidget
+
+from client.data.journal import Journal
+
+
+def install_undo(widget: QWidget, journal: Journal, root, refresh: Callable[[], None]):
+    """ Undo and redo edits of root object recorded in journal by standard
+    shortcuts of widget, `refresh` is called after every step
+    """
+    def undo():
+        if journal.undo(root) is not None:
+            refresh()
+
+    def redo():
+        if journal.redo(root) is not None:
+            refresh()
+
+    QShortcut(QKeySequence(QKeySequence.Undo), widget, undo)
+    QShortcut(QKeySequence(QKeySequence.Redo), widget, redo)
@@ -0,0 +1,41 @@
+from typing import Callable, Dict
+
+
+class FragmentCache:
+    """ Cache of serialized XML fragments
+
+    Fragments are keyed by object revision (see `client.data.objects.touch`),
+    so unchanged objects, including deep copies of them, are serialized once.
+    Entries which were not used during the last serialization pass are dropped.
+    """
+
+    def __init__(self) -> None:
+        self._fragments: Dict[int, str] = {}
+        self._previous: Dict[int, str] = {}
+
+    def begin(self):
+        """ Start new serialization pass """
+        self._previous = self._fragments
+        self._fragments = {}
+
+    def end(self):
+        """ Finish serialization pass and drop unused fragments """
+        self._previous = {}
+
+    def get(self, obj, serializer: Callable[[object], str]) -> str:
+        """ Get cached fragment of object or serialize it """
+        revision = obj.revision
+        fragment = self._fragments.get(revision)
+        if fragment is None:
+            fragment = self._previous.pop(revision, None)
+            if fragment is None:
+                fragment = serializer(obj)
+            self._fragments[revision] = fragment
+        return fragment
+
+    def clear(self):
+        self._fragments = {}
+        self._previous = {}
+
+    def __len__(self):
+        return len(self._fragments) + len(self._previous)
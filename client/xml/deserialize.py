@@ -0,0 +1,142 @@
+from typing import BinaryIO, Union
+from xml.etree.ElementTree import Element, iterparse
+
+from client.data.model import Model, ModelParameters
+from client.data.objects import *
+
+
+def _parse_attributes(element: Element) -> Attributes:
+    attributes = element.find('attributes')
+    table = AttributeTable()
+    if attributes is None:
+        return table
+    for attr in attributes.iter('attribute'):
+        # Older versions saved rows with the same key, e.g. several
+        # default `name` rows, they are kept under unused keys
+        table.append((table.unused_key(attr.get('key')), attr.get('value')))
+    return table
+
+
+def _parse_position(element: Element) -> Optional[Position]:
+    x, y = element.get('x'), element.get('y')
+    if x is None or y is None:
+        return None
+    return float(x), float(y)
+
+
+def _parse_device(element: Element) -> Device:
+    ipv4_addresses = []
+    ipv6_addresses = []
+    for address in element.iter('address'):
+        if address.get('netmask') is not None:
+            ipv4_addresses.append([address.get('value'), address.get('netmask')])
+        else:
+            ipv6_addresses.append([address.get('value'), address.get('prefix')])
+
+    return Device(name=element.get('name'),
+                  type=element.get('type'),
+                  attributes=_parse_attributes(element),
+                  ipv4_addresses=ipv4_addresses,
+                  ipv6_addresses=ipv6_addresses)
+
+
+def _parse_app(element: Element) -> Application:
+    return Application(name=element.get('name'),
+                       type=element.get('type'),
+                       attributes=_parse_attributes(element))
+
+
+def parse_node(element: Element) -> Node:
+    ipv4_routes = RouteTable()
+    ipv6_routes = RouteTable()
+    for route in element.iter('route'):
+        prefix = route.get('prefix')
+        (ipv4_routes if prefix is None else ipv6_routes).add(
+            network=route.get('network'),
+            dst=route.get('dst'),
+            metric=int(route.get('metric')),
+            prefix=prefix,
+            netmask=route.get('netmask'))
+    return Node(name=element.get('name'),
+                devices=list(map(_parse_device, element.iter('device'))),
+                applications=list(map(_parse_app, element.iter('application'))),
+                ipv4_routes=ipv4_routes,
+                ipv6_routes=ipv6_routes,
+                position=_parse_position(element))
+
+
+def parse_connection(element: Element) -> Connection:
+    return Connection(name=element.get('name'),
+                      type=element.get('type'),
+                      interfaces=[iface.text or ''
+                                  for iface in element.iter('interface')],
+                      attributes=_parse_attributes(element),
+                      position=_parse_position(element))
+
+
+def parse_register(element: Element) -> Register:
+    return Register(value_name=element.get('value_name'),
+                    type=element.get('type'),
+                    source=element.get('source'),
+                    start=element.get('start'),
+                    file=element.get('file'),
+                    end=element.get('end'),
+                    sink=element.get('sink'))
+
+
+def load_model(source: Union[str, BinaryIO]) -> Model:
+    """ Load model saved by `Model.convert_to_xml`
+
+    Document is parsed incrementally and every node, connection and register
+    element is dropped right after conversion, so memory used by the parser
+    is bounded by the size of one node.
+
+    :param source: file name or binary file object
+    :raises xml.etree.ElementTree.ParseError: if document is malformed
+    :raises ValueError: if document is not a model
+    """
+    parameters = ModelParameters(name='',
+                                 duration='',
+                                 populate_tables=False,
+                                 precision=Precision.NS)
+    nodes = []
+    connections = []
+    registers = []
+
+    # Currently open elements, parsed subtrees are removed from their parents
+    parents = []
+    for event, element in iterparse(source, events=('start', 'end')):
+        if event == 'start':
+            if not parents:
+                if element.tag != 'model':
+                    raise ValueError(f'Unexpected root element "{element.tag}"')
+                parameters.name = element.get('name', '')
+            parents.append(element)
+            continue
+
+        parents.pop()
+        tag = element.tag
+        if tag == 'node':
+            nodes.append(parse_node(element))
+        elif tag == 'connection':
+            connections.append(parse_connection(element))
+        elif tag == 'registrator':
+            registers.append(parse_register(element))
+        elif len(parents) != 1:
+            continue
+        elif tag == 'populate-routing-tables':
+            parameters.populate_tables = (element.text or '').strip() == 'true'
+        elif tag == 'duration':
+            parameters.duration = (element.text or '').strip()
+        elif tag == 'precision':
+            parameters.precision = Precision[(element.text or '').strip()]
+        else:
+            continue
+
+        if parents:
+            parents[-1].remove(element)
+
+    return Model(parameters=parameters,
+                 nodes=nodes,
+                 connections=connections,
+                 registers=registers)
@@ -1,6 +1,7 @@
-from typing import List
+from typing import Iterable, Iterator, List, Optional, Tuple, Union
 
 from client.data.objects import *
+from client.xml.cache import FragmentCache
 
 
 def serialize_applications(apps: List[Application]):
@@ -17,10 +18,8 @@ def _serialize_app(app: Application):
 
 def _serialize_attributes(attributes: Attributes):
     return '<attributes>' \
-        + ''.join(
-            map(
-                lambda attr: f'<attribute key="{attr[0]}" value="{attr[1]}"/>', attributes)
-        ) \
+        + ''.join([f'<attribute key="{key}" value="{value}"/>'
+                   for key, value in attributes.items()]) \
         + '</attributes>'
 
 
@@ -46,12 +45,54 @@ def _serialize_route(route: Route):
     return f'<route network="{route.network}" {mask_type}="{content}" dst="{route.dst}" metric="{route.metric}"/>'
 
 
-def serialize_routes(routes: List[Route]):
-    return ''.join(map(_serialize_route, routes))
+def _serialize_target(target: Tuple[Optional[str], Optional[str], str]):
+    # Attributes between network and metric of route
+    prefix, netmask, dst = target
+    mask_type, content = ('prefix', prefix) if prefix is not None else ('netmask', netmask)
+    return f'" {mask_type}="{content}" dst="{dst}" metric="'
+
+
+# Texts of small metrics, most routes have one of them
+_metric_texts = [str(metric) for metric in range(1024)]
+
+
+def serialize_routes(routes: Union[RouteTable, List[Route]]):
+    """ Serialize routes, tables stored by columns column by column
+
+    Texts of every column are made at once and interleaved in one list of
+    pieces, so no string is formatted per route. Attributes of prefix,
+    netmask and dst are formatted once per distinct triple.
+    """
+    if not isinstance(routes, RouteTable) or len(routes) < VECTOR_ROWS:
+        return ''.join(map(_serialize_route, routes))
+
+    count = len(routes)
+    targets = routes.targets()
+    target_texts = {target: _serialize_target(target) for target in set(targets)}
+    metrics = routes.column('metric')
+    if 0 <= min(metrics) and max(metrics) < len(_metric_texts):
+        metric_texts = map(_metric_texts.__getitem__, metrics)
+    else:
+        metric_texts = map(str, metrics)
+
+    # network in two pieces, attributes, metric, end of route
+    pieces = ['"/><route network="'] * (count * 5)
+    pieces[0::5], pieces[1::5] = routes.network_halves()
+    pieces[2::5] = map(target_texts.__getitem__, targets)
+    pieces[3::5] = metric_texts
+    pieces[-1] = '"/>'
+    return '<route network="' + ''.join(pieces)
+
+
+def _serialize_position(position: Optional[Position]):
+    if position is None:
+        return ''
+    return f' x="{position[0]}" y="{position[1]}"'
 
 
 def _serialize_connection(connection: Connection):
-    return f'<connection name="{connection.name}" type="{connection.type}">' \
+    return f'<connection name="{connection.name}" type="{connection.type}"' \
+        + _serialize_position(connection.position) + '>' \
         + '<interfaces>' \
         + ''.join(
             map(lambda iface: f'<interface>{iface}</interface>',
@@ -68,6 +109,17 @@ def serialize_connections(connections: List[Connection]):
         + '</connections>'
 
 
+def serialize_connections_iter(connections: List[Connection],
+                               cache: Optional[FragmentCache] = None) -> Iterator[str]:
+    yield '<connections>'
+    if cache is None:
+        yield from map(_serialize_connection, connections)
+    else:
+        for connection in connections:
+            yield cache.get(connection, _serialize_connection)
+    yield '</connections>'
+
+
 def serialize_register(register: Register):
     return f'<registrator value_name="{register.value_name}"' \
         + f' type="{register.type}"'\
@@ -85,8 +137,20 @@ def serialize_registers(registers: List[Register]):
         + '</statistics>'
 
 
+def serialize_registers_iter(registers: List[Register],
+                             cache: Optional[FragmentCache] = None) -> Iterator[str]:
+    yield '<statistics>'
+    if cache is None:
+        yield from map(serialize_register, registers)
+    else:
+        for register in registers:
+            yield cache.get(register, serialize_register)
+    yield '</statistics>'
+
+
 def serialize_node(node: Node):
-    return f'<node name="{node.name}">' \
+    return f'<node name="{node.name}"' \
+        + _serialize_position(node.position) + '>' \
         + serialize_devices(node.devices) \
         + '<routing>' \
         + serialize_routes(node.ipv4_routes) \
@@ -98,3 +162,23 @@ def serialize_node(node: Node):
 
 def _serialize_precision(precision: Precision):
     return f'<precision>{precision.name}</precision>'
+
+
+# Size of chunks written to files and sent to server, in characters
+CHUNK_SIZE = 64 * 1024
+
+
+def chunked(fragments: Iterable[str], chunk_size: int = CHUNK_SIZE) -> Iterator[str]:
+    """ Join small fragments into chunks of at least `chunk_size` characters """
+    buffer = []
+    size = 0
+    for fragment in fragments:
+        buffer.append(fragment)
+        size += len(fragment)
+        if size >= chunk_size:
+            yield ''.join(buffer)
+            buffer.clear()
+            size = 0
+
+    if buffer:
+        yield ''.join(buffer)
@@ -0,0 +1,31 @@
+from typing import Iterable, List, Optional, Sequence, Tuple, Union
+
+from client.data.model import Model, ModelParameters
+from client.data.objects import *
+
+
+def make_device(name: str, attributes=(), addresses=()) -> Device:
+    return Device(name, 'Csma', [list(row) for row in attributes],
+                  [list(row) for row in addresses], [])
+
+
+def make_node(name: str, devices: Sequence[Device] = (), routes: Sequence[Route] = (),
+              position: Optional[Position] = None) -> Node:
+    return Node(name, list(devices), [], list(routes), [], position=position)
+
+
+def make_model(nodes: Iterable[Union[str, Node]] = (),
+               connections: Iterable[Union[Tuple[str, List[str]], Connection]] = (),
+               registers: Iterable[Register] = ()) -> Model:
+    """ Model of nodes and connections used by tests
+
+    Nodes are given as `Node` objects or names of nodes without devices,
+    connections as `Connection` objects or `(name, interfaces)` pairs.
+    """
+    return Model(parameters=ModelParameters('test', '1s', False, Precision.NS),
+                 nodes=[make_node(node) if isinstance(node, str) else node
+                        for node in nodes],
+                 connections=[connection if isinstance(connection, Connection)
+                              else Connection(connection[0], 'Csma', list(connection[1]), [])
+                              for connection in connections],
+                 registers=list(registers))
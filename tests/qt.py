@@ -0,0 +1,9 @@
+import os
+
+from PyQt5.QtWidgets import QApplication
+
+
+def application() -> QApplication:
+    """ Get application shared by tests, widgets are rendered offscreen """
+    os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+    return QApplication.instance() or QApplication([])
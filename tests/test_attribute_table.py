@@ -0,0 +1,125 @@
+import unittest
+from copy import deepcopy
+from io import BytesIO
+
+from PyQt5.QtCore import Qt
+
+from client.data.journal import Journal, SetValue, set_value
+from client.data.objects import *
+from client.views.attributes_model import AttributesModel
+from client.xml.deserialize import load_model
+from tests.qt import application
+from tests.test_xml_deserialization import round_trip
+from tests.test_xml_streaming import make_model
+
+
+def make_table():
+    return AttributeTable([['DataRate', '5Mbps'], ['Mtu', '1500'], ['Delay', '2ms']])
+
+
+class TestAttributeTable(unittest.TestCase):
+    def test_table_is_list_of_rows(self):
+        table = make_table()
+
+        self.assertEqual(len(table), 3)
+        self.assertEqual(table, [['DataRate', '5Mbps'], ['Mtu', '1500'], ['Delay', '2ms']])
+        self.assertEqual(table[-1], ['Delay', '2ms'])
+        with self.assertRaises(IndexError):
+            table[3]
+
+        table.insert(1, ['Queue', '100p'])
+        self.assertEqual(table.keys(), ['DataRate', 'Queue', 'Mtu', 'Delay'])
+        self.assertEqual(table.pop(1), ['Queue', '100p'])
+        del table[0]
+        self.assertEqual(table, [['Mtu', '1500'], ['Delay', '2ms']])
+
+    def test_lookup_by_key(self):
+        table = make_table()
+
+        self.assertIn('Mtu', table)
+        self.assertEqual(table.get('Mtu'), '1500')
+        self.assertIsNone(table.get('Queue'))
+        table.set('Mtu', '9000')
+        table.set('Queue', '100p')
+        self.assertEqual(list(table.items())[1:], [('Mtu', '9000'), ('Delay', '2ms'), ('Queue', '100p')])
+        self.assertEqual(table.unused_key('Queue'), 'Queue2')
+        self.assertEqual(table.unused_key('Name'), 'Name')
+
+    def test_keys_are_interned(self):
+        key = ''.join(['Data', 'Rate'])
+        table = AttributeTable([[key, '1Mbps']])
+
+        self.assertIs(table.keys()[0], make_table().keys()[0])
+
+    def test_duplicate_keys_are_rejected(self):
+        table = make_table()
+
+        with self.assertRaises(ValueError):
+            table.append(['Mtu', '9000'])
+        with self.assertRaises(ValueError):
+            table.insert(0, ['Delay', '1ms'])
+        with self.assertRaises(ValueError):
+            table.set_field(0, 0, 'Mtu')
+        self.assertEqual(table, make_table())
+
+    def test_renamed_key_keeps_position(self):
+        table = make_table()
+
+        self.assertEqual(table.set_field(1, 0, 'MTU'), 'Mtu')
+        self.assertEqual(table.set_field(1, 1, '9000'), '1500')
+        self.assertEqual(table.keys(), ['DataRate', 'MTU', 'Delay'])
+        table[1] = ['MTU', '1400']
+        self.assertEqual(table.field(1, 1), '1400')
+
+    def test_journal_edits_cells(self):
+        device = Device('eth0', 'Csma', make_table(), [], [])
+        journal = Journal()
+
+        old = set_value(device, ('attributes', 1, 1), '9000')
+        journal.record(SetValue(('attributes', 1, 1), old, '9000'))
+        self.assertEqual(device.attributes.get('Mtu'), '9000')
+        journal.undo(device)
+        self.assertEqual(device.attributes.get('Mtu'), '1500')
+
+    def test_objects_convert_and_copy_tables(self):
+        device = Device('eth0', 'Csma', [['Mtu', '1500']], [], [])
+        self.assertIsInstance(device.attributes, AttributeTable)
+
+        copy = deepcopy(device)
+        copy.attributes.set('Mtu', '9000')
+        self.assertEqual(device.attributes.get('Mtu'), '1500')
+
+    def test_xml_round_trip(self):
+        model = make_model()
+        model.connections[0].attributes = make_table()
+
+        loaded = round_trip(model)
+
+        self.assertIsInstance(loaded.connections[0].attributes, AttributeTable)
+        self.assertEqual(loaded.connections[0].attributes, make_table())
+
+    def test_duplicate_keys_are_renamed_on_load(self):
+        # Attribute dialogs of older versions added default `name` rows
+        xml = make_model().convert_to_xml().replace(
+            '<attribute key="Mtu"', '<attribute key="name" value="a"/>'
+            '<attribute key="name" value="b"/><attribute key="Mtu"', 1)
+
+        loaded = load_model(BytesIO(xml.encode('utf-8')))
+
+        self.assertEqual(loaded.nodes[0].devices[0].attributes,
+                         [['name', 'a'], ['name2', 'b'], ['Mtu', '1500']])
+
+
+class TestAttributesModel(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.app = application()
+
+    def test_edit_rejects_key_of_other_row(self):
+        journal = Journal()
+        model = AttributesModel(make_table(), None, journal, ('attributes',))
+
+        self.assertFalse(model.setData(model.index(1, 0), 'Delay', Qt.EditRole))
+        self.assertTrue(model.setData(model.index(1, 0), 'MTU ', Qt.EditRole))
+        self.assertEqual(model.data(model.index(1, 0), Qt.DisplayRole), 'MTU')
+        self.assertEqual(len(journal.done), 1)
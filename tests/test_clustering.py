@@ -0,0 +1,139 @@
+import unittest
+
+from client.data.clustering import (CELL_CAPACITY, build_cluster_tree,
+                                    expanded_clusters, update_cluster_tree,
+                                    visible_graph)
+from client.data.objects import *
+from client.data.topology import build_graph, update_graph
+from tests import models
+
+
+def make_model(count, connections=(), address=lambda index: f'10.{index}.0.1'):
+    return models.make_model(
+        [models.make_node(f'n{index}',
+                          [models.make_device('eth0',
+                                              addresses=[[address(index), '255.255.255.0']])],
+                          position=(index % 100 * 10.0, index // 100 * 10.0))
+         for index in range(count)],
+        [Connection(name, 'Csma', interfaces, [], position=(0.0, 0.0))
+         for name, interfaces in connections])
+
+
+def members(tree, item_id):
+    cluster = tree.clusters.get(item_id)
+    if cluster is None:
+        return [item_id]
+    return [node for child in cluster.children for node in members(tree, child)]
+
+
+class TestClustering(unittest.TestCase):
+    def test_quadtree(self):
+        model = make_model(1000)
+        graph = build_graph(model)
+        tree = build_cluster_tree(model, graph)
+
+        self.assertLessEqual(len(tree.roots), 4)
+        self.assertEqual(sorted(node for root in tree.roots for node in members(tree, root)),
+                         sorted(graph.nodes))
+        for cluster in tree.clusters.values():
+            self.assertLessEqual(len(cluster.children), max(CELL_CAPACITY, 4))
+            self.assertEqual(cluster.size, len(members(tree, cluster.id)))
+
+    def test_hub_and_subnet_groups(self):
+        model = make_model(5, [('lan', ['n0/eth0', 'n1/eth0', 'n2/eth0'])],
+                           address=lambda index: f'10.0.{index // 3}.{index + 1}')
+        graph = build_graph(model)
+        tree = build_cluster_tree(model, graph)
+
+        self.assertEqual(sorted(tree.clusters['cluster:connection:lan'].children),
+                         ['connection:lan', 'node:n0', 'node:n1', 'node:n2'])
+        self.assertEqual(sorted(tree.clusters['cluster:subnet:10.0.1.0/24'].children),
+                         ['node:n3', 'node:n4'])
+
+    def test_visible_graph(self):
+        model = make_model(200, [('lan', ['n0/eth0', 'n1/eth0', 'n150/eth0'])])
+        graph = build_graph(model)
+        tree = build_cluster_tree(model, graph)
+
+        collapsed = visible_graph(graph, tree, set())
+        self.assertEqual(len(collapsed.nodes), len(tree.roots))
+        self.assertEqual(sum(node['value'] for node in collapsed.nodes.values()
+                             if 'value' in node) + len(set(collapsed.nodes) & set(graph.nodes)),
+                         len(graph.nodes))
+
+        expanded = visible_graph(graph, tree, set(tree.clusters))
+        self.assertEqual(expanded, graph)
+
+    def test_expanded_clusters(self):
+        model = make_model(10000)
+        graph = build_graph(model)
+        tree = build_cluster_tree(model, graph)
+
+        self.assertEqual(expanded_clusters(tree, (0, 0, 1000, 1000), 0.01, 100), set())
+        self.assertEqual(expanded_clusters(tree, (0, 0, 1000, 1000), 100, 100),
+                         set(tree.clusters))
+
+        # Zoomed into a corner, only clusters near it are expanded
+        corner = expanded_clusters(tree, (0, 0, 50, 50), 20, 150)
+        shown = visible_graph(graph, tree, corner)
+        self.assertIn('node:n0', shown.nodes)
+        self.assertLess(len(shown.nodes), 200)
+
+        pinned = next(iter(tree.roots))
+        self.assertEqual(expanded_clusters(tree, (-1e9, -1e9, 1e9, 1e9), 0.01, 100, {pinned}),
+                         {pinned})
+
+    def assert_tree_matches(self, tree, graph):
+        self.assertEqual(sorted(node for root in tree.roots for node in members(tree, root)),
+                         sorted(graph.nodes))
+        for cluster in tree.clusters.values():
+            nodes = members(tree, cluster.id)
+            self.assertEqual(cluster.size, len(nodes))
+            self.assertEqual(cluster.box, (min(graph.nodes[node]['x'] for node in nodes),
+                                           min(graph.nodes[node]['y'] for node in nodes),
+                                           max(graph.nodes[node]['x'] for node in nodes),
+                                           max(graph.nodes[node]['y'] for node in nodes)))
+            self.assertTrue(all(tree.parents[child] == cluster.id for child in cluster.children))
+        self.assertEqual(visible_graph(graph, tree, set(tree.clusters)), graph)
+
+        # Edges between collapsed roots are merged
+        root_of = {node: root for root in tree.roots for node in members(tree, root)}
+        merged = {}
+        for edge in graph.edges.values():
+            src, dst = root_of[edge['from']], root_of[edge['to']]
+            if src != dst:
+                merged[f'{src}-{dst}'] = merged.get(f'{src}-{dst}', 0) + 1
+        collapsed = visible_graph(graph, tree, set())
+        self.assertEqual({edge_id: edge.get('value', 1)
+                          for edge_id, edge in collapsed.edges.items()}, merged)
+
+    def test_update_cluster_tree(self):
+        model = make_model(1000, [(f'l{index}', [f'n{index}/eth0', f'n{index + 1}/eth0'])
+                                  for index in range(0, 999, 7)])
+        graph = build_graph(model)
+        tree = build_cluster_tree(model, graph)
+        model.subscribe(lambda event: update_cluster_tree(
+            tree, graph, update_graph(graph, model, event)))
+        clusters = set(tree.clusters)
+
+        # New nodes crowd one cell, which gets split
+        for index in range(3 * CELL_CAPACITY):
+            model.add_node(models.make_node(f'new{index}', position=(5.0 + index / 10, 5.0)))
+            model.add_connection(Connection(f'new{index}', 'Csma',
+                                            [f'new{index}/eth0', 'n500/eth1'], []))
+        self.assertNotIn(tree.parents['node:new0'], clusters)
+        self.assertTrue(all(len(cluster.children) <= max(CELL_CAPACITY, 4)
+                            for cluster in tree.clusters.values()))
+        self.assert_tree_matches(tree, graph)
+
+        # Cluster of removed nodes is removed
+        removed = tree.parents['node:n999']
+        for name in members(tree, removed):
+            model.remove_node(model.node(name[len('node:'):]))
+        model.remove_connection(model.connections[0])
+        self.assertNotIn(removed, tree.clusters)
+        self.assert_tree_matches(tree, graph)
+
+
+if __name__ == '__main__':
+    unittest.main()
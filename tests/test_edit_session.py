@@ -0,0 +1,65 @@
+import unittest
+
+from client.data.events import Change
+from client.data.objects import *
+from client.data.session import EditSession
+from tests.models import make_model
+
+
+class TestEditSession(unittest.TestCase):
+    def setUp(self):
+        self.model = make_model(['a', 'b', 'c'])
+        self.events = []
+        self.model.subscribe(self.events.append)
+
+    def test_objects_are_shared_until_checkout(self):
+        session = EditSession(self.model, 'nodes')
+        self.assertIs(session[1], self.model.nodes[1])
+
+        edited = session.checkout(1)
+        edited.name = 'x'
+        self.assertIsNot(edited, self.model.nodes[1])
+        self.assertEqual(self.model.nodes[1].name, 'b')
+
+    def test_commit_replays_edits(self):
+        original = list(self.model.nodes)
+        session = EditSession(self.model, 'nodes')
+        edited = session.checkout(1)
+        edited.name = 'x'
+        touch(edited)
+        session[1] = edited
+        del session[-1]
+        session.append(Node('d', [], [], [], []))
+        self.assertEqual([node.name for node in self.model.nodes], ['a', 'b', 'c'])
+
+        session.commit()
+
+        self.assertEqual([(event.change, event.row) for event in self.events],
+                         [(Change.NODE_CHANGED, 1), (Change.NODE_REMOVED, 2),
+                          (Change.NODE_ADDED, 2)])
+        self.assertEqual([node.name for node in self.model.nodes], ['a', 'x', 'd'])
+        self.assertIs(self.model.nodes[0], original[0])
+        self.assertIs(self.model.node('x'), edited)
+        self.assertIsNone(self.model.node('c'))
+
+    def test_commit_after_model_change_merges(self):
+        session = EditSession(self.model, 'nodes')
+        del session[0]
+        self.model.add_node(Node('d', [], [], [], []))
+        self.events.clear()
+
+        session.commit()
+
+        self.assertEqual([node.name for node in self.model.nodes], ['b', 'c'])
+        self.assertEqual([event.change for event in self.events],
+                         [Change.NODE_REMOVED, Change.NODE_REMOVED])
+
+    def test_row_out_of_range(self):
+        session = EditSession(self.model, 'nodes')
+        with self.assertRaises(IndexError):
+            del session[3]
+        self.assertEqual(session.operations, [])
+
+
+if __name__ == '__main__':
+    unittest.main()
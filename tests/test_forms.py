@@ -0,0 +1,54 @@
+import os
+import tempfile
+import unittest
+
+try:
+    from PyQt5 import uic
+    from PyQt5.QtCore import QFile
+    from PyQt5.QtWidgets import QDialog
+    from client.views.forms import UI_DIR, form_class, load_form
+    from tests.qt import application
+except ImportError:
+    form_class = None
+
+
+@unittest.skipIf(form_class is None, 'PyQt5 is required')
+class TestForms(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.app = application()
+
+    def test_form_class_is_cached(self):
+        self.assertIs(form_class('NodeList'), form_class('NodeList'))
+
+    def test_same_attributes_as_load_ui(self):
+        expected = QDialog()
+        uic.loadUi(os.path.join(UI_DIR, 'NodeSettings.ui'), expected)
+        dialog = QDialog()
+        load_form(dialog, 'NodeSettings')
+
+        self.assertEqual(dialog.windowTitle(), expected.windowTitle())
+        for name, value in vars(expected).items():
+            self.assertIsInstance(getattr(dialog, name), type(value))
+
+    def test_resources_are_registered(self):
+        import client.res.resources_rcc
+
+        self.assertTrue(QFile(':/images/run.svg').exists())
+        self.assertTrue(QFile(':/images/ns-3.png').exists())
+
+    def test_independent_of_working_directory(self):
+        cwd = os.getcwd()
+        form_class.cache_clear()
+        with tempfile.TemporaryDirectory() as directory:
+            os.chdir(directory)
+            try:
+                dialog = QDialog()
+                load_form(dialog, 'ConnectRemote')
+            finally:
+                os.chdir(cwd)
+        self.assertFalse(dialog.windowIcon().isNull())
+
+
+if __name__ == '__main__':
+    unittest.main()
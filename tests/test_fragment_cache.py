@@ -0,0 +1,104 @@
+import unittest
+from copy import deepcopy
+
+from client.data.objects import *
+from client.xml.cache import FragmentCache
+from client.xml.serialize import serialize_node
+from tests.test_xml_streaming import make_model, to_string
+
+
+class CountingSerializer:
+    def __init__(self):
+        self.calls = 0
+
+    def __call__(self, obj):
+        self.calls += 1
+        return serialize_node(obj)
+
+
+class TestFragmentCache(unittest.TestCase):
+    def test_unchanged_objects_are_serialized_once(self):
+        cache = FragmentCache()
+        serializer = CountingSerializer()
+        nodes = [Node(f'node-{index}', [], [], [], []) for index in range(10)]
+
+        for _ in range(3):
+            cache.begin()
+            for node in nodes:
+                cache.get(node, serializer)
+            cache.end()
+
+        self.assertEqual(serializer.calls, 10)
+
+    def test_touched_object_is_serialized_again(self):
+        cache = FragmentCache()
+        serializer = CountingSerializer()
+        node = Node('old', [], [], [], [])
+
+        cache.begin()
+        self.assertEqual(cache.get(node, serializer),
+                         serialize_node(Node('old', [], [], [], [])))
+        cache.end()
+
+        node.name = 'new'
+        touch(node)
+
+        cache.begin()
+        self.assertEqual(cache.get(node, serializer),
+                         serialize_node(Node('new', [], [], [], [])))
+        cache.end()
+        self.assertEqual(serializer.calls, 2)
+
+    def test_deep_copy_shares_fragment(self):
+        cache = FragmentCache()
+        serializer = CountingSerializer()
+        node = Node('node', [], [], [], [])
+
+        cache.begin()
+        cache.get(node, serializer)
+        cache.get(deepcopy(node), serializer)
+        cache.end()
+        self.assertEqual(serializer.calls, 1)
+
+    def test_unused_fragments_are_dropped(self):
+        cache = FragmentCache()
+        serializer = CountingSerializer()
+        first = Node('first', [], [], [], [])
+        second = Node('second', [], [], [], [])
+
+        cache.begin()
+        cache.get(first, serializer)
+        cache.get(second, serializer)
+        cache.end()
+        self.assertEqual(len(cache), 2)
+
+        cache.begin()
+        cache.get(first, serializer)
+        cache.end()
+        self.assertEqual(len(cache), 1)
+
+    def test_model_serialization_after_edit(self):
+        model = make_model()
+        model.convert_to_xml()
+
+        model.nodes[3].name = 'renamed'
+        touch(model.nodes[3])
+        model.connections[0].interfaces.append('renamed/eth0')
+        touch(model.connections[0])
+        model.registers[0].start = '5s'
+        touch(model.registers[0])
+
+        self.assertEqual(model.convert_to_xml(), to_string(model))
+
+    def test_snapshot_is_not_changed_by_later_edits(self):
+        model = make_model()
+        expected = to_string(model)
+
+        snapshot = model.xml_snapshot()
+        model.remove_node(model.nodes[0])
+        model.rename_node(model.nodes[0], 'renamed')
+        model.parameters.duration = '10s'
+        # Export of the edited model while the snapshot is sent
+        model.convert_to_xml()
+
+        self.assertEqual(''.join(snapshot), expected)
@@ -0,0 +1,129 @@
+import unittest
+from copy import deepcopy
+
+from client.data.events import Change
+from client.data.journal import InsertItem, Journal, RemoveItem, SetValue
+from client.data.objects import *
+from tests import models
+
+
+def make_model(names):
+    return models.make_model(
+        models.make_node(name, [models.make_device('eth0', [['Mtu', '1500']])],
+                         [Route('10.0.0.0', 'eth0', 1, netmask='255.0.0.0')])
+        for name in names)
+
+
+class TestJournal(unittest.TestCase):
+    def setUp(self):
+        self.model = make_model(['a', 'b'])
+        self.journal = Journal()
+        self.model.journal = self.journal
+
+    def edit(self, model):
+        model.add_node(Node('c', [], [], [], []))
+        model.rename_node(model.node('a'), 'x')
+        model.set_value(('nodes', 1, 'ipv4_routes', 0, 'metric'), 5)
+        model.set_value(('nodes', 1, 'devices', 0, 'attributes', 0, 1), '9000')
+        model.remove_node(model.node('b'))
+
+    def test_undo_and_redo(self):
+        original = deepcopy(self.model)
+        self.edit(self.model)
+        edited = deepcopy(self.model)
+        self.assertEqual(len(self.journal.done), 5)
+        self.assertEqual(self.journal.done[1], SetValue(('nodes', 0, 'name'), 'a', 'x'))
+
+        while self.journal.undo(self.model) is not None:
+            pass
+        self.assertEqual(self.model, original)
+        self.assertIs(self.model.node('a'), self.model.nodes[0])
+        self.assertIsNone(self.model.node('x'))
+        self.assertEqual(len(self.journal.done), 0)
+
+        while self.journal.redo(self.model) is not None:
+            pass
+        self.assertEqual(self.model, edited)
+        self.assertIs(self.model.node('x'), self.model.nodes[0])
+
+    def test_undo_notifies_observers(self):
+        self.model.rename_node(self.model.node('a'), 'x')
+        events = []
+        self.model.subscribe(events.append)
+
+        self.journal.undo(self.model)
+
+        self.assertEqual([(event.change, event.old) for event in events],
+                         [(Change.NODE_RENAMED, 'x')])
+        self.assertEqual(len(self.journal.undone), 1)
+
+    def test_new_edit_drops_redo(self):
+        self.model.rename_node(self.model.node('a'), 'x')
+        self.journal.undo(self.model)
+        self.model.rename_node(self.model.node('b'), 'y')
+
+        self.assertIsNone(self.journal.redo(self.model))
+
+    def test_limit(self):
+        self.journal.limit = 2
+        self.edit(self.model)
+
+        self.assertEqual(len(self.journal.done), 2)
+        self.assertEqual(self.journal.dropped, 3)
+        with self.assertRaises(ValueError):
+            self.journal.replay(make_model(['a', 'b']))
+
+    def test_replay_onto_base(self):
+        self.model.journal = self.journal = Journal(limit=2, base=make_model(['a', 'b']))
+        self.edit(self.model)
+
+        rebuilt = deepcopy(self.journal.base)
+        self.journal.replay(rebuilt)
+        self.assertEqual(rebuilt, self.model)
+        # Replayed objects are copies
+        self.assertIsNot(rebuilt.nodes[0], self.model.nodes[0])
+
+    def test_objects_edited_after_insert_are_replayed_once(self):
+        def edit(model):
+            model.add_node(Node('c', [], [], [], []))
+            node = model.node('c')
+            model.add_device(node, Device('d1', 'Csma', [], [], []))
+            model.add_device(node, Device('d2', 'Csma', [], [], []))
+            model.remove_device(node, node.devices[0])
+            model.rename_node(node, 'x')
+            model.rename_node(node, 'y')
+
+        for limit, base in ((1000, None), (2, make_model(['a', 'b']))):
+            with self.subTest(limit=limit):
+                model = make_model(['a', 'b'])
+                model.journal = journal = Journal(limit=limit, base=base)
+                edit(model)
+
+                rebuilt = deepcopy(base) if base is not None else make_model(['a', 'b'])
+                journal.replay(rebuilt)
+                self.assertEqual([device.name for device in rebuilt.node('y').devices], ['d2'])
+                self.assertEqual(rebuilt, model)
+
+    def test_assigned_list_starts_new_journal(self):
+        self.model.rename_node(self.model.node('a'), 'x')
+        self.model.nodes = []
+
+        self.assertIsNot(self.model.journal, self.journal)
+        self.assertEqual(len(self.model.journal.done), 0)
+
+    def test_edits_of_object(self):
+        node = self.model.nodes[0]
+        journal = Journal()
+        journal.execute(node, InsertItem(('ipv4_routes',), 1, Route('0.0.0.0', 'eth0', 0)))
+        journal.execute(node, RemoveItem(('ipv4_routes',), 0, node.ipv4_routes[0]))
+
+        self.assertEqual([route.network for route in node.ipv4_routes], ['0.0.0.0'])
+        journal.undo(node)
+        journal.undo(node)
+        self.assertEqual([route.network for route in node.ipv4_routes], ['10.0.0.0'])
+        # Edits of objects outside of model journal are not recorded in it
+        self.assertEqual(len(self.journal.done), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,70 @@
+import math
+import unittest
+
+from client.data import layout
+from client.data.layout import (SPACING, force_layout, hierarchical_layout,
+                                layout_graph, radial_layout)
+from client.data.topology import Graph
+
+
+def make_graph(count, edges):
+    return Graph(nodes={i: {'id': i, 'label': str(i)} for i in range(count)},
+                 edges={f'{src}-{dst}': {'id': f'{src}-{dst}', 'from': src, 'to': dst}
+                        for src, dst in edges})
+
+
+def ring(count):
+    return [(i, (i + 1) % count) for i in range(count)]
+
+
+class TestLayout(unittest.TestCase):
+    def test_hierarchical_layout(self):
+        # Star with a tail and an isolated node
+        positions = hierarchical_layout(6, [(0, 1), (0, 2), (0, 3), (3, 4)])
+
+        self.assertEqual(len(set(positions)), 6)
+        self.assertEqual(positions[1][1], positions[2][1])
+        self.assertEqual(positions[1][1], positions[3][1])
+        self.assertLess(positions[0][1], positions[1][1])
+        self.assertLess(positions[3][1], positions[4][1])
+
+    @unittest.skipIf(layout.np is None, 'numpy is not installed')
+    def test_force_layout(self):
+        count = 200
+        initial = radial_layout(count, ring(count))
+        positions = force_layout(count, ring(count), initial=initial)
+
+        self.assertEqual(len(positions), count)
+        self.assertTrue(all(math.isfinite(x) and math.isfinite(y) for x, y in positions))
+        self.assertEqual(force_layout(count, ring(count)), force_layout(count, ring(count)))
+
+        # Neighbours are closer than average pair of nodes
+        def distance(a, b):
+            return math.dist(positions[a], positions[b])
+        neighbours = sum(distance(a, b) for a, b in ring(count)) / count
+        others = sum(distance(i, (i + count // 2) % count) for i in range(count)) / count
+        self.assertLess(neighbours * 5, others)
+
+    def test_known_positions_are_kept(self):
+        graph = make_graph(3, [(0, 1)])
+        known = layout_graph(graph)
+
+        graph = make_graph(5, [(0, 1), (1, 3), (3, 4)])
+        positions = layout_graph(graph, known)
+
+        self.assertEqual(set(positions), set(range(5)))
+        for node_id in range(3):
+            self.assertEqual(positions[node_id], known[node_id])
+        self.assertLessEqual(math.dist(positions[3], positions[1]), SPACING)
+
+    def test_layout_graph(self):
+        self.assertEqual(layout_graph(Graph()), {})
+
+        graph = make_graph(50, ring(50))
+        positions = layout_graph(graph)
+        self.assertEqual(set(positions), set(graph.nodes))
+        self.assertEqual(len(set(positions.values())), 50)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,130 @@
+import unittest
+
+from client.data.log import LogBuffer, LogFilter
+
+
+def rows(log_filter: LogFilter):
+    return [log_filter.buffer.text(log_filter.seq(row)) for row in range(len(log_filter))]
+
+
+class TestLogBuffer(unittest.TestCase):
+    def test_append(self):
+        buffer = LogBuffer(10)
+        buffer.append('LOG', '+0.1s 0 UdpEchoClientApplication:Send(): Sent 1024 bytes')
+        buffer.append('ERROR', 'failed')
+
+        self.assertEqual(len(buffer), 2)
+        self.assertEqual(buffer.level(0), 'LOG')
+        self.assertEqual(buffer.source(0), 'UdpEchoClientApplication')
+        self.assertEqual(buffer.level(1), 'ERROR')
+        self.assertEqual(buffer.source(1), '')
+        self.assertEqual(buffer.text(1), 'failed')
+
+    def test_ring(self):
+        buffer = LogBuffer(3)
+        buffer.extend(('LOG', str(index)) for index in range(10))
+
+        self.assertEqual(len(buffer), 3)
+        self.assertEqual((buffer.first, buffer.end), (7, 10))
+        self.assertEqual([buffer.text(seq) for seq in range(7, 10)], ['7', '8', '9'])
+
+    def test_clear(self):
+        buffer = LogBuffer(3)
+        buffer.extend(('LOG', str(index)) for index in range(5))
+        buffer.clear()
+        buffer.append('LOG', 'new')
+
+        self.assertEqual(len(buffer), 1)
+        self.assertEqual(buffer.text(buffer.first), 'new')
+
+
+class TestLogFilter(unittest.TestCase):
+    def setUp(self):
+        self.buffer = LogBuffer(100)
+        self.buffer.extend([
+            ('LOG', '+0s 0 UdpEchoClientApplication:Send(): Sent packet'),
+            ('LOG', '+0s 1 UdpEchoServerApplication:HandleRead(): Received packet'),
+            ('ERROR', 'Simulation failed'),
+            ('LOG', '+1s 0 UdpEchoClientApplication:HandleRead(): Received PACKET'),
+        ])
+        self.filter = LogFilter(self.buffer)
+
+    def test_unfiltered(self):
+        self.assertEqual(len(self.filter), 4)
+        self.assertEqual(rows(self.filter)[2], 'Simulation failed')
+
+    def test_level_and_source(self):
+        self.filter.set_filter(levels={'ERROR'})
+        self.assertEqual(rows(self.filter), ['Simulation failed'])
+
+        self.filter.set_filter(source='UdpEchoClientApplication')
+        self.assertEqual(len(self.filter), 2)
+
+        self.filter.set_filter()
+        self.assertEqual(len(self.filter), 4)
+
+    def test_search(self):
+        self.filter.set_query('rec')
+        self.assertEqual(len(self.filter), 2)
+
+        self.filter.set_query('received p')
+        self.assertEqual(len(self.filter), 2)
+
+        self.filter.set_query('received packet')
+        self.assertEqual(len(self.filter), 2)
+
+        self.filter.set_query('re')
+        self.assertEqual(len(self.filter), 2)
+
+        self.filter.set_query('sent')
+        self.assertEqual(len(self.filter), 1)
+
+        self.filter.set_query('')
+        self.assertEqual(len(self.filter), 4)
+
+    def test_extended_query_checks_only_matches(self):
+        self.filter.set_query('rec')
+        checked = []
+        matches = self.filter._matches
+        self.filter._matches = lambda seq, query: checked.append(seq) or matches(seq, query)
+
+        self.filter.set_query('recei')
+        self.assertEqual(len(checked), 2)
+
+        checked.clear()
+        self.filter.set_query('rec')
+        self.assertEqual(checked, [])
+
+    def test_update(self):
+        self.filter.set_query('packet')
+        self.assertEqual(self.filter.update(), (0, 0))
+
+        self.buffer.append('LOG', 'Dropped packet')
+        self.buffer.append('LOG', 'Other')
+        self.assertEqual(self.filter.update(), (0, 1))
+        self.assertEqual(rows(self.filter)[-1], 'Dropped packet')
+
+        self.filter.set_query('')
+        self.buffer.append('LOG', 'Last')
+        self.assertEqual(self.filter.update(), (0, 1))
+        self.assertEqual(len(self.filter), 7)
+
+    def test_update_with_eviction(self):
+        buffer = LogBuffer(4)
+        log_filter = LogFilter(buffer)
+        buffer.extend(('LOG', f'line {index}') for index in range(4))
+        self.assertEqual(log_filter.update(), (0, 4))
+
+        buffer.extend(('LOG', f'line {index}') for index in range(4, 6))
+        self.assertEqual(log_filter.update(), (2, 2))
+        self.assertEqual(rows(log_filter), ['line 2', 'line 3', 'line 4', 'line 5'])
+
+        log_filter.set_query('line 1')
+        self.assertEqual(len(log_filter), 0)
+        buffer.extend(('LOG', f'line {index}') for index in range(6, 12))
+        self.assertEqual(log_filter.update(), (0, 2))
+        self.assertEqual(rows(log_filter), ['line 10', 'line 11'])
+
+        buffer.extend(('LOG', 'other') for _ in range(3))
+        self.assertEqual(log_filter.update(), (1, 0))
+        self.assertEqual(rows(log_filter), ['line 11'])
@@ -0,0 +1,51 @@
+import unittest
+
+from PyQt5.QtCore import Qt
+
+from client.views.log_console import LogConsole
+from tests.qt import application
+
+
+class TestLogConsole(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.app = application()
+
+    def make_console(self, max_lines=1000):
+        console = LogConsole(max_lines=max_lines, refresh_rate=10)
+        self.inserts = []
+        console.model.rowsInserted.connect(
+            lambda parent, first, last: self.inserts.append((first, last)))
+        return console
+
+    def rows(self, console):
+        return [console.model.data(console.model.index(row), Qt.DisplayRole)
+                for row in range(console.model.rowCount())]
+
+    def test_appended_lines_are_flushed_in_one_batch(self):
+        console = self.make_console()
+
+        for index in range(100):
+            console.append('LOG', f'line {index}')
+        self.assertTrue(console.timer.isActive())
+        self.assertEqual(console.model.rowCount(), 0)
+
+        console.flush()
+
+        self.assertEqual(self.inserts, [(0, 99)])
+        self.assertEqual(self.rows(console)[-1], 'line 99')
+        self.assertEqual(list(console.pending), [])
+
+    def test_lines_are_bounded(self):
+        console = self.make_console(max_lines=5)
+
+        for index in range(12):
+            console.append('LOG', f'line {index}')
+        self.assertEqual(len(console.pending), 5)
+        console.flush()
+        self.assertEqual(self.rows(console), [f'line {index}' for index in range(7, 12)])
+
+        for index in range(12, 15):
+            console.append('ERROR', f'line {index}')
+        console.flush()
+        self.assertEqual(self.rows(console), [f'line {index}' for index in range(10, 15)])
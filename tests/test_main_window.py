@@ -0,0 +1,48 @@
+import unittest
+from unittest.mock import patch
+
+import client.data.model as model
+from client.data.objects import *
+from client.data.session import EditSession
+from client.views.main_window import MainWindow
+from tests.models import make_model
+from tests.qt import application
+
+
+class AcceptingDialog:
+    """ Dialog stub which removes the first object of the session and is accepted """
+
+    def __init__(self, parent, session: EditSession) -> None:
+        self.session = session
+
+    def exec(self):
+        del self.session[0]
+        return 1
+
+
+class TestMainWindowHandlers(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.app = application()
+
+    def setUp(self):
+        self.saved_model = model.current_model
+        model.current_model = make_model(
+            connections=[('ab', ['a/eth0', 'b/eth0'])],
+            registers=[Register('CWND', 'ns3::Uinteger32Probe',
+                                '/NodeList/0/CongestionWindow', '1s', 'cwnd')])
+
+    def tearDown(self):
+        model.current_model = self.saved_model
+
+    def test_open_connections_commits_session(self):
+        with patch('client.views.main_window.ConnectionsList', AcceptingDialog):
+            MainWindow.on_open_connections(None)
+
+        self.assertEqual(model.current_model.connections, [])
+
+    def test_open_tracers_commits_session(self):
+        with patch('client.views.main_window.TracersList', AcceptingDialog):
+            MainWindow.on_open_tracers(None)
+
+        self.assertEqual(model.current_model.registers, [])
@@ -0,0 +1,98 @@
+import json
+import threading
+import time
+import unittest
+
+from client.message_queue import MessageQueue
+
+
+def message(status, msg):
+    return json.dumps({'status': status, 'msg': msg})
+
+
+class TestMessageQueue(unittest.TestCase):
+    def test_put_and_drain(self):
+        queue = MessageQueue(capacity=10)
+        self.assertTrue(queue.put(message('LOG', 'first')))
+        self.assertFalse(queue.put(message('LOG', 'second')))
+
+        self.assertEqual(queue.drain(1), [{'status': 'LOG', 'msg': 'first'}])
+        self.assertEqual(queue.drain(10), [{'status': 'LOG', 'msg': 'second'}])
+        self.assertEqual(queue.drain(10), [])
+
+        # Consumer is notified again after queue is drained
+        self.assertTrue(queue.put(message('LOG', 'third')))
+
+    def test_overflow(self):
+        queue = MessageQueue(capacity=2)
+        for index in range(5):
+            queue.put(message('LOG', str(index)))
+        queue.put(message('ERROR', 'error'))
+        queue.put(message('UPLOADED', 'model'))
+
+        self.assertEqual(queue.received, 7)
+        self.assertEqual(queue.dropped, 3)
+        self.assertEqual(queue.drain(10), [
+            {'status': 'LOG', 'msg': '0'},
+            {'status': 'LOG', 'msg': '1'},
+            {'status': 'ERROR', 'msg': 'error'},
+            {'status': 'UPLOADED', 'msg': 'model'},
+            {'status': 'LOG', 'msg': '[3 log messages dropped]'},
+        ])
+
+    def test_drop_without_summary(self):
+        queue = MessageQueue(capacity=1, summarize=False)
+        queue.put(message('LOG', '0'))
+        queue.put(message('LOG', '1'))
+        self.assertEqual(queue.drain(10), [{'status': 'LOG', 'msg': '0'}])
+        self.assertEqual(queue.dropped, 1)
+
+    def test_malformed(self):
+        queue = MessageQueue()
+        self.assertFalse(queue.put('not json'))
+        self.assertFalse(queue.put('{"msg": "no status"}'))
+        self.assertEqual(queue.malformed, 2)
+        self.assertEqual(len(queue), 0)
+
+    def test_burst(self):
+        """ Stand-in socket thread emits 50k msg/s, GUI drains per tick """
+        queue = MessageQueue(capacity=1000)
+        rate = 50000
+        duration = 0.5
+        errors_every = 997
+        sent_errors = []
+
+        def produce():
+            start = time.perf_counter()
+            index = 0
+            while index < rate * duration:
+                # Keep the rate, sending in small bursts
+                if index > (time.perf_counter() - start) * rate:
+                    time.sleep(0.001)
+                    continue
+                if index % errors_every == 0:
+                    sent_errors.append(str(index))
+                    queue.put(message('ERROR', str(index)))
+                else:
+                    queue.put(message('LOG', str(index)))
+                index += 1
+
+        producer = threading.Thread(target=produce)
+        producer.start()
+
+        received = []
+        max_size = 0
+        while producer.is_alive() or len(queue) > 0:
+            max_size = max(max_size, len(queue))
+            received.extend(queue.drain(500))
+            time.sleep(0.03)
+        producer.join()
+
+        errors = [data['msg'] for data in received if data['status'] == 'ERROR']
+        self.assertEqual(errors, sent_errors)
+        self.assertLessEqual(max_size, 1000 + len(sent_errors))
+        self.assertEqual(queue.received, rate * duration)
+
+        logs = [data for data in received if data['status'] == 'LOG'
+                and not data['msg'].startswith('[')]
+        self.assertEqual(len(logs) + len(errors) + queue.dropped, queue.received)
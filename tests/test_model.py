@@ -1,5 +1,8 @@
 import client.data.model as model
 import unittest
+from copy import deepcopy
+
+from client.data.objects import Device, Node, Route
 
 
 class TestModel(unittest.TestCase):
@@ -9,4 +12,12 @@ class TestModel(unittest.TestCase):
     def test_can_be_modified(self):
         m = model.current_model
         m.precision = model.Precision.H
-        self.assertEqual(m.precision, model.current_model.precision)
\ No newline at end of file
+        self.assertEqual(m.precision, model.current_model.precision)
+
+    def test_objects_are_slotted(self):
+        device = Device('eth0', 'Csma', [['Mtu', '1500']],
+                        [['10.0.0.1', '255.255.255.0']], [])
+        node = Node('n0', [device], [], [Route('10.0.1.0', 'eth0', 1)], [])
+        self.assertFalse(hasattr(node, '__dict__'))
+        self.assertFalse(hasattr(node.devices[0], '__dict__'))
+        self.assertEqual(node, deepcopy(node))
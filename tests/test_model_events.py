@@ -0,0 +1,65 @@
+import unittest
+from copy import deepcopy
+
+from client.data.events import Change
+from client.data.objects import *
+from tests.models import make_model
+
+
+class TestModelEvents(unittest.TestCase):
+    def setUp(self):
+        self.model = make_model(['a', 'b', 'c'])
+        self.events = []
+        self.model.subscribe(self.events.append)
+
+    def changes(self):
+        return [(event.change, event.row) for event in self.events]
+
+    def test_editing_methods(self):
+        node = Node('d', [], [], [], [])
+        self.model.add_node(node)
+        self.model.rename_node(node, 'e')
+        self.model.add_device(node, Device('eth0', 'Csma', [], [], []))
+        self.model.remove_node(self.model.node('a'))
+
+        self.assertEqual(self.changes(), [(Change.NODE_ADDED, 3), (Change.NODE_RENAMED, 3),
+                                          (Change.NODE_CHANGED, 3), (Change.NODE_REMOVED, 0)])
+        self.assertEqual(self.events[1].old, 'd')
+        self.assertEqual(self.events[3].obj.name, 'a')
+
+    def test_update_from_edited_copy(self):
+        original = list(self.model.nodes)
+        edited = deepcopy(self.model.nodes)
+        del edited[0]
+        edited[1].name = 'x'
+        touch(edited[1])
+        edited.append(Node('d', [], [], [], []))
+
+        self.model.update_nodes(edited)
+
+        self.assertEqual(self.changes(), [(Change.NODE_REMOVED, 0), (Change.NODE_CHANGED, 1),
+                                          (Change.NODE_ADDED, 2)])
+        self.assertEqual([node.name for node in self.model.nodes], ['b', 'x', 'd'])
+        # Unchanged nodes are kept, not replaced with copies
+        self.assertIs(self.model.nodes[0], original[1])
+        self.assertIs(self.model.node('x'), edited[1])
+        self.assertIsNone(self.model.node('c'))
+
+    def test_update_without_changes(self):
+        self.model.update_nodes(deepcopy(self.model.nodes))
+        self.assertEqual(self.events, [])
+
+    def test_reordered_copy_resets(self):
+        self.model.update_nodes(list(reversed(self.model.nodes)))
+
+        self.assertEqual(self.changes(), [(Change.RESET, -1)])
+        self.assertEqual([node.name for node in self.model.nodes], ['c', 'b', 'a'])
+
+    def test_unsubscribe(self):
+        self.model.unsubscribe(self.events.append)
+        self.model.nodes = []
+        self.assertEqual(self.events, [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,127 @@
+import unittest
+from copy import deepcopy
+
+from client.data.objects import *
+from tests import models
+from tests.models import make_device, make_node
+
+
+def make_model():
+    return models.make_model([make_node('a', [make_device('eth0'), make_device('eth1')]),
+                              make_node('b', [make_device('eth0')])],
+                             [('ab', ['a/eth0', 'b/eth0']), ('a', ['a/eth1'])])
+
+
+class TestModelIndex(unittest.TestCase):
+    def test_lookup(self):
+        m = make_model()
+
+        self.assertIs(m.node('b'), m.nodes[1])
+        self.assertIsNone(m.node('x'))
+        self.assertEqual(m.device('a/eth1'), (m.nodes[0], m.nodes[0].devices[1]))
+        self.assertIsNone(m.device('b/eth1'))
+        self.assertEqual(m.device_paths(), ['a/eth0', 'a/eth1', 'b/eth0'])
+        self.assertEqual(m.connections_of('b/eth0'), [m.connections[0]])
+        self.assertEqual(m.connections_of('b/eth1'), [])
+
+    def test_add_and_remove(self):
+        m = make_model()
+        m.index
+        node = Node('c', [make_device('eth0')], [], [], [])
+        connection = Connection('bc', 'Ppp', ['b/eth0', 'c/eth0'], [])
+
+        m.add_node(node)
+        m.add_connection(connection)
+        self.assertIs(m.node('c'), node)
+        self.assertEqual(m.connections_of('b/eth0'), [m.connections[0], connection])
+
+        m.remove_node(m.node('a'))
+        m.remove_connection(m.connections[0])
+        self.assertEqual([n.name for n in m.nodes], ['b', 'c'])
+        self.assertIsNone(m.node('a'))
+        self.assertIsNone(m.device('a/eth0'))
+        self.assertEqual(m.connections_of('b/eth0'), [connection])
+        # Remembered rows are checked on use and may differ
+        tables = {name: table for name, table in vars(m.index).items() if name != 'rows'}
+        fresh = vars(type(m.index)(m.nodes, m.connections))
+        self.assertEqual(tables, {name: fresh[name] for name in tables})
+
+    def test_rename(self):
+        m = make_model()
+        m.index
+        node = m.node('a')
+        revision = node.revision
+
+        m.rename_node(node, 'x')
+        self.assertIsNone(m.node('a'))
+        self.assertIs(m.node('x'), node)
+        self.assertEqual(m.device_paths(), ['b/eth0', 'x/eth0', 'x/eth1'])
+        self.assertNotEqual(node.revision, revision)
+
+        m.rename_device(node, node.devices[0], 'eth5')
+        self.assertIsNone(m.device('x/eth0'))
+        self.assertEqual(m.device('x/eth5'), (node, node.devices[0]))
+
+        m.set_interfaces(m.connections[0], ['x/eth5', 'b/eth0'])
+        self.assertEqual(m.connections_of('x/eth5'), [m.connections[0]])
+        self.assertEqual(m.connections_of('a/eth0'), [])
+
+    def test_duplicate_names(self):
+        m = make_model()
+        m.index
+        first = m.node('a')
+        second = Node('a', [], [], [], [])
+
+        m.add_node(second)
+        self.assertIs(m.node('a'), first)
+        m.remove_node(first)
+        self.assertIs(m.node('a'), second)
+
+    def test_replace_by_equal_copy(self):
+        m = make_model()
+        m.index
+        old = m.nodes[0]
+        new = deepcopy(old)
+
+        m.replace_node(old, new)
+        self.assertIs(m.nodes[0], new)
+        self.assertIs(m.node('a'), new)
+        self.assertIs(m.device('a/eth0')[0], new)
+
+    def test_rows_follow_inserted_and_removed_objects(self):
+        m = make_model()
+        for name in 'cde':
+            m.add_node(Node(name, [], [], [], []))
+        copy = deepcopy(m.node('d'))
+        m.add_node(copy)
+
+        m.rename_node(m.node('d'), 'x')
+        self.assertEqual(m.nodes[3].name, 'x')
+        self.assertEqual(m.nodes[5].name, 'd')
+        m.remove_node(m.node('b'))
+        m.rename_node(m.node('e'), 'y')
+        m.replace_node(copy, Node('z', [], [], [], []))
+        m.remove_node(m.node('a'))
+        m.rename_node(m.node('c'), 'w')
+        self.assertEqual([node.name for node in m.nodes], ['w', 'x', 'y', 'z'])
+        with self.assertRaises(ValueError):
+            m.remove_node(copy)
+
+        m.add_register(Register('CWND', 'ns3::Uinteger32Probe', '/NodeList/0', '1s', 'a'))
+        m.registers = [Register('RTT', 'ns3::TimeProbe', '/NodeList/1', '1s', 'b')]
+        m.remove_register(m.registers[0])
+        self.assertEqual(m.registers, [])
+
+    def test_assigned_lists_are_indexed(self):
+        m = make_model()
+        m.index
+        m.nodes = [Node('c', [], [], [], [])]
+        m.connections = []
+
+        self.assertIsNone(m.node('a'))
+        self.assertIs(m.node('c'), m.nodes[0])
+        self.assertEqual(m.connections_of('a/eth0'), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
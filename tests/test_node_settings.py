@@ -0,0 +1,83 @@
+import unittest
+from copy import deepcopy
+from unittest.mock import patch
+
+from client.data.objects import *
+from client.views.node_settings import NodeSettings
+from tests.models import make_device, make_node
+from tests.qt import application
+
+
+class EditingDialog:
+    """ Dialog stub which sets an attribute of the edited object and is accepted """
+
+    def __init__(self, parent, editable) -> None:
+        self.editable = editable
+
+    def exec(self):
+        self.editable.attributes.set('Edited', '1')
+        return 1
+
+
+class TestNodeSettings(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.app = application()
+
+    def setUp(self):
+        self.node = make_node('a', [make_device('eth0', [['Mtu', '1500']]), make_device('eth1')])
+        self.original = deepcopy(self.node)
+        self.dialog = NodeSettings(None, self.node)
+
+    def select(self, view, row):
+        view.setCurrentIndex(view.model().index(row))
+
+    def undo_all(self):
+        while self.dialog.journal.undo(self.node) is not None:
+            self.dialog.update_lists()
+
+    @patch('client.views.node_settings.DeviceSettings', EditingDialog)
+    def test_device_edits_are_undone(self):
+        self.select(self.dialog.device_list, 0)
+        self.dialog.on_edit_device()
+        self.dialog.on_add_device()
+        self.select(self.dialog.device_list, 1)
+        self.dialog.on_delete_device()
+        self.assertEqual([device.name for device in self.node.devices], ['eth0', 'eth'])
+        self.assertEqual(self.node.devices[0].attributes.get('Edited'), '1')
+        self.assertEqual(len(self.dialog.journal.done), 3)
+
+        self.undo_all()
+
+        self.assertEqual(self.node, self.original)
+        self.assertEqual(self.dialog.device_list.model().rowCount(), 2)
+
+    @patch('client.views.node_settings.ApplicationsSettings', EditingDialog)
+    def test_application_edits_are_undone(self):
+        self.dialog.on_add_app()
+        added = self.node.applications[0]
+        self.select(self.dialog.applications_list, 0)
+        self.dialog.on_edit_app()
+        self.assertIsNot(self.node.applications[0], added)
+
+        self.dialog.journal.undo(self.node)
+        self.assertIs(self.node.applications[0], added)
+        self.dialog.on_delete_app()
+        self.undo_all()
+
+        self.assertEqual(self.node, self.original)
+
+    @patch('client.views.node_settings.DeviceSettings', EditingDialog)
+    def test_edits_keep_list_model_and_selection(self):
+        model = self.dialog.device_list.model()
+        self.select(self.dialog.device_list, 1)
+
+        self.dialog.on_edit_device()
+        self.dialog.on_add_device()
+        self.assertIs(self.dialog.device_list.model(), model)
+        self.assertEqual(self.dialog.device_list.currentIndex().row(), 1)
+        self.assertEqual(model.rowCount(), 3)
+
+        self.dialog.on_delete_device()
+        self.assertIs(self.dialog.device_list.model(), model)
+        self.assertEqual([device.name for device in self.node.devices], ['eth0', 'eth'])
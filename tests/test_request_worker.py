@@ -0,0 +1,112 @@
+import threading
+import time
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+try:
+    from PyQt5.QtCore import QEventLoop, QThreadPool, QTimer
+    from client.remote.worker import RequestTask
+    from tests.qt import application
+except ImportError:
+    RequestTask = None
+
+
+class SlowHandler(BaseHTTPRequestHandler):
+    """ Stand-in server which reads body slowly and answers after a delay """
+
+    delay = 0.5
+
+    def do_POST(self):
+        remaining = int(self.headers.get('Content-Length', 0))
+        if self.headers.get('Transfer-Encoding') == 'chunked':
+            while True:
+                size = int(self.rfile.readline().split(b';')[0], 16)
+                self.rfile.read(size + 2)
+                if size == 0:
+                    break
+                time.sleep(0.01)
+        else:
+            self.rfile.read(remaining)
+        self.do_GET()
+
+    def do_GET(self):
+        time.sleep(self.delay)
+        body = b'{"error": "busy"}' if self.path == '/busy' else b'{}'
+        self.send_response(500 if self.path == '/busy' else 200)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@unittest.skipIf(RequestTask is None, 'PyQt5 and requests are required')
+class TestRequestWorker(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.app = application()
+
+    def setUp(self):
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), SlowHandler)
+        threading.Thread(target=self.server.serve_forever, args=(0.05,),
+                         daemon=True).start()
+        host, port = self.server.server_address
+        self.url = f'http://{host}:{port}'
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def run_task(self, task: RequestTask):
+        """ Run task and count timer ticks processed meanwhile """
+        results = []
+        loop = QEventLoop()
+        task.signals.finished.connect(lambda *args: results.append(('finished', args)))
+        task.signals.failed.connect(lambda *args: results.append(('failed', args)))
+        task.signals.cancelled.connect(lambda: results.append(('cancelled', ())))
+        for signal in (task.signals.finished, task.signals.failed, task.signals.cancelled):
+            signal.connect(loop.quit)
+
+        ticks = []
+        timer = QTimer()
+        timer.timeout.connect(lambda: ticks.append(time.perf_counter()))
+        timer.start(10)
+
+        QTimer.singleShot(10000, loop.quit)
+        QThreadPool.globalInstance().start(task)
+        loop.exec()
+        timer.stop()
+        return results, ticks
+
+    def test_event_loop_is_not_blocked(self):
+        body = (b'x' * 1024 for _ in range(20))
+        task = RequestTask('POST', self.url + '/start', body=body)
+        progress = []
+        task.signals.progress.connect(progress.append)
+
+        results, ticks = self.run_task(task)
+
+        self.assertEqual(results, [('finished', (200, '{}'))])
+        self.assertEqual(progress[-1], 20 * 1024)
+        # Server answers after 0.5s, timer must keep firing meanwhile
+        self.assertGreater(len(ticks), 20)
+        self.assertLess(max(b - a for a, b in zip(ticks, ticks[1:])), 0.2)
+
+    def test_server_error(self):
+        results, _ = self.run_task(RequestTask('GET', self.url + '/busy'))
+        self.assertEqual(results, [('finished', (500, '{"error": "busy"}'))])
+
+    def test_connection_error(self):
+        self.server.shutdown()
+        self.server.server_close()
+        results, _ = self.run_task(RequestTask('GET', self.url + '/stop', timeout=1))
+        self.assertEqual(results[0][0], 'failed')
+
+    def test_cancel_upload(self):
+        body = (b'x' * 1024 for _ in range(1000))
+        task = RequestTask('POST', self.url + '/start', body=body)
+        task.signals.progress.connect(lambda sent: task.cancel())
+
+        results, _ = self.run_task(task)
+        self.assertEqual(results, [('cancelled', ())])
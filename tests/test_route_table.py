@@ -0,0 +1,144 @@
+import unittest
+from copy import deepcopy
+from io import BytesIO
+
+from client.data.journal import Journal, SetValue, set_value
+from client.data.objects import *
+from client.xml.deserialize import load_model
+from client.xml.serialize import _serialize_route, serialize_routes
+from tests.models import make_model
+
+ROUTES = [
+    Route('10.0.0.0', 'eth0', 1, netmask='255.0.0.0'),
+    Route('2001:db8::0', 'eth1', 2, prefix='64'),
+    # Kept as written, not as packed address
+    Route('010.1.1.1', 'eth0', 3, netmask='255.255.255.0'),
+    Route('', '', 0, netmask=''),
+]
+
+
+def make_table(count):
+    return RouteTable(ROUTES[index % len(ROUTES)] for index in range(count))
+
+
+class TestRouteTable(unittest.TestCase):
+    def test_small_and_large_tables_are_lists_of_routes(self):
+        for count in (len(ROUTES), VECTOR_ROWS * 2):
+            with self.subTest(count=count):
+                routes = [ROUTES[index % len(ROUTES)] for index in range(count)]
+                table = make_table(count)
+
+                self.assertEqual(len(table), count)
+                self.assertEqual(list(table), routes)
+                self.assertEqual(table, routes)
+                self.assertEqual(table[-2], routes[-2])
+                self.assertEqual(table.column('network'), [route.network for route in routes])
+                with self.assertRaises(IndexError):
+                    table[count]
+
+                table.insert(1, Route('192.168.0.0', 'eth2', 7, netmask='255.255.0.0'))
+                self.assertEqual(table.pop(1).dst, 'eth2')
+                table[0] = Route('10.1.0.0', 'eth1', 4, netmask='255.255.0.0')
+                del table[-1]
+                self.assertEqual(table[0].network, '10.1.0.0')
+                self.assertEqual(len(table), count - 1)
+
+    def test_set_field(self):
+        for count in (len(ROUTES), VECTOR_ROWS * 2):
+            with self.subTest(count=count):
+                table = make_table(count)
+                read = table[0]
+
+                self.assertEqual(table.set_field(0, 'metric', 9), 1)
+                self.assertEqual(table.set_field(0, 'netmask', '255.255.0.0'), '255.0.0.0')
+                self.assertEqual(table.set_field(0, 'network', '10.0.0.1'), '10.0.0.0')
+                self.assertEqual(table[0], Route('10.0.0.1', 'eth0', 9, netmask='255.255.0.0'))
+                # Read and added routes are not changed
+                self.assertEqual(read, ROUTES[0])
+                self.assertEqual(ROUTES[0].metric, 1)
+
+    def test_edit_by_path(self):
+        node = Node('a', [], [], make_table(VECTOR_ROWS), [])
+        journal = Journal()
+        old = set_value(node, ('ipv4_routes', 2, 'dst'), 'eth3')
+        journal.record(SetValue(('ipv4_routes', 2, 'dst'), old, 'eth3'))
+
+        self.assertEqual(node.ipv4_routes[2].dst, 'eth3')
+        journal.undo(node)
+        self.assertEqual(node.ipv4_routes[2].dst, 'eth0')
+
+    def test_sort(self):
+        for count in (len(ROUTES), VECTOR_ROWS * 2):
+            with self.subTest(count=count):
+                table = make_table(count)
+
+                table.sort('network')
+                self.assertEqual(table.column('network')[::count // 4],
+                                 ['10.0.0.0', '', '010.1.1.1', '2001:db8::0'])
+                table.sort('metric', reverse=True)
+                self.assertEqual(table[0].metric, 3)
+                table.sort('prefix')
+                self.assertIsNone(table[0].prefix)
+                self.assertEqual(table[-1].prefix, '64')
+
+    def test_sort_by_prefix_length(self):
+        prefixes = ['16', '8', None, '64', '128', '8']
+        for count in (len(prefixes), VECTOR_ROWS * 2):
+            with self.subTest(count=count):
+                table = RouteTable(Route('2001:db8::0', 'eth0', index,
+                                         prefix=prefixes[index % len(prefixes)])
+                                   for index in range(count))
+
+                table.sort('prefix')
+                self.assertEqual(list(dict.fromkeys(table.column('prefix'))),
+                                 [None, '8', '16', '64', '128'])
+
+    def test_pools_keep_only_used_values(self):
+        table = make_table(VECTOR_ROWS * 2)
+
+        for index in range(1000):
+            table.set_field(1, 'network', f'2001:db8::{index}')
+            table.set_field(1, 'dst', f'eth{index}')
+            table[2] = Route(f'2001:db8:1::{index}', f'ppp{index}', 1, prefix='64')
+        # Escaped networks of ROUTES and the last two edited ones
+        self.assertEqual(len(table._escaped), 5)
+        self.assertEqual(len(table._target_pool), len(set(table.targets())))
+
+        table.set_field(5, 'network', '2001:db8::999')
+        self.assertEqual(len(table._escaped), 5)
+        while len(table):
+            table.pop()
+        self.assertEqual(len(table._escaped), 0)
+        self.assertEqual(len(table._target_pool), 0)
+
+    def test_copies_and_node_fields(self):
+        table = make_table(VECTOR_ROWS * 2)
+        copy = deepcopy(table)
+        copy.set_field(0, 'metric', 100)
+
+        self.assertEqual(table.copy(), table)
+        self.assertNotEqual(copy, table)
+        node = Node('a', [], [], list(ROUTES), [])
+        self.assertIsInstance(node.ipv4_routes, RouteTable)
+        self.assertEqual(node, deepcopy(node))
+
+    def test_serialize(self):
+        for count in (len(ROUTES), VECTOR_ROWS * 2):
+            with self.subTest(count=count):
+                table = make_table(count)
+                self.assertEqual(serialize_routes(table),
+                                 ''.join(map(_serialize_route, table)))
+
+    def test_xml_round_trip(self):
+        ipv4 = [Route(f'10.{index // 256}.{index % 256}.0', f'eth{index % 3}', index,
+                      netmask='255.255.255.0')
+                for index in range(VECTOR_ROWS * 3)]
+        model = make_model([Node('a', [], [], ipv4, [ROUTES[1]])])
+
+        loaded = load_model(BytesIO(model.convert_to_xml().encode()))
+        self.assertEqual(loaded.nodes[0].ipv4_routes, ipv4)
+        self.assertEqual(loaded.nodes[0].ipv6_routes, [ROUTES[1]])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,98 @@
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+try:
+    from client.remote.session import ServerClient
+except ImportError:
+    ServerClient = None
+
+
+class KeepAliveHandler(BaseHTTPRequestHandler):
+    """ Stand-in server counting TCP connections and requests """
+
+    protocol_version = 'HTTP/1.1'
+
+    def setup(self):
+        super().setup()
+        self.server.connections += 1
+
+    def do_GET(self):
+        self.server.requests += 1
+        status = 200
+        if self.server.failures > 0:
+            self.server.failures -= 1
+            status = 503
+        self._reply(status, b'{}')
+
+    def do_POST(self):
+        self.server.requests += 1
+        self.rfile.read(int(self.headers['Content-Length']))
+        self._reply(503 if self.server.failures > 0 else 200, b'{}')
+
+    def _reply(self, status, body):
+        self.send_response(status)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@unittest.skipIf(ServerClient is None, 'requests is not installed')
+class TestServerClient(unittest.TestCase):
+    def setUp(self):
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), KeepAliveHandler)
+        self.server.connections = 0
+        self.server.requests = 0
+        self.server.failures = 0
+        threading.Thread(target=self.server.serve_forever, args=(0.05,),
+                         daemon=True).start()
+        host, port = self.server.server_address
+        self.url = f'http://{host}:{port}'
+        self.client = ServerClient(retries=2, backoff=0)
+
+    def tearDown(self):
+        self.client.close()
+        self.server.shutdown()
+        self.server.server_close()
+
+    def test_connection_is_reused(self):
+        for _ in range(10):
+            self.assertEqual(self.client.stop(self.url).status_code, 200)
+        self.assertEqual(self.server.requests, 10)
+        self.assertEqual(self.server.connections, 1)
+
+    def test_threads_use_own_sessions_and_shared_pool(self):
+        sessions = []
+
+        def stop():
+            sessions.append(self.client.session)
+            self.client.stop(self.url)
+
+        for _ in range(3):
+            thread = threading.Thread(target=stop)
+            thread.start()
+            thread.join()
+        stop()
+
+        self.assertEqual(len({id(session) for session in sessions}), 4)
+        self.assertIs(self.client.session, sessions[-1])
+        self.assertEqual(self.server.requests, 4)
+        self.assertEqual(self.server.connections, 1)
+
+    def test_idempotent_request_is_retried(self):
+        self.server.failures = 2
+        self.assertEqual(self.client.stop(self.url).status_code, 200)
+        self.assertEqual(self.server.requests, 3)
+
+    def test_retries_are_bounded(self):
+        self.server.failures = 10
+        self.assertEqual(self.client.stop(self.url).status_code, 503)
+        self.assertEqual(self.server.requests, 3)
+
+    def test_start_is_not_retried(self):
+        self.server.failures = 1
+        self.assertEqual(self.client.start(self.url, b'<model/>').status_code, 503)
+        self.assertEqual(self.server.requests, 1)
@@ -0,0 +1,30 @@
+import subprocess
+import sys
+import unittest
+
+# Modules which must not be imported before main window is shown
+HEAVY_MODULES = ('numpy', 'requests', 'socketio', 'PyQt5.QtWebEngineWidgets')
+# Native modules installed separately from PyQt5, app can not be
+# imported without them
+OPTIONAL_NATIVE_MODULES = ('PyQt5.QtWebEngineCore', 'PyQt5.QtWebEngineWidgets')
+
+
+class TestStartup(unittest.TestCase):
+    def test_heavy_modules_are_imported_lazily(self):
+        script = ('import sys, app; '
+                  f'print(" ".join(m for m in {HEAVY_MODULES!r} if m in sys.modules))')
+        try:
+            result = subprocess.run([sys.executable, '-c', script],
+                                    capture_output=True, text=True, check=True)
+        except subprocess.CalledProcessError as err:
+            error = err.stderr.strip().splitlines()[-1]
+            if any(error == f"ModuleNotFoundError: No module named '{module}'"
+                   for module in OPTIONAL_NATIVE_MODULES):
+                self.skipTest(f'app can not be imported: {error}')
+            self.fail(f'app can not be imported:\n{err.stderr}')
+
+        self.assertEqual(result.stdout.split(), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,120 @@
+import unittest
+
+from client.data.objects import *
+from client.data.topology import (Graph, apply_positions, build_graph,
+                                   diff_graphs, known_positions, update_graph)
+from tests.models import make_model
+
+
+class TestTopology(unittest.TestCase):
+    def test_build_graph(self):
+        graph = build_graph(make_model(
+            ['a', 'b', 'c'],
+            [('ab', ['a/eth0', 'b/eth0']),
+             ('ab2', ['a/eth1', 'b/eth1']),
+             ('lan', ['a/eth2', 'b/eth2', 'c/eth0']),
+             ('broken', ['a/eth3', 'x/eth0'])]
+        ))
+
+        self.assertEqual(graph.nodes['node:a'], {'id': 'node:a', 'label': 'a'})
+        self.assertEqual(graph.nodes['connection:lan']['shape'], 'text')
+        self.assertEqual(len(graph.nodes), 4)
+        self.assertEqual(len(graph.edges), 5)
+        self.assertEqual({(edge['from'], edge['to']) for edge in graph.edges.values()},
+                         {('node:a', 'node:b'), ('node:a', 'connection:lan'),
+                          ('node:b', 'connection:lan'), ('node:c', 'connection:lan')})
+
+    def test_ids_do_not_depend_on_order(self):
+        graph = build_graph(make_model(['a', 'b'], [('ab', ['a/eth0', 'b/eth0'])]))
+        reordered = build_graph(make_model(['b', 'a'], [('ab', ['a/eth0', 'b/eth0'])]))
+
+        self.assertEqual(graph, reordered)
+
+    def test_positions(self):
+        model = make_model(['a', 'b', 'c'], [('lan', ['a/eth0', 'b/eth0', 'c/eth0'])])
+        model.nodes[0].position = (1.0, 2.0)
+        graph = build_graph(model)
+        self.assertEqual(known_positions(graph), {'node:a': (1.0, 2.0)})
+
+        revision = model.nodes[0].revision
+        apply_positions(graph, {'node:a': (1.0, 2.0),
+                                'node:b': (3.14159, 0.0),
+                                'connection:lan': (5.0, 5.0)})
+        self.assertEqual(model.nodes[0].revision, revision)
+        self.assertEqual(model.nodes[1].position, (3.1, 0.0))
+        self.assertIsNone(model.nodes[2].position)
+        self.assertEqual(model.connections[0].position, (5.0, 5.0))
+        self.assertEqual(graph, build_graph(model))
+
+    def test_diff_from_empty(self):
+        graph = build_graph(make_model(['a', 'b'], [('ab', ['a/eth0', 'b/eth0'])]))
+        diff = diff_graphs(Graph(), graph)
+
+        self.assertEqual(diff.nodes, list(graph.nodes.values()))
+        self.assertEqual(diff.edges, list(graph.edges.values()))
+        self.assertEqual(diff.removed_nodes, [])
+
+    def test_diff(self):
+        old = build_graph(make_model(['a', 'b', 'c'], [('ab', ['a/eth0', 'b/eth0'])]))
+        new = build_graph(make_model(['a', 'renamed'], [('ab', ['a/eth0', 'renamed/eth0'])]))
+        diff = diff_graphs(old, new)
+
+        self.assertEqual(diff.nodes, [{'id': 'node:renamed', 'label': 'renamed'}])
+        self.assertEqual(sorted(diff.removed_nodes), ['node:b', 'node:c'])
+        self.assertEqual(diff.edges, [{'id': 'node:a-node:renamed',
+                                       'from': 'node:a', 'to': 'node:renamed'}])
+        self.assertEqual(diff.removed_edges, ['node:a-node:b'])
+        self.assertTrue(diff_graphs(new, new).is_empty())
+
+    def test_update_graph(self):
+        model = make_model(['a', 'b', 'c'],
+                           [('ab', ['a/eth0', 'b/eth0']),
+                            ('lan', ['a/eth1', 'b/eth1', 'd/eth0']),
+                            ('cd', ['c/eth0', 'd/eth1'])])
+        graph = build_graph(model)
+        diffs = []
+        model.subscribe(lambda event: diffs.append(update_graph(graph, model, event)))
+
+        # New node gets edges of connections which already refer to it
+        model.add_node(Node('d', [], [], [], []))
+        self.assertEqual(graph, build_graph(model))
+        self.assertEqual(diffs[-1].nodes, [{'id': 'node:d', 'label': 'd'}])
+        self.assertEqual(sorted(edge['id'] for edge in diffs[-1].edges),
+                         ['node:c-node:d', 'node:d-connection:lan'])
+
+        model.rename_node(model.node('b'), 'x')
+        self.assertEqual(graph, build_graph(model))
+        self.assertIn('node:b', diffs[-1].removed_nodes)
+        self.assertEqual(diffs[-1].removed_edges, ['node:a-node:b', 'node:b-connection:lan'])
+
+        model.set_interfaces(model.connections[0], ['a/eth0', 'x/eth0'])
+        model.remove_connection(model.connections[1])
+        model.remove_node(model.node('c'))
+        self.assertEqual(graph, build_graph(model))
+        self.assertEqual(diffs[-1].removed_nodes, ['node:c'])
+        self.assertEqual(diffs[-1].removed_edges, ['node:c-node:d'])
+
+        model.nodes = []
+        self.assertIsNone(diffs[-1])
+
+    def test_update_graph_with_shared_proxy(self):
+        # Dialogs name new connections the same, proxies of 3-way ones are shared
+        for removed in (0, 1):
+            with self.subTest(removed=removed):
+                model = make_model(['a', 'b', 'c'], [
+                    Connection('new-connection', 'Csma', ['a/eth0', 'b/eth0', 'c/eth0'], [],
+                               position=(1.0, 1.0)),
+                    Connection('new-connection', 'Csma', ['a/eth1', 'b/eth1', 'c/eth1'], [],
+                               position=(2.0, 2.0))])
+                graph = build_graph(model)
+                diffs = []
+                model.subscribe(lambda event: diffs.append(update_graph(graph, model, event)))
+
+                model.remove_connection(model.connections[removed])
+
+                self.assertEqual(graph, build_graph(model))
+                self.assertEqual(diffs[-1].removed_nodes, [])
+                self.assertTrue(all(edge['to'] in graph.nodes for edge in graph.edges.values()))
+                model.remove_connection(model.connections[0])
+                self.assertEqual(graph, build_graph(model))
+                self.assertEqual(diffs[-1].removed_nodes, ['connection:new-connection'])
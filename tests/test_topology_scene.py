@@ -0,0 +1,117 @@
+import unittest
+
+import client.data.model as model
+import client.data.settings as settings
+from client.data.layout import SPACING
+from client.data.objects import *
+from tests.models import make_model
+
+try:
+    from client.views.topology_scene import SceneTopologyView
+    from tests.qt import application
+except ImportError:
+    SceneTopologyView = None
+
+
+@unittest.skipIf(SceneTopologyView is None, 'PyQt5 is required')
+class TestSceneTopologyView(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.app = application()
+
+    def setUp(self):
+        self.current_model = model.current_model
+
+    def tearDown(self):
+        model.current_model = self.current_model
+
+    def test_incremental_update(self):
+        model.current_model = make_model(['a', 'b', 'c'],
+                                         [('ab', ['a/eth0', 'b/eth0']),
+                                          ('bc', ['b/eth1', 'c/eth0'])])
+        view = SceneTopologyView()
+        view.update_topology()
+
+        self.assertEqual(set(view.node_items), {'node:a', 'node:b', 'node:c'})
+        self.assertEqual(len(view.edge_items), 2)
+        self.assertEqual(len(view.scene.items()), 5)
+        item_a = view.node_items['node:a']
+        self.assertEqual((item_a.pos().x(), item_a.pos().y()),
+                         model.current_model.nodes[0].position)
+
+        model.current_model.remove_node(model.current_model.node('c'))
+        model.current_model.remove_connection(model.current_model.connections[1])
+        model.current_model.add_node(Node('d', [], [], [], []))
+        model.current_model.add_connection(Connection('ad', 'Csma', ['a/eth1', 'd/eth0'], []))
+        view.update_topology()
+
+        self.assertIs(view.node_items['node:a'], item_a)
+        self.assertEqual(set(view.node_items), {'node:a', 'node:b', 'node:d'})
+        self.assertEqual(set(view.edge_items), {'node:a-node:b', 'node:a-node:d'})
+        self.assertEqual(len(view.scene.items()), 5)
+        self.assertEqual(len(item_a.edges), 2)
+
+    def test_model_changes_are_shown(self):
+        model.current_model = make_model(['a', 'b'], [('ab', ['a/eth0', 'b/eth0']),
+                                                      ('bc', ['b/eth1', 'c/eth0'])])
+        view = SceneTopologyView()
+        view.update_topology()
+        item_b = view.node_items['node:b']
+
+        node = Node('c', [], [], [], [])
+        model.current_model.add_node(node)
+
+        self.assertIs(view.node_items['node:b'], item_b)
+        self.assertEqual(set(view.edge_items), {'node:a-node:b', 'node:b-node:c'})
+        # New node is placed next to its neighbour and position is kept in model
+        x, y = node.position
+        self.assertLess(abs(x - item_b.pos().x()) + abs(y - item_b.pos().y()),
+                        SPACING)
+        self.assertEqual((view.node_items['node:c'].pos().x(),
+                          view.node_items['node:c'].pos().y()), node.position)
+
+        model.current_model.remove_connection(model.current_model.connections[0])
+        self.assertEqual(set(view.edge_items), {'node:b-node:c'})
+
+    def test_clusters_expand_on_zoom(self):
+        names = [f'n{index}' for index in range(settings.cluster_threshold)]
+        model.current_model = make_model(
+            names, [(f'l{index}', [f'{src}/eth0', f'{dst}/eth1'])
+                    for index, (src, dst) in enumerate(zip(names, names[1:]))])
+        view = SceneTopologyView()
+        view.resize(800, 600)
+        view.update_topology()
+
+        collapsed = len(view.node_items)
+        self.assertLess(collapsed, 50)
+
+        view.graphics_view.scale(20, 20)
+        view.graphics_view.centerOn(view.node_items[next(iter(view.node_items))])
+        view.graphics_view.report_viewport()
+        self.assertGreater(len(view.node_items), collapsed)
+        self.assertLess(len(view.node_items), len(names))
+
+    def test_clustered_model_changes_are_shown(self):
+        names = [f'n{index}' for index in range(settings.cluster_threshold)]
+        model.current_model = make_model(names)
+        view = SceneTopologyView()
+        view.resize(800, 600)
+        view.update_topology()
+        clusters = view.clusters
+
+        node = Node('new', [], [], [], [])
+        model.current_model.add_node(node)
+        model.current_model.add_connection(Connection('l', 'Csma', ['new/eth0', 'n0/eth0'], []))
+        model.current_model.remove_node(model.current_model.node('n1'))
+
+        # Clusters are updated instead of rebuilt
+        self.assertIs(view.clusters, clusters)
+        self.assertIn('node:new', clusters.parents)
+        self.assertNotIn('node:n1', clusters.parents)
+        self.assertIn('node:new-node:n0', clusters.edge_clusters)
+        self.assertEqual(sum(item.get('value', 1) for item in view.target.nodes.values()),
+                         len(names))
+
+
+if __name__ == '__main__':
+    unittest.main()
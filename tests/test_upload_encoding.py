@@ -0,0 +1,104 @@
+import gzip
+import http.client
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from client.remote.encoding import available_encodings, encode_body
+from tests.test_xml_streaming import make_model
+
+
+def decode(data: bytes, encoding: str) -> bytes:
+    if encoding == 'gzip':
+        return gzip.decompress(data)
+    elif encoding == 'zstd':
+        import zstandard
+        return zstandard.ZstdDecompressor().decompressobj().decompress(data)
+    return data
+
+
+class StartHandler(BaseHTTPRequestHandler):
+    """ Stand-in for server's /start endpoint, stores decoded body """
+
+    def do_POST(self):
+        if self.headers.get('Transfer-Encoding') == 'chunked':
+            data = self._read_chunked()
+        else:
+            data = self.rfile.read(int(self.headers['Content-Length']))
+
+        self.server.received.append({
+            'encoding': self.headers.get('Content-Encoding'),
+            'chunked': self.headers.get('Transfer-Encoding') == 'chunked',
+            'body': decode(data, self.headers.get('Content-Encoding')),
+        })
+        self.send_response(200)
+        self.send_header('Content-Length', '0')
+        self.end_headers()
+
+    def _read_chunked(self):
+        data = bytearray()
+        while True:
+            size = int(self.rfile.readline().split(b';')[0], 16)
+            if size == 0:
+                self.rfile.readline()
+                return bytes(data)
+            data += self.rfile.read(size)
+            self.rfile.readline()
+
+    def log_message(self, format, *args):
+        pass
+
+
+class TestUploadEncoding(unittest.TestCase):
+    def setUp(self):
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), StartHandler)
+        self.server.received = []
+        threading.Thread(target=self.server.serve_forever, args=(0.05,),
+                         daemon=True).start()
+
+        self.model = make_model()
+        self.xml = self.model.convert_to_xml().encode('utf-8')
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def upload(self, encoding, threshold):
+        chunks = (chunk.encode('utf-8')
+                  for chunk in self.model.iter_xml_chunks(chunk_size=1024))
+        headers, body = encode_body(chunks, encoding, threshold)
+        headers['Content-Type'] = 'application/xml'
+
+        connection = http.client.HTTPConnection(*self.server.server_address)
+        connection.request('POST', '/start', body=body, headers=headers,
+                           encode_chunked=not isinstance(body, bytes))
+        self.assertEqual(connection.getresponse().status, 200)
+        connection.close()
+        return self.server.received[-1]
+
+    def test_uncompressed(self):
+        received = self.upload(None, 0)
+        self.assertIsNone(received['encoding'])
+        self.assertEqual(received['body'], self.xml)
+
+    def test_below_threshold(self):
+        received = self.upload('gzip', len(self.xml) + 1)
+        self.assertIsNone(received['encoding'])
+        self.assertFalse(received['chunked'])
+        self.assertEqual(received['body'], self.xml)
+
+    def test_gzip(self):
+        received = self.upload('gzip', 1024)
+        self.assertEqual(received['encoding'], 'gzip')
+        self.assertTrue(received['chunked'])
+        self.assertEqual(received['body'], self.xml)
+
+    @unittest.skipIf('zstd' not in available_encodings(), 'zstandard is not installed')
+    def test_zstd(self):
+        received = self.upload('zstd', 1024)
+        self.assertEqual(received['encoding'], 'zstd')
+        self.assertEqual(received['body'], self.xml)
+
+    def test_unknown_encoding(self):
+        with self.assertRaises(ValueError):
+            encode_body([b'data'], 'br', 0)
@@ -0,0 +1,68 @@
+import io
+import unittest
+from xml.etree.ElementTree import ParseError
+
+from client.data.model import Model, ModelParameters
+from client.data.objects import *
+from client.xml.deserialize import load_model
+from tests.test_xml_streaming import make_model
+
+
+def round_trip(model: Model) -> Model:
+    return load_model(io.BytesIO(model.convert_to_xml().encode('utf-8')))
+
+
+class TestXmlDeserialization(unittest.TestCase):
+    def test_round_trip_empty_model(self):
+        model = Model(parameters=ModelParameters(name='empty',
+                                                 duration='1s',
+                                                 populate_tables=False,
+                                                 precision=Precision.NS),
+                      nodes=[], connections=[], registers=[])
+        self.assertEqual(round_trip(model), model)
+
+    def test_round_trip(self):
+        model = make_model()
+        loaded = round_trip(model)
+
+        self.assertEqual(loaded.parameters, model.parameters)
+        self.assertEqual(loaded.nodes, model.nodes)
+        self.assertEqual(loaded.connections, model.connections)
+        self.assertEqual(loaded.registers, model.registers)
+        self.assertEqual(loaded.convert_to_xml(), model.convert_to_xml())
+
+    def test_round_trip_optional_fields(self):
+        model = make_model()
+        model.registers = [
+            Register('CWND', 'ns3::Uinteger32Probe', '/NodeList/0/CongestionWindow',
+                     '1s', 'cwnd')
+        ]
+        model.nodes[0].devices[0].ipv4_addresses = []
+        model.nodes[0].ipv6_routes = []
+
+        self.assertEqual(round_trip(model), model)
+
+    def test_round_trip_positions(self):
+        model = make_model()
+        model.nodes[0].position = (12.5, -3.0)
+        model.connections[0].position = (0.0, 100.0)
+
+        loaded = round_trip(model)
+        self.assertEqual(loaded.nodes[0].position, (12.5, -3.0))
+        self.assertEqual(loaded.connections[0].position, (0.0, 100.0))
+        self.assertEqual(loaded, model)
+
+    def test_load_from_file(self):
+        model = make_model()
+        with io.StringIO() as output:
+            model.write_xml(output)
+            data = output.getvalue().encode('utf-8')
+
+        self.assertEqual(load_model(io.BytesIO(data)), model)
+
+    def test_invalid_document(self):
+        with self.assertRaises(ValueError):
+            load_model(io.BytesIO(b'<nodes></nodes>'))
+
+        with self.assertRaises(ParseError):
+            load_model(io.BytesIO(b'<model name="broken"><node></model>'))
@@ -0,0 +1,79 @@
+import io
+import unittest
+
+from client.data.model import Model, ModelParameters
+from client.data.objects import *
+from client.xml.serialize import (chunked, serialize_connections,
+                                  serialize_node, serialize_registers)
+
+
+def make_model():
+    return Model(
+        parameters=ModelParameters(name='stream',
+                                   duration='2s',
+                                   populate_tables=True,
+                                   precision=Precision.MS),
+        nodes=[
+            Node(
+                name=f'node-{index}',
+                devices=[Device('eth0', 'Csma', [['Mtu', '1500']],
+                                [[f'10.0.0.{index}', '255.255.255.0']],
+                                [[f'dead:beef::{index}', '64']])],
+                applications=[Application('echo', 'ns3::UdpEchoServer',
+                                          [['Port', '9']])],
+                ipv4_routes=[Route('10.1.0.0', 'eth0', 1,
+                                   netmask='255.255.0.0')],
+                ipv6_routes=[Route('dead:cafe::0', 'eth0', 2, prefix='64')])
+            for index in range(50)
+        ],
+        connections=[
+            Connection('lan', 'Csma', [f'node-{index}/eth0' for index in range(50)],
+                       [['Delay', '2ms']])
+        ],
+        registers=[
+            Register('Bytes', 'ns3::Ipv4PacketProbe',
+                     '/NodeList/0/$ns3::Ipv4L3Protocol/Tx', '0s', 'tx',
+                     end='1s', sink='OutputBytes')
+        ]
+    )
+
+
+def to_string(model: Model):
+    return '<?xml version="1.0" encoding="UTF-8"?>' \
+        + f'<model name="{model.parameters.name}">' \
+        + f'<populate-routing-tables>{str(model.parameters.populate_tables).lower()}</populate-routing-tables>' \
+        + f'<duration>{model.parameters.duration}</duration>' \
+        + f'<precision>{model.parameters.precision.name}</precision>' \
+        + ''.join(map(serialize_node, model.nodes)) \
+        + serialize_connections(model.connections) \
+        + serialize_registers(model.registers) \
+        + '</model>'
+
+
+class TestXmlStreaming(unittest.TestCase):
+    def test_stream_equals_string(self):
+        model = make_model()
+        self.assertEqual(''.join(model.iter_xml()), to_string(model))
+        self.assertEqual(model.convert_to_xml(), to_string(model))
+
+    def test_stream_equals_string_for_empty_model(self):
+        model = Model(parameters=ModelParameters('empty', '1s', False, Precision.NS),
+                      nodes=[], connections=[], registers=[])
+        self.assertEqual(''.join(model.iter_xml()), to_string(model))
+
+    def test_chunks_equal_string(self):
+        model = make_model()
+        chunks = list(model.iter_xml_chunks(chunk_size=1024))
+        self.assertGreater(len(chunks), 1)
+        self.assertEqual(''.join(chunks), to_string(model))
+
+    def test_write_xml(self):
+        model = make_model()
+        output = io.StringIO()
+        model.write_xml(output)
+        self.assertEqual(output.getvalue(), to_string(model))
+
+    def test_chunked(self):
+        self.assertEqual(list(chunked([], 4)), [])
+        self.assertEqual(list(chunked(['ab', 'cd', 'e'], 3)), ['abcd', 'e'])
+        self.assertEqual(list(chunked(['abcd', 'e', 'fgh'], 3)), ['abcd', 'efgh'])